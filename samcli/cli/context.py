@@ -6,10 +6,6 @@ import logging
 import uuid
 from typing import Optional, cast, List
 
-import boto3
-import botocore
-import botocore.session
-from botocore import credentials
 import click
 
 from samcli.commands.exceptions import CredentialsError
@@ -181,6 +177,12 @@ class Context:
         the Boto3's session object are read-only. Therefore when Click parses new AWS session related properties (like
         region & profile), it will call this method to create a new session with latest values for these properties.
         """
+        # boto3 is slow to import, only load it when a command needs an AWS session
+        import boto3
+        import botocore.session
+        from botocore import credentials
+        from botocore.exceptions import ProfileNotFound
+
         try:
             botocore_session = botocore.session.get_session()
             boto3.setup_default_session(
@@ -191,7 +193,7 @@ class Context:
                 "assume-role"
             ).cache = credentials.JSONFileCache()
 
-        except botocore.exceptions.ProfileNotFound as ex:
+        except ProfileNotFound as ex:
             raise CredentialsError(str(ex)) from ex
 
 
@@ -7,7 +7,6 @@ import pathlib
 
 import jmespath
 import yaml
-from botocore.utils import set_value_from_jmespath
 
 from samcli.commands.exceptions import UserException
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer, ASSET_PATH_METADATA_KEY
@@ -93,7 +92,7 @@ def move_template(src_template_path, dest_template_path, template_dict):
     # here we make sure the directory the destination template file to write to exists.
     os.makedirs(os.path.dirname(dest_template_path), exist_ok=True)
     with open(dest_template_path, "w") as fp:
-        fp.write(yaml_dump(modified_template))
+        yaml_dump(modified_template, fp)
 
 
 def _update_relative_paths(template_dict, original_root, new_root):
@@ -169,6 +168,9 @@ def _update_relative_paths(template_dict, original_root, new_root):
                 # This path does not need to get updated
                 continue
 
+            # botocore.utils is slow to import, only load it when a template is actually updated
+            from botocore.utils import set_value_from_jmespath
+
             set_value_from_jmespath(properties, path_prop_name, updated_path)
 
         metadata = resource.get("Metadata", {})
@@ -5,20 +5,22 @@ import errno
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, IO, cast, Tuple, Any, Type
 
 from samcli.lib.utils import osutils
-from samcli.lib.providers.provider import Stack, Function
+from samcli.lib.providers.provider import Stack
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
-from samcli.lib.utils.async_utils import AsyncContext
 from samcli.lib.utils.stream_writer import StreamWriter
 from samcli.commands.exceptions import ContainersInitializationException
 from samcli.commands.local.cli_common.user_exceptions import InvokeContextException, DebugContextException
 from samcli.commands.local.lib.local_lambda import LocalLambdaRunner
 from samcli.commands.local.lib.debug_context import DebugContext
+from samcli.local.lambdafn.config import FunctionConfig
 from samcli.local.lambdafn.runtime import LambdaRuntime, WarmLambdaRuntime
+from samcli.local.lambdafn.unzip_cache import get_unzip_cache
 from samcli.local.docker.lambda_image import LambdaImage
 from samcli.local.docker.manager import ContainerManager
 from samcli.commands._utils.template import TemplateNotFoundException, TemplateFailedParsingException
@@ -27,6 +29,9 @@ from samcli.lib.providers.sam_function_provider import SamFunctionProvider, Refr
 
 LOG = logging.getLogger(__name__)
 
+# Maximum number of function containers that are initialized at the same time in EAGER mode
+EAGER_CONTAINERS_INITIALIZATION_WORKERS = 8
+
 
 class ContainersInitializationMode(Enum):
     EAGER = "EAGER"
@@ -264,21 +269,43 @@ class InvokeContext:
     def _initialize_all_functions_containers(self) -> None:
         """
         Create and run a container for each available lambda function
+
+        Functions that use the same image are grouped, and the first function of each group is initialized
+        before the others. This way each image is built only once, instead of being built by every function
+        that uses it at the same time. Both stages create and start the containers concurrently.
         """
         LOG.info("Initializing the lambda functions containers.")
 
-        def initialize_function_container(function: Function) -> None:
-            function_config = self.local_lambda_runner.get_invoke_config(function)
+        def initialize_function_container(function_config: FunctionConfig) -> None:
             self.lambda_runtime.run(
                 None, function_config, self._debug_context, self._container_host, self._container_host_interface
             )
 
         try:
-            async_context = AsyncContext()
-            for function in self._function_provider.get_all():
-                async_context.add_async_task(initialize_function_container, function)
-
-            async_context.run_async(default_executor=False)
+            function_configs = [
+                self.local_lambda_runner.get_invoke_config(function) for function in self._function_provider.get_all()
+            ]
+            initialized_count = 0
+            with ThreadPoolExecutor(max_workers=EAGER_CONTAINERS_INITIALIZATION_WORKERS) as executor:
+                for stage in _group_by_image(function_configs):
+                    futures = {
+                        executor.submit(initialize_function_container, function_config): function_config
+                        for function_config in stage
+                    }
+                    try:
+                        for future in as_completed(futures):
+                            future.result()
+                            initialized_count += 1
+                            LOG.info(
+                                "Initialized the container of %s (%d/%d)",
+                                futures[future].full_path,
+                                initialized_count,
+                                len(function_configs),
+                            )
+                    except BaseException:
+                        for future in futures:
+                            future.cancel()
+                        raise
             LOG.info("Containers Initialization is done.")
         except KeyboardInterrupt:
             LOG.debug("Ctrl+C was pressed. Aborting containers initialization")
@@ -332,9 +359,10 @@ class InvokeContext:
             image_builder = LambdaImage(
                 layer_downloader, self._skip_pull_image, self._force_image_build, invoke_images=self._invoke_images
             )
+            unzip_cache = get_unzip_cache()
             self._lambda_runtimes = {
-                ContainersMode.WARM: WarmLambdaRuntime(self._container_manager, image_builder),
-                ContainersMode.COLD: LambdaRuntime(self._container_manager, image_builder),
+                ContainersMode.WARM: WarmLambdaRuntime(self._container_manager, image_builder, unzip_cache),
+                ContainersMode.COLD: LambdaRuntime(self._container_manager, image_builder, unzip_cache),
             }
 
         return self._lambda_runtimes[self._containers_mode]
@@ -547,3 +575,37 @@ class InvokeContext:
         return ContainerManager(
             docker_network_id=docker_network, skip_pull_image=skip_pull_image, do_shutdown_event=shutdown
         )
+
+
+def _group_by_image(function_configs: List[FunctionConfig]) -> Tuple[List[FunctionConfig], List[FunctionConfig]]:
+    """
+    Split the functions into the first function that uses each image, and the other functions.
+    Image of a function is determined by the same values that LambdaImage uses to tag the images it builds.
+
+    Parameters
+    ----------
+    function_configs : List[FunctionConfig]
+        Configurations of the functions
+
+    Returns
+    -------
+    Tuple[List[FunctionConfig], List[FunctionConfig]]
+        First function of each image, and the other functions
+    """
+    first_functions: List[FunctionConfig] = []
+    other_functions: List[FunctionConfig] = []
+    image_keys = set()
+    for function_config in function_configs:
+        image_key = (
+            function_config.packagetype,
+            function_config.runtime,
+            function_config.imageuri,
+            function_config.architecture,
+            tuple(getattr(layer, "name", str(layer)) for layer in function_config.layers),
+        )
+        if image_key in image_keys:
+            other_functions.append(function_config)
+        else:
+            image_keys.add(image_key)
+            first_functions.append(function_config)
+    return first_functions, other_functions
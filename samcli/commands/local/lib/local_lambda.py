@@ -4,10 +4,11 @@ Implementation of Local Lambda runner
 
 import logging
 import os
-from typing import Any, Dict, Optional, cast
+import threading
+from typing import Any, Dict, NamedTuple, Optional, cast
 
 import boto3
-from botocore.credentials import Credentials
+from botocore.credentials import Credentials, RefreshableCredentials
 
 from samcli.commands.local.lib.debug_context import DebugContext
 from samcli.commands.local.lib.exceptions import (
@@ -19,6 +20,7 @@ from samcli.lib.providers.provider import Function
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider
 from samcli.lib.utils.architecture import validate_architecture_runtime
 from samcli.lib.utils.codeuri import resolve_code_path
+from samcli.lib.utils.invocation_timings import invocation_phase, CONFIG_PHASE, ENV_VARS_PHASE
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from samcli.lib.utils.stream_writer import StreamWriter
 from samcli.local.docker.container import ContainerResponseException, ContainerStartTimeoutException
@@ -30,6 +32,15 @@ from samcli.local.lambdafn.runtime import LambdaRuntime
 LOG = logging.getLogger(__name__)
 
 
+class _CachedFunctionConfig(NamedTuple):
+    """Invoke configuration of a function, and the values it was generated from"""
+
+    function: Function
+    env_vars_values: Dict[Any, Any]
+    credentials: Optional[Credentials]
+    config: FunctionConfig
+
+
 class LocalLambdaRunner:
     """
     Runs Lambda functions locally. This class is a wrapper around the `samcli.local` library which takes care
@@ -76,6 +87,8 @@ class LocalLambdaRunner:
         self._boto3_region: Optional[str] = None
         self.container_host = container_host
         self.container_host_interface = container_host_interface
+        self._function_configs: Dict[str, _CachedFunctionConfig] = {}
+        self._function_configs_lock = threading.Lock()
 
     def invoke(
         self,
@@ -108,7 +121,8 @@ class LocalLambdaRunner:
         """
 
         # Generate the correct configuration based on given inputs
-        function = self.provider.get(function_identifier)
+        with invocation_phase(CONFIG_PHASE):
+            function = self.provider.get(function_identifier)
 
         if not function:
             all_function_full_paths = [f.full_path for f in self.provider.get_all()]
@@ -130,7 +144,8 @@ class LocalLambdaRunner:
 
         validate_architecture_runtime(function)
 
-        config = self.get_invoke_config(function)
+        with invocation_phase(CONFIG_PHASE):
+            config = self.get_invoke_config(function)
 
         # Invoke the function
         try:
@@ -177,13 +192,47 @@ class LocalLambdaRunner:
 
     def get_invoke_config(self, function: Function) -> FunctionConfig:
         """
-        Returns invoke configuration to pass to Lambda Runtime to invoke the given function
+        Returns invoke configuration to pass to Lambda Runtime to invoke the given function.
+
+        The configuration is generated once per function, and reused by following invocations until the function
+        definition or the environment variables overrides change, or the AWS credentials need to be refreshed.
 
         :param samcli.commands.local.lib.provider.Function function: Lambda function to generate the configuration for
         :return samcli.local.lambdafn.config.FunctionConfig: Function configuration to pass to Lambda runtime
         """
+        with self._function_configs_lock:
+            cached = self._function_configs.get(function.full_path)
+
+        if cached and self._is_cached_config_valid(cached, function):
+            return cached.config
+
+        config = self._make_invoke_config(function)
+        with self._function_configs_lock:
+            self._function_configs[function.full_path] = _CachedFunctionConfig(
+                function, self.env_vars_values, self._boto3_session_creds, config
+            )
+        return config
+
+    def _is_cached_config_valid(self, cached: _CachedFunctionConfig, function: Function) -> bool:
+        # Functions are loaded again when the template changes, compare them only if they are not the same object
+        if cached.function is not function and cached.function != function:
+            LOG.debug("Definition of function %s is changed, generating its invoke configuration", function.full_path)
+            return False
+
+        if cached.env_vars_values is not self.env_vars_values:
+            LOG.debug("Environment variables overrides are changed, generating invoke configuration")
+            return False
+
+        # Temporary credentials are refreshed when they are read, generate the configuration again to read them
+        if isinstance(cached.credentials, RefreshableCredentials) and cached.credentials.refresh_needed():
+            LOG.debug("AWS credentials need to be refreshed, generating invoke configuration")
+            return False
+
+        return True
 
-        env_vars = self._make_env_vars(function)
+    def _make_invoke_config(self, function: Function) -> FunctionConfig:
+        with invocation_phase(ENV_VARS_PHASE):
+            env_vars = self._make_env_vars(function)
         code_abs_path = None
         if function.packagetype == ZIP:
             code_abs_path = resolve_code_path(self.cwd, function.codeuri)
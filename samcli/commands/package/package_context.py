@@ -17,7 +17,7 @@ Logic for uploading to s3 based on supplied template file and s3 bucket
 import json
 import logging
 import os
-from typing import Optional
+from typing import Dict, IO, Optional
 
 import boto3
 import click
@@ -135,9 +135,9 @@ class PackageContext:
         self.code_signer = CodeSigner(code_signer_client, self.signing_profiles)
 
         try:
-            exported_str = self._export(self.template_file, self.use_json)
+            exported_template = self._export(self.template_file)
 
-            self.write_output(self.output_template_file, exported_str)
+            self.write_output(self.output_template_file, exported_template, self.use_json)
 
             if self.output_template_file and not self.on_deploy:
                 msg = self.MSG_PACKAGED_TEMPLATE_WRITTEN.format(
@@ -148,7 +148,7 @@ class PackageContext:
         except OSError as ex:
             raise PackageFailedError(template_file=self.template_file, ex=str(ex)) from ex
 
-    def _export(self, template_path, use_json):
+    def _export(self, template_path) -> Dict:
         template = Template(
             template_path,
             os.getcwd(),
@@ -157,20 +157,26 @@ class PackageContext:
             normalize_template=True,
             normalize_parameters=True,
         )
-        exported_template = template.export()
-
-        if use_json:
-            exported_str = json.dumps(exported_template, indent=4, ensure_ascii=False)
-        else:
-            exported_str = yaml_dump(exported_template)
-
-        return exported_str
+        return template.export()
 
     @staticmethod
-    def write_output(output_file_name: Optional[str], data: str) -> None:
+    def write_output(output_file_name: Optional[str], exported_template: Dict, use_json: bool) -> None:
+        """
+        Write the exported template to the output file, or to stdout if no output file is given.
+        The template is written to the file as it is serialized, without building the whole document in memory.
+        """
         if output_file_name is None:
-            click.echo(data)
+            click.echo(PackageContext._dump_template(exported_template, use_json))
             return
 
         with open(output_file_name, "w") as fp:
-            fp.write(data)
+            PackageContext._dump_template(exported_template, use_json, fp)
+
+    @staticmethod
+    def _dump_template(exported_template: Dict, use_json: bool, stream: Optional[IO[str]] = None) -> Optional[str]:
+        if use_json:
+            if stream is None:
+                return json.dumps(exported_template, indent=4, ensure_ascii=False)
+            json.dump(exported_template, stream, indent=4, ensure_ascii=False)
+            return None
+        return yaml_dump(exported_template, stream)
@@ -6,7 +6,10 @@ import io
 import json
 import logging
 import pathlib
-from typing import List, Optional, Dict, cast, Union, NamedTuple, Set
+import platform
+import tarfile
+from contextlib import nullcontext
+from typing import ContextManager, Iterator, List, Optional, Dict, cast, Union, NamedTuple, Set
 
 import docker
 import docker.errors
@@ -41,7 +44,8 @@ from samcli.lib.utils import osutils
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 from samcli.lib.utils.stream_writer import StreamWriter
 from samcli.local.docker.lambda_build_container import LambdaBuildContainer
-from samcli.local.docker.utils import is_docker_reachable, get_docker_platform
+from samcli.lib.utils.tar import stream_tarball
+from samcli.local.docker.utils import is_docker_reachable, get_docker_platform, get_docker_context_paths
 from samcli.local.docker.manager import ContainerManager
 from samcli.commands._utils.experimental import get_enabled_experimental_flags
 from samcli.lib.build.exceptions import (
@@ -407,7 +411,6 @@ class ApplicationBuilder:
             LOG.info("Setting DockerBuildArgs: %s for %s function", docker_build_args, function_name)
 
         build_args = {
-            "path": str(docker_context_dir),
             "dockerfile": dockerfile,
             "tag": docker_tag,
             "buildargs": docker_build_args,
@@ -417,18 +420,34 @@ class ApplicationBuilder:
         if docker_build_target:
             build_args["target"] = cast(str, docker_build_target)
 
-        build_logs = self._docker_client.api.build(**build_args)
-
-        # The Docker-py low level api will stream logs back but if an exception is raised by the api
-        # this is raised when accessing the generator. So we need to wrap accessing build_logs in a try: except.
-        try:
-            self._stream_lambda_image_build_logs(build_logs, function_name)
-        except docker.errors.APIError as e:
-            if e.is_server_error and "Cannot locate specified Dockerfile" in e.explanation:
-                raise DockerfileOutSideOfContext(e.explanation) from e
+        docker_context_paths = get_docker_context_paths(str(docker_context_dir), dockerfile)
+        if docker_context_paths is None:
+            # Docker client adds a Dockerfile outside of the context to the context itself
+            build_args["path"] = str(docker_context_dir)
+            context_stream: ContextManager[Optional[Iterator[bytes]]] = nullcontext()
+        else:
+            context_paths, build_args["dockerfile"] = docker_context_paths
+            # Stream the context to Docker while it is archived, instead of archiving it into a temporary file first.
+            # Like the Docker client, make the files executable on Windows, which doesn't have unix like permission bits
+            tar_filter = _set_windows_item_permission if platform.system().lower() == "windows" else None
+            context_stream = stream_tarball(context_paths, tar_filter=tar_filter, recursive=False)
+
+        with context_stream as context:
+            if context is not None:
+                build_args["fileobj"] = context
+                build_args["custom_context"] = True
+            build_logs = self._docker_client.api.build(**build_args)
+
+            # The Docker-py low level api will stream logs back but if an exception is raised by the api
+            # this is raised when accessing the generator. So we need to wrap accessing build_logs in a try: except.
+            try:
+                self._stream_lambda_image_build_logs(build_logs, function_name)
+            except docker.errors.APIError as e:
+                if e.is_server_error and "Cannot locate specified Dockerfile" in e.explanation:
+                    raise DockerfileOutSideOfContext(e.explanation) from e
 
-            # Not sure what else can be raise that we should be catching but re-raising for now
-            raise
+                # Not sure what else can be raise that we should be catching but re-raising for now
+                raise
 
         return docker_tag
 
@@ -945,3 +964,8 @@ class ApplicationBuilder:
             result.update(inline_specific_result)
 
         return result
+
+
+def _set_windows_item_permission(tar_info: tarfile.TarInfo) -> tarfile.TarInfo:
+    tar_info.mode = tar_info.mode & 0o755 | 0o111
+    return tar_info
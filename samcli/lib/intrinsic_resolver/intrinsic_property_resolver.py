@@ -1,7 +1,6 @@
 """
 Process and simplifies CloudFormation intrinsic properties such as FN::* and Ref
 """
-import copy
 import logging
 
 import base64
@@ -20,7 +19,9 @@ from samcli.lib.intrinsic_resolver.invalid_intrinsic_validation import (
     verify_all_list_intrinsic_type,
 )
 from samcli.lib.intrinsic_resolver.invalid_intrinsic_exception import InvalidIntrinsicException, InvalidSymbolException
+from samcli.lib.intrinsic_resolver.resolution_helpers import ResolvedIntrinsicCache, resolve_properties
 from samcli.commands._utils.template import get_template_data
+from samcli.lib.providers.template_cache import copy_template
 
 LOG = logging.getLogger(__name__)
 
@@ -80,6 +81,8 @@ class IntrinsicResolver:
         self._parameters = None
         self._conditions = None
         self._outputs = None
+        # Results of the intrinsic functions resolved so far, see _resolve_intrinsic_function
+        self._resolved_intrinsics = ResolvedIntrinsicCache()
         self.init_template(template)
 
         self._symbol_resolver = symbol_resolver
@@ -88,7 +91,8 @@ class IntrinsicResolver:
         self.conditional_key_function_map = self.default_conditional_key_map()
 
     def init_template(self, template):
-        self._template = copy.deepcopy(template or {})
+        self._resolved_intrinsics.clear()
+        self._template = copy_template(template or {})
         self._resources = self._template.get("Resources", {})
         self._mapping = self._template.get("Mappings", {})
         self._parameters = self._template.get("Parameters", {})
@@ -149,6 +153,7 @@ class IntrinsicResolver:
 
         """
         self.intrinsic_key_function_map = function_map
+        self._resolved_intrinsics.clear()
 
     def set_conditional_function_map(self, function_map):
         """
@@ -162,6 +167,7 @@ class IntrinsicResolver:
 
         """
         self.conditional_key_function_map = function_map
+        self._resolved_intrinsics.clear()
 
     def intrinsic_property_resolver(self, intrinsic, ignore_errors, parent_function="template"):
         """
@@ -193,48 +199,88 @@ class IntrinsicResolver:
         """
         if intrinsic is None:
             raise InvalidIntrinsicException("Missing Intrinsic property in {}".format(parent_function))
-        if isinstance(intrinsic, list):
-            return [self.intrinsic_property_resolver(item, ignore_errors) for item in intrinsic]
-        if not isinstance(intrinsic, dict) or intrinsic == {}:
+        if not isinstance(intrinsic, (dict, list)) or intrinsic == {}:
             return intrinsic
 
-        # `intrinsic` is a dict at this point.
+        if isinstance(intrinsic, dict):
+            key = next(iter(intrinsic))
+            if key in self.intrinsic_key_function_map or key in self.conditional_key_function_map:
+                return self._resolve_intrinsic_function(key, intrinsic.get(key), ignore_errors)
 
-        keys = list(intrinsic.keys())
-        key = keys[0]
+        # In this case, it is a list or a dictionary that doesn't directly contain an intrinsic resolver, we must
+        # resolve each of it's sub properties.
+        return self._resolve_properties(intrinsic, ignore_errors, parent_function)
 
-        if key in self.intrinsic_key_function_map:
-            intrinsic_value = intrinsic.get(key)
-            return self.intrinsic_key_function_map.get(key)(intrinsic_value, ignore_errors)
+    def _resolve_intrinsic_function(self, key, intrinsic_value, ignore_errors):
+        """
+        Resolve an intrinsic function with its resolver from intrinsic_key_function_map or
+        conditional_key_function_map. The results are memoized in _resolved_intrinsics, since the template and the
+        symbol resolver don't change while the template is resolved.
 
-        if key in self.conditional_key_function_map:
-            intrinsic_value = intrinsic.get(key)
-            return self.conditional_key_function_map.get(key)(intrinsic_value, ignore_errors)
+        Parameters
+        ----------
+        key : str
+            Intrinsic function key, ex: Fn::Sub
+        intrinsic_value : dict, str, list, bool, int
+            The value of the intrinsic function
+        ignore_errors : bool
+            Whether to ignore errors
 
-        # In this case, it is a dictionary that doesn't directly contain an intrinsic resolver, we must recursively
-        # resolve each of it's sub properties.
-        sanitized_dict = {}
-        for key, val in intrinsic.items():
-            try:
-                sanitized_key = self.intrinsic_property_resolver(key, ignore_errors, parent_function=parent_function)
-                sanitized_val = self.intrinsic_property_resolver(val, ignore_errors, parent_function=parent_function)
-                verify_intrinsic_type_str(
-                    sanitized_key,
-                    message="The keys of the dictionary {} in {} must all resolve to a string".format(
-                        sanitized_key, parent_function
-                    ),
-                )
-                sanitized_dict[sanitized_key] = sanitized_val
-            # On any exception, leave the key:val of the orginal intact and continue on.
-            # https://github.com/awslabs/aws-sam-cli/issues/1386
-            except Exception:
-                if ignore_errors:
-                    LOG.debug("Unable to resolve property %s: %s. Leaving as is.", key, val)
-                    sanitized_dict[key] = val
-                else:
-                    raise
+        Return
+        ---------
+        The resolved value of the intrinsic function
+        """
+        function_map = (
+            self.intrinsic_key_function_map
+            if key in self.intrinsic_key_function_map
+            else self.conditional_key_function_map
+        )
+        return self._resolved_intrinsics.resolve(key, intrinsic_value, ignore_errors, function_map.get(key))
+
+    def _resolve_properties(self, properties, ignore_errors, parent_function):
+        """
+        Resolve all the values of a list or a dictionary that is not an intrinsic function itself.
+        See resolution_helpers.resolve_properties.
 
-        return sanitized_dict
+        Parameters
+        ----------
+        properties : dict, list
+            A list or a dictionary without an intrinsic function key
+        ignore_errors : bool
+            Whether to ignore errors
+        parent_function : str
+            In case there is a missing property, this is used to figure out where the property resolved is missing.
+
+        Return
+        ---------
+        A new list or dictionary with the resolved values
+        """
+
+        def resolve_key(key):
+            sanitized_key = self.intrinsic_property_resolver(key, ignore_errors, parent_function=parent_function)
+            verify_intrinsic_type_str(
+                sanitized_key,
+                message="The keys of the dictionary {} in {} must all resolve to a string".format(
+                    sanitized_key, parent_function
+                ),
+            )
+            return sanitized_key
+
+        def resolve_value(value):
+            return self.intrinsic_property_resolver(value, ignore_errors, parent_function=parent_function)
+
+        return resolve_properties(properties, resolve_key, resolve_value, self._is_nested_properties, ignore_errors)
+
+    def _is_nested_properties(self, value):
+        """
+        Whether the value is a list or a dictionary that is walked by _resolve_properties
+        """
+        if isinstance(value, list):
+            return True
+        if not isinstance(value, dict) or value == {}:
+            return False
+        key = next(iter(value))
+        return key not in self.intrinsic_key_function_map and key not in self.conditional_key_function_map
 
     def resolve_template(self, ignore_errors=False):
         """
@@ -9,6 +9,10 @@ from samcli.lib.intrinsic_resolver.invalid_intrinsic_exception import InvalidSym
 
 LOG = logging.getLogger(__name__)
 
+# Returned by IntrinsicsSymbolTable._resolve_default_symbol when no resolver handles the symbol, since the resolvers
+# can return None
+_NOT_RESOLVED = object()
+
 
 class IntrinsicsSymbolTable:
     AWS_ACCOUNT_ID = "AWS::AccountId"
@@ -143,6 +147,11 @@ class IntrinsicsSymbolTable:
         self.common_attribute_resolver = common_attribute_resolver or self.get_default_attribute_resolver()
         self.default_pseudo_resolver = self.get_default_pseudo_resolver()
 
+        # Cache of the string symbols resolved from the parameters, default_type_resolver and
+        # common_attribute_resolver, keyed by (logical_id, resource_attribute). ARNs are resolved for every Fn::GetAtt
+        # and Fn::Sub, so they are computed once per symbol. The logical_id_translator is still checked first.
+        self._resolved_symbols = {}
+
     def get_default_pseudo_resolver(self):
         return {
             IntrinsicsSymbolTable.AWS_ACCOUNT_ID: self.handle_pseudo_account_id,
@@ -208,6 +217,41 @@ class IntrinsicsSymbolTable:
             self.logical_id_translator[logical_id] = translated
             return translated
 
+        cache_key = (logical_id, resource_attribute)
+        translated = self._resolved_symbols.get(cache_key)
+        if translated is not None:
+            return translated
+
+        translated = self._resolve_default_symbol(logical_id, resource_attribute)
+        if translated is not _NOT_RESOLVED:
+            # Only strings are cached, other values might be changed by the caller
+            if isinstance(translated, str):
+                self._resolved_symbols[cache_key] = translated
+            return translated
+
+        if ignore_errors:
+            return "${}".format(logical_id + "." + resource_attribute)
+        raise InvalidSymbolException(
+            "The {} is not supported in the logical_id_translator, default_type_resolver, or the attribute_resolver."
+            " It is also not a supported pseudo function".format(logical_id + "." + resource_attribute)
+        )
+
+    def _resolve_default_symbol(self, logical_id, resource_attribute):
+        """
+        Resolves the symbol from the parameter defaults, then the default_type_resolver, and then the
+        common_attribute_resolver.
+
+        Parameters
+        -----------
+        logical_id: str
+            The logical id of the resource in question or a pseudo type.
+        resource_attribute: str
+            The resource attribute of the resource in question or Ref for psuedo types.
+
+        Return
+        -------
+        The resolved attribute, _NOT_RESOLVED if none of them can resolve it
+        """
         # Handle Default Parameters
         translated = self._parameters.get(logical_id, {}).get("Default")
         if translated is not None:
@@ -228,12 +272,7 @@ class IntrinsicsSymbolTable:
                 return attribute_resolver(logical_id)
             return attribute_resolver
 
-        if ignore_errors:
-            return "${}".format(logical_id + "." + resource_attribute)
-        raise InvalidSymbolException(
-            "The {} is not supported in the logical_id_translator, default_type_resolver, or the attribute_resolver."
-            " It is also not a supported pseudo function".format(logical_id + "." + resource_attribute)
-        )
+        return _NOT_RESOLVED
 
     def arn_resolver(self, logical_id, service_name="lambda"):
         """
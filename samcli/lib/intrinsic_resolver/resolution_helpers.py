@@ -0,0 +1,174 @@
+"""
+Helpers of IntrinsicResolver for large templates: memoization of resolved intrinsic functions, and an iterative
+walk over the properties of a template
+"""
+import json
+import logging
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from samcli.lib.providers.template_cache import copy_template
+
+LOG = logging.getLogger(__name__)
+
+
+class ResolvedIntrinsicCache:
+    """
+    Results of the intrinsic functions resolved for a template, keyed by the content of the intrinsic function.
+
+    The same intrinsic functions are usually repeated across the resources of a template, like the Fn::GetAtt
+    of a shared role, or the Fn::Sub of an asset bucket in CDK synthesized templates. The results are only valid
+    while the template and the resolvers of the intrinsic functions don't change, the cache must be cleared
+    when they do.
+    """
+
+    _results: Dict[str, Any]
+
+    def __init__(self) -> None:
+        self._results = {}
+
+    def clear(self) -> None:
+        """Remove all results"""
+        self._results = {}
+
+    def resolve(
+        self, key: str, intrinsic_value: Any, ignore_errors: bool, resolve_function: Callable[[Any, bool], Any]
+    ) -> Any:
+        """
+        Return the result of an intrinsic function, resolving it if it is not in the cache.
+        Failures are not cached, they are raised again on each call.
+
+        Parameters
+        ----------
+        key : str
+            Intrinsic function key, ex: Fn::Sub
+        intrinsic_value : Any
+            The value of the intrinsic function
+        ignore_errors : bool
+            Whether to ignore errors
+        resolve_function : Callable[[Any, bool], Any]
+            Resolver of the intrinsic function, called with the intrinsic value and ignore_errors
+
+        Returns
+        -------
+        Any
+            The resolved value of the intrinsic function, which the caller can change
+        """
+        try:
+            cache_key: Optional[str] = json.dumps([key, intrinsic_value, ignore_errors])
+        except (TypeError, ValueError):
+            # Not a JSON like value, resolve it without memoization
+            cache_key = None
+
+        if cache_key is not None and cache_key in self._results:
+            return copy_template(self._results[cache_key])
+
+        result = resolve_function(intrinsic_value, ignore_errors)
+        if cache_key is not None:
+            # Store a copy, the caller might change the returned value
+            self._results[cache_key] = copy_template(result)
+        return result
+
+
+class PropertiesFrame:
+    """
+    A list or a dictionary that is being resolved by resolve_properties
+    """
+
+    is_dict: bool
+    entries: Iterator[Tuple[Any, Any]]
+    result: Union[Dict, List]
+
+    def __init__(self, properties: Union[Dict, List]):
+        self.is_dict = isinstance(properties, dict)
+        if isinstance(properties, dict):
+            self.entries = iter(properties.items())
+            self.result = {}
+        else:
+            self.entries = ((None, item) for item in properties)
+            self.result = []
+        # The original key and value of the dictionary entry being resolved, and the resolved key
+        self.current_key: Any = None
+        self.current_val: Any = None
+        self.sanitized_key: Any = None
+
+    def set_current_entry(self, key: Any, val: Any) -> None:
+        self.current_key = key
+        self.current_val = val
+        self.sanitized_key = None
+
+    def add(self, value: Any) -> None:
+        if isinstance(self.result, dict):
+            self.result[self.sanitized_key] = value
+        else:
+            self.result.append(value)
+
+
+def resolve_properties(
+    properties: Union[Dict, List],
+    resolve_key: Callable[[Any], Any],
+    resolve_value: Callable[[Any], Any],
+    is_nested: Callable[[Any], bool],
+    ignore_errors: bool,
+) -> Union[Dict, List]:
+    """
+    Resolve all the values of a list or a dictionary that is not an intrinsic function itself.
+
+    Nested lists and dictionaries are walked with an explicit stack instead of recursion, so that deeply nested
+    templates don't hit the recursion limit. If a value of a dictionary can't be resolved and errors are ignored,
+    the original value is kept as is.
+
+    Parameters
+    ----------
+    properties : Union[Dict, List]
+        A list or a dictionary without an intrinsic function key
+    resolve_key : Callable[[Any], Any]
+        Resolves a dictionary key that is not a string, and verifies that it resolves to a string.
+        String keys resolve to themselves, so they are not passed to it.
+    resolve_value : Callable[[Any], Any]
+        Resolves a value that is not walked
+    is_nested : Callable[[Any], bool]
+        Whether a value is a list or a dictionary that is walked instead of being resolved with resolve_value
+    ignore_errors : bool
+        Whether to ignore errors
+
+    Returns
+    -------
+    Union[Dict, List]
+        A new list or dictionary with the resolved values
+    """
+    root = PropertiesFrame(properties)
+    frames = [root]
+    while frames:
+        frame = frames[-1]
+        entry = next(frame.entries, None)
+        if entry is None:
+            frames.pop()
+            if frames:
+                frames[-1].add(frame.result)
+            continue
+
+        key, val = entry
+        try:
+            if frame.is_dict:
+                frame.set_current_entry(key, val)
+                frame.sanitized_key = key if isinstance(key, str) else resolve_key(key)
+
+            if is_nested(val):
+                frames.append(PropertiesFrame(val))
+            else:
+                frame.add(resolve_value(val))
+        # On any exception, leave the key:val of the orginal intact and continue on.
+        # https://github.com/awslabs/aws-sam-cli/issues/1386
+        except Exception:
+            # Lists don't handle errors, the nearest dictionary leaves its current value as is
+            while not frames[-1].is_dict:
+                frames.pop()
+                if not frames:
+                    raise
+            if not ignore_errors:
+                raise
+            frame = frames[-1]
+            LOG.debug("Unable to resolve property %s: %s. Leaving as is.", frame.current_key, frame.current_val)
+            frame.result[frame.current_key] = frame.current_val
+
+    return root.result
@@ -91,10 +91,8 @@ class CloudFormationStackResource(ResourceZip):
             parent_stack_id=resource_id,
         ).export()
 
-        exported_template_str = yaml_dump(exported_template_dict)
-
         with mktempfile() as temporary_file:
-            temporary_file.write(exported_template_str)
+            yaml_dump(exported_template_dict, temporary_file)
             temporary_file.flush()
             remote_path = get_uploaded_s3_object_name(file_path=temporary_file.name, extension="template")
             url = self.uploader.upload(temporary_file.name, remote_path)
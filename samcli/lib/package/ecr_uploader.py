@@ -19,6 +19,7 @@ from samcli.commands.package.exceptions import (
     DeleteArtifactFailedError,
 )
 from samcli.lib.docker.log_streamer import LogStreamer, LogStreamError
+from samcli.lib.package.ecr_utils import is_ecr_url
 from samcli.lib.package.image_utils import tag_translation
 from samcli.lib.utils.osutils import stderr
 from samcli.lib.utils.stream_writer import StreamWriter
@@ -34,7 +35,15 @@ class ECRUploader:
     """
 
     def __init__(
-        self, docker_client, ecr_client, ecr_repo, ecr_repo_multi, no_progressbar=False, tag="latest", stream=stderr()
+        self,
+        docker_client,
+        ecr_client,
+        ecr_repo,
+        ecr_repo_multi,
+        no_progressbar=False,
+        tag="latest",
+        stream=stderr(),
+        skip_existing_images=False,
     ):
         self.docker_client = docker_client if docker_client else docker.from_env()
         self.ecr_client = ecr_client
@@ -46,6 +55,7 @@ class ECRUploader:
         self.stream = StreamWriter(stream=stream, auto_flush=True)
         self.log_streamer = LogStreamer(stream=self.stream)
         self.login_session_active = False
+        self.skip_existing_images = skip_existing_images
 
     def login(self):
         """
@@ -72,9 +82,6 @@ class ECRUploader:
         :param resource_name: logical ID of the resource to be uploaded to ECR.
         :return: remote ECR image path that has been uploaded.
         """
-        if not self.login_session_active:
-            self.login()
-            self.login_session_active = True
         try:
             docker_img = self.docker_client.images.get(image)
 
@@ -85,6 +92,15 @@ class ECRUploader:
                 else self.ecr_repo_multi.get(resource_name)
             )
 
+            # Generated tags contain the image ID, an existing tag means the same image is already pushed
+            if self.skip_existing_images and self._is_image_in_repository(repository, _tag):
+                LOG.debug("Image %s:%s already exists in the repository, skipping push", repository, _tag)
+                return f"{repository}:{_tag}"
+
+            if not self.login_session_active:
+                self.login()
+                self.login_session_active = True
+
             docker_img.tag(repository=repository, tag=_tag)
             push_logs = self.docker_client.api.push(
                 repository=repository, tag=_tag, auth_config=self.auth_config, stream=True, decode=True
@@ -102,6 +118,27 @@ class ECRUploader:
 
         return f"{repository}:{_tag}"
 
+    def _is_image_in_repository(self, repository: str, tag: str) -> bool:
+        """
+        Checks with DescribeImages whether an image with the given tag has already been pushed to the repository.
+        :param repository: ECR repository URI
+        :param tag: tag of the image
+        :return: True if the image exists in the repository, False otherwise.
+        """
+        image_uri = f"{repository}:{tag}"
+        if not is_ecr_url(image_uri):
+            return False
+
+        repository_name = repository.split("/", 1)[1]
+        try:
+            response = self.ecr_client.describe_images(repositoryName=repository_name, imageIds=[{"imageTag": tag}])
+        except botocore.exceptions.ClientError as ex:
+            # ImageNotFoundException or any other error means that the image needs to be pushed
+            LOG.debug("Could not find image %s in the repository: %s", image_uri, str(ex))
+            return False
+
+        return bool(response.get("imageDetails"))
+
     def delete_artifact(self, image_uri: str, resource_id: str, property_name: str):
         """
         Delete the given ECR image by extracting the repository and image_tag from
@@ -24,6 +24,13 @@ class RemoteStackLocationNotSupported(Exception):
     pass
 
 
+class CircularStackReference(Exception):
+    """Exception when a nested stack has itself as a descendant"""
+
+    def __init__(self, stack_path: str, location: str) -> None:
+        super().__init__(f"Nested stack {stack_path} references its own template {location} in its descendants.")
+
+
 class MissingCodeUri(Exception):
     """Exception when Function or Lambda resources do not have CodeUri specified"""
 
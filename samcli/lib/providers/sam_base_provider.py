@@ -3,8 +3,14 @@ Base class for SAM Template providers
 """
 
 import logging
+import os
+import sys
 
 from typing import Any, Dict, Optional, cast, Iterable, Union
+
+from samtranslator import __version__ as samtranslator_version
+
+from samcli import __version__ as samcli_version
 from samcli.lib.utils.resources import (
     AWS_LAMBDA_FUNCTION,
     AWS_SERVERLESS_FUNCTION,
@@ -17,6 +23,7 @@ from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymb
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer
 from samcli.lib.samlib.wrapper import SamTranslatorWrapper
 from samcli.lib.package.ecr_utils import is_ecr_url
+from samcli.lib.providers.template_cache import TemplateCache, get_disk_cache_root, get_template_cache_key
 
 
 LOG = logging.getLogger(__name__)
@@ -41,6 +48,13 @@ class SamBaseProvider:
         AWS_SERVERLESS_FUNCTION: "ImageUri",
     }
 
+    # Processed templates shared by all providers, so that each template is only translated and resolved once.
+    # They are also stored in the .aws-sam folder of the project, so that following invocations can reuse them.
+    _template_cache = TemplateCache()
+
+    # Everything other than the template itself that changes the result of processing a template
+    _TEMPLATE_CACHE_VERSIONS = [samcli_version, samtranslator_version, sys.version_info[:2]]
+
     def get(self, name: str) -> Optional[Any]:
         """
         Given name of the function, this method must return the Function object
@@ -165,7 +179,9 @@ class SamBaseProvider:
         return resource_properties.get(code_property_key, None)
 
     @staticmethod
-    def get_template(template_dict: Dict, parameter_overrides: Optional[Dict[str, str]] = None) -> Dict:
+    def get_template(
+        template_dict: Dict, parameter_overrides: Optional[Dict[str, str]] = None, template_file: Optional[str] = None
+    ) -> Dict:
         """
         Given a SAM template dictionary, return a cleaned copy of the template where SAM plugins have been run
         and parameter values have been substituted.
@@ -178,12 +194,29 @@ class SamBaseProvider:
         parameter_overrides: dict
             Optional dictionary of values for template parameters
 
+        template_file: str
+            Optional path of the template file, the processed template is stored in the .aws-sam folder
+            of its project if it is given
+
         Returns
         -------
         dict
             Processed SAM template
         """
         template_dict = template_dict or {}
+        return SamBaseProvider._template_cache.get_or_process(
+            get_template_cache_key(
+                template_dict, parameter_overrides, SamBaseProvider._TEMPLATE_CACHE_VERSIONS, os.getenv("AWS_REGION")
+            ),
+            lambda: SamBaseProvider._process_template(template_dict, parameter_overrides),
+            get_disk_cache_root(template_file),
+        )
+
+    @staticmethod
+    def _process_template(template_dict: Dict, parameter_overrides: Optional[Dict[str, str]] = None) -> Dict:
+        """
+        Run SAM plugins on the template and substitute parameter values, without using the template cache
+        """
         parameters_values = SamBaseProvider._get_parameter_values(template_dict, parameter_overrides)
         if template_dict:
             template_dict = SamTranslatorWrapper(template_dict, parameter_values=parameters_values).run_plugins()
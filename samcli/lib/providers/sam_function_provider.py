@@ -2,7 +2,9 @@
 Class that provides functions from a given SAM template
 """
 import logging
-from typing import Dict, List, Optional, cast, Iterator, Any
+import os
+import threading
+from typing import Dict, List, Optional, Set, Tuple, cast, Iterator, Any
 
 from samtranslator.policy_template_processor.exceptions import TemplateNotFoundException
 
@@ -53,7 +55,9 @@ class SamFunctionProvider(SamBaseProvider):
         :param bool ignore_code_extraction_warnings: Ignores Log warnings
         """
 
-        self._stacks = stacks
+        self._set_stacks(stacks)
+        # Index of the functions by id, name and function name, together with the functions dict it was built from
+        self._function_index: Optional[Tuple[Dict[str, Function], Dict[str, List[Function]]]] = None
 
         for stack in stacks:
             LOG.debug("%d resources found in the stack %s", len(stack.resources), stack.stack_path)
@@ -65,6 +69,40 @@ class SamFunctionProvider(SamBaseProvider):
 
         self._colored = Colored()
 
+    @staticmethod
+    def _build_function_index(functions: Dict[str, Function]) -> Dict[str, List[Function]]:
+        """
+        Index functions by every identifier that get() accepts besides the full path, so that lookups
+        don't need to go through all the functions
+
+        :param dict functions: Map of function full_path to function information
+        :return dict: Map of function id, name and function name to the functions that have it, in the same
+            order as the given functions
+        """
+        function_index: Dict[str, List[Function]] = {}
+        for function in functions.values():
+            for key in {function.function_id, function.name, function.functionname}:
+                function_index.setdefault(key, []).append(function)
+        return function_index
+
+    def _get_function_index(self) -> Dict[str, List[Function]]:
+        """
+        Returns the index of the current functions, and rebuilds it if the functions got replaced since it was built
+        """
+        functions = self.functions
+        function_index = self._function_index
+        if function_index is None or function_index[0] is not functions:
+            function_index = (functions, SamFunctionProvider._build_function_index(functions))
+            self._function_index = function_index
+        return function_index[1]
+
+    def _set_stacks(self, stacks: List[Stack]) -> None:
+        self._stacks = stacks
+        # Only the first stack with a given stack path is used, same as the linear search that it replaces
+        self._stack_index: Dict[str, Stack] = {}
+        for stack in stacks:
+            self._stack_index.setdefault(stack.stack_path, stack)
+
     @property
     def stacks(self) -> List[Stack]:
         """
@@ -91,20 +129,12 @@ class SamFunctionProvider(SamBaseProvider):
         if not name:
             raise ValueError("Function name is required")
 
-        resolved_function = None
-
-        if name in self.functions:
-            # support lookup by full_path
-            resolved_function = self.functions.get(name)
+        # support lookup by full_path
+        resolved_function = self.functions.get(name)
 
         if not resolved_function:
-            # If function is not found by full path, search through all functions
-
-            found_fs = []
-
-            for f in self.get_all():
-                if name in (f.function_id, f.name, f.functionname):
-                    found_fs.append(f)
+            # If function is not found by full path, look it up by its function id, name or function name
+            found_fs = list(self._get_function_index().get(name, []))
 
             # If multiple functions are found, only return one of them
             if len(found_fs) > 1:
@@ -543,10 +573,10 @@ class SamFunctionProvider(SamBaseProvider):
         )
 
     def get_resources_by_stack_path(self, stack_path: str) -> Dict:
-        candidates = [stack.resources for stack in self._stacks if stack.stack_path == stack_path]
-        if not candidates:
+        stack = self._stack_index.get(stack_path)
+        if stack is None:
             raise RuntimeError(f"Cannot find resources with stack_path = {stack_path}")
-        return candidates[0]
+        return stack.resources
 
     @staticmethod
     def _metadata_has_necessary_entries_for_image_function_to_be_built(metadata: Optional[Dict[str, Any]]) -> bool:
@@ -612,6 +642,9 @@ class RefreshableSamFunctionProvider(SamFunctionProvider):
                 self.parent_templates_paths.append(stack.location)
 
         self.is_changed = False
+        # Template paths that got changed since the last refresh, updated from the file observer thread
+        self._changed_templates: Set[str] = set()
+        self._changed_templates_lock = threading.Lock()
         self._observer = FileObserver(self._set_templates_changed)
         self._observer.start()
         self._watch_stack_templates(stacks)
@@ -676,9 +709,12 @@ class RefreshableSamFunctionProvider(SamFunctionProvider):
             "A change got detected in the templates %s. Mark templates as changed to be reloaded in the next invoke",
             ", ".join(paths),
         )
-        self.is_changed = True
-        for stack in self._stacks:
-            self._observer.unwatch(stack.location)
+        with self._changed_templates_lock:
+            self._changed_templates.update(paths)
+            self.is_changed = True
+        # Keep watching the other templates, they are not reloaded if only nested stack templates got changed
+        for path in paths:
+            self._observer.unwatch(path)
 
     def _watch_stack_templates(self, stacks: List[Stack]) -> None:
         """
@@ -689,10 +725,35 @@ class RefreshableSamFunctionProvider(SamFunctionProvider):
 
     def _refresh_loaded_functions(self) -> None:
         """
-        Reload the stacks, and lambda functions from template files.
+        Reload the stacks, and lambda functions from the changed template files.
+        If only nested stack templates got changed, only these stacks and their children stacks are reloaded,
+        and the functions of the other stacks are kept. Otherwise, all the stacks are reloaded.
+        """
+        with self._changed_templates_lock:
+            changed_templates = set(self._changed_templates)
+
+        old_stacks = self._stacks
+        changed_nested_stacks = self._get_changed_nested_stacks(changed_templates)
+        if changed_nested_stacks:
+            self._reload_nested_stacks(changed_nested_stacks)
+        else:
+            self._reload_all_stacks()
+
+        with self._changed_templates_lock:
+            self._changed_templates -= changed_templates
+            self.is_changed = bool(self._changed_templates)
+
+        current_locations = {stack.location for stack in self._stacks}
+        for location in {stack.location for stack in old_stacks} - current_locations - changed_templates:
+            self._observer.unwatch(location)
+        self._watch_stack_templates(self._stacks)
+
+    def _reload_all_stacks(self) -> None:
+        """
+        Reload all the stacks, and lambda functions from the root template files.
         """
         LOG.debug("A change got detected in one of the stack templates. Reload the lambda function resources")
-        self._stacks = []
+        stacks: List[Stack] = []
 
         for template_file in self.parent_templates_paths:
             try:
@@ -701,18 +762,112 @@ class RefreshableSamFunctionProvider(SamFunctionProvider):
                     parameter_overrides=self._parameter_overrides,
                     global_parameter_overrides=self._global_parameter_overrides,
                 )
-                self._stacks += template_stacks
+                stacks += template_stacks
             except (TemplateNotFoundException, TemplateFailedParsingException) as ex:
                 raise ex
 
-        self.is_changed = False
+        self._set_stacks(stacks)
         self.functions = self._extract_functions(
             self._stacks, self._use_raw_codeuri, self._ignore_code_extraction_warnings
         )
-        self._watch_stack_templates(self._stacks)
+
+    def _get_changed_nested_stacks(self, changed_templates: Set[str]) -> List[Stack]:
+        """
+        Find the nested stacks whose templates got changed. Stacks nested in another changed stack are not returned,
+        as they are reloaded together with their parent stack.
+
+        :param set changed_templates: Paths of the changed templates
+        :return list: Changed nested stacks, empty if a root stack template got changed, or if none of the changed
+            templates belongs to a loaded stack, which requires reloading all the stacks
+        """
+        changed_locations = {os.path.realpath(path) for path in changed_templates}
+        changed_stacks = [stack for stack in self._stacks if os.path.realpath(stack.location) in changed_locations]
+        if any(stack.is_root_stack for stack in changed_stacks):
+            return []
+
+        changed_stack_paths = [stack.stack_path for stack in changed_stacks]
+        return [
+            stack
+            for stack in changed_stacks
+            if not any(_is_nested_stack_path(stack.stack_path, stack_path) for stack_path in changed_stack_paths)
+        ]
+
+    def _reload_nested_stacks(self, changed_stacks: List[Stack]) -> None:
+        """
+        Reload the given nested stacks, and their children stacks from their templates. Only the functions of these
+        stacks are extracted again, the functions of the other stacks are kept as is.
+
+        :param list changed_stacks: Nested stacks to be reloaded, none of them is nested in another one
+        """
+        reloaded_stacks: Dict[str, List[Stack]] = {}
+        for stack in changed_stacks:
+            LOG.debug("Reload the nested stack %s from the changed template %s", stack.stack_path, stack.location)
+            reloaded_stacks[stack.stack_path], _ = SamLocalStackProvider.get_stacks(
+                stack.location,
+                stack.parent_stack_path,
+                stack.name,
+                parameter_overrides=stack.parameters,
+                global_parameter_overrides=self._global_parameter_overrides,
+                metadata=stack.metadata,
+            )
+
+        def is_reloaded(stack_path: str) -> bool:
+            return any(
+                stack_path == reloaded_stack_path or _is_nested_stack_path(stack_path, reloaded_stack_path)
+                for reloaded_stack_path in reloaded_stacks
+            )
+
+        # Replace the changed stacks and their children stacks in place, to keep the order of the stacks
+        stacks: List[Stack] = []
+        for stack in self._stacks:
+            if stack.stack_path in reloaded_stacks:
+                stacks += reloaded_stacks[stack.stack_path]
+            elif not is_reloaded(stack.stack_path):
+                stacks.append(stack)
+
+        reloaded_functions = self._extract_functions(
+            [stack for stacks_in_tree in reloaded_stacks.values() for stack in stacks_in_tree],
+            self._use_raw_codeuri,
+            self._ignore_code_extraction_warnings,
+        )
+        old_functions = {
+            full_path: function for full_path, function in self.functions.items() if is_reloaded(function.stack_path)
+        }
+        for full_path in old_functions.keys() - reloaded_functions.keys():
+            LOG.info("Lambda Function '%s' got removed from the stack template", full_path)
+        for full_path, function in reloaded_functions.items():
+            old_function = old_functions.get(full_path)
+            if old_function is None:
+                LOG.info("Lambda Function '%s' got added to the stack template", full_path)
+            elif old_function == function:
+                # Keep the same object for the unchanged functions
+                reloaded_functions[full_path] = old_function
+            else:
+                LOG.info("Lambda Function '%s' definition got changed in the stack template", full_path)
+
+        functions_per_stack: Dict[str, List[Function]] = {}
+        for function in self.functions.values():
+            if not is_reloaded(function.stack_path):
+                functions_per_stack.setdefault(function.stack_path, []).append(function)
+        for function in reloaded_functions.values():
+            functions_per_stack.setdefault(function.stack_path, []).append(function)
+
+        self._set_stacks(stacks)
+        self.functions = {
+            function.full_path: function
+            for stack in stacks
+            for function in functions_per_stack.get(stack.stack_path, [])
+        }
 
     def stop_observer(self) -> None:
         """
         Stop Observing.
         """
         self._observer.stop()
+
+
+def _is_nested_stack_path(stack_path: str, parent_stack_path: str) -> bool:
+    """
+    Check if the stack path belongs to a stack that is nested, directly or indirectly, in the parent stack
+    """
+    return stack_path.startswith(parent_stack_path + "/")
@@ -3,11 +3,12 @@ Class that provides all nested stacks from a given SAM template
 """
 import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, cast, List, Iterator, Tuple, Union
 from urllib.parse import unquote, urlparse
 
 from samcli.commands._utils.template import get_template_data
-from samcli.lib.providers.exceptions import RemoteStackLocationNotSupported
+from samcli.lib.providers.exceptions import CircularStackReference, RemoteStackLocationNotSupported
 from samcli.lib.providers.provider import Stack, get_full_path
 from samcli.lib.providers.sam_base_provider import SamBaseProvider
 from samcli.lib.utils.resources import AWS_CLOUDFORMATION_STACK, AWS_SERVERLESS_APPLICATION
@@ -51,6 +52,7 @@ class SamLocalStackProvider(SamBaseProvider):
         self._template_dict = self.get_template(
             template_dict,
             SamLocalStackProvider.merge_parameter_overrides(parameter_overrides, global_parameter_overrides),
+            template_file,
         )
         self._resources = self._template_dict.get("Resources", {})
         self._global_parameter_overrides = global_parameter_overrides
@@ -201,6 +203,7 @@ class SamLocalStackProvider(SamBaseProvider):
     ) -> Tuple[List[Stack], List[str]]:
         """
         Recursively extract stacks from a template file.
+        Sibling stacks are processed concurrently, the returned stacks are in depth first order.
 
         Parameters
         ----------
@@ -225,37 +228,85 @@ class SamLocalStackProvider(SamBaseProvider):
             The list of stacks extracted from template_file
         remote_stack_full_paths : List[str]
             The list of full paths of detected remote stacks
+
+        Raises
+        ------
+        CircularStackReference
+            If a stack is nested in itself
         """
-        template_dict = get_template_data(template_file)
-        stacks = [
-            Stack(
-                stack_path,
-                name,
-                template_file,
-                SamLocalStackProvider.merge_parameter_overrides(parameter_overrides, global_parameter_overrides),
-                template_dict,
-                metadata,
+        root_stack = Stack(
+            stack_path,
+            name,
+            template_file,
+            SamLocalStackProvider.merge_parameter_overrides(parameter_overrides, global_parameter_overrides),
+            get_template_data(template_file),
+            metadata,
+        )
+        with ThreadPoolExecutor() as executor:
+            root_future = executor.submit(
+                SamLocalStackProvider._extract_child_stacks, executor, root_stack, global_parameter_overrides, ()
             )
-        ]
-        remote_stack_full_paths: List[str] = []
+            return SamLocalStackProvider._collect_stacks(root_future)
+
+    @staticmethod
+    def _extract_child_stacks(
+        executor: ThreadPoolExecutor,
+        stack: Stack,
+        global_parameter_overrides: Optional[Dict],
+        ancestor_locations: Tuple[str, ...],
+    ) -> Tuple[Stack, List[str], List[Future]]:
+        """
+        Process a stack and submit the processing of its child stacks to the executor.
+        This never waits on other futures, so that it can't block the executor.
+
+        Returns
+        -------
+        stack: Stack
+            The processed stack
+        remote_stack_full_paths : List[str]
+            The list of full paths of detected remote stacks in the stack
+        child_futures: List[Future]
+            Futures of _extract_child_stacks for each child stack, in the order they appear in the template
+        """
+        location = os.path.realpath(stack.location)
+        if location in ancestor_locations:
+            raise CircularStackReference(stack.stack_path, stack.location)
 
         current = SamLocalStackProvider(
-            template_file, stack_path, template_dict, parameter_overrides, global_parameter_overrides
+            stack.location, stack.parent_stack_path, stack.template_dict, stack.parameters, global_parameter_overrides
         )
-        remote_stack_full_paths.extend(current.remote_stack_full_paths)
-
-        for child_stack in current.get_all():
-            stacks_in_child, remote_stack_full_paths_in_child = SamLocalStackProvider.get_stacks(
-                child_stack.location,
-                os.path.join(stack_path, stacks[0].stack_id),
-                child_stack.name,
-                child_stack.parameters,
+        child_futures = [
+            executor.submit(
+                SamLocalStackProvider._extract_child_stacks,
+                executor,
+                # child stacks returned from the provider already contain their template, don't read them again
+                Stack(
+                    os.path.join(stack.parent_stack_path, stack.stack_id),
+                    child_stack.name,
+                    child_stack.location,
+                    SamLocalStackProvider.merge_parameter_overrides(child_stack.parameters, global_parameter_overrides),
+                    child_stack.template_dict,
+                    child_stack.metadata,
+                ),
                 global_parameter_overrides,
-                child_stack.metadata,
+                ancestor_locations + (location,),
             )
+            for child_stack in current.get_all()
+        ]
+        return stack, current.remote_stack_full_paths, child_futures
+
+    @staticmethod
+    def _collect_stacks(stack_future: Future) -> Tuple[List[Stack], List[str]]:
+        """
+        Wait for the future of _extract_child_stacks and its descendants and flatten them in depth first order
+        """
+        stack, remote_stack_full_paths, child_futures = stack_future.result()
+        stacks = [stack]
+        remote_stack_full_paths = list(remote_stack_full_paths)
+        for child_future in child_futures:
+            stacks_in_child, remote_stack_full_paths_in_child = SamLocalStackProvider._collect_stacks(child_future)
             stacks.extend(stacks_in_child)
             remote_stack_full_paths.extend(remote_stack_full_paths_in_child)
-
         return stacks, remote_stack_full_paths
 
     @staticmethod
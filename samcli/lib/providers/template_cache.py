@@ -0,0 +1,263 @@
+"""
+Process wide cache of processed SAM templates
+"""
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, cast
+
+LOG = logging.getLogger(__name__)
+
+# Number of processed templates to keep in memory, least recently used ones are evicted first
+DEFAULT_MAX_SIZE = 128
+# Number of processed templates to keep on disk, least recently written ones are removed first
+DEFAULT_MAX_DISK_SIZE = 256
+# Folder of the project that processed templates are stored in, it is only used if it already exists
+AWS_SAM_DIR = ".aws-sam"
+# Processed templates are not stored in the build cache folder, since build removes everything in there
+# that is not a cached build folder
+TEMPLATE_CACHE_DIR = "template-cache"
+TEMPLATE_CACHE_FILE_SUFFIX = ".json"
+
+
+def get_template_cache_key(template_dict: Dict, parameter_overrides: Optional[Dict], *extra: Any) -> Optional[str]:
+    """
+    Compute the cache key of a template from its content and the values it is processed with.
+    The template path is not part of the key, since processing only depends on the content of the template.
+
+    Parameters
+    ----------
+    template_dict : Dict
+        Unprocessed template dictionary
+    parameter_overrides : Optional[Dict]
+        Parameter overrides that the template is processed with
+    extra : Any
+        Any other JSON serializable value that changes the result of processing
+
+    Returns
+    -------
+    Optional[str]
+        SHA256 hash of the inputs, None if the inputs cannot be serialized
+    """
+    try:
+        serialized = json.dumps([template_dict, parameter_overrides, extra], sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        LOG.debug("Unable to compute cache key for template, it will not be cached", exc_info=True)
+        return None
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def get_disk_cache_root(template_file: Optional[str]) -> Optional[str]:
+    """
+    Find the .aws-sam folder of the project that a template belongs to. Templates written by build are
+    in the .aws-sam folder already, other templates are expected to be next to it.
+
+    Parameters
+    ----------
+    template_file : Optional[str]
+        Path of the template file
+
+    Returns
+    -------
+    Optional[str]
+        Path of the .aws-sam folder, None if the template file is not known
+    """
+    if not template_file:
+        return None
+    template_dir = Path(template_file).resolve().parent
+    for folder in (template_dir, *template_dir.parents):
+        if folder.name == AWS_SAM_DIR:
+            return str(folder)
+    return str(template_dir.joinpath(AWS_SAM_DIR))
+
+
+def copy_template(value: Any) -> Any:
+    """
+    Deep copy a template dictionary. Plain dictionaries and lists are copied directly,
+    which is considerably faster than copy.deepcopy for the JSON like structure of templates.
+
+    Parameters
+    ----------
+    value : Any
+        Template or part of a template
+
+    Returns
+    -------
+    Any
+        Copy of the value that doesn't share any mutable containers with it
+    """
+    value_type = type(value)
+    if value_type in (dict, OrderedDict):
+        return value_type((key, copy_template(item)) for key, item in value.items())
+    if value_type is list:
+        return [copy_template(item) for item in value]
+    if value_type in (str, int, float, bool, type(None)):
+        return value
+    return copy.deepcopy(value)
+
+
+class TemplateDiskCache:
+    """
+    Stores processed templates as JSON files, so that they can be reused by following invocations.
+    JSON is used instead of pickle, since loading a pickle from the project folder could run arbitrary code.
+    """
+
+    _cache_dir: Path
+    _max_size: int
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_DISK_SIZE):
+        """
+        Parameters
+        ----------
+        cache_dir : str
+            Directory where the processed templates will be stored
+        max_size : int
+            Maximum number of templates kept in the directory
+        """
+        self._cache_dir = Path(cache_dir)
+        self._max_size = max_size
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Parameters
+        ----------
+        key : str
+            Cache key of the template
+
+        Returns
+        -------
+        Optional[Dict]
+            Processed template, None if it is not stored or cannot be read
+        """
+        file_path = self._cache_dir.joinpath(key + TEMPLATE_CACHE_FILE_SUFFIX)
+        try:
+            with open(file_path, "r") as template_file:
+                return cast(Dict, json.load(template_file))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            LOG.debug("Unable to read processed template from %s", file_path, exc_info=True)
+            return None
+
+    def put(self, key: str, template: Dict) -> None:
+        """
+        Store a processed template. Templates that cannot be serialized as JSON without loss are not stored.
+
+        Parameters
+        ----------
+        key : str
+            Cache key of the template
+        template : Dict
+            Processed template
+        """
+        try:
+            serialized = json.dumps(template, separators=(",", ":"))
+        except (TypeError, ValueError):
+            LOG.debug("Processed template is not JSON serializable, it will not be stored on disk")
+            return
+
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # Write to a temporary file first, so that other processes never read a partially written template
+            with tempfile.NamedTemporaryFile("w", dir=self._cache_dir, suffix=".tmp", delete=False) as temp_file:
+                temp_file.write(serialized)
+            os.replace(temp_file.name, self._cache_dir.joinpath(key + TEMPLATE_CACHE_FILE_SUFFIX))
+            self._remove_old_templates()
+        except OSError:
+            LOG.debug("Unable to write processed template to %s", self._cache_dir, exc_info=True)
+
+    def _remove_old_templates(self) -> None:
+        template_files = list(self._cache_dir.glob("*" + TEMPLATE_CACHE_FILE_SUFFIX))
+        if len(template_files) <= self._max_size:
+            return
+        template_files.sort(key=lambda template_file: template_file.stat().st_mtime)
+        for template_file in template_files[: len(template_files) - self._max_size]:
+            template_file.unlink()
+
+
+class TemplateCache:
+    """
+    Thread safe LRU cache of processed templates, keyed by the content of the template and the
+    parameter overrides it is processed with. Every lookup returns a copy of the cached template,
+    since providers add fields to the resource dictionaries they are given.
+
+    If a disk cache root is given for a template, it is also stored in it and reused by following invocations.
+    The disk cache is only used when the root folder already exists, so that commands don't create it
+    just for caching.
+    """
+
+    _max_size: int
+    _lock: threading.Lock
+    _templates: "OrderedDict[str, Dict]"
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Parameters
+        ----------
+        max_size : int
+            Maximum number of templates kept in the cache
+        """
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._templates = OrderedDict()
+
+    @staticmethod
+    def _get_disk_cache(disk_cache_root: Optional[str]) -> Optional[TemplateDiskCache]:
+        if not disk_cache_root or not os.path.isdir(disk_cache_root):
+            return None
+        return TemplateDiskCache(os.path.join(disk_cache_root, TEMPLATE_CACHE_DIR))
+
+    def get_or_process(
+        self, key: Optional[str], process: Callable[[], Dict], disk_cache_root: Optional[str] = None
+    ) -> Dict:
+        """
+        Return a copy of the processed template for the key, processing it if it is not in the cache
+
+        Parameters
+        ----------
+        key : Optional[str]
+            Cache key from get_template_cache_key, template is processed without caching if it is None
+        process : Callable[[], Dict]
+            Callable that processes the template
+        disk_cache_root : Optional[str]
+            Folder to store the processed template in, under template-cache. Ex: .aws-sam of the project
+
+        Returns
+        -------
+        Dict
+            Processed template
+        """
+        if key is None:
+            return process()
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+
+        if template is None:
+            disk_cache = self._get_disk_cache(disk_cache_root)
+            template = disk_cache.get(key) if disk_cache else None
+            if template is None:
+                template = process()
+                if disk_cache:
+                    disk_cache.put(key, template)
+            else:
+                LOG.debug("Loaded processed template %s from disk cache", key)
+            with self._lock:
+                self._templates[key] = template
+                while len(self._templates) > self._max_size:
+                    self._templates.popitem(last=False)
+
+        return cast(Dict, copy_template(template))
+
+    def clear(self) -> None:
+        """Remove all templates from the cache"""
+        with self._lock:
+            self._templates.clear()
@@ -7,7 +7,6 @@ a tech debt that we have decided to take on. This will be eventually thrown away
 rich public interface.
 """
 
-import copy
 import functools
 from typing import Dict
 
@@ -25,8 +24,11 @@ from samtranslator.translator.translator import prepare_plugins
 from samtranslator.validator.validator import SamTemplateValidator
 
 from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
+from samcli.lib.providers.template_cache import copy_template
 from .local_uri_plugin import SupportLocalUriPlugin
 
+SERVERLESS_RESOURCE_TYPE_PREFIX = "AWS::Serverless::"
+
 
 class SamTranslatorWrapper:
     def __init__(self, sam_template, parameter_values=None, offline_fallback=True):
@@ -52,7 +54,25 @@ class SamTranslatorWrapper:
         self._offline_fallback = offline_fallback
 
     def run_plugins(self, convert_local_uris=True):
-        template_copy = self.template
+        """
+        Run the SAM plugins on a copy of the template
+
+        Only the parts of the template that the plugins can change are deep copied. Other resources are copied
+        down to their Properties and Metadata dictionaries, and the values inside them are shared with the
+        original template. Callers may add or replace the top level values of a resource, its Properties and
+        its Metadata, but must not change the nested values in place.
+
+        Parameters
+        ----------
+        convert_local_uris bool:
+            Set it to True to run the plugin that converts local paths of CodeUri & DefinitionUri
+
+        Returns
+        -------
+        dict
+            Template after running the plugins
+        """
+        template_copy = self._copy_template_for_plugins()
 
         additional_plugins = []
         if convert_local_uris:
@@ -75,7 +95,41 @@ class SamTranslatorWrapper:
 
     @property
     def template(self):
-        return copy.deepcopy(self._sam_template)
+        return copy_template(self._sam_template)
+
+    def _copy_template_for_plugins(self) -> Dict:
+        """
+        Copy the template, sharing the nested values of the resources that are not processed by the SAM plugins.
+        SAM plugins only change the Serverless resources, add new resources and change the top level sections
+        like Globals and Conditions.
+        """
+        resources = self._sam_template.get("Resources") if isinstance(self._sam_template, dict) else None
+        if not isinstance(resources, dict):
+            return self.template
+
+        template_copy = type(self._sam_template)(
+            (key, value if key == "Resources" else copy_template(value)) for key, value in self._sam_template.items()
+        )
+        template_copy["Resources"] = type(resources)(
+            (logical_id, _copy_resource_for_plugins(resource)) for logical_id, resource in resources.items()
+        )
+        return template_copy
+
+
+def _copy_resource_for_plugins(resource):
+    """
+    Deep copy the resources that SAM plugins can change, shallow copy the others down to Properties and Metadata
+    """
+    resource_type = resource.get("Type") if isinstance(resource, dict) else None
+    if not isinstance(resource_type, str) or resource_type.startswith(SERVERLESS_RESOURCE_TYPE_PREFIX):
+        return copy_template(resource)
+
+    resource_copy = type(resource)(resource)
+    for key in ("Properties", "Metadata"):
+        value = resource_copy.get(key)
+        if isinstance(value, dict):
+            resource_copy[key] = type(value)(value)
+    return resource_copy
 
 
 class _SamParserReimplemented:
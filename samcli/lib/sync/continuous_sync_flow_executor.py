@@ -3,28 +3,19 @@ import time
 import logging
 
 from typing import Callable, Optional
-from concurrent.futures.thread import ThreadPoolExecutor
-
-from dataclasses import dataclass
 
 from samcli.lib.sync.exceptions import SyncFlowException
 from samcli.lib.sync.sync_flow import SyncFlow
-from samcli.lib.sync.sync_flow_executor import SyncFlowExecutor, SyncFlowFuture, SyncFlowTask, default_exception_handler
+from samcli.lib.sync.sync_flow_executor import (
+    DelayedSyncFlowTask,
+    SyncFlowExecutor,
+    SyncFlowTask,
+    default_exception_handler,
+)
 
 LOG = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True, eq=True)
-class DelayedSyncFlowTask(SyncFlowTask):
-    """Data struct for individual SyncFlow execution tasks"""
-
-    # Time in seconds of when the task was initially queued
-    queue_time: float
-
-    # Number of seconds this task should stay in queue before being executed
-    wait_time: float
-
-
 class ContinuousSyncFlowExecutor(SyncFlowExecutor):
     """SyncFlowExecutor that continuously runs and executes SyncFlows.
     Call stop() to stop the executor"""
@@ -55,34 +46,6 @@ class ContinuousSyncFlowExecutor(SyncFlowExecutor):
     def _can_exit(self):
         return self.should_stop() and super()._can_exit()
 
-    def _submit_sync_flow_task(
-        self, executor: ThreadPoolExecutor, sync_flow_task: SyncFlowTask
-    ) -> Optional[SyncFlowFuture]:
-        """Submit SyncFlowTask to be executed by ThreadPoolExecutor
-        and return its future
-        Adds additional time checks for DelayedSyncFlowTask
-
-        Parameters
-        ----------
-        executor : ThreadPoolExecutor
-            THreadPoolExecutor to be used for execution
-        sync_flow_task : SyncFlowTask
-            SyncFlowTask to be executed.
-
-        Returns
-        -------
-        Optional[SyncFlowFuture]
-            Returns SyncFlowFuture generated by the SyncFlowTask.
-            Can be None if the task cannot be executed yet.
-        """
-        if (
-            isinstance(sync_flow_task, DelayedSyncFlowTask)
-            and sync_flow_task.wait_time + sync_flow_task.queue_time > time.time()
-        ):
-            return None
-
-        return super()._submit_sync_flow_task(executor, sync_flow_task)
-
     def _add_sync_flow_task(self, task: SyncFlowTask) -> None:
         """Add SyncFlowTask to the queue
         Skips if the executor is in the state of being shut down.
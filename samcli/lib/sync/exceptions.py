@@ -171,3 +171,44 @@ class InvalidRuntimeDefinitionForFunction(Exception):
     @property
     def function_logical_id(self):
         return self._function_logical_id
+
+
+class SyncFlowRetryRequired(Exception):
+    """Raised from a SyncFlow when remote is not ready yet.
+    The SyncFlow will be queued again and executed after wait_time seconds, without holding a worker thread."""
+
+    _wait_time: float
+
+    def __init__(self, wait_time: float):
+        """
+        Parameters
+        ----------
+        wait_time : float
+            Number of seconds to wait before executing the SyncFlow again
+        """
+        super().__init__(f"SyncFlow needs to be executed again after {wait_time} seconds")
+        self._wait_time = wait_time
+
+    @property
+    def wait_time(self) -> float:
+        return self._wait_time
+
+
+class FunctionUpdateFailedError(Exception):
+    """This is used when a Lambda function update fails or does not finish in time"""
+
+    _function_logical_id: str
+    _reason: str
+
+    def __init__(self, function_logical_id: str, reason: str):
+        super().__init__(f"Update of function {function_logical_id} failed: {reason}")
+        self._function_logical_id = function_logical_id
+        self._reason = reason
+
+    @property
+    def function_logical_id(self) -> str:
+        return self._function_logical_id
+
+    @property
+    def reason(self) -> str:
+        return self._reason
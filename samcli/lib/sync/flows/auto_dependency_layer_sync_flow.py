@@ -107,11 +107,11 @@ class AutoDependencyLayerParentSyncFlow(ZipFunctionSyncFlow):
     dependency layer.
     """
 
-    def gather_dependencies(self) -> List[SyncFlow]:
+    def _gather_dependencies_after_update(self) -> List[SyncFlow]:
         """
         Return auto dependency layer sync flow along with parent dependencies
         """
-        parent_dependencies = super().gather_dependencies()
+        parent_dependencies = super()._gather_dependencies_after_update()
 
         function_build_definitions = cast(BuildGraph, self._build_graph).get_function_build_definitions()
         if not function_build_definitions:
@@ -120,16 +120,16 @@ class AutoDependencyLayerParentSyncFlow(ZipFunctionSyncFlow):
         # don't queue up auto dependency layer, if dependencies are not changes
         need_dependency_layer_sync = function_build_definitions[0].download_dependencies
         if need_dependency_layer_sync:
-            parent_dependencies.append(
-                AutoDependencyLayerSyncFlow(
-                    self._function_identifier,
-                    cast(BuildGraph, self._build_graph),
-                    self._build_context,
-                    self._deploy_context,
-                    self._physical_id_mapping,
-                    cast(List[Stack], self._stacks),
-                )
+            auto_dependency_layer_sync_flow = AutoDependencyLayerSyncFlow(
+                self._function_identifier,
+                cast(BuildGraph, self._build_graph),
+                self._build_context,
+                self._deploy_context,
+                self._physical_id_mapping,
+                cast(List[Stack], self._stacks),
             )
+            auto_dependency_layer_sync_flow.set_resource_cache(self._resource_cache)
+            parent_dependencies.append(auto_dependency_layer_sync_flow)
         return parent_dependencies
 
     @staticmethod
@@ -1,13 +1,15 @@
 """Base SyncFlow for Lambda Function"""
 import logging
-from typing import Any, Dict, List, TYPE_CHECKING, cast
+import time
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, cast
 
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider
 from samcli.lib.sync.flows.alias_version_sync_flow import AliasVersionSyncFlow
 from samcli.lib.providers.provider import Function, Stack
+from samcli.lib.sync.exceptions import FunctionUpdateFailedError, SyncFlowRetryRequired
 from samcli.local.lambdafn.exceptions import FunctionNotFound
 
-from samcli.lib.sync.sync_flow import SyncFlow
+from samcli.lib.sync.sync_flow import ResourceAPICall, SyncFlow
 
 if TYPE_CHECKING:  # pragma: no cover
     from samcli.commands.deploy.deploy_context import DeployContext
@@ -15,14 +17,18 @@ if TYPE_CHECKING:  # pragma: no cover
 
 LOG = logging.getLogger(__name__)
 
+# Polling intervals in seconds for remote function updates, doubled after each poll until the maximum is reached
+FUNCTION_UPDATE_INITIAL_POLL_INTERVAL = 0.25
+FUNCTION_UPDATE_MAX_POLL_INTERVAL = 2.0
+# Number of seconds to wait for a remote function update before failing
+FUNCTION_UPDATE_TIMEOUT = 60.0
+
 
 class FunctionSyncFlow(SyncFlow):
     _function_identifier: str
     _function_provider: SamFunctionProvider
     _function: Function
     _lambda_client: Any
-    _lambda_waiter: Any
-    _lambda_waiter_config: Dict[str, Any]
 
     def __init__(
         self,
@@ -57,25 +63,32 @@ class FunctionSyncFlow(SyncFlow):
         self._function_provider = self._build_context.function_provider
         self._function = cast(Function, self._function_provider.functions.get(self._function_identifier))
         self._lambda_client = None
-        self._lambda_waiter = None
-        self._lambda_waiter_config = {"Delay": 1, "MaxAttempts": 60}
 
     def set_up(self) -> None:
         super().set_up()
         self._lambda_client = self._boto_client("lambda")
-        self._lambda_waiter = self._lambda_client.get_waiter("function_updated")
 
     def gather_dependencies(self) -> List[SyncFlow]:
+        """Returns a FunctionUpdateWaitSyncFlow which waits on the remote function update
+        without blocking a worker thread, and then queues the dependencies from _gather_dependencies_after_update.
+        """
+        wait_sync_flow = FunctionUpdateWaitSyncFlow(
+            self._function_identifier,
+            self._build_context,
+            self._deploy_context,
+            self._physical_id_mapping,
+            self._stacks,
+            self._gather_dependencies_after_update,
+        )
+        wait_sync_flow.set_resource_cache(self._resource_cache)
+        return [wait_sync_flow]
+
+    def _gather_dependencies_after_update(self) -> List[SyncFlow]:
         """Gathers alias and versions related to a function.
         Currently only handles serverless function AutoPublishAlias field
         since a manually created function version resource behaves statically in a stack.
         Redeploying a version resource through CFN will not create a new version.
         """
-        LOG.debug("%sWaiting on Remote Function Update", self.log_prefix)
-        self._lambda_waiter.wait(
-            FunctionName=self.get_physical_id(self._function_identifier), WaiterConfig=self._lambda_waiter_config
-        )
-        LOG.debug("%sRemote Function Updated", self.log_prefix)
         sync_flows: List[SyncFlow] = list()
 
         function_resource = self._get_resource(self._function_identifier)
@@ -84,19 +97,123 @@ class FunctionSyncFlow(SyncFlow):
 
         auto_publish_alias_name = function_resource.get("Properties", dict()).get("AutoPublishAlias", None)
         if auto_publish_alias_name:
-            sync_flows.append(
-                AliasVersionSyncFlow(
-                    self._function_identifier,
-                    auto_publish_alias_name,
-                    self._build_context,
-                    self._deploy_context,
-                    self._physical_id_mapping,
-                    self._stacks,
-                )
+            alias_version_sync_flow = AliasVersionSyncFlow(
+                self._function_identifier,
+                auto_publish_alias_name,
+                self._build_context,
+                self._deploy_context,
+                self._physical_id_mapping,
+                self._stacks,
             )
+            alias_version_sync_flow.set_resource_cache(self._resource_cache)
+            sync_flows.append(alias_version_sync_flow)
             LOG.debug("%sCreated  Alias and Version SyncFlow", self.log_prefix)
 
         return sync_flows
 
     def _equality_keys(self):
         return self._function_identifier
+
+
+class FunctionUpdateWaitSyncFlow(SyncFlow):
+    """
+    SyncFlow that waits for a remote function update to finish.
+
+    Instead of blocking a worker thread like a boto3 waiter, each execution checks the update status once
+    and raises SyncFlowRetryRequired while the update is in progress, so that the executor parks this flow
+    in its queue until the next poll is due. Polling interval starts short and is doubled after each poll.
+    """
+
+    _function_identifier: str
+    _dependencies_after_update: Callable[[], List[SyncFlow]]
+    _lambda_client: Any
+    _poll_interval: float
+    _deadline: Optional[float]
+
+    def __init__(
+        self,
+        function_identifier: str,
+        build_context: "BuildContext",
+        deploy_context: "DeployContext",
+        physical_id_mapping: Dict[str, str],
+        stacks: Optional[List[Stack]],
+        dependencies_after_update: Callable[[], List[SyncFlow]],
+    ):
+        """
+        Parameters
+        ----------
+        function_identifier : str
+            Function resource identifier that is being updated
+        build_context : BuildContext
+            BuildContext
+        deploy_context : DeployContext
+            DeployContext
+        physical_id_mapping : Dict[str, str]
+            Physical ID Mapping
+        stacks : Optional[List[Stack]]
+            Stacks
+        dependencies_after_update : Callable[[], List[SyncFlow]]
+            Callable that returns the SyncFlows that should be executed after the function is updated
+        """
+        super().__init__(
+            build_context,
+            deploy_context,
+            physical_id_mapping,
+            log_name="Lambda Function Update " + function_identifier,
+            stacks=stacks,
+        )
+        self._function_identifier = function_identifier
+        self._dependencies_after_update = dependencies_after_update
+        self._lambda_client = None
+        self._poll_interval = FUNCTION_UPDATE_INITIAL_POLL_INTERVAL
+        self._deadline = None
+
+    def set_up(self) -> None:
+        # The same SyncFlow instance is executed multiple times, only create the client once
+        if self._lambda_client:
+            return
+        super().set_up()
+        self._lambda_client = self._boto_client("lambda")
+
+    @property
+    def is_internal(self) -> bool:
+        return True
+
+    def gather_resources(self) -> None:
+        pass
+
+    def compare_remote(self) -> bool:
+        return False
+
+    def sync(self) -> None:
+        if self._deadline is None:
+            self._deadline = time.time() + FUNCTION_UPDATE_TIMEOUT
+
+        function_configuration = self._lambda_client.get_function_configuration(
+            FunctionName=self.get_physical_id(self._function_identifier)
+        )
+        update_status = function_configuration.get("LastUpdateStatus")
+        if update_status == "Failed":
+            raise FunctionUpdateFailedError(
+                self._function_identifier, function_configuration.get("LastUpdateStatusReason", "Unknown reason")
+            )
+        if update_status == "InProgress":
+            if time.time() >= self._deadline:
+                raise FunctionUpdateFailedError(
+                    self._function_identifier,
+                    f"Update did not finish in {FUNCTION_UPDATE_TIMEOUT} seconds",
+                )
+            wait_time = self._poll_interval
+            self._poll_interval = min(self._poll_interval * 2, FUNCTION_UPDATE_MAX_POLL_INTERVAL)
+            raise SyncFlowRetryRequired(wait_time)
+        LOG.debug("%sRemote Function Updated", self.log_prefix)
+
+    def gather_dependencies(self) -> List[SyncFlow]:
+        self._invalidate_function_configuration(self._function_identifier)
+        return self._dependencies_after_update()
+
+    def _get_resource_api_calls(self) -> List[ResourceAPICall]:
+        return []
+
+    def _equality_keys(self):
+        return self._function_identifier
@@ -1,6 +1,6 @@
 """SyncFlow for Image based Lambda Functions"""
 import logging
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING, cast
 
 import docker
 from docker.client import DockerClient
@@ -8,6 +8,7 @@ from docker.client import DockerClient
 from samcli.lib.providers.provider import Stack
 from samcli.lib.sync.flows.function_sync_flow import FunctionSyncFlow
 from samcli.lib.package.ecr_uploader import ECRUploader
+from samcli.lib.package.image_utils import tag_translation
 
 from samcli.lib.build.app_builder import ApplicationBuilder
 from samcli.lib.sync.sync_flow import ResourceAPICall
@@ -23,6 +24,7 @@ class ImageFunctionSyncFlow(FunctionSyncFlow):
     _ecr_client: Any
     _docker_client: Optional[DockerClient]
     _image_name: Optional[str]
+    _remote_image_uri: Optional[str]
 
     def __init__(
         self,
@@ -53,6 +55,7 @@ class ImageFunctionSyncFlow(FunctionSyncFlow):
         super().__init__(function_identifier, build_context, deploy_context, physical_id_mapping, stacks)
         self._ecr_client = None
         self._image_name = None
+        self._remote_image_uri = None
         self._docker_client = docker_client
 
     def set_up(self) -> None:
@@ -77,13 +80,30 @@ class ImageFunctionSyncFlow(FunctionSyncFlow):
         self._image_name = builder.build().artifacts.get(self._function_identifier)
 
     def compare_remote(self) -> bool:
-        return False
-
-    def sync(self) -> None:
+        """Compare the image URI that the built image would be pushed to with the one used by the remote function.
+        Image tags contain the local image ID, so the same tag means that the same image has already been pushed
+        and the function is using it.
+        """
         if not self._image_name:
-            LOG.debug("%sSkipping sync. Image name is None.", self.log_prefix)
-            return
-        function_physical_id = self.get_physical_id(self._function_identifier)
+            return False
+        docker_image_id = cast(DockerClient, self._docker_client).images.get(self._image_name).id
+        local_image_uri = f"{self._get_ecr_repo()}:{tag_translation(self._image_name, docker_image_id=docker_image_id)}"
+        remote_image_uri = self._get_remote_image_uri()
+        LOG.debug("%sLocal Image URI: %s Remote Image URI: %s", self.log_prefix, local_image_uri, remote_image_uri)
+
+        return local_image_uri == remote_image_uri
+
+    def _get_remote_image_uri(self) -> str:
+        """Image URI of the remote function, it is only fetched once for each sync flow"""
+        if self._remote_image_uri is None:
+            function_result = self._lambda_client.get_function(
+                FunctionName=self.get_physical_id(self._function_identifier)
+            )
+            self._remote_image_uri = cast(str, function_result.get("Code", dict()).get("ImageUri", ""))
+        return self._remote_image_uri
+
+    def _get_ecr_repo(self) -> str:
+        """ECR repository that the image will be pushed to"""
         # Load ECR Repo from --image-repository
         ecr_repo = self._deploy_context.image_repository
 
@@ -98,9 +118,18 @@ class ImageFunctionSyncFlow(FunctionSyncFlow):
         # Load ECR Repo directly from remote function
         if not ecr_repo:
             LOG.debug("%sGetting ECR Repo from Remote Function", self.log_prefix)
-            function_result = self._lambda_client.get_function(FunctionName=function_physical_id)
-            ecr_repo = function_result.get("Code", dict()).get("ImageUri", "").split(":")[0]
-        ecr_uploader = ECRUploader(self._docker_client, self._ecr_client, ecr_repo, None)
+            ecr_repo = self._get_remote_image_uri().split(":")[0]
+        return cast(str, ecr_repo)
+
+    def sync(self) -> None:
+        if not self._image_name:
+            LOG.debug("%sSkipping sync. Image name is None.", self.log_prefix)
+            return
+        function_physical_id = self.get_physical_id(self._function_identifier)
+        ecr_repo = self._get_ecr_repo()
+
+        # Images which are already in the repository won't be pushed again
+        ecr_uploader = ECRUploader(self._docker_client, self._ecr_client, ecr_repo, None, skip_existing_images=True)
         image_uri = ecr_uploader.upload(self._image_name, self._function_identifier)
 
         self._lambda_client.update_function_code(FunctionName=function_physical_id, ImageUri=image_uri)
@@ -10,19 +10,22 @@ from abc import ABC, abstractmethod
 from typing import Any, TYPE_CHECKING, cast, Dict, List, Optional
 
 from samcli.lib.build.app_builder import ApplicationBuilder
+from samcli.lib.package.s3_uploader import S3Uploader
 from samcli.lib.package.utils import make_zip
 from samcli.lib.providers.provider import ResourceIdentifier, Stack, get_resource_by_id, Function
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider
 from samcli.lib.sync.exceptions import MissingPhysicalResourceError, NoLayerVersionsFoundError
+from samcli.lib.sync.layer_content_hash_store import LayerContentHashRecord, LayerContentHashStore
 from samcli.lib.sync.sync_flow import SyncFlow, ResourceAPICall
 from samcli.lib.sync.sync_flow_executor import HELP_TEXT_FOR_SYNC_INFRA
-from samcli.lib.utils.hash import file_checksum
+from samcli.lib.utils.hash import dir_checksum, file_checksum
 
 if TYPE_CHECKING:  # pragma: no cover
     from samcli.commands.build.build_context import BuildContext
     from samcli.commands.deploy.deploy_context import DeployContext
 
 LOG = logging.getLogger(__name__)
+MAXIMUM_LAYER_ZIP_SIZE = 50 * 1024 * 1024  # 50MB limit for Lambda direct ZIP upload
 
 
 class AbstractLayerSyncFlow(SyncFlow, ABC):
@@ -31,6 +34,7 @@ class AbstractLayerSyncFlow(SyncFlow, ABC):
     """
 
     _lambda_client: Any
+    _s3_client: Any
     _layer_arn: Optional[str]
     _old_layer_version: Optional[int]
     _new_layer_version: Optional[int]
@@ -58,16 +62,22 @@ class AbstractLayerSyncFlow(SyncFlow, ABC):
     def set_up(self) -> None:
         super().set_up()
         self._lambda_client = self._boto_client("lambda")
+        self._s3_client = self._boto_client("s3")
 
     def compare_remote(self) -> bool:
         """
         Compare Sha256 of the deployed layer code vs the one just built, True if they are same, False otherwise
         """
         self._old_layer_version = self._get_latest_layer_version()
-        old_layer_info = self._lambda_client.get_layer_version(
-            LayerName=self._layer_arn,
-            VersionNumber=self._old_layer_version,
-        )
+        if self._resource_cache:
+            old_layer_info = self._resource_cache.get_layer_version(
+                self._lambda_client, cast(str, self._layer_arn), cast(int, self._old_layer_version)
+            )
+        else:
+            old_layer_info = self._lambda_client.get_layer_version(
+                LayerName=self._layer_arn,
+                VersionNumber=self._old_layer_version,
+            )
         remote_sha = base64.b64decode(old_layer_info.get("Content", {}).get("CodeSha256", "")).hex()
         LOG.debug("%sLocal SHA: %s Remote SHA: %s", self.log_prefix, self._local_sha, remote_sha)
 
@@ -75,6 +85,13 @@ class AbstractLayerSyncFlow(SyncFlow, ABC):
 
     def _get_latest_layer_version(self):
         """Fetches all layer versions from remote and returns the latest one"""
+        if self._resource_cache:
+            latest_layer_version = self._resource_cache.get_latest_layer_version(
+                self._lambda_client, cast(str, self._layer_arn)
+            )
+            if latest_layer_version is None:
+                raise NoLayerVersionsFoundError(self._layer_arn)
+            return latest_layer_version
         layer_versions = self._lambda_client.list_layer_versions(LayerName=self._layer_arn).get("LayerVersions", [])
         if not layer_versions:
             raise NoLayerVersionsFoundError(self._layer_arn)
@@ -87,6 +104,11 @@ class AbstractLayerSyncFlow(SyncFlow, ABC):
         LOG.debug("%sPublishing new Layer Version", self.log_prefix)
         self._new_layer_version = self._publish_new_layer_version()
         self._delete_old_layer_version()
+        if self._resource_cache:
+            self._resource_cache.invalidate_layer_version(
+                cast(str, self._layer_arn), cast(int, self._old_layer_version)
+            )
+            self._resource_cache.set_latest_layer_version(cast(str, self._layer_arn), self._new_layer_version)
 
     def gather_dependencies(self) -> List[SyncFlow]:
         if self._zip_file and os.path.exists(self._zip_file):
@@ -96,17 +118,17 @@ class AbstractLayerSyncFlow(SyncFlow, ABC):
         dependent_functions = self._get_dependent_functions()
         if self._stacks:
             for function in dependent_functions:
-                dependencies.append(
-                    FunctionLayerReferenceSync(
-                        function.full_path,
-                        cast(str, self._layer_arn),
-                        cast(int, self._new_layer_version),
-                        self._build_context,
-                        self._deploy_context,
-                        self._physical_id_mapping,
-                        self._stacks,
-                    )
+                function_layer_reference_sync = FunctionLayerReferenceSync(
+                    function.full_path,
+                    cast(str, self._layer_arn),
+                    cast(int, self._new_layer_version),
+                    self._build_context,
+                    self._deploy_context,
+                    self._physical_id_mapping,
+                    self._stacks,
                 )
+                function_layer_reference_sync.set_resource_cache(self._resource_cache)
+                dependencies.append(function_layer_reference_sync)
         return dependencies
 
     def _get_resource_api_calls(self) -> List[ResourceAPICall]:
@@ -120,13 +142,34 @@ class AbstractLayerSyncFlow(SyncFlow, ABC):
         Publish new layer version and keep new layer version arn so that we can update related functions
         """
         compatible_runtimes = self._get_compatible_runtimes()
-        with open(cast(str, self._zip_file), "rb") as zip_file:
-            data = zip_file.read()
+        zip_file_size = os.path.getsize(cast(str, self._zip_file))
+        if zip_file_size < MAXIMUM_LAYER_ZIP_SIZE:
+            # Direct upload through Lambda API
+            with open(cast(str, self._zip_file), "rb") as zip_file:
+                data = zip_file.read()
+                layer_publish_result = self._lambda_client.publish_layer_version(
+                    LayerName=self._layer_arn, Content={"ZipFile": data}, CompatibleRuntimes=compatible_runtimes
+                )
+        else:
+            # Upload to S3 first for oversized ZIPs, S3 uploads are streamed from the file
+            LOG.debug("%sUploading Layer Through S3", self.log_prefix)
+            uploader = S3Uploader(
+                s3_client=self._s3_client,
+                bucket_name=self._deploy_context.s3_bucket,
+                prefix=self._deploy_context.s3_prefix,
+                kms_key_id=self._deploy_context.kms_key_id,
+                force_upload=True,
+                no_progressbar=True,
+            )
+            s3_url = uploader.upload_with_dedup(cast(str, self._zip_file))
+            s3_key = s3_url[5:].split("/", 1)[1]
             layer_publish_result = self._lambda_client.publish_layer_version(
-                LayerName=self._layer_arn, Content={"ZipFile": data}, CompatibleRuntimes=compatible_runtimes
+                LayerName=self._layer_arn,
+                Content={"S3Bucket": self._deploy_context.s3_bucket, "S3Key": s3_key},
+                CompatibleRuntimes=compatible_runtimes,
             )
-            LOG.debug("%sPublish Layer Version Result %s", self.log_prefix, layer_publish_result)
-            return int(layer_publish_result.get("Version"))
+        LOG.debug("%sPublish Layer Version Result %s", self.log_prefix, layer_publish_result)
+        return int(layer_publish_result.get("Version"))
 
     def _delete_old_layer_version(self) -> None:
         """
@@ -171,6 +214,20 @@ class LayerSyncFlow(AbstractLayerSyncFlow):
     """SyncFlow for Lambda Layers"""
 
     _new_layer_version: Optional[int]
+    _content_hash: Optional[str]
+    _content_hash_store: Optional[LayerContentHashStore]
+
+    def __init__(
+        self,
+        layer_identifier: str,
+        build_context: "BuildContext",
+        deploy_context: "DeployContext",
+        physical_id_mapping: Dict[str, str],
+        stacks: List[Stack],
+    ):
+        super().__init__(layer_identifier, build_context, deploy_context, physical_id_mapping, stacks)
+        self._content_hash = None
+        self._content_hash_store = None
 
     def set_up(self) -> None:
         super().set_up()
@@ -215,11 +272,50 @@ class LayerSyncFlow(AbstractLayerSyncFlow):
             LOG.debug("%sBuilding Layer", self.log_prefix)
             self._artifact_folder = builder.build().artifacts.get(self._layer_identifier)
 
+        # Creating and hashing the ZIP file is skipped if the layer content is same as the last published one
+        self._content_hash = dir_checksum(cast(str, self._artifact_folder), hash_generator=hashlib.sha256())
+        content_hash_record = self._get_content_hash_store().get(cast(str, self._layer_arn))
+        if content_hash_record and content_hash_record.content_hash == self._content_hash:
+            LOG.debug("%sLayer content is unchanged since the last publish, skipping ZIP creation", self.log_prefix)
+            self._local_sha = content_hash_record.code_sha256
+            return
+
+        self._create_zip_file()
+
+    def _create_zip_file(self) -> None:
+        """ZIP the artifact folder into a temp file in self._zip_file and calculate its SHA256"""
         zip_file_path = os.path.join(tempfile.gettempdir(), f"data-{uuid.uuid4().hex}")
         self._zip_file = make_zip(zip_file_path, self._artifact_folder)
         LOG.debug("%sCreated artifact ZIP file: %s", self.log_prefix, self._zip_file)
         self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
 
+    def _get_content_hash_store(self) -> LayerContentHashStore:
+        if not self._content_hash_store:
+            self._content_hash_store = LayerContentHashStore(self._build_context.build_dir)
+        return self._content_hash_store
+
+    def _record_content_hash(self) -> None:
+        """Store content hash of the layer folder along with the SHA256 of its published ZIP file"""
+        if self._content_hash and self._local_sha:
+            self._get_content_hash_store().put(
+                cast(str, self._layer_arn), LayerContentHashRecord(self._content_hash, self._local_sha)
+            )
+
+    def compare_remote(self) -> bool:
+        is_synced = super().compare_remote()
+        if not is_synced and not self._zip_file:
+            # Recorded hash doesn't belong to the latest remote version, layer might be updated outside of sync
+            LOG.debug("%sRecorded content hash does not match with remote, creating ZIP file", self.log_prefix)
+            self._create_zip_file()
+            is_synced = super().compare_remote()
+        if is_synced and self._zip_file:
+            self._record_content_hash()
+        return is_synced
+
+    def sync(self) -> None:
+        super().sync()
+        self._record_content_hash()
+
     def _get_compatible_runtimes(self):
         layer_resource = cast(Dict[str, Any], self._get_resource(self._layer_identifier))
         return layer_resource.get("Properties", {}).get("CompatibleRuntimes", [])
@@ -298,10 +394,10 @@ class FunctionLayerReferenceSync(SyncFlow):
             new_layer_arn = f"{self._layer_arn}:{self._new_layer_version}"
 
             function_physical_id = self.get_physical_id(self._function_identifier)
-            get_function_result = self._lambda_client.get_function(FunctionName=function_physical_id)
+            function_configuration = self._get_function_configuration(self._lambda_client, self._function_identifier)
 
             # get the current layer version arns
-            layer_arns = [layer.get("Arn") for layer in get_function_result.get("Configuration", {}).get("Layers", [])]
+            layer_arns = [layer.get("Arn") for layer in function_configuration.get("Layers", [])]
 
             # Check whether layer version is up to date
             if new_layer_arn in layer_arns:
@@ -330,6 +426,7 @@ class FunctionLayerReferenceSync(SyncFlow):
             layer_arns.remove(old_layer_arn)
             layer_arns.append(new_layer_arn)
             self._lambda_client.update_function_configuration(FunctionName=function_physical_id, Layers=layer_arns)
+            self._invalidate_function_configuration(self._function_identifier)
 
     def _get_resource_api_calls(self) -> List[ResourceAPICall]:
         return [ResourceAPICall(self._function_identifier, [FunctionLayerReferenceSync.UPDATE_FUNCTION_CONFIGURATION])]
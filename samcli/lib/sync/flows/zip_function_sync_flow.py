@@ -100,8 +100,8 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
         self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
 
     def compare_remote(self) -> bool:
-        remote_info = self._lambda_client.get_function(FunctionName=self.get_physical_id(self._function_identifier))
-        remote_sha = base64.b64decode(remote_info["Configuration"]["CodeSha256"]).hex()
+        remote_configuration = self._get_function_configuration(self._lambda_client, self._function_identifier)
+        remote_sha = base64.b64decode(remote_configuration["CodeSha256"]).hex()
         LOG.debug("%sLocal SHA: %s Remote SHA: %s", self.log_prefix, self._local_sha, remote_sha)
 
         return self._local_sha == remote_sha
@@ -0,0 +1,88 @@
+"""Local store for content hashes of published layer versions"""
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+LOG = logging.getLogger(__name__)
+
+LAYER_CONTENT_HASHES_FILE_NAME = "layer_content_hashes.json"
+
+
+class LayerContentHashRecord(NamedTuple):
+    """Content hash of a built layer folder and the CodeSha256 of the ZIP file that was published for it"""
+
+    content_hash: str
+    code_sha256: str
+
+
+class LayerContentHashStore:
+    """Keeps the content hash of the last published version of each layer in a JSON file.
+    This allows layer syncs to compare the built layer folder with the remote layer version
+    without creating and hashing a new ZIP file when the layer content is unchanged.
+    """
+
+    # Multiple layer sync flows can be writing to the same file from different threads
+    _lock = threading.Lock()
+
+    _file_path: Path
+
+    def __init__(self, build_dir: str):
+        """
+        Parameters
+        ----------
+        build_dir : str
+            Build directory, the JSON file will be stored in its parent folder next to build.toml.
+            It is not stored in the cache directory since build removes everything in there that is not
+            a cached build folder.
+        """
+        self._file_path = Path(build_dir).parent.joinpath(LAYER_CONTENT_HASHES_FILE_NAME)
+
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        if not self._file_path.exists():
+            return dict()
+        try:
+            return dict(json.loads(self._file_path.read_text()))
+        except (OSError, ValueError):
+            LOG.debug("Unable to read layer content hashes from %s", self._file_path, exc_info=True)
+            return dict()
+
+    def get(self, layer_arn: str) -> Optional[LayerContentHashRecord]:
+        """
+        Parameters
+        ----------
+        layer_arn : str
+            Layer ARN without the version
+
+        Returns
+        -------
+        Optional[LayerContentHashRecord]
+            Record for the last published version of the layer, None if there is no record
+        """
+        with LayerContentHashStore._lock:
+            record = self._read().get(layer_arn)
+        if not record:
+            return None
+        return LayerContentHashRecord(record.get("content_hash", ""), record.get("code_sha256", ""))
+
+    def put(self, layer_arn: str, record: LayerContentHashRecord) -> None:
+        """
+        Parameters
+        ----------
+        layer_arn : str
+            Layer ARN without the version
+        record : LayerContentHashRecord
+            Record for the published version of the layer
+        """
+        with LayerContentHashStore._lock:
+            records = self._read()
+            records[layer_arn] = record._asdict()
+            try:
+                os.makedirs(self._file_path.parent, exist_ok=True)
+                temp_file_path = self._file_path.with_suffix(".tmp")
+                temp_file_path.write_text(json.dumps(records, indent=2))
+                os.replace(temp_file_path, self._file_path)
+            except OSError:
+                LOG.debug("Unable to write layer content hashes to %s", self._file_path, exc_info=True)
@@ -0,0 +1,260 @@
+"""Session wide cache for remote resource metadata used by SyncFlows"""
+import logging
+import time
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple, cast
+
+LOG = logging.getLogger(__name__)
+
+# Remote metadata is refreshed after this many seconds even if it was not invalidated by a sync
+DEFAULT_TTL_SECONDS = 60
+
+
+class SyncResourceCache:
+    """Thread safe, TTL based cache for remote resource metadata.
+
+    A single instance is shared by all SyncFlows created by the same SyncFlowFactory, so it lives until the
+    next infra sync which creates a new factory. Function configurations and latest layer versions are loaded
+    with paginated bulk calls on the first lookup, and resources that are missing from the bulk result or that
+    were invalidated by a sync are fetched individually.
+
+    Remote calls are made without holding the lock, so that lookups of cached values are never blocked behind
+    a bulk load. Lookups that miss while a bulk load is running fetch their resource individually.
+    """
+
+    FUNCTION_CONFIGURATION = "FunctionConfiguration"
+    LATEST_LAYER_VERSION = "LatestLayerVersion"
+    LAYER_VERSION = "LayerVersion"
+
+    _ttl: float
+    _lock: RLock
+    _entries: Dict[Tuple[str, Hashable], Tuple[float, Any]]
+    _bulk_loaded: Dict[str, float]
+    _bulk_loading: Set[str]
+    _invalidations: Dict[Tuple[str, Hashable], int]
+
+    def __init__(self, ttl: float = DEFAULT_TTL_SECONDS):
+        """
+        Parameters
+        ----------
+        ttl : float
+            Number of seconds a cached value will be considered valid
+        """
+        self._ttl = ttl
+        self._lock = RLock()
+        self._entries = dict()
+        self._bulk_loaded = dict()
+        self._bulk_loading = set()
+        # Values loaded from remote are not stored if the resource was changed after the load started,
+        # which is tracked with a counter that is increased on every change
+        self._change_count = 0
+        self._cleared_at = 0
+        self._invalidations = dict()
+
+    def _get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get((namespace, key))
+        if not entry:
+            return None
+        created_at, value = entry
+        if time.time() - created_at > self._ttl:
+            del self._entries[(namespace, key)]
+            return None
+        return value
+
+    def _put(self, namespace: str, key: Hashable, value: Any) -> None:
+        self._entries[(namespace, key)] = (time.time(), value)
+
+    def _put_loaded(self, namespace: str, key: Hashable, value: Any, loaded_at: int) -> None:
+        if self._cleared_at > loaded_at or self._invalidations.get((namespace, key), 0) > loaded_at:
+            return
+        self._put(namespace, key, value)
+
+    def _record_change(self, namespace: str, key: Hashable) -> None:
+        self._change_count += 1
+        self._invalidations[(namespace, key)] = self._change_count
+
+    def _is_bulk_loaded(self, namespace: str) -> bool:
+        loaded_at = self._bulk_loaded.get(namespace)
+        return loaded_at is not None and time.time() - loaded_at <= self._ttl
+
+    def _lookup(
+        self,
+        namespace: str,
+        key: Hashable,
+        load_one: Callable[[], Optional[Any]],
+        load_all: Optional[Callable[[], Dict[Hashable, Any]]] = None,
+    ) -> Optional[Any]:
+        with self._lock:
+            value = self._get(namespace, key)
+            if value is not None:
+                return value
+            loaded_at = self._change_count
+            bulk_load = bool(load_all) and not self._is_bulk_loaded(namespace) and namespace not in self._bulk_loading
+            if bulk_load:
+                self._bulk_loading.add(namespace)
+
+        if bulk_load and load_all:
+            try:
+                values = load_all()
+            finally:
+                with self._lock:
+                    self._bulk_loading.discard(namespace)
+            with self._lock:
+                for loaded_key, loaded_value in values.items():
+                    self._put_loaded(namespace, loaded_key, loaded_value, loaded_at)
+                if self._cleared_at <= loaded_at:
+                    self._bulk_loaded[namespace] = time.time()
+            value = values.get(key)
+            if value is not None:
+                return value
+
+        value = load_one()
+        if value is not None:
+            with self._lock:
+                self._put_loaded(namespace, key, value, loaded_at)
+        return value
+
+    def get_function_configuration(self, lambda_client: Any, function_name: str) -> Dict[str, Any]:
+        """Get function configuration of a Lambda function.
+        All function configurations are loaded with ListFunctions when the cache is empty or expired.
+
+        Parameters
+        ----------
+        lambda_client : Any
+            Lambda client to be used if the configuration needs to be loaded from remote
+        function_name : str
+            Physical ID of the function
+
+        Returns
+        -------
+        Dict[str, Any]
+            Function configuration in the same shape as the one returned by GetFunctionConfiguration
+        """
+
+        def load_all() -> Dict[Hashable, Any]:
+            LOG.debug("Loading all function configurations")
+            return {
+                function_configuration.get("FunctionName"): function_configuration
+                for page in lambda_client.get_paginator("list_functions").paginate()
+                for function_configuration in page.get("Functions", [])
+            }
+
+        def load_one() -> Dict[str, Any]:
+            LOG.debug("Loading function configuration of %s", function_name)
+            return cast(Dict[str, Any], lambda_client.get_function_configuration(FunctionName=function_name))
+
+        return cast(
+            Dict[str, Any], self._lookup(SyncResourceCache.FUNCTION_CONFIGURATION, function_name, load_one, load_all)
+        )
+
+    def invalidate_function(self, function_name: str) -> None:
+        """Remove cached configuration of a function, should be called after the function is updated
+
+        Parameters
+        ----------
+        function_name : str
+            Physical ID of the function
+        """
+        with self._lock:
+            self._entries.pop((SyncResourceCache.FUNCTION_CONFIGURATION, function_name), None)
+            self._record_change(SyncResourceCache.FUNCTION_CONFIGURATION, function_name)
+
+    def get_latest_layer_version(self, lambda_client: Any, layer_arn: str) -> Optional[int]:
+        """Get latest version number of a layer.
+        Latest versions of all layers are loaded with ListLayers when the cache is empty or expired.
+
+        Parameters
+        ----------
+        lambda_client : Any
+            Lambda client to be used if the version needs to be loaded from remote
+        layer_arn : str
+            Layer ARN without the version
+
+        Returns
+        -------
+        Optional[int]
+            Latest version of the layer, None if the layer doesn't have any versions
+        """
+
+        def load_all() -> Dict[Hashable, Any]:
+            LOG.debug("Loading latest versions of all layers")
+            return {
+                layer.get("LayerArn"): layer.get("LatestMatchingVersion", {}).get("Version")
+                for page in lambda_client.get_paginator("list_layers").paginate()
+                for layer in page.get("Layers", [])
+                if layer.get("LatestMatchingVersion", {}).get("Version") is not None
+            }
+
+        def load_one() -> Optional[int]:
+            LOG.debug("Loading latest version of layer %s", layer_arn)
+            layer_versions = lambda_client.list_layer_versions(LayerName=layer_arn).get("LayerVersions", [])
+            return layer_versions[0].get("Version") if layer_versions else None
+
+        version = self._lookup(SyncResourceCache.LATEST_LAYER_VERSION, layer_arn, load_one, load_all)
+        return int(version) if version is not None else None
+
+    def set_latest_layer_version(self, layer_arn: str, version: int) -> None:
+        """Record a newly published layer version as the latest one
+
+        Parameters
+        ----------
+        layer_arn : str
+            Layer ARN without the version
+        version : int
+            Newly published layer version
+        """
+        with self._lock:
+            self._record_change(SyncResourceCache.LATEST_LAYER_VERSION, layer_arn)
+            self._put(SyncResourceCache.LATEST_LAYER_VERSION, layer_arn, version)
+
+    def get_layer_version(self, lambda_client: Any, layer_arn: str, version: int) -> Dict[str, Any]:
+        """Get information of a single layer version. Layer versions are immutable so they are only
+        removed from the cache when they expire or when they are deleted.
+
+        Parameters
+        ----------
+        lambda_client : Any
+            Lambda client to be used if the layer version needs to be loaded from remote
+        layer_arn : str
+            Layer ARN without the version
+        version : int
+            Layer version
+
+        Returns
+        -------
+        Dict[str, Any]
+            Layer version information in the same shape as the one returned by GetLayerVersion
+        """
+
+        def load_one() -> Dict[str, Any]:
+            LOG.debug("Loading layer version %s:%s", layer_arn, version)
+            return cast(Dict[str, Any], lambda_client.get_layer_version(LayerName=layer_arn, VersionNumber=version))
+
+        return cast(Dict[str, Any], self._lookup(SyncResourceCache.LAYER_VERSION, (layer_arn, version), load_one))
+
+    def invalidate_layer_version(self, layer_arn: str, version: int) -> None:
+        """Remove a deleted layer version from the cache
+
+        Parameters
+        ----------
+        layer_arn : str
+            Layer ARN without the version
+        version : int
+            Deleted layer version
+        """
+        with self._lock:
+            self._entries.pop((SyncResourceCache.LAYER_VERSION, (layer_arn, version)), None)
+            self._record_change(SyncResourceCache.LAYER_VERSION, (layer_arn, version))
+            if self._get(SyncResourceCache.LATEST_LAYER_VERSION, layer_arn) == version:
+                self._entries.pop((SyncResourceCache.LATEST_LAYER_VERSION, layer_arn), None)
+                self._record_change(SyncResourceCache.LATEST_LAYER_VERSION, layer_arn)
+
+    def invalidate(self) -> None:
+        """Remove everything from the cache"""
+        with self._lock:
+            self._entries.clear()
+            self._bulk_loaded.clear()
+            self._change_count += 1
+            self._cleared_at = self._change_count
+            # Changes before the cache is cleared are covered by the time it is cleared
+            self._invalidations.clear()
@@ -2,8 +2,9 @@
 import logging
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from threading import Lock
-from typing import Any, Dict, List, NamedTuple, Optional, TYPE_CHECKING, cast
+from typing import Any, ContextManager, Dict, List, NamedTuple, Optional, TYPE_CHECKING, cast
 from boto3.session import Session
 
 from samcli.lib.providers.provider import get_resource_by_id
@@ -12,6 +13,8 @@ from samcli.lib.providers.provider import ResourceIdentifier, Stack
 from samcli.lib.utils.boto_utils import get_boto_client_provider_from_session_with_config
 from samcli.lib.utils.lock_distributor import LockDistributor, LockChain
 from samcli.lib.sync.exceptions import MissingLockException, MissingPhysicalResourceError
+from samcli.lib.sync.resource_cache import SyncResourceCache
+from samcli.lib.sync.sync_timeline import SyncTimeline
 
 if TYPE_CHECKING:  # pragma: no cover
     from samcli.commands.deploy.deploy_context import DeployContext
@@ -39,6 +42,8 @@ class SyncFlow(ABC):
     _session: Optional[Session]
     _physical_id_mapping: Dict[str, str]
     _locks: Optional[Dict[str, Lock]]
+    _resource_cache: Optional[SyncResourceCache]
+    _timeline: Optional[SyncTimeline]
 
     def __init__(
         self,
@@ -69,6 +74,8 @@ class SyncFlow(ABC):
         self._session = None
         self._physical_id_mapping = physical_id_mapping
         self._locks = None
+        self._resource_cache = None
+        self._timeline = None
 
     def set_up(self) -> None:
         """Clients and other expensives setups should be handled here instead of constructor"""
@@ -165,6 +172,37 @@ class SyncFlow(ABC):
         """
         self._locks = locks
 
+    def set_resource_cache(self, resource_cache: Optional[SyncResourceCache]) -> None:
+        """Set the cache to be used for remote resource metadata.
+        Dependent SyncFlows will share the same cache.
+
+        Parameters
+        ----------
+        resource_cache : Optional[SyncResourceCache]
+            Cache shared between the SyncFlows of the same sync session
+        """
+        self._resource_cache = resource_cache
+
+    def set_timeline(self, timeline: Optional[SyncTimeline]) -> None:
+        """Set the timeline that the duration of each execution phase will be recorded to.
+
+        Parameters
+        ----------
+        timeline : Optional[SyncTimeline]
+            Timeline of the sync session
+        """
+        self._timeline = timeline
+
+    def _time_phase(self, phase: str) -> ContextManager:
+        """Context manager for recording the duration of an execution phase, no-op if there is no timeline
+
+        Parameters
+        ----------
+        phase : str
+            Name of the phase
+        """
+        return self._timeline.phase(self.log_name, phase) if self._timeline else nullcontext()
+
     @staticmethod
     def _get_lock_key(logical_id: str, api_call: str) -> str:
         """Get a single lock key for a pair of resource and API call.
@@ -235,6 +273,40 @@ class SyncFlow(ABC):
 
         return physical_id
 
+    def _get_function_configuration(self, lambda_client: Any, function_identifier: str) -> Dict[str, Any]:
+        """Get the remote configuration of a Lambda function.
+        Resource cache will be used if it is set, otherwise the configuration is fetched with GetFunction.
+
+        Parameters
+        ----------
+        lambda_client : Any
+            Lambda client
+        function_identifier : str
+            Function resource identifier
+
+        Returns
+        -------
+        Dict[str, Any]
+            Remote function configuration
+        """
+        function_physical_id = self.get_physical_id(function_identifier)
+        if self._resource_cache:
+            return self._resource_cache.get_function_configuration(lambda_client, function_physical_id)
+        return cast(
+            Dict[str, Any], lambda_client.get_function(FunctionName=function_physical_id).get("Configuration", {})
+        )
+
+    def _invalidate_function_configuration(self, function_identifier: str) -> None:
+        """Remove the cached configuration of a Lambda function after it is updated
+
+        Parameters
+        ----------
+        function_identifier : str
+            Function resource identifier
+        """
+        if self._resource_cache:
+            self._resource_cache.invalidate_function(self.get_physical_id(function_identifier))
+
     @abstractmethod
     def _equality_keys(self) -> Any:
         """This method needs to be overridden to distinguish between multiple instances of SyncFlows
@@ -275,6 +347,17 @@ class SyncFlow(ABC):
         """
         return f"SyncFlow [{self.log_name}]: "
 
+    @property
+    def is_internal(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            True if the SyncFlow is an implementation detail of another one, like waiting for a remote update.
+            Its start and finish are only logged at debug level.
+        """
+        return False
+
     def execute(self) -> List["SyncFlow"]:
         """Execute the sync flow and returns a list of dependent sync flows.
         Skips sync() and gather_dependencies() if compare() is True
@@ -285,15 +368,22 @@ class SyncFlow(ABC):
             A list of dependent sync flows
         """
         dependencies: List["SyncFlow"] = list()
-        LOG.debug("%sSetting Up", self.log_prefix)
-        self.set_up()
-        LOG.debug("%sGathering Resources", self.log_prefix)
-        self.gather_resources()
-        LOG.debug("%sComparing with Remote", self.log_prefix)
-        if not self.compare_remote():
-            LOG.debug("%sSyncing", self.log_prefix)
-            self.sync()
-            LOG.debug("%sGathering Dependencies", self.log_prefix)
-            dependencies = self.gather_dependencies()
+        with self._time_phase("execute"):
+            LOG.debug("%sSetting Up", self.log_prefix)
+            with self._time_phase("set_up"):
+                self.set_up()
+            LOG.debug("%sGathering Resources", self.log_prefix)
+            with self._time_phase("gather_resources"):
+                self.gather_resources()
+            LOG.debug("%sComparing with Remote", self.log_prefix)
+            with self._time_phase("compare_remote"):
+                is_synced = self.compare_remote()
+            if not is_synced:
+                LOG.debug("%sSyncing", self.log_prefix)
+                with self._time_phase("sync"):
+                    self.sync()
+                LOG.debug("%sGathering Dependencies", self.log_prefix)
+                with self._time_phase("gather_dependencies"):
+                    dependencies = self.gather_dependencies()
         LOG.debug("%sFinished", self.log_prefix)
         return dependencies
@@ -4,7 +4,7 @@ import time
 
 from queue import Queue
 from typing import Callable, List, Optional, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from threading import RLock
 from concurrent.futures import ThreadPoolExecutor, Future
@@ -20,10 +20,13 @@ from samcli.lib.sync.exceptions import (
     SyncFlowException,
     MissingFunctionBuildDefinition,
     InvalidRuntimeDefinitionForFunction,
+    SyncFlowRetryRequired,
+    FunctionUpdateFailedError,
 )
 
 from samcli.lib.utils.lock_distributor import LockDistributor, LockDistributorType
 from samcli.lib.sync.sync_flow import SyncFlow
+from samcli.lib.sync.sync_timeline import SyncTimeline
 
 LOG = logging.getLogger(__name__)
 
@@ -41,6 +44,20 @@ class SyncFlowTask:
     dedup: bool
 
 
+@dataclass(frozen=True, eq=True)
+class DelayedSyncFlowTask(SyncFlowTask):
+    """Data struct for individual SyncFlow execution tasks"""
+
+    # Time in seconds of when the task was initially queued
+    queue_time: float
+
+    # Number of seconds this task should stay in queue before being executed
+    wait_time: float
+
+    # Whether this task is a retry of a SyncFlow that is waiting on remote
+    retry: bool = False
+
+
 @dataclass(frozen=True, eq=True)
 class SyncFlowResult:
     """Data struct for SyncFlow results"""
@@ -56,6 +73,9 @@ class SyncFlowFuture:
     sync_flow: SyncFlow
     future: Future
 
+    # Time in seconds of when the SyncFlow was submitted to the ThreadPoolExecutor
+    submit_time: float = field(default_factory=time.time, compare=False)
+
 
 def default_exception_handler(sync_flow_exception: SyncFlowException) -> None:
     """Default exception handler for SyncFlowExecutor
@@ -95,6 +115,8 @@ def default_exception_handler(sync_flow_exception: SyncFlowException) -> None:
         )
     elif isinstance(exception, InvalidRuntimeDefinitionForFunction):
         LOG.error("No Runtime information found for function resource named %s", exception.function_logical_id)
+    elif isinstance(exception, FunctionUpdateFailedError):
+        LOG.error("Remote update of function %s failed: %s", exception.function_logical_id, exception.reason)
     elif isinstance(exception, MissingLocalDefinition):
         LOG.error(
             "Resource %s does not have %s specified. Skipping the sync.%s",
@@ -117,6 +139,7 @@ class SyncFlowExecutor:
     _running_flag: bool
     _color: Colored
     _running_futures: Set[SyncFlowFuture]
+    _timeline: SyncTimeline
 
     def __init__(
         self,
@@ -127,6 +150,7 @@ class SyncFlowExecutor:
         self._flow_queue_lock = RLock()
         self._color = Colored()
         self._running_futures = set()
+        self._timeline = SyncTimeline()
 
     def _add_sync_flow_task(self, task: SyncFlowTask) -> None:
         """Add SyncFlowTask to the queue
@@ -143,6 +167,7 @@ class SyncFlowExecutor:
                 return
 
             task.sync_flow.set_locks_with_distributor(self._lock_distributor)
+            task.sync_flow.set_timeline(self._timeline)
             self._flow_queue.put(task)
 
     def add_sync_flow(self, sync_flow: SyncFlow, dedup: bool = True) -> None:
@@ -167,6 +192,15 @@ class SyncFlowExecutor:
         """
         return self._running_flag
 
+    def _is_idle(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            Are there no running and pending SyncFlows
+        """
+        return not self._running_futures and self._flow_queue.empty()
+
     def _can_exit(self) -> bool:
         """
         Returns
@@ -174,7 +208,7 @@ class SyncFlowExecutor:
         bool
             Can executor be safely exited
         """
-        return not self._running_futures and self._flow_queue.empty()
+        return self._is_idle()
 
     def execute(
         self, exception_handler: Optional[Callable[[SyncFlowException], None]] = default_exception_handler
@@ -194,6 +228,10 @@ class SyncFlowExecutor:
 
                 self._execute_step(executor, exception_handler)
 
+                # Export timings of each batch of SyncFlows once all of them are finished
+                if self._is_idle():
+                    self._timeline.export()
+
                 # Exit execution if there are no running and pending sync flows
                 if self._can_exit():
                     LOG.debug("No more SyncFlows in executor. Stopping.")
@@ -203,6 +241,11 @@ class SyncFlowExecutor:
                 time.sleep(0.1)
         self._running_flag = False
 
+    @property
+    def timeline(self) -> SyncTimeline:
+        """Timeline containing phase timings of all SyncFlows executed by this executor"""
+        return self._timeline
+
     def _execute_step(
         self,
         executor: ThreadPoolExecutor,
@@ -233,7 +276,11 @@ class SyncFlowExecutor:
                 # Put it into deferred_tasks and add all of them at the end to avoid endless loop
                 if sync_flow_future:
                     self._running_futures.add(sync_flow_future)
-                    LOG.info(self._color.cyan(f"Syncing {sync_flow_future.sync_flow.log_name}..."))
+                    if isinstance(sync_flow_task, DelayedSyncFlowTask) and sync_flow_task.retry:
+                        continue
+                    sync_flow = sync_flow_future.sync_flow
+                    log = LOG.debug if sync_flow.is_internal else LOG.info
+                    log(self._color.cyan(f"Syncing {sync_flow.log_name}..."))
                 else:
                     deferred_tasks.append(sync_flow_task)
 
@@ -267,6 +314,13 @@ class SyncFlowExecutor:
         """
         sync_flow = sync_flow_task.sync_flow
 
+        # Check whether the delay of the task has passed or not
+        if (
+            isinstance(sync_flow_task, DelayedSyncFlowTask)
+            and sync_flow_task.wait_time + sync_flow_task.queue_time > time.time()
+        ):
+            return None
+
         # Check whether the same sync flow is already running or not
         if sync_flow in [future.sync_flow for future in self._running_futures]:
             return None
@@ -299,9 +353,24 @@ class SyncFlowExecutor:
         if not future.done():
             return False
 
+        # Time between submission and handling of the result, including the time spent waiting for a worker
+        self._timeline.record(
+            sync_flow_future.sync_flow.log_name,
+            "executor",
+            sync_flow_future.submit_time,
+            time.time() - sync_flow_future.submit_time,
+        )
+
         exception = future.exception()
 
-        if exception and isinstance(exception, SyncFlowException) and exception_handler:
+        if isinstance(exception, SyncFlowException) and isinstance(exception.exception, SyncFlowRetryRequired):
+            # Park the SyncFlow in the queue instead of waiting in a worker thread
+            wait_time = exception.exception.wait_time
+            LOG.debug("%sWaiting %s seconds for remote", sync_flow_future.sync_flow.log_prefix, wait_time)
+            self._add_sync_flow_task(
+                DelayedSyncFlowTask(sync_flow_future.sync_flow, False, time.time(), wait_time, retry=True)
+            )
+        elif exception and isinstance(exception, SyncFlowException) and exception_handler:
             # Exception handling
             exception_handler(exception)
         else:
@@ -309,7 +378,8 @@ class SyncFlowExecutor:
             sync_flow_result: SyncFlowResult = future.result()
             for dependent_sync_flow in sync_flow_result.dependent_sync_flows:
                 self.add_sync_flow(dependent_sync_flow)
-            LOG.info(self._color.green(f"Finished syncing {sync_flow_result.sync_flow.log_name}."))
+            log = LOG.debug if sync_flow_result.sync_flow.is_internal else LOG.info
+            log(self._color.green(f"Finished syncing {sync_flow_result.sync_flow.log_name}."))
         return True
 
     @staticmethod
@@ -7,6 +7,7 @@ from samcli.lib.providers.provider import Stack, get_resource_by_id, ResourceIde
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer
 from samcli.lib.sync.flows.auto_dependency_layer_sync_flow import AutoDependencyLayerParentSyncFlow
 from samcli.lib.sync.flows.layer_sync_flow import LayerSyncFlow
+from samcli.lib.sync.resource_cache import SyncResourceCache
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from samcli.lib.utils.resource_type_based_factory import ResourceTypeBasedFactory
 
@@ -48,6 +49,7 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
     _build_context: "BuildContext"
     _physical_id_mapping: Dict[str, str]
     _auto_dependency_layer: bool
+    _resource_cache: SyncResourceCache
 
     def __init__(
         self,
@@ -71,10 +73,13 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
         self._build_context = build_context
         self._auto_dependency_layer = auto_dependency_layer
         self._physical_id_mapping = dict()
+        self._resource_cache = SyncResourceCache()
 
     def load_physical_id_mapping(self) -> None:
         """Load physical IDs of the stack resources from remote"""
         LOG.debug("Loading physical ID mapping")
+        # remote resources might have changed, drop everything that was cached with the previous mapping
+        self._resource_cache.invalidate()
         self._physical_id_mapping = get_physical_id_mapping(
             get_boto_resource_provider_with_config(
                 region=self._deploy_context.region,
@@ -197,4 +202,7 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
         generator = self._get_generator_function(resource_identifier)
         if not generator or not resource:
             return None
-        return cast(SyncFlowFactory.GeneratorFunction, generator)(self, resource_identifier, resource)
+        sync_flow = cast(SyncFlowFactory.GeneratorFunction, generator)(self, resource_identifier, resource)
+        if sync_flow:
+            sync_flow.set_resource_cache(self._resource_cache)
+        return sync_flow
@@ -0,0 +1,188 @@
+"""Timing information of SyncFlow phases for a sync session"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, NamedTuple
+
+LOG = logging.getLogger(__name__)
+
+# If set, a trace of the sync session is written to this file in Chrome trace event format,
+# which can be opened with chrome://tracing or https://ui.perfetto.dev
+SYNC_TRACE_FILE_ENV_VAR = "SAM_CLI_SYNC_TRACE_FILE"
+# Maximum number of records kept in memory, older records are dropped from the trace once it is reached
+DEFAULT_MAX_RECORDS = 10000
+
+
+class SyncPhaseRecord(NamedTuple):
+    """Timing of a single phase of a SyncFlow"""
+
+    # Name of the SyncFlow, same as SyncFlow.log_name
+    flow_name: str
+    # Name of the phase, ex: gather_resources
+    phase: str
+    # Start time in seconds since epoch
+    start_time: float
+    # Duration in seconds
+    duration: float
+    # Thread that executed the phase
+    thread_id: int
+
+
+class SyncPhaseSummary(NamedTuple):
+    """Aggregated timing of a phase across all SyncFlows"""
+
+    phase: str
+    count: int
+    total: float
+    maximum: float
+
+
+class SyncTimeline:
+    """Thread safe collection of SyncFlow phase timings for a sync session.
+    Only the latest records are kept, while the summary covers every phase recorded in the session."""
+
+    _lock: threading.Lock
+    _records: Deque[SyncPhaseRecord]
+    _summaries: Dict[str, SyncPhaseSummary]
+
+    def __init__(self, max_records: int = DEFAULT_MAX_RECORDS) -> None:
+        """
+        Parameters
+        ----------
+        max_records : int
+            Maximum number of records to keep
+        """
+        self._lock = threading.Lock()
+        self._records = deque(maxlen=max_records)
+        self._summaries = dict()
+        self._record_count = 0
+        self._exported_record_count = 0
+
+    def record(self, flow_name: str, phase: str, start_time: float, duration: float) -> None:
+        """Add timing of a phase to the timeline
+
+        Parameters
+        ----------
+        flow_name : str
+            Name of the SyncFlow
+        phase : str
+            Name of the phase
+        start_time : float
+            Start time of the phase in seconds since epoch
+        duration : float
+            Duration of the phase in seconds
+        """
+        with self._lock:
+            self._records.append(SyncPhaseRecord(flow_name, phase, start_time, duration, threading.get_ident()))
+            summary = self._summaries.get(phase, SyncPhaseSummary(phase, 0, 0.0, 0.0))
+            self._summaries[phase] = SyncPhaseSummary(
+                phase, summary.count + 1, summary.total + duration, max(summary.maximum, duration)
+            )
+            self._record_count += 1
+
+    @contextmanager
+    def phase(self, flow_name: str, phase: str) -> Iterator[None]:
+        """Context manager that records the time spent in its block as a phase, including failed ones
+
+        Parameters
+        ----------
+        flow_name : str
+            Name of the SyncFlow
+        phase : str
+            Name of the phase
+        """
+        start_time = time.time()
+        start_counter = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(flow_name, phase, start_time, time.perf_counter() - start_counter)
+
+    @property
+    def records(self) -> List[SyncPhaseRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def get_flow_records(self, flow_name: str) -> List[SyncPhaseRecord]:
+        """
+        Parameters
+        ----------
+        flow_name : str
+            Name of the SyncFlow
+
+        Returns
+        -------
+        List[SyncPhaseRecord]
+            All records of the given SyncFlow in the order they were recorded
+        """
+        return [record for record in self.records if record.flow_name == flow_name]
+
+    def get_summary(self) -> List[SyncPhaseSummary]:
+        """
+        Returns
+        -------
+        List[SyncPhaseSummary]
+            Aggregated timings for each phase, in the order the phases were first recorded
+        """
+        with self._lock:
+            return list(self._summaries.values())
+
+    def log_summary(self) -> None:
+        """Log aggregated timings for each phase"""
+        summaries = self.get_summary()
+        if not summaries:
+            return
+        LOG.debug("Sync session timing summary:")
+        for summary in summaries:
+            LOG.debug(
+                "  %s: count=%d total=%.3fs avg=%.3fs max=%.3fs",
+                summary.phase,
+                summary.count,
+                summary.total,
+                summary.total / summary.count,
+                summary.maximum,
+            )
+
+    def write_trace(self, file_path: str) -> None:
+        """Write all records to a file in Chrome trace event format
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the trace file
+        """
+        trace_events = [
+            {
+                "name": f"{record.flow_name} {record.phase}",
+                "cat": record.phase,
+                "ph": "X",
+                "ts": int(record.start_time * 1_000_000),
+                "dur": int(record.duration * 1_000_000),
+                "pid": os.getpid(),
+                "tid": record.thread_id,
+                "args": {"flow": record.flow_name},
+            }
+            for record in self.records
+        ]
+        with open(file_path, "w") as trace_file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, trace_file)
+        LOG.debug("Sync session trace is written to %s", file_path)
+
+    def export(self) -> None:
+        """Log the summary and write the trace file if it is enabled through SAM_CLI_SYNC_TRACE_FILE.
+        Nothing is exported if there are no new records since the last export."""
+        with self._lock:
+            if self._record_count == self._exported_record_count:
+                return
+            self._exported_record_count = self._record_count
+        self.log_summary()
+        trace_file_path = os.environ.get(SYNC_TRACE_FILE_ENV_VAR)
+        if trace_file_path:
+            try:
+                self.write_trace(trace_file_path)
+            except OSError as ex:
+                LOG.warning("Failed to write sync trace file %s: %s", trace_file_path, str(ex))
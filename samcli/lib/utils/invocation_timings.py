@@ -0,0 +1,339 @@
+"""
+Opt-in timing of the phases of local Lambda invocations, to tell the overhead of the local emulation apart from the
+time the function code runs
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+LOG = logging.getLogger(__name__)
+
+# Set this environment variable to 1 to time the phases of local invocations
+INVOCATION_TIMINGS_ENV_VAR = "SAM_CLI_INVOCATION_TIMINGS"
+# Interval in seconds of the summary of the invocation timings that is logged
+SUMMARY_INTERVAL_SECONDS = 60.0
+# Response header that the timings of an invocation are returned in, see https://www.w3.org/TR/server-timing/
+SERVER_TIMING_HEADER = "Server-Timing"
+# Path of the endpoint of the local services that returns the aggregated timings as JSON
+INVOCATION_METRICS_PATH = "/_sam/invocation-metrics"
+
+CONFIG_PHASE = "config"
+ENV_VARS_PHASE = "env-vars"
+CODE_PHASE = "code"
+IMAGE_PHASE = "image"
+CREATE_PHASE = "create"
+START_PHASE = "start"
+PORT_WAIT_PHASE = "port-wait"
+INVOKE_PHASE = "invoke"
+LOGS_PHASE = "logs"
+CLEANUP_PHASE = "cleanup"
+# Time of the invocation that is not spent in any phase
+OTHER_PHASE = "other"
+# Phase that the function code runs in, together with the Runtime Interface Emulator. Everything else is overhead.
+FUNCTION_PHASE = INVOKE_PHASE
+
+_local = threading.local()
+
+_metrics: Optional["InvocationMetrics"] = None
+_metrics_lock = threading.Lock()
+
+
+def is_invocation_timing_enabled() -> bool:
+    """
+    Returns
+    -------
+    bool
+        True if the phases of local invocations are timed
+    """
+    return os.environ.get(INVOCATION_TIMINGS_ENV_VAR, "").lower() in ("1", "true")
+
+
+def get_invocation_metrics() -> "InvocationMetrics":
+    """
+    Returns
+    -------
+    InvocationMetrics
+        Aggregated timings of all invocations of the process
+    """
+    global _metrics  # pylint: disable=global-statement
+    with _metrics_lock:
+        if not _metrics:
+            _metrics = InvocationMetrics()
+        return _metrics
+
+
+def get_current_timings() -> Optional["InvocationTimings"]:
+    """
+    Returns
+    -------
+    Optional[InvocationTimings]
+        Timings of the invocation that is recorded on the current thread, None if there is none
+    """
+    return getattr(_local, "timings", None)
+
+
+@contextmanager
+def record_invocation(function_name: str) -> Iterator[Optional["InvocationTimings"]]:
+    """
+    Context Manager that records the timings of the phases of an invocation that run on the current thread.
+    Timings of invocations that finish without an exception are added to the aggregated metrics.
+
+    Parameters
+    ----------
+    function_name : str
+        Name of the invoked function
+
+    Yields
+    ------
+    Optional[InvocationTimings]
+        Timings of the invocation, None if invocation timing is not enabled
+    """
+    current = get_current_timings()
+    if current or not is_invocation_timing_enabled():
+        yield current
+        return
+
+    timings = InvocationTimings(function_name)
+    _local.timings = timings
+    try:
+        yield timings
+    finally:
+        _local.timings = None
+        timings.finish()
+    get_invocation_metrics().add(timings)
+
+
+@contextmanager
+def invocation_phase(name: str) -> Iterator[None]:
+    """
+    Context Manager that times a phase of the invocation that is recorded on the current thread, if any
+
+    Parameters
+    ----------
+    name : str
+        Name of the phase
+    """
+    timings = get_current_timings()
+    if not timings:
+        yield
+        return
+    with timings.phase(name):
+        yield
+
+
+class InvocationTimings:
+    """
+    Time spent in each phase of one invocation. The time of a nested phase is only counted in the nested phase,
+    so that the phases add up to the time of the invocation.
+    """
+
+    function_name: str
+    durations: Dict[str, float]
+    total: float
+
+    def __init__(self, function_name: str):
+        """
+        Parameters
+        ----------
+        function_name : str
+            Name of the invoked function
+        """
+        self.function_name = function_name
+        self.durations = {}
+        self.total = 0.0
+        self._start_time = time.perf_counter()
+        # Name of each running phase, and the time since which it is not counted yet
+        self._running: List[List[Any]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Context Manager that times a phase of the invocation
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase, the time of phases with the same name is added up
+        """
+        now = time.perf_counter()
+        if self._running:
+            parent_name, parent_start_time = self._running[-1]
+            self._add(parent_name, now - parent_start_time)
+        self._running.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            _, start_time = self._running.pop()
+            self._add(name, now - start_time)
+            if self._running:
+                self._running[-1][1] = now
+
+    def finish(self) -> None:
+        """Stop timing the invocation"""
+        self.total = time.perf_counter() - self._start_time
+        other = self.total - sum(self.durations.values())
+        if other > 0:
+            self.durations[OTHER_PHASE] = other
+
+    @property
+    def overhead(self) -> float:
+        """Time in seconds of the invocation that is not spent running the function code"""
+        return max(self.total - self.durations.get(FUNCTION_PHASE, 0.0), 0.0)
+
+    def to_server_timing_header(self) -> str:
+        """
+        Returns
+        -------
+        str
+            Value of the Server-Timing header with the duration of each phase, the overhead and the total in ms
+        """
+        metrics = [f"{name};dur={duration * 1000:.3f}" for name, duration in self.durations.items()]
+        metrics.append(f"overhead;dur={self.overhead * 1000:.3f}")
+        metrics.append(f"total;dur={self.total * 1000:.3f}")
+        return ", ".join(metrics)
+
+    def _add(self, name: str, duration: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + duration
+
+
+class _Aggregate:
+    """Count, total and maximum of durations"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "average_ms": round(self.average * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "total_ms": round(self.total * 1000, 3),
+        }
+
+
+class _FunctionMetrics:
+    """Aggregated timings of the invocations of one function"""
+
+    def __init__(self) -> None:
+        self.total = _Aggregate()
+        self.overhead = _Aggregate()
+        self.phases: Dict[str, _Aggregate] = {}
+
+    def add(self, timings: InvocationTimings) -> None:
+        self.total.add(timings.total)
+        self.overhead.add(timings.overhead)
+        for name, duration in timings.durations.items():
+            self.phases.setdefault(name, _Aggregate()).add(duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "invocations": self.total.count,
+            "total": self.total.to_dict(),
+            "overhead": self.overhead.to_dict(),
+            "phases": {name: phase.to_dict() for name, phase in self.phases.items()},
+        }
+
+
+class InvocationMetrics:
+    """
+    Aggregated timings of the invocations of each function. A summary of them is logged periodically
+    while there are new invocations.
+    """
+
+    _summary_interval: float
+    _lock: threading.Lock
+    _functions: Dict[str, _FunctionMetrics]
+    _summary_thread: Optional[threading.Thread]
+
+    def __init__(self, summary_interval: float = SUMMARY_INTERVAL_SECONDS):
+        """
+        Parameters
+        ----------
+        summary_interval : float
+            Interval in seconds of the summary that is logged
+        """
+        self._summary_interval = summary_interval
+        self._lock = threading.Lock()
+        self._functions = {}
+        self._invocations = 0
+        self._summarized_invocations = 0
+        self._summary_thread = None
+        self._stopped = threading.Event()
+
+    def add(self, timings: InvocationTimings) -> None:
+        """
+        Add the timings of a finished invocation
+
+        Parameters
+        ----------
+        timings : InvocationTimings
+            Timings of the invocation
+        """
+        with self._lock:
+            self._functions.setdefault(timings.function_name, _FunctionMetrics()).add(timings)
+            self._invocations += 1
+            if not self._summary_thread:
+                self._summary_thread = threading.Thread(
+                    target=self._log_summaries, name="InvocationMetricsSummary", daemon=True
+                )
+                self._summary_thread.start()
+        LOG.debug("Timings of invocation of %s: %s", timings.function_name, timings.to_server_timing_header())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns
+        -------
+        Dict[str, Any]
+            JSON serializable metrics of each function, with the count, average, maximum and total of the
+            invocation time, the overhead and each phase in ms
+        """
+        with self._lock:
+            return {name: function_metrics.to_dict() for name, function_metrics in self._functions.items()}
+
+    def log_summary(self) -> None:
+        """Log a summary of the metrics of each function, if there were invocations since the last summary"""
+        with self._lock:
+            if self._invocations == self._summarized_invocations:
+                return
+            self._summarized_invocations = self._invocations
+            summaries = [
+                "{} ({} invocations): average {:.1f}ms, overhead {:.1f}ms [{}]".format(
+                    name,
+                    function_metrics.total.count,
+                    function_metrics.total.average * 1000,
+                    function_metrics.overhead.average * 1000,
+                    ", ".join(
+                        "{} {:.1f}ms".format(phase_name, phase.average * 1000)
+                        for phase_name, phase in function_metrics.phases.items()
+                    ),
+                )
+                for name, function_metrics in self._functions.items()
+            ]
+        LOG.info("Invocation timings:\n%s", "\n".join(summaries))
+
+    def stop(self) -> None:
+        """Stop logging summaries"""
+        self._stopped.set()
+        with self._lock:
+            thread = self._summary_thread
+        if thread:
+            thread.join()
+
+    def _log_summaries(self) -> None:
+        while not self._stopped.wait(self._summary_interval):
+            self.log_summary()
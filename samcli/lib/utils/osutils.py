@@ -7,8 +7,9 @@ import shutil
 import stat
 import sys
 import tempfile
+import time
 from contextlib import contextmanager
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 LOG = logging.getLogger(__name__)
 
@@ -113,6 +114,43 @@ def tempfile_platform_independent():
         remove(_tempfile.name)
 
 
+@contextmanager
+def file_lock(lock_file_path: str) -> Iterator[None]:
+    """
+    Context manager that holds an exclusive lock on a file, so that only one process at a time
+    can run the code inside it for the same lock file. The lock file is created if it doesn't exist.
+
+    Parameters
+    ----------
+    lock_file_path : str
+        Path of the lock file
+    """
+    with open(lock_file_path, "a+b") as lock_file:
+        if os.name == "nt":  # pragma: no cover
+            import msvcrt  # pylint: disable=import-outside-toplevel,import-error
+
+            while True:
+                try:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)  # type: ignore
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore
+        else:
+            import fcntl  # pylint: disable=import-outside-toplevel
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 # NOTE: Py3.8 or higher has a ``dir_exist_ok=True`` parameter to provide this functionality.
 #       This method can be removed if we stop supporting Py37
 def copytree(source, destination, ignore=None):
@@ -2,9 +2,25 @@
 Tarball Archive utility
 """
 
+import logging
+import queue
 import tarfile
+import threading
+from gzip import GzipFile
 from tempfile import TemporaryFile
 from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+LOG = logging.getLogger(__name__)
+
+# Size of the chunks that a streamed tarball is yielded in
+STREAM_CHUNK_SIZE = 1024 * 1024
+# Number of chunks that are written ahead of the reader, this bounds the memory used by a streamed tarball
+STREAM_MAX_PENDING_CHUNKS = 8
+# Modification time of the entries in deterministic tarballs
+DETERMINISTIC_MTIME = 0
+
+_END_OF_STREAM = b""
 
 
 @contextmanager
@@ -36,3 +52,145 @@ def create_tarball(tar_paths, tar_filter=None):
         yield tarballfile
     finally:
         tarballfile.close()
+
+
+class _StreamCancelled(Exception):
+    pass
+
+
+class _ChunkWriter:
+    """
+    Write only file object that splits the written data into chunks and puts them in a bounded queue,
+    so that writing blocks while the reader is behind
+    """
+
+    def __init__(self, chunks: "queue.Queue[bytes]", cancelled: threading.Event, chunk_size: int = STREAM_CHUNK_SIZE):
+        self._chunks = chunks
+        self._cancelled = cancelled
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._chunk_size:
+            self.put(bytes(self._buffer[: self._chunk_size]))
+            del self._buffer[: self._chunk_size]
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if self._buffer:
+            self.put(bytes(self._buffer))
+            self._buffer.clear()
+        self.put(_END_OF_STREAM)
+
+    def put(self, chunk: bytes) -> None:
+        while True:
+            if self._cancelled.is_set():
+                raise _StreamCancelled()
+            try:
+                self._chunks.put(chunk, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+@contextmanager
+def stream_tarball(
+    tar_paths: Dict[str, str],
+    tar_filter: Optional[Callable[[tarfile.TarInfo], Optional[tarfile.TarInfo]]] = None,
+    gzip: bool = False,
+    deterministic: bool = False,
+    recursive: bool = True,
+) -> Iterator[Iterator[bytes]]:
+    """
+    Context Manager that streams the tarball of the Docker Context to use for building the image.
+    The tarball is written by a background thread while it is read, instead of being written to a temporary file
+    first, so that Docker receives the context while the files are walked.
+
+    Parameters
+    ----------
+    tar_paths dict(str, str)
+        Key representing a full path to the file or directory and the Value representing the path within the tarball
+    tar_filter Callable
+        Filter that is applied to the entries of the tarball, see tarfile.TarFile.add
+    gzip bool
+        True to compress the tarball with gzip
+    deterministic bool
+        True to produce the same tarball for the same content, by clearing the owner and modification time
+        of the entries. Entries of directories are always added in sorted order.
+    recursive bool
+        False to only add the given paths, and not the content of the directories
+
+    Yields
+    ------
+    Iterator[bytes]
+        Chunks of the tarball. Errors from reading the files are raised while iterating. Since the reader of the
+        chunks can wrap them, they are raised again when exiting the context with an exception, but only if they
+        were raised to the reader. Other exceptions of the context are not replaced.
+    """
+    chunks: "queue.Queue[bytes]" = queue.Queue(maxsize=STREAM_MAX_PENDING_CHUNKS)
+    cancelled = threading.Event()
+    errors: List[Exception] = []
+    # Set when an error of the writer is raised to the reader of the chunks
+    error_raised = threading.Event()
+    item_filter = _get_deterministic_filter(tar_filter) if deterministic else tar_filter
+
+    def write_tarball() -> None:
+        writer = _ChunkWriter(chunks, cancelled)
+        try:
+            compressor = GzipFile(fileobj=writer, mode="wb", mtime=DETERMINISTIC_MTIME) if gzip else None
+            with tarfile.open(fileobj=compressor or writer, mode="w|") as archive:
+                for path_on_system, path_in_tarball in tar_paths.items():
+                    archive.add(path_on_system, arcname=path_in_tarball, recursive=recursive, filter=item_filter)
+            if compressor:
+                compressor.close()
+            writer.close()
+        except _StreamCancelled:
+            LOG.debug("Streaming of tarball is cancelled")
+        except Exception as ex:  # pylint: disable=broad-except
+            errors.append(ex)
+            try:
+                writer.put(_END_OF_STREAM)
+            except _StreamCancelled:
+                pass
+
+    def read_chunks() -> Iterator[bytes]:
+        while True:
+            chunk = chunks.get()
+            # Chunks of the tarball are never empty
+            if chunk == _END_OF_STREAM:
+                break
+            yield chunk
+        if errors:
+            error_raised.set()
+            raise errors[0]
+
+    writer_thread = threading.Thread(target=write_tarball, name="TarballWriter", daemon=True)
+    writer_thread.start()
+    try:
+        yield read_chunks()
+    except Exception as ex:
+        if errors and errors[0] is not ex:
+            if error_raised.is_set():
+                # The reader stopped because of the truncated stream, and wrapped the error of the writer
+                raise errors[0] from ex
+            LOG.debug("Streaming of tarball failed after the reader failed", exc_info=errors[0])
+        raise
+    finally:
+        cancelled.set()
+        writer_thread.join()
+
+
+def _get_deterministic_filter(
+    tar_filter: Optional[Callable[[tarfile.TarInfo], Optional[tarfile.TarInfo]]]
+) -> Callable[[tarfile.TarInfo], Optional[tarfile.TarInfo]]:
+    def deterministic_filter(tar_info: tarfile.TarInfo) -> Optional[tarfile.TarInfo]:
+        tar_info.uid = tar_info.gid = 0
+        tar_info.uname = tar_info.gname = ""
+        tar_info.mtime = DETERMINISTIC_MTIME
+        return tar_filter(tar_info) if tar_filter else tar_info
+
+    return deterministic_filter
@@ -14,6 +14,7 @@ from werkzeug.routing import BaseConverter
 
 from samcli.lib.providers.provider import Cors
 from samcli.local.services.base_local_service import BaseLocalService, LambdaOutputParser
+from samcli.lib.utils.invocation_timings import invocation_phase, record_invocation, LOGS_PHASE
 from samcli.lib.utils.stream_writer import StreamWriter
 from samcli.local.lambdafn.exceptions import FunctionNotFound
 from samcli.local.events.api_event import (
@@ -201,6 +202,7 @@ class LocalApigwService(BaseLocalService):
             self._add_catch_all_path(all_methods, "/", default_route)
             self._add_catch_all_path(Route.ANY_HTTP_METHODS, "/<path:any_path>", default_route)
 
+        self._add_invocation_metrics_endpoint()
         self._construct_error_handling()
 
     def _add_catch_all_path(self, methods, path, route):
@@ -354,15 +356,17 @@ class LocalApigwService(BaseLocalService):
         stdout_stream_writer = StreamWriter(stdout_stream, auto_flush=True)
 
         try:
-            self.lambda_runner.invoke(route.function_name, event, stdout=stdout_stream_writer, stderr=self.stderr)
-        except FunctionNotFound:
-            return ServiceErrorResponses.lambda_not_found_response()
+            with record_invocation(route.function_name) as timings:
+                self.lambda_runner.invoke(route.function_name, event, stdout=stdout_stream_writer, stderr=self.stderr)
 
-        lambda_response, lambda_logs, _ = LambdaOutputParser.get_lambda_output(stdout_stream)
+                with invocation_phase(LOGS_PHASE):
+                    lambda_response, lambda_logs, _ = LambdaOutputParser.get_lambda_output(stdout_stream)
 
-        if self.stderr and lambda_logs:
-            # Write the logs to stderr if available.
-            self.stderr.write(lambda_logs)
+                    if self.stderr and lambda_logs:
+                        # Write the logs to stderr if available.
+                        self.stderr.write(lambda_logs)
+        except FunctionNotFound:
+            return ServiceErrorResponses.lambda_not_found_response()
 
         try:
             if route.event_type == Route.HTTP and (
@@ -379,7 +383,7 @@ class LocalApigwService(BaseLocalService):
             LOG.error("Invalid lambda response received: %s", ex)
             return ServiceErrorResponses.lambda_failure_response()
 
-        return self.service_response(body, headers, status_code)
+        return self.add_invocation_timings(self.service_response(body, headers, status_code), timings)
 
     def _get_current_route(self, flask_request):
         """
@@ -13,8 +13,10 @@ import docker
 import requests
 
 from docker.errors import NotFound as DockerNetworkNotFound
+from samcli.lib.utils.invocation_timings import invocation_phase, PORT_WAIT_PHASE
 from samcli.lib.utils.retry import retry
 from .exceptions import ContainerNotStartableException
+from .log_collector import ContainerLogCollector, get_container_log_collector
 
 from .utils import to_posix_path, find_free_port, NoFreePortsError
 
@@ -284,7 +286,8 @@ class Container:
         real_container.start()
 
         # Wait for port to be open
-        self.wait_for_port()
+        with invocation_phase(PORT_WAIT_PHASE):
+            self.wait_for_port()
 
     def wait_for_port(self):
         """
@@ -330,9 +333,14 @@ class Container:
         # NOTE(sriram-mv): All logging is re-directed to stderr, so that only the lambda function return
         # will be written to stdout.
 
-        # the log thread will not be closed until the container itself got deleted,
-        # so as long as the container is still there, no need to start a new log thread
-        if not self._logs_thread or not self._logs_thread.is_alive():
+        # the logs will be collected until the container itself got deleted,
+        # so as long as the container is still there, no need to attach to its logs again
+        if ContainerLogCollector.is_supported(self.docker_client):
+            # Collect the logs of all containers on a single thread, instead of starting a thread per container
+            log_collector = get_container_log_collector()
+            if not log_collector.is_attached(self.id):
+                log_collector.attach(self.id, self._attach_socket(), stdout=stderr, stderr=stderr)
+        elif not self._logs_thread or not self._logs_thread.is_alive():
             self._logs_thread = threading.Thread(target=self.wait_for_logs, args=(stderr, stderr), daemon=True)
             self._logs_thread.start()
 
@@ -354,6 +362,20 @@ class Container:
 
         self._write_container_output(logs_itr, stdout=stdout, stderr=stderr)
 
+    def _attach_socket(self):
+        """
+        Attach to the stdout and stderr of the container, including the output written so far
+
+        Returns
+        -------
+        socket
+            Socket that the output is read from, in the Docker Attach Stream format
+        """
+        if not self.is_created():
+            raise RuntimeError("Container does not exist. Cannot get logs for this container")
+
+        return self.docker_client.api.attach_socket(self.id, params={"stdout": 1, "stderr": 1, "stream": 1, "logs": 1})
+
     def copy(self, from_container_path, to_host_path):
 
         if not self.is_created():
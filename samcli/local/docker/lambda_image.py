@@ -1,22 +1,28 @@
 """
 Generates a Docker Image to be used for invoking a function locally
 """
+import os
 import uuid
 import logging
 import hashlib
+import threading
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
 
 import sys
 import platform
 import docker
+from docker.utils import parse_repository_tag
 
 from samcli.commands.local.cli_common.user_exceptions import ImageBuildException
 from samcli.commands.local.lib.exceptions import InvalidIntermediateImageError
 from samcli.lib.utils.architecture import has_runtime_multi_arch_image
+from samcli.lib.utils.hash import dir_checksum, file_checksum
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from samcli.lib.utils.stream_writer import StreamWriter
-from samcli.lib.utils.tar import create_tarball
+from samcli.lib.utils.tar import stream_tarball
 from samcli.local.docker.utils import get_rapid_name, get_docker_platform
 
 from samcli import __version__ as version
@@ -24,6 +30,8 @@ from samcli import __version__ as version
 LOG = logging.getLogger(__name__)
 
 RAPID_IMAGE_TAG_PREFIX = "rapid"
+# Label of the built images that holds the hash of the content they are built from
+CONTEXT_HASH_LABEL = "com.amazonaws.samcli.context-hash"
 
 
 class Runtime(Enum):
@@ -79,6 +87,9 @@ class LambdaImage:
         self.force_image_build = force_image_build
         self.docker_client = docker_client or docker.from_env()
         self.invoke_images = invoke_images
+        self._lock = threading.Lock()
+        # Lock of each image that is being built, and the number of builds that hold or wait for it
+        self._build_locks: Dict[str, Tuple[threading.Lock, int]] = {}
 
     def build(self, runtime, packagetype, image, layers, architecture, stream=None, function_name=None):
         """
@@ -127,39 +138,55 @@ class LambdaImage:
         image_repo = image_name.split(":")[0].replace("@", "")
         image_tag = f"{image_repo}:{RAPID_IMAGE_TAG_PREFIX}-{version}-{architecture}"
 
-        downloaded_layers = []
-
         if layers and packagetype == ZIP:
-            downloaded_layers = self.layer_downloader.download_all(layers, self.force_image_build)
-
-            docker_image_version = self._generate_docker_image_version(downloaded_layers, runtime, architecture)
+            docker_image_version = self._generate_docker_image_version(layers, runtime, architecture)
             image_tag = f"{self._SAM_CLI_REPO_NAME}:{docker_image_version}"
 
-        image_not_found = False
-
-        # If we are not using layers, build anyways to ensure any updates to rapid get added
-        try:
-            self.docker_client.images.get(image_tag)
-        except docker.errors.ImageNotFound:
-            LOG.info("Image was not found.")
-            image_not_found = True
-
-        # If building a new rapid image, delete older rapid images of the same repo
-        if image_not_found and image_tag == f"{image_repo}:{RAPID_IMAGE_TAG_PREFIX}-{version}-{architecture}":
-            self._remove_rapid_images(image_repo)
-
-        if (
-            self.force_image_build
-            or image_not_found
-            or any(layer.is_defined_within_template for layer in downloaded_layers)
-            or not runtime
-        ):
-            stream_writer = stream or StreamWriter(sys.stderr)
-            stream_writer.write("Building image...")
-            stream_writer.flush()
-            self._build_image(
-                image if image else image_name, image_tag, downloaded_layers, architecture, stream=stream_writer
-            )
+        # Functions that share the same image are built once, others wait for the build and then reuse the image
+        with self._build_lock(image_tag):
+            downloaded_layers = []
+
+            if layers and packagetype == ZIP:
+                downloaded_layers = self.layer_downloader.download_all(layers, self.force_image_build)
+
+            image_not_found = False
+            existing_image = None
+
+            # If we are not using layers, build anyways to ensure any updates to rapid get added
+            try:
+                existing_image = self.docker_client.images.get(image_tag)
+            except docker.errors.ImageNotFound:
+                LOG.info("Image was not found.")
+                image_not_found = True
+
+            # If building a new rapid image, delete older rapid images of the same repo
+            if image_not_found and image_tag == f"{image_repo}:{RAPID_IMAGE_TAG_PREFIX}-{version}-{architecture}":
+                self._remove_rapid_images(image_repo)
+
+            base_image = image if image else image_name
+            if (
+                self.force_image_build
+                or image_not_found
+                or any(layer.is_defined_within_template for layer in downloaded_layers)
+                or not runtime
+            ):
+                # A forced build picks up the updates of the base image, which are pulled before the existing image
+                # is compared with it
+                if self.force_image_build and not self.skip_pull_image:
+                    self._pull_base_image(base_image, architecture)
+                context_hash = self._get_context_hash(base_image, downloaded_layers, architecture)
+                if not self._is_image_up_to_date(existing_image, context_hash):
+                    stream_writer = stream or StreamWriter(sys.stderr)
+                    stream_writer.write("Building image...")
+                    stream_writer.flush()
+                    self._build_image(
+                        base_image,
+                        image_tag,
+                        downloaded_layers,
+                        architecture,
+                        stream=stream_writer,
+                        context_hash=context_hash,
+                    )
 
         return image_tag
 
@@ -171,6 +198,113 @@ class LambdaImage:
         except docker.errors.ImageNotFound:
             return config
 
+    @contextmanager
+    def _build_lock(self, image_tag: str) -> Iterator[None]:
+        """
+        Context Manager that holds the lock of an image while it is built. The lock is removed once no other build
+        of the image is waiting for it.
+
+        Parameters
+        ----------
+        image_tag str
+            Tag of the image that is built
+        """
+        with self._lock:
+            lock, count = self._build_locks.get(image_tag, (threading.Lock(), 0))
+            self._build_locks[image_tag] = (lock, count + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, count = self._build_locks[image_tag]
+                if count > 1:
+                    self._build_locks[image_tag] = (lock, count - 1)
+                else:
+                    del self._build_locks[image_tag]
+
+    def _pull_base_image(self, base_image, architecture):
+        """
+        Pull the latest version of the base image. The image on the system is used if it cannot be pulled.
+
+        Parameters
+        ----------
+        base_image str
+            Base Image to use for the new image
+        architecture str
+            Architecture type either x86_64 or arm64 on AWS lambda
+        """
+        repository, tag = parse_repository_tag(base_image)
+        LOG.info("Pulling base image %s", base_image)
+        try:
+            # Without a tag, Docker would pull all tags of the repository
+            self.docker_client.images.pull(repository, tag=tag or "latest", platform=get_docker_platform(architecture))
+        except docker.errors.APIError:
+            LOG.debug("Unable to pull the base image %s, using the image on the system", base_image, exc_info=True)
+
+    @staticmethod
+    def _is_image_up_to_date(existing_image, context_hash) -> bool:
+        """
+        Check if an existing image is built from the same content that it would be rebuilt from
+
+        Parameters
+        ----------
+        existing_image docker.models.images.Image
+            Existing image with the tag to build, None if there isn't one
+        context_hash Optional[str]
+            Hash of the content that the new image would be built from, see _get_context_hash
+
+        Returns
+        -------
+        bool
+            True if the existing image has the same context hash label as the new image would have
+        """
+        if existing_image is None:
+            return False
+        if not context_hash or (existing_image.labels or {}).get(CONTEXT_HASH_LABEL) != context_hash:
+            return False
+        LOG.info("Image is up-to-date with its layers, skipping build.")
+        return True
+
+    def _get_context_hash(self, base_image, layers, architecture) -> Optional[str]:
+        """
+        Generate the hash of the content that an image is built from: the local base image, the Dockerfile,
+        the version of SAM CLI which the RIE is shipped with, and the content of the layers
+
+        Parameters
+        ----------
+        base_image str
+            Base Image to use for the new image
+        layers list(samcli.commands.local.lib.provider.Layer)
+            List of Layers to be use to mount in the image
+        architecture str
+            Architecture type either x86_64 or arm64 on AWS lambda
+
+        Returns
+        -------
+        Optional[str]
+            SHA256 hash of the content, None if the base image is not on the system or a layer cannot be read
+        """
+        try:
+            base_image_id = self.docker_client.images.get(base_image).id
+        except (docker.errors.ImageNotFound, docker.errors.APIError):
+            LOG.debug("Unable to get the base image %s to compute the context hash", base_image, exc_info=True)
+            return None
+
+        dockerfile_content = self._generate_dockerfile(base_image, layers, architecture)
+        hash_generator = hashlib.sha256(f"{version}\n{base_image_id}\n{dockerfile_content}".encode("utf-8"))
+        try:
+            for layer in layers:
+                if os.path.isdir(layer.codeuri):
+                    layer_checksum = dir_checksum(layer.codeuri, hash_generator=hashlib.sha256())
+                else:
+                    layer_checksum = file_checksum(layer.codeuri, hashlib.sha256())
+                hash_generator.update(f"{layer.name}\n{layer_checksum}\n".encode("utf-8"))
+        except OSError:
+            LOG.debug("Unable to read the layers to compute the context hash", exc_info=True)
+            return None
+        return hash_generator.hexdigest()
+
     @staticmethod
     def _generate_docker_image_version(layers, runtime, architecture):
         """
@@ -207,7 +341,7 @@ class LambdaImage:
             + hashlib.sha256("-".join([layer.name for layer in layers]).encode("utf-8")).hexdigest()[0:25]
         )
 
-    def _build_image(self, base_image, docker_tag, layers, architecture, stream=None):
+    def _build_image(self, base_image, docker_tag, layers, architecture, stream=None, context_hash=None):
         """
         Builds the image
 
@@ -219,6 +353,8 @@ class LambdaImage:
             Docker tag (REPOSITORY:TAG) to use when building the image
         layers list(samcli.commands.local.lib.provider.Layer)
             List of Layers to be use to mount in the image
+        context_hash Optional[str]
+            Hash of the content that the image is built from, the image is labeled with it if it is given
 
         Raises
         ------
@@ -255,16 +391,18 @@ class LambdaImage:
             # Set only on Windows, unix systems will preserve the host permission into the tarball
             tar_filter = set_item_permission if platform.system().lower() == "windows" else None
 
-            with create_tarball(tar_paths, tar_filter=tar_filter) as tarballfile:
+            # Stream the context to Docker while it is archived, instead of archiving the layers into a temporary file
+            with stream_tarball(tar_paths, tar_filter=tar_filter) as tarball:
                 try:
                     resp_stream = self.docker_client.api.build(
-                        fileobj=tarballfile,
+                        fileobj=tarball,
                         custom_context=True,
                         rm=True,
                         tag=docker_tag,
                         pull=not self.skip_pull_image,
                         decode=True,
                         platform=get_docker_platform(architecture),
+                        labels={CONTEXT_HASH_LABEL: context_hash} if context_hash else None,
                     )
                     for log in resp_stream:
                         stream_writer.write(".")
@@ -0,0 +1,271 @@
+"""
+Collects the output of the running containers on a single thread
+"""
+import logging
+import selectors
+import socket
+import ssl
+import struct
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+LOG = logging.getLogger(__name__)
+
+# Number of bytes read from a container at a time
+READ_SIZE = 64 * 1024
+# Number of bytes of output that are collected before they are written, even if more output is available
+MAX_PENDING_BYTES = 256 * 1024
+
+# Header of the frames in the Docker Attach Stream, which contains the frame type and the size of the payload
+_FRAME_HEADER = struct.Struct(">BxxxL")
+_STDOUT_FRAME_TYPE = 1
+_STDERR_FRAME_TYPE = 2
+
+# Docker clients that connect through unix or plain tcp sockets, which can be waited on with a selector
+_UNIX_SOCKET_BASE_URL = "http+docker://localhost"
+_TCP_SOCKET_BASE_URL_PREFIX = "http://"
+
+_collector: Optional["ContainerLogCollector"] = None
+_collector_lock = threading.Lock()
+
+
+def get_container_log_collector() -> "ContainerLogCollector":
+    """
+    Returns
+    -------
+    ContainerLogCollector
+        Log collector that is shared by all the containers of the process
+    """
+    global _collector  # pylint: disable=global-statement
+    with _collector_lock:
+        if not _collector:
+            _collector = ContainerLogCollector()
+        return _collector
+
+
+class _AttachedContainer:
+    """Output of an attached container, and the state of the frame that is being read from it"""
+
+    def __init__(self, container_id: str, attach_socket: Any, sock: socket.socket, stdout: Any, stderr: Any):
+        self.container_id = container_id
+        self.attach_socket = attach_socket
+        self.sock = sock
+        self.stdout = stdout
+        self.stderr = stderr
+        self._buffer = bytearray()
+        self._frame_type = 0
+        self._remaining = 0
+
+    def parse(self, data: bytes) -> Iterator[Tuple[int, bytes]]:
+        """
+        Parse the output of the container. The payload of the frames is returned as it is read,
+        so that only the header of a frame is buffered.
+
+        Parameters
+        ----------
+        data : bytes
+            Data read from the container
+
+        Yields
+        ------
+        Tuple[int, bytes]
+            Frame type and the payload of the frame that is read so far
+        """
+        self._buffer += data
+        while self._buffer:
+            if not self._remaining:
+                if len(self._buffer) < _FRAME_HEADER.size:
+                    return
+                self._frame_type, self._remaining = _FRAME_HEADER.unpack_from(self._buffer)
+                del self._buffer[: _FRAME_HEADER.size]
+                continue
+            payload = bytes(self._buffer[: self._remaining])
+            del self._buffer[: self._remaining]
+            self._remaining -= len(payload)
+            yield self._frame_type, payload
+
+
+class ContainerLogCollector:
+    """
+    Reads the output of all attached containers on a single thread that waits on their sockets with a selector,
+    instead of a thread per container. The output that is read in one round is written to each stream at once,
+    so that streams that flush on every write are flushed once per round.
+    """
+
+    _read_size: int
+    _max_pending_bytes: int
+    _selector: selectors.BaseSelector
+    _attached: Dict[str, _AttachedContainer]
+    _lock: threading.Lock
+    _thread: Optional[threading.Thread]
+
+    def __init__(self, read_size: int = READ_SIZE, max_pending_bytes: int = MAX_PENDING_BYTES):
+        """
+        Parameters
+        ----------
+        read_size : int
+            Number of bytes read from a container at a time
+        max_pending_bytes : int
+            Number of bytes of output that are collected before they are written
+        """
+        self._read_size = read_size
+        self._max_pending_bytes = max_pending_bytes
+        self._selector = selectors.DefaultSelector()
+        self._attached = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+        # Wakes up the collector thread when containers are attached, so that they are read right away
+        self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self._wakeup_reader.setblocking(False)
+        self._selector.register(self._wakeup_reader, selectors.EVENT_READ)
+
+    @staticmethod
+    def is_supported(docker_client: Any) -> bool:
+        """
+        Parameters
+        ----------
+        docker_client : docker.DockerClient
+            Docker client that the containers are attached with
+
+        Returns
+        -------
+        bool
+            True if the sockets of the client can be waited on with a selector, False for TLS, named pipes and SSH
+        """
+        base_url = getattr(docker_client.api, "base_url", None)
+        return isinstance(base_url, str) and (
+            base_url == _UNIX_SOCKET_BASE_URL or base_url.startswith(_TCP_SOCKET_BASE_URL_PREFIX)
+        )
+
+    def attach(self, container_id: str, attach_socket: Any, stdout: Any = None, stderr: Any = None) -> None:
+        """
+        Start collecting the output of a container, until the container closes its output
+
+        Parameters
+        ----------
+        container_id : str
+            ID of the container
+        attach_socket : Any
+            Socket returned by the Docker attach socket API, for a container that is not created with a TTY
+        stdout : samcli.lib.utils.stream_writer.StreamWriter, optional
+            Stream writer to write stdout data from Container into
+        stderr : samcli.lib.utils.stream_writer.StreamWriter, optional
+            Stream writer to write stderr data from Container into
+        """
+        sock = getattr(attach_socket, "_sock", attach_socket)
+        if not isinstance(sock, socket.socket) or isinstance(sock, ssl.SSLSocket):
+            raise ValueError(f"Output of container {container_id} is not a socket that can be collected")
+
+        attached = _AttachedContainer(container_id, attach_socket, sock, stdout, stderr)
+        with self._lock:
+            previous = self._attached.pop(container_id, None)
+            if previous:
+                self._close(previous)
+            self._attached[container_id] = attached
+            self._selector.register(sock, selectors.EVENT_READ, attached)
+            if not self._thread:
+                self._thread = threading.Thread(target=self._run, name="ContainerLogCollector", daemon=True)
+                self._thread.start()
+        self._wakeup()
+
+    def is_attached(self, container_id: Optional[str]) -> bool:
+        """
+        Parameters
+        ----------
+        container_id : Optional[str]
+            ID of the container
+
+        Returns
+        -------
+        bool
+            True if the output of the container is being collected
+        """
+        with self._lock:
+            return container_id in self._attached
+
+    def stop(self) -> None:
+        """Stop collecting the output of all containers"""
+        with self._lock:
+            self._stopped = True
+            thread = self._thread
+        self._wakeup()
+        if thread:
+            thread.join()
+        with self._lock:
+            for attached in self._attached.values():
+                self._close(attached)
+            self._attached.clear()
+
+    def _wakeup(self) -> None:
+        try:
+            self._wakeup_writer.send(b"\0")
+        except OSError:
+            LOG.debug("Unable to wake up container log collector", exc_info=True)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if self._stopped:
+                    return
+            pending: Dict[int, Tuple[Any, List[bytes]]] = {}
+            pending_bytes = 0
+            for key, _ in self._selector.select():
+                if key.fileobj is self._wakeup_reader:
+                    self._drain_wakeup()
+                    continue
+                for writer, payload in self._read(key.data):
+                    pending.setdefault(id(writer), (writer, []))[1].append(payload)
+                    pending_bytes += len(payload)
+                if pending_bytes >= self._max_pending_bytes:
+                    self._write(pending)
+                    pending_bytes = 0
+            self._write(pending)
+
+    def _drain_wakeup(self) -> None:
+        try:
+            while self._wakeup_reader.recv(1024):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    def _read(self, attached: _AttachedContainer) -> Iterator[Tuple[Any, bytes]]:
+        try:
+            data = attached.sock.recv(self._read_size)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            LOG.debug("Unable to read output of container %s", attached.container_id, exc_info=True)
+            data = b""
+
+        for frame_type, payload in attached.parse(data):
+            writer = {_STDOUT_FRAME_TYPE: attached.stdout, _STDERR_FRAME_TYPE: attached.stderr}.get(frame_type)
+            if writer and payload:
+                yield writer, payload
+
+        if not data:
+            LOG.debug("Output of container %s is closed", attached.container_id)
+            with self._lock:
+                if self._attached.get(attached.container_id) is attached:
+                    del self._attached[attached.container_id]
+                self._close(attached)
+
+    @staticmethod
+    def _write(pending: Dict[int, Tuple[Any, List[bytes]]]) -> None:
+        for writer, payloads in pending.values():
+            try:
+                writer.write(b"".join(payloads))
+            except (OSError, ValueError):
+                LOG.debug("Unable to write output of container", exc_info=True)
+        pending.clear()
+
+    def _close(self, attached: _AttachedContainer) -> None:
+        try:
+            self._selector.unregister(attached.sock)
+        except (KeyError, ValueError):
+            pass
+        for closeable in (attached.attach_socket, attached.sock):
+            try:
+                closeable.close()
+            except OSError:
+                pass
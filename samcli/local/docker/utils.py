@@ -10,9 +10,11 @@ import logging
 import posixpath
 import pathlib
 import socket
+from typing import Dict, Optional, Tuple
 
 import docker
 import requests
+from docker.utils.build import exclude_paths
 
 from samcli.lib.utils.architecture import ARM64, validate_architecture
 
@@ -154,3 +156,46 @@ def get_docker_platform(architecture: str) -> str:
     validate_architecture(architecture)
 
     return f"linux/{get_image_arch(architecture)}"
+
+
+def get_docker_context_paths(context_path: str, dockerfile: str) -> Optional[Tuple[Dict[str, str], str]]:
+    """
+    Returns the paths of the files and directories to send to Docker as the build context, excluding the ones
+    that match the patterns in the .dockerignore file of the context like the Docker client does
+
+    Parameters
+    ----------
+    context_path : str
+        Path to the Docker context directory
+    dockerfile : str
+        Path to the Dockerfile, relative to the context directory or absolute
+
+    Returns
+    -------
+    Optional[Tuple[Dict[str, str], str]]
+        Dictionary of the full paths on the system to the paths within the context, which are not recursive,
+        and the path of the Dockerfile within the context, which Docker expects for a custom context.
+        None if the Dockerfile is outside of the context, since it is then added to the context by the Docker client.
+    """
+    root = os.path.abspath(context_path)
+    dockerfile_path = os.path.join(root, dockerfile)
+    if os.path.splitdrive(root)[0] != os.path.splitdrive(dockerfile_path)[0]:
+        return None
+    context_dockerfile = os.path.relpath(dockerfile_path, root)
+    if context_dockerfile.startswith(".."):
+        return None
+
+    exclude = None
+    dockerignore_path = os.path.join(root, ".dockerignore")
+    if os.path.exists(dockerignore_path):
+        with open(dockerignore_path, "r") as dockerignore:
+            exclude = [
+                line.strip() for line in dockerignore.read().splitlines() if line.strip() and line.strip()[0] != "#"
+            ]
+
+    paths = {
+        os.path.join(root, path): path
+        for path in sorted(exclude_paths(root, exclude or [], dockerfile=context_dockerfile))
+    }
+    # Docker expects the path of the Dockerfile within the context in unix format
+    return paths, pathlib.PurePath(context_dockerfile).as_posix()
@@ -0,0 +1,224 @@
+"""Bounded queue that runs asynchronous (Event) Lambda invocations in the background"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, List, NamedTuple, Optional
+
+LOG = logging.getLogger(__name__)
+
+# Number of Event invocations that can wait for a worker, following ones are throttled
+DEFAULT_MAX_QUEUED_INVOCATIONS = 100
+# Number of Event invocations that are run at the same time
+DEFAULT_EVENT_INVOCATION_WORKERS = 4
+
+
+class EventInvocation(NamedTuple):
+    """Event invocation waiting in the queue"""
+
+    function_name: str
+    event: str
+    # Time in seconds of when the invocation was queued, from time.perf_counter
+    queued_time: float
+
+
+class EventInvocationMetrics(NamedTuple):
+    """Snapshot of the Event invocation queue metrics"""
+
+    # Number of invocations waiting for a worker
+    queue_depth: int
+    # Number of invocations that are running
+    running: int
+    # Number of invocations that finished, including the failed ones
+    completed: int
+    # Number of invocations that raised an exception
+    failed: int
+    # Number of invocations that were throttled since the queue was full
+    throttled: int
+    # Average and maximum time in seconds that finished invocations waited in the queue
+    average_queue_latency: float
+    max_queue_latency: float
+    # Average and maximum time in seconds that finished invocations ran
+    average_run_latency: float
+    max_run_latency: float
+
+
+class EventInvocationQueue:
+    """
+    Runs Event invocations on a pool of worker threads. Workers are started with the first invocation,
+    so that the pool is not created when start-lambda only receives RequestResponse invocations.
+    """
+
+    _invoke: Callable[[str, str], None]
+    _max_workers: int
+    _queue: "queue.Queue[Optional[EventInvocation]]"
+    _workers: List[threading.Thread]
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        invoke: Callable[[str, str], None],
+        max_queued_invocations: int = DEFAULT_MAX_QUEUED_INVOCATIONS,
+        max_workers: int = DEFAULT_EVENT_INVOCATION_WORKERS,
+    ):
+        """
+        Parameters
+        ----------
+        invoke : Callable[[str, str], None]
+            Callable that invokes the function with the given name and event, blocking until it finishes
+        max_queued_invocations : int
+            Maximum number of invocations waiting for a worker
+        max_workers : int
+            Number of invocations that are run at the same time
+        """
+        self._invoke = invoke
+        self._max_workers = max_workers
+        self._queue = queue.Queue(maxsize=max_queued_invocations)
+        self._workers = []
+        self._lock = threading.Lock()
+
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._throttled = 0
+        self._total_queue_latency = 0.0
+        self._max_queue_latency = 0.0
+        self._total_run_latency = 0.0
+        self._max_run_latency = 0.0
+
+    def submit(self, function_name: str, event: str) -> bool:
+        """
+        Queue an invocation to be run in the background
+
+        Parameters
+        ----------
+        function_name : str
+            Name of the function to invoke
+        event : str
+            Event data passed to the function
+
+        Returns
+        -------
+        bool
+            True if the invocation is queued, False if it is throttled since the queue is full
+        """
+        self._start_workers()
+        try:
+            self._queue.put_nowait(EventInvocation(function_name, event, time.perf_counter()))
+        except queue.Full:
+            with self._lock:
+                self._throttled += 1
+            LOG.warning("Event invocation of %s is throttled, %d invocations are queued", function_name, self.depth)
+            return False
+        return True
+
+    @property
+    def depth(self) -> int:
+        """Number of invocations waiting for a worker"""
+        return self._queue.qsize()
+
+    def get_metrics(self) -> EventInvocationMetrics:
+        """
+        Returns
+        -------
+        EventInvocationMetrics
+            Snapshot of the queue metrics
+        """
+        with self._lock:
+            completed = self._completed
+            return EventInvocationMetrics(
+                queue_depth=self.depth,
+                running=self._running,
+                completed=completed,
+                failed=self._failed,
+                throttled=self._throttled,
+                average_queue_latency=self._total_queue_latency / completed if completed else 0.0,
+                max_queue_latency=self._max_queue_latency,
+                average_run_latency=self._total_run_latency / completed if completed else 0.0,
+                max_run_latency=self._max_run_latency,
+            )
+
+    def log_metrics(self) -> None:
+        """Log the queue metrics"""
+        metrics = self.get_metrics()
+        LOG.info(
+            "Event invocations: %d completed, %d failed, %d throttled, queue latency average %.3fs max %.3fs, "
+            "run latency average %.3fs max %.3fs",
+            metrics.completed,
+            metrics.failed,
+            metrics.throttled,
+            metrics.average_queue_latency,
+            metrics.max_queue_latency,
+            metrics.average_run_latency,
+            metrics.max_run_latency,
+        )
+
+    def join(self) -> None:
+        """Block until all queued invocations are finished"""
+        self._queue.join()
+
+    def stop(self) -> None:
+        """Stop the workers after the queued invocations are finished"""
+        with self._lock:
+            workers = list(self._workers)
+            self._workers = []
+        for _ in workers:
+            self._queue.put(None)
+        for worker in workers:
+            worker.join()
+
+    def _start_workers(self) -> None:
+        with self._lock:
+            if self._workers:
+                return
+            for index in range(self._max_workers):
+                worker = threading.Thread(target=self._run_worker, name=f"EventInvocationWorker-{index}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def _run_worker(self) -> None:
+        while True:
+            invocation = self._queue.get()
+            try:
+                if invocation is None:
+                    return
+                self._run_invocation(invocation)
+            finally:
+                self._queue.task_done()
+
+    def _run_invocation(self, invocation: EventInvocation) -> None:
+        start_time = time.perf_counter()
+        queue_latency = start_time - invocation.queued_time
+        with self._lock:
+            self._running += 1
+
+        failed = False
+        try:
+            self._invoke(invocation.function_name, invocation.event)
+        except Exception:  # pylint: disable=broad-except
+            # There is no caller to return the error to, log it and keep the worker running
+            failed = True
+            LOG.error("Event invocation of %s failed", invocation.function_name, exc_info=True)
+
+        run_latency = time.perf_counter() - start_time
+        with self._lock:
+            self._running -= 1
+            idle = not self._running and self._queue.empty()
+            self._completed += 1
+            self._failed += int(failed)
+            self._total_queue_latency += queue_latency
+            self._max_queue_latency = max(self._max_queue_latency, queue_latency)
+            self._total_run_latency += run_latency
+            self._max_run_latency = max(self._max_run_latency, run_latency)
+
+        LOG.debug(
+            "Event invocation of %s finished, waited %.3fs in queue and ran %.3fs, %d invocations are queued",
+            invocation.function_name,
+            queue_latency,
+            run_latency,
+            self.depth,
+        )
+        # Summarize each burst of invocations once all of them are finished
+        if idle:
+            self.log_metrics()
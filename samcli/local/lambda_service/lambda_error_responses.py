@@ -22,6 +22,9 @@ class LambdaErrorResponses:
 
     NotImplementedException = ("NotImplemented", 501)
 
+    # The request throughput limit was exceeded.
+    TooManyRequestsException = ("TooManyRequests", 429)
+
     PathNotFoundException = ("PathNotFoundLocally", 404)
 
     MethodNotAllowedException = ("MethodNotAllowedLocally", 405)
@@ -155,6 +158,29 @@ class LambdaErrorResponses:
             exception_tuple[1],
         )
 
+    @staticmethod
+    def too_many_requests(message):
+        """
+        Creates a Lambda Service TooManyRequests Response
+
+        Parameters
+        ----------
+        message str
+            Message to be added to the body of the response
+
+        Returns
+        -------
+        Flask.Response
+            A response object representing the TooManyRequests Error
+        """
+        exception_tuple = LambdaErrorResponses.TooManyRequestsException
+
+        return BaseLocalService.service_response(
+            LambdaErrorResponses._construct_error_response_body(LambdaErrorResponses.USER_ERROR, message),
+            LambdaErrorResponses._construct_headers(exception_tuple[0]),
+            exception_tuple[1],
+        )
+
     @staticmethod
     def generic_path_not_found(*args):
         """
@@ -7,13 +7,17 @@ import io
 from flask import Flask, request
 from werkzeug.routing import BaseConverter
 
+from samcli.lib.utils.invocation_timings import invocation_phase, record_invocation, LOGS_PHASE
 from samcli.lib.utils.stream_writer import StreamWriter
 from samcli.local.services.base_local_service import BaseLocalService, LambdaOutputParser
 from samcli.local.lambdafn.exceptions import FunctionNotFound
+from .event_invocation_queue import DEFAULT_EVENT_INVOCATION_WORKERS, EventInvocationQueue
 from .lambda_error_responses import LambdaErrorResponses
 
 LOG = logging.getLogger(__name__)
 
+SUPPORTED_INVOCATION_TYPES = ("RequestResponse", "Event")
+
 
 class FunctionNamePathConverter(BaseConverter):
     regex = ".+"
@@ -44,6 +48,10 @@ class LocalLambdaInvokeService(BaseLocalService):
         super().__init__(lambda_runner.is_debugging(), port=port, host=host)
         self.lambda_runner = lambda_runner
         self.stderr = stderr
+        # A debugger can only be attached to one invocation at a time
+        self.event_invocation_queue = EventInvocationQueue(
+            self._invoke_event, max_workers=1 if self.is_debugging else DEFAULT_EVENT_INVOCATION_WORKERS
+        )
 
     def create(self):
         """
@@ -63,6 +71,8 @@ class LocalLambdaInvokeService(BaseLocalService):
             provide_automatic_options=False,
         )
 
+        self._add_invocation_metrics_endpoint()
+
         # setup request validation before Flask calls the view_func
         self._app.before_request(LocalLambdaInvokeService.validate_request)
 
@@ -78,7 +88,7 @@ class LocalLambdaInvokeService(BaseLocalService):
             2. Query Parameters are sent to the endpoint
             3. The Request Content-Type is not application/json
             4. 'X-Amz-Log-Type' header is not 'None'
-            5. 'X-Amz-Invocation-Type' header is not 'RequestResponse'
+            5. 'X-Amz-Invocation-Type' header is not 'RequestResponse' or 'Event'
 
         Returns
         -------
@@ -118,10 +128,14 @@ class LocalLambdaInvokeService(BaseLocalService):
             )
 
         invocation_type = request_headers.get("X-Amz-Invocation-Type", "RequestResponse")
-        if invocation_type != "RequestResponse":
-            LOG.warning("invocation-type: %s is not supported. RequestResponse is only supported.", invocation_type)
+        if invocation_type not in SUPPORTED_INVOCATION_TYPES:
+            LOG.warning(
+                "invocation-type: %s is not supported. RequestResponse and Event are only supported.", invocation_type
+            )
             return LambdaErrorResponses.not_implemented_locally(
-                "invocation-type: {} is not supported. RequestResponse is only supported.".format(invocation_type)
+                "invocation-type: {} is not supported. RequestResponse and Event are only supported.".format(
+                    invocation_type
+                )
             )
 
         return None
@@ -158,26 +172,91 @@ class LocalLambdaInvokeService(BaseLocalService):
 
         request_data = request_data.decode("utf-8")
 
-        stdout_stream = io.BytesIO()
-        stdout_stream_writer = StreamWriter(stdout_stream, auto_flush=True)
+        if flask_request.headers.get("X-Amz-Invocation-Type") == "Event":
+            return self._queue_event_invocation(function_name, request_data)
 
         try:
-            self.lambda_runner.invoke(function_name, request_data, stdout=stdout_stream_writer, stderr=self.stderr)
+            with record_invocation(function_name) as timings:
+                lambda_response, is_lambda_user_error_response = self._invoke(function_name, request_data)
         except FunctionNotFound:
             LOG.debug("%s was not found to invoke.", function_name)
             return LambdaErrorResponses.resource_not_found(function_name)
 
-        lambda_response, lambda_logs, is_lambda_user_error_response = LambdaOutputParser.get_lambda_output(
-            stdout_stream
-        )
-
-        if self.stderr and lambda_logs:
-            # Write the logs to stderr if available.
-            self.stderr.write(lambda_logs)
-
         if is_lambda_user_error_response:
-            return self.service_response(
+            response = self.service_response(
                 lambda_response, {"Content-Type": "application/json", "x-amz-function-error": "Unhandled"}, 200
             )
+        else:
+            response = self.service_response(lambda_response, {"Content-Type": "application/json"}, 200)
+
+        return self.add_invocation_timings(response, timings)
+
+    def _queue_event_invocation(self, function_name, request_data):
+        """
+        Queue an Event invocation to be run in the background, and respond immediately as Lambda does
+
+        Parameters
+        ----------
+        function_name str
+            Name of the function to invoke
+        request_data str
+            Event data passed to the function
+
+        Returns
+        -------
+        A Flask Response response object as if it was returned from Lambda
+        """
+        if not self.lambda_runner.provider.get(function_name):
+            LOG.debug("%s was not found to invoke.", function_name)
+            return LambdaErrorResponses.resource_not_found(function_name)
+
+        if not self.event_invocation_queue.submit(function_name, request_data):
+            return LambdaErrorResponses.too_many_requests(
+                "Event invocation queue is full, {} invocations are waiting".format(self.event_invocation_queue.depth)
+            )
+
+        return self.service_response("", {"Content-Type": "application/json"}, 202)
+
+    def get_invocation_metrics(self):
+        """
+        Returns
+        -------
+        dict
+            Aggregated invocation timings, and the metrics of the Event invocation queue
+        """
+        metrics = super().get_invocation_metrics()
+        metrics["event_invocation_queue"] = self.event_invocation_queue.get_metrics()._asdict()
+        return metrics
+
+    def _invoke_event(self, function_name, request_data):
+        """
+        Invoke the function for an Event invocation. The response of the function is discarded, only its logs
+        are written to stderr.
+        """
+        with record_invocation(function_name):
+            self._invoke(function_name, request_data)
+
+    def _invoke(self, function_name, request_data):
+        """
+        Invoke the function and write its logs to stderr
+
+        Returns
+        -------
+        Tuple(str, bool)
+            Response of the function, and whether it is an error response
+        """
+        stdout_stream = io.BytesIO()
+        stdout_stream_writer = StreamWriter(stdout_stream, auto_flush=True)
+
+        self.lambda_runner.invoke(function_name, request_data, stdout=stdout_stream_writer, stderr=self.stderr)
+
+        with invocation_phase(LOGS_PHASE):
+            lambda_response, lambda_logs, is_lambda_user_error_response = LambdaOutputParser.get_lambda_output(
+                stdout_stream
+            )
+
+            if self.stderr and lambda_logs:
+                # Write the logs to stderr if available.
+                self.stderr.write(lambda_logs)
 
-        return self.service_response(lambda_response, {"Content-Type": "application/json"}, 200)
+        return lambda_response, is_lambda_user_error_response
@@ -207,6 +207,8 @@ class EnvironmentVariables:
         return result
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if not isinstance(other, EnvironmentVariables):
             return False
         return self.resolve() == other.resolve()
@@ -8,12 +8,23 @@ import tempfile
 import signal
 import logging
 import threading
-from typing import Optional, Union, Dict
+from typing import List, Optional, Union, Dict
 
 from samcli.local.docker.lambda_container import LambdaContainer
 from samcli.lib.utils.file_observer import LambdaFunctionObserver
+from samcli.lib.utils.invocation_timings import (
+    invocation_phase,
+    CLEANUP_PHASE,
+    CODE_PHASE,
+    CREATE_PHASE,
+    ENV_VARS_PHASE,
+    IMAGE_PHASE,
+    INVOKE_PHASE,
+    START_PHASE,
+)
 from samcli.lib.utils.packagetype import ZIP
 from samcli.lib.telemetry.metric import capture_parameter
+from .unzip_cache import UnzipCache
 from .zip import unzip
 from ...lib.providers.provider import LayerVersion
 from ...lib.utils.stream_writer import StreamWriter
@@ -30,7 +41,7 @@ class LambdaRuntime:
 
     SUPPORTED_ARCHIVE_EXTENSIONS = (".zip", ".jar", ".ZIP", ".JAR")
 
-    def __init__(self, container_manager, image_builder):
+    def __init__(self, container_manager, image_builder, unzip_cache: Optional[UnzipCache] = None):
         """
         Initialize the Local Lambda runtime
 
@@ -40,10 +51,15 @@ class LambdaRuntime:
             Instance of the ContainerManager class that can run a local Docker container
         image_builder samcli.local.docker.lambda_image.LambdaImage
             Instance of the LambdaImage class that can create am image
+        unzip_cache samcli.local.lambdafn.unzip_cache.UnzipCache
+            Optional. Cache to decompress zip/jar code into. If not given, code is decompressed into
+            a temporary directory that is removed after the invocation
         """
         self._container_manager = container_manager
         self._image_builder = image_builder
+        self._unzip_cache = unzip_cache
         self._temp_uncompressed_paths_to_be_cleaned = []
+        self._cached_uncompressed_paths_to_be_released: List[str] = []
 
     def create(self, function_config, debug_context=None, container_host=None, container_host_interface=None):
         """
@@ -66,30 +82,35 @@ class LambdaRuntime:
             the created container
         """
         # Generate a dictionary of environment variable key:values
-        env_vars = function_config.env_vars.resolve()
-
-        code_dir = self._get_code_dir(function_config.code_abs_path)
-        layers = [self._unarchived_layer(layer) for layer in function_config.layers]
-        container = LambdaContainer(
-            function_config.runtime,
-            function_config.imageuri,
-            function_config.handler,
-            function_config.packagetype,
-            function_config.imageconfig,
-            code_dir,
-            layers,
-            self._image_builder,
-            function_config.architecture,
-            memory_mb=function_config.memory,
-            env_vars=env_vars,
-            debug_options=debug_context,
-            container_host=container_host,
-            container_host_interface=container_host_interface,
-            function_full_path=function_config.full_path,
-        )
+        with invocation_phase(ENV_VARS_PHASE):
+            env_vars = function_config.env_vars.resolve()
+
+        with invocation_phase(CODE_PHASE):
+            code_dir = self._get_code_dir(function_config.code_abs_path)
+            layers = [self._unarchived_layer(layer) for layer in function_config.layers]
+        # Creating the container object builds the image of the function, or checks that it is up to date
+        with invocation_phase(IMAGE_PHASE):
+            container = LambdaContainer(
+                function_config.runtime,
+                function_config.imageuri,
+                function_config.handler,
+                function_config.packagetype,
+                function_config.imageconfig,
+                code_dir,
+                layers,
+                self._image_builder,
+                function_config.architecture,
+                memory_mb=function_config.memory,
+                env_vars=env_vars,
+                debug_options=debug_context,
+                container_host=container_host,
+                container_host_interface=container_host_interface,
+                function_full_path=function_config.full_path,
+            )
         try:
             # create the container.
-            self._container_manager.create(container)
+            with invocation_phase(CREATE_PHASE):
+                self._container_manager.create(container)
             return container
 
         except KeyboardInterrupt:
@@ -130,7 +151,8 @@ class LambdaRuntime:
 
         try:
             # start the container.
-            self._container_manager.run(container)
+            with invocation_phase(START_PHASE):
+                self._container_manager.run(container)
             return container
 
         except KeyboardInterrupt:
@@ -190,7 +212,10 @@ class LambdaRuntime:
             # Block on waiting for result from the init process on the container, below method also
             # starts another thread to stream logs. This method will terminate
             # either successfully or be killed by one of the interrupt handlers above.
-            container.wait_for_result(full_path=function_config.full_path, event=event, stdout=stdout, stderr=stderr)
+            with invocation_phase(INVOKE_PHASE):
+                container.wait_for_result(
+                    full_path=function_config.full_path, event=event, stdout=stdout, stderr=stderr
+                )
 
         except KeyboardInterrupt:
             # When user presses Ctrl+C, we receive a Keyboard Interrupt. This is especially very common when
@@ -205,7 +230,8 @@ class LambdaRuntime:
             # If we are in debugging mode, timer would not be created. So skip cleanup of the timer
             if timer:
                 timer.cancel()
-            self._on_invoke_done(container)
+            with invocation_phase(CLEANUP_PHASE):
+                self._on_invoke_done(container)
 
     def _on_invoke_done(self, container):
         """
@@ -278,8 +304,13 @@ class LambdaRuntime:
         """
 
         if code_path and os.path.isfile(code_path) and code_path.endswith(self.SUPPORTED_ARCHIVE_EXTENSIONS):
-            decompressed_dir: str = _unzip_file(code_path)
-            self._temp_uncompressed_paths_to_be_cleaned += [decompressed_dir]
+            decompressed_dir: str
+            if self._unzip_cache:
+                decompressed_dir = self._unzip_cache.acquire(code_path)
+                self._cached_uncompressed_paths_to_be_released += [decompressed_dir]
+            else:
+                decompressed_dir = _unzip_file(code_path)
+                self._temp_uncompressed_paths_to_be_cleaned += [decompressed_dir]
             return decompressed_dir
 
         LOG.debug("Code %s is not a zip/jar file", code_path)
@@ -315,6 +346,12 @@ class LambdaRuntime:
             shutil.rmtree(decompressed_dir)
         self._temp_uncompressed_paths_to_be_cleaned = []
 
+        # Decompressed dirs in the unzip cache are kept for the following invocations
+        if self._unzip_cache:
+            for decompressed_dir in self._cached_uncompressed_paths_to_be_released:
+                self._unzip_cache.release(decompressed_dir)
+        self._cached_uncompressed_paths_to_be_released = []
+
 
 class WarmLambdaRuntime(LambdaRuntime):
     """
@@ -322,7 +359,7 @@ class WarmLambdaRuntime(LambdaRuntime):
     warm containers life cycle.
     """
 
-    def __init__(self, container_manager, image_builder):
+    def __init__(self, container_manager, image_builder, unzip_cache: Optional[UnzipCache] = None):
         """
         Initialize the Local Lambda runtime
 
@@ -332,15 +369,15 @@ class WarmLambdaRuntime(LambdaRuntime):
             Instance of the ContainerManager class that can run a local Docker container
         image_builder samcli.local.docker.lambda_image.LambdaImage
             Instance of the LambdaImage class that can create am image
-        warm_containers bool
-            Determines if the warm containers is enabled or not.
+        unzip_cache samcli.local.lambdafn.unzip_cache.UnzipCache
+            Optional. Cache to decompress zip/jar code into
         """
         self._function_configs = {}
         self._containers = {}
 
         self._observer = LambdaFunctionObserver(self._on_code_change)
 
-        super().__init__(container_manager, image_builder)
+        super().__init__(container_manager, image_builder, unzip_cache)
 
     def create(self, function_config, debug_context=None, container_host=None, container_host_interface=None):
         """
@@ -0,0 +1,371 @@
+"""
+Persistent cache of decompressed function and layer archives, keyed by the content of the archive
+"""
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from collections import defaultdict
+from pathlib import Path
+from typing import DefaultDict, Dict, List, Optional, Tuple
+
+from samcli.cli.global_config import GlobalConfig
+from samcli.lib.utils.hash import file_checksum
+from .zip import unzip
+
+LOG = logging.getLogger(__name__)
+
+# Set this environment variable to 1 to keep decompressed archives across invocations and SAM CLI runs, instead of
+# decompressing them into temporary directories that are removed after each invocation
+UNZIP_CACHE_ENV_VAR = "SAM_CLI_UNZIP_CACHE"
+# Maximum total size in MB of the decompressed archives kept in the cache
+UNZIP_CACHE_MAX_SIZE_ENV_VAR = "SAM_CLI_UNZIP_CACHE_MAX_SIZE_MB"
+UNZIP_CACHE_DIR_NAME = "unzipped-code"
+DEFAULT_MAX_SIZE_BYTES = 2 * 1024 * 1024 * 1024
+SIZE_FILE_SUFFIX = ".size"
+TEMP_DIR_PREFIX = ".tmp-"
+# Temporary directories and size files without a directory are left behind by killed processes once they are older
+# than this
+STALE_FILE_SECONDS = 60 * 60
+# Directory of the reference files of the entries that are acquired by running SAM CLI processes
+REFERENCES_DIR_NAME = ".references"
+# Reference files are touched at this interval while their entries are acquired. References that are not touched for
+# REFERENCE_EXPIRY_SECONDS belong to processes that were killed before releasing them.
+REFERENCE_REFRESH_INTERVAL_SECONDS = 60
+REFERENCE_EXPIRY_SECONDS = 10 * 60
+
+
+def get_default_unzip_cache_dir() -> str:
+    """
+    Returns
+    -------
+    str
+        Default directory of the unzip cache, under the SAM CLI application directory
+    """
+    return str(GlobalConfig().config_dir.joinpath(UNZIP_CACHE_DIR_NAME))
+
+
+def get_unzip_cache() -> Optional["UnzipCache"]:
+    """
+    Returns
+    -------
+    Optional[UnzipCache]
+        Unzip cache in the default directory if it is enabled with the SAM_CLI_UNZIP_CACHE environment variable,
+        with the maximum size from SAM_CLI_UNZIP_CACHE_MAX_SIZE_MB
+    """
+    if os.environ.get(UNZIP_CACHE_ENV_VAR, "").lower() not in ("1", "true"):
+        return None
+
+    max_size = DEFAULT_MAX_SIZE_BYTES
+    max_size_mb = os.environ.get(UNZIP_CACHE_MAX_SIZE_ENV_VAR)
+    if max_size_mb:
+        try:
+            max_size = int(float(max_size_mb) * 1024 * 1024)
+        except ValueError:
+            LOG.warning(
+                "Invalid %s value %s, using the default of %d MB",
+                UNZIP_CACHE_MAX_SIZE_ENV_VAR,
+                max_size_mb,
+                DEFAULT_MAX_SIZE_BYTES // (1024 * 1024),
+            )
+    return UnzipCache(get_default_unzip_cache_dir(), max_size)
+
+
+class UnzipCache:
+    """
+    Decompresses zip/jar archives into directories named after the SHA256 hash of the archive, so that following
+    invocations of the same code reuse the decompressed directory instead of decompressing it again.
+
+    Archives are decompressed into a temporary directory first and then renamed, so that concurrent threads and
+    SAM CLI processes never see a partially decompressed directory. While a directory is acquired, for instance
+    because it is mounted into a warm container, a reference file of this instance is kept in the cache, so that
+    neither this nor other SAM CLI processes evict the directory until it is released.
+    """
+
+    _cache_dir: str
+    _max_size: int
+    _lock: threading.Lock
+    _key_locks: DefaultDict[str, threading.Lock]
+    _in_use: Dict[str, int]
+    _archive_hashes: Dict[Tuple[str, int, int], str]
+    _reference_name: str
+    _refresher: Optional[threading.Thread]
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE_BYTES):
+        """
+        Parameters
+        ----------
+        cache_dir : str
+            Directory where the archives will be decompressed
+        max_size : int
+            Maximum total size of the decompressed archives in bytes, least recently used ones are evicted first
+        """
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._key_locks = defaultdict(threading.Lock)
+        self._in_use = {}
+        self._archive_hashes = {}
+        self._reference_name = "{}-{}".format(os.getpid(), uuid.uuid4().hex)
+        self._refresher = None
+
+    def acquire(self, archive_path: str) -> str:
+        """
+        Return the directory that contains the decompressed archive, decompressing it if it is not in the cache.
+        The directory is kept in the cache until it is released.
+
+        Parameters
+        ----------
+        archive_path : str
+            Path to the zip/jar archive
+
+        Returns
+        -------
+        str
+            Real path of the directory containing the content of the archive
+        """
+        key = self._get_archive_hash(archive_path)
+        with self._lock:
+            self._in_use[key] = self._in_use.get(key, 0) + 1
+            self._start_refresher()
+
+        try:
+            with self._get_key_lock(key):
+                # The reference is added before the directory is checked, so that an eviction by another process
+                # either happens before the check or sees the reference
+                self._add_reference(key)
+                entry_dir = self._get_entry_dir(key)
+                if os.path.isdir(entry_dir):
+                    LOG.debug("Reusing decompressed %s from %s", archive_path, entry_dir)
+                    _touch(entry_dir)
+                else:
+                    self._extract(archive_path, key)
+                    self._evict(key)
+        except Exception:
+            self.release(key)
+            raise
+
+        return os.path.realpath(entry_dir)
+
+    def release(self, directory: str) -> None:
+        """
+        Release a directory returned by acquire, so that it can be evicted
+
+        Parameters
+        ----------
+        directory : str
+            Directory returned by acquire, or its cache key
+        """
+        key = os.path.basename(directory)
+        with self._get_key_lock(key):
+            with self._lock:
+                count = self._in_use.get(key, 0) - 1
+                if count > 0:
+                    self._in_use[key] = count
+                else:
+                    self._in_use.pop(key, None)
+            if count <= 0:
+                self._remove_reference(key)
+
+    def _get_key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks[key]
+
+    def _get_entry_dir(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key)
+
+    def _get_reference_file(self, key: str) -> str:
+        return os.path.join(self._cache_dir, REFERENCES_DIR_NAME, "{}.{}".format(key, self._reference_name))
+
+    def _add_reference(self, key: str) -> None:
+        reference_file = self._get_reference_file(key)
+        os.makedirs(os.path.dirname(reference_file), exist_ok=True)
+        Path(reference_file).touch()
+
+    def _remove_reference(self, key: str) -> None:
+        try:
+            os.remove(self._get_reference_file(key))
+        except OSError:
+            LOG.debug("Unable to remove reference to %s from unzip cache", key, exc_info=True)
+
+    def _is_referenced(self, key: str) -> bool:
+        """
+        Whether the entry is acquired by this or another SAM CLI process. Expired reference files are removed.
+        """
+        expired_before = time.time() - REFERENCE_EXPIRY_SECONDS
+        referenced = False
+        for reference_file in Path(self._cache_dir, REFERENCES_DIR_NAME).glob(key + ".*"):
+            try:
+                if os.path.getmtime(reference_file) > expired_before:
+                    referenced = True
+                else:
+                    LOG.debug("Removing expired reference %s from unzip cache", reference_file.name)
+                    os.remove(reference_file)
+            except OSError:
+                LOG.debug("Unable to read reference %s in unzip cache", reference_file.name, exc_info=True)
+        return referenced
+
+    def _start_refresher(self) -> None:
+        # Must be called with self._lock held
+        if not self._refresher:
+            self._refresher = threading.Thread(target=self._refresh_references, daemon=True)
+            self._refresher.start()
+
+    def _refresh_references(self) -> None:
+        """
+        Touch the reference files of the acquired entries periodically, so that they don't expire while the entries
+        are mounted into long running warm containers. Stops once no entry is acquired.
+        """
+        while True:
+            time.sleep(REFERENCE_REFRESH_INTERVAL_SECONDS)
+            with self._lock:
+                keys = list(self._in_use)
+                if not keys:
+                    self._refresher = None
+                    return
+            for key in keys:
+                _touch(self._get_reference_file(key))
+
+    def _get_archive_hash(self, archive_path: str) -> str:
+        # Hashing a large archive takes a while, only hash it again if the file is modified
+        stat = os.stat(archive_path)
+        stat_key = (os.path.realpath(archive_path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            archive_hash = self._archive_hashes.get(stat_key)
+        if not archive_hash:
+            archive_hash = file_checksum(archive_path, hashlib.sha256())
+            with self._lock:
+                self._archive_hashes[stat_key] = archive_hash
+        return archive_hash
+
+    def _extract(self, archive_path: str, key: str) -> None:
+        os.makedirs(self._cache_dir, exist_ok=True)
+        temp_dir = tempfile.mkdtemp(prefix=_get_temp_dir_prefix(), dir=self._cache_dir)
+        entry_dir = self._get_entry_dir(key)
+        try:
+            if os.name == "posix":
+                os.chmod(temp_dir, 0o755)
+            LOG.info("Decompressing %s", archive_path)
+            unzip(archive_path, temp_dir)
+            # The size is written before the directory is renamed, so that a killed process never leaves a directory
+            # that can't be evicted
+            with zipfile.ZipFile(archive_path, "r") as zip_ref:
+                size = sum(file_info.file_size for file_info in zip_ref.infolist())
+            size_file = Path(entry_dir + SIZE_FILE_SUFFIX)
+            size_file.write_text(str(size))
+            try:
+                os.rename(temp_dir, entry_dir)
+            except OSError:
+                # Another SAM CLI process decompressed the same archive in the meantime
+                if not os.path.isdir(entry_dir):
+                    size_file.unlink()
+                    raise
+                LOG.debug("%s is already decompressed by another process", archive_path)
+        finally:
+            if os.path.isdir(temp_dir):
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _evict(self, new_key: str) -> None:
+        self._remove_stale_temp_dirs()
+        stale_before = time.time() - STALE_FILE_SECONDS
+        entries: List[Tuple[float, int, str]] = []
+        for size_file in Path(self._cache_dir).glob("*" + SIZE_FILE_SUFFIX):
+            key = size_file.name[: -len(SIZE_FILE_SUFFIX)]
+            try:
+                entries.append((os.path.getmtime(self._get_entry_dir(key)), int(size_file.read_text()), key))
+            except FileNotFoundError:
+                # Either the archive is being decompressed, or the process decompressing it was killed
+                _remove_if_stale(size_file, stale_before)
+            except (OSError, ValueError):
+                LOG.debug("Unable to read decompressed archive %s in unzip cache", key, exc_info=True)
+
+        total_size = sum(size for _, size, _ in entries)
+        if total_size <= self._max_size:
+            return
+
+        with self._lock:
+            in_use = set(self._in_use)
+        for _, size, key in sorted(entries):
+            if total_size <= self._max_size:
+                break
+            if key == new_key or key in in_use or self._is_referenced(key) or not self._remove_entry(key, size):
+                continue
+            total_size -= size
+
+    def _remove_stale_temp_dirs(self) -> None:
+        """
+        Remove the temporary directories left behind by SAM CLI processes that were killed while decompressing or
+        evicting an archive. Their names start with the time they were created at, their modification time is kept
+        when they are renamed.
+        """
+        stale_before = time.time() - STALE_FILE_SECONDS
+        for temp_dir in Path(self._cache_dir).glob(TEMP_DIR_PREFIX + "*"):
+            created_at = temp_dir.name[len(TEMP_DIR_PREFIX) :].split("-", 1)[0]
+            if created_at.isdigit() and int(created_at) < stale_before:
+                LOG.debug("Removing stale temporary directory %s from unzip cache", temp_dir.name)
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _remove_entry(self, key: str, size: int) -> bool:
+        """
+        Remove a decompressed archive from the cache, unless another process acquires it in the meantime
+
+        Returns
+        -------
+        bool
+            Whether the decompressed archive was removed
+        """
+        entry_dir = self._get_entry_dir(key)
+        size_file = Path(entry_dir + SIZE_FILE_SUFFIX)
+        evicted_dir = os.path.join(self._cache_dir, _get_temp_dir_prefix() + uuid.uuid4().hex)
+        try:
+            size_file.unlink()
+        except OSError:
+            LOG.debug("Decompressed archive %s is already evicted", key, exc_info=True)
+            return False
+        try:
+            # Move the directory out of the way first, processes that acquire the entry from now on decompress it
+            # again and write their own size file
+            os.rename(entry_dir, evicted_dir)
+        except OSError:
+            LOG.debug("Unable to evict decompressed archive %s from unzip cache", key, exc_info=True)
+            size_file.write_text(str(size))
+            return False
+
+        if self._is_referenced(key):
+            # Acquired by another process before the directory was moved, put it back
+            try:
+                os.rename(evicted_dir, entry_dir)
+                size_file.write_text(str(size))
+            except OSError:
+                LOG.debug("Decompressed archive %s was decompressed again in the meantime", key)
+                shutil.rmtree(evicted_dir, ignore_errors=True)
+            return False
+
+        LOG.debug("Evicting decompressed archive %s from unzip cache", key)
+        shutil.rmtree(evicted_dir, ignore_errors=True)
+        return True
+
+
+def _touch(path: str) -> None:
+    try:
+        os.utime(path)
+    except OSError:
+        LOG.debug("Unable to update the last used time of %s", path, exc_info=True)
+
+
+def _get_temp_dir_prefix() -> str:
+    return "{}{}-".format(TEMP_DIR_PREFIX, int(time.time()))
+
+
+def _remove_if_stale(path: Path, stale_before: float) -> None:
+    try:
+        if os.path.getmtime(path) < stale_before:
+            LOG.debug("Removing stale %s from unzip cache", path.name)
+            os.remove(path)
+    except OSError:
+        LOG.debug("Unable to remove %s from unzip cache", path, exc_info=True)
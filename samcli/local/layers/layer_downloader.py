@@ -3,6 +3,10 @@ Downloads Layers locally
 """
 
 import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -11,12 +15,17 @@ from botocore.exceptions import NoCredentialsError, ClientError
 
 from samcli.lib.providers.provider import Stack, LayerVersion
 from samcli.lib.utils.codeuri import resolve_code_path
+from samcli.lib.utils.osutils import file_lock
 from samcli.local.lambdafn.zip import unzip_from_uri
 from samcli.commands.local.cli_common.user_exceptions import CredentialsRequired, ResourceNotFound
 
 
 LOG = logging.getLogger(__name__)
 
+# Maximum number of layers that are downloaded at the same time
+MAX_CONCURRENT_LAYER_DOWNLOADS = 4
+LAYER_LOCK_FILE_SUFFIX = ".lock"
+
 
 class LayerDownloader:
     def __init__(self, layer_cache, cwd, stacks: List[Stack], lambda_client=None):
@@ -72,13 +81,18 @@ class LayerDownloader:
         List(Path)
             List of Paths to where the layer was cached
         """
-        layer_dirs = []
-        for layer in layers:
-            layer_dirs.append(self.download(layer, force))
+        if len(layers) <= 1:
+            return [self.download(layer, force) for layer in layers]
+
+        # Create the client before starting the threads, boto3 clients are thread safe but creating them is not
+        if any(isinstance(layer, LayerVersion) and not layer.is_defined_within_template for layer in layers):
+            _ = self.lambda_client
 
-        return layer_dirs
+        # Progress bars of concurrent downloads would overwrite each other
+        with ThreadPoolExecutor(max_workers=min(len(layers), MAX_CONCURRENT_LAYER_DOWNLOADS)) as executor:
+            return list(executor.map(lambda layer: self.download(layer, force, show_progress=False), layers))
 
-    def download(self, layer: LayerVersion, force=False) -> LayerVersion:
+    def download(self, layer: LayerVersion, force=False, show_progress=True) -> LayerVersion:
         """
         Download a given layer to the local cache.
 
@@ -88,6 +102,8 @@ class LayerDownloader:
             Layer representing the layer to be downloaded.
         force bool
             True to download the layer even if it exists already on the system
+        show_progress bool
+            True to show a progress bar of the download, False to log when the download starts and finishes
 
         Returns
         -------
@@ -107,14 +123,33 @@ class LayerDownloader:
             LOG.info("%s is already cached. Skipping download", layer.arn)
             return layer
 
-        layer_zip_path = layer.codeuri + ".zip"
-        layer_zip_uri = self._fetch_layer_uri(layer)
-        unzip_from_uri(
-            layer_zip_uri,
-            layer_zip_path,
-            unzip_output_dir=layer.codeuri,
-            progressbar_label="Downloading {}".format(layer.layer_arn),
-        )
+        # Other SAM CLI processes can be downloading the same layer into the same cache
+        with file_lock(layer.codeuri + LAYER_LOCK_FILE_SUFFIX):
+            if not force and self._is_layer_cached(layer_path):
+                LOG.info("%s is downloaded by another process. Skipping download", layer.arn)
+                return layer
+
+            layer_zip_uri = self._fetch_layer_uri(layer)
+
+            # Decompress into a temporary directory first, so that an interrupted download is never used as cached
+            temp_layer_dir = tempfile.mkdtemp(prefix=layer.name + ".tmp-", dir=self.layer_cache)
+            try:
+                if not show_progress:
+                    LOG.info("Downloading %s", layer.layer_arn)
+                unzip_from_uri(
+                    layer_zip_uri,
+                    temp_layer_dir + ".zip",
+                    unzip_output_dir=temp_layer_dir,
+                    progressbar_label="Downloading {}".format(layer.layer_arn) if show_progress else None,
+                )
+                if not show_progress:
+                    LOG.info("Downloaded %s", layer.layer_arn)
+                if self._is_layer_cached(layer_path):
+                    shutil.rmtree(layer.codeuri)
+                os.rename(temp_layer_dir, layer.codeuri)
+            finally:
+                if os.path.isdir(temp_layer_dir):
+                    shutil.rmtree(temp_layer_dir, ignore_errors=True)
 
         return layer
 
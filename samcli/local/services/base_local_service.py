@@ -3,9 +3,18 @@
 import json
 import logging
 import os
+from typing import Any, Dict, Optional
 
 from flask import Response
 
+from samcli.lib.utils.invocation_timings import (
+    InvocationTimings,
+    get_invocation_metrics,
+    is_invocation_timing_enabled,
+    INVOCATION_METRICS_PATH,
+    SERVER_TIMING_HEADER,
+)
+
 LOG = logging.getLogger(__name__)
 
 
@@ -77,6 +86,48 @@ class BaseLocalService:
         response.status_code = status_code
         return response
 
+    @staticmethod
+    def add_invocation_timings(response, timings: Optional[InvocationTimings]):
+        """
+        Adds the timings of the invocation to the response in the Server-Timing header
+
+        :param flask.Response response: Response of the invocation
+        :param InvocationTimings timings: Timings of the invocation, None if invocation timing is not enabled
+        :return: Flask Response
+        """
+        if timings:
+            response.headers[SERVER_TIMING_HEADER] = timings.to_server_timing_header()
+        return response
+
+    def get_invocation_metrics(self) -> Dict[str, Any]:
+        """
+        Returns
+        -------
+        Dict[str, Any]
+            JSON serializable metrics returned by the invocation metrics endpoint
+        """
+        return {"functions": get_invocation_metrics().to_dict()}
+
+    def _add_invocation_metrics_endpoint(self):
+        """
+        Adds the endpoint that returns the aggregated invocation timings as JSON, if invocation timing is enabled
+        """
+        if not is_invocation_timing_enabled():
+            return
+        LOG.info("Invocation timings are available at %s", INVOCATION_METRICS_PATH)
+        self._app.add_url_rule(
+            INVOCATION_METRICS_PATH,
+            endpoint=INVOCATION_METRICS_PATH,
+            view_func=self._invocation_metrics_handler,
+            methods=["GET"],
+            provide_automatic_options=False,
+        )
+
+    def _invocation_metrics_handler(self):
+        return self.service_response(
+            json.dumps(self.get_invocation_metrics()), {"Content-Type": "application/json"}, 200
+        )
+
 
 class LambdaOutputParser:
     @staticmethod
@@ -18,15 +18,23 @@ https://github.com/aws/aws-cli/blob/develop/awscli/customizations/cloudformation
 # pylint: disable=too-many-ancestors
 
 import json
-from typing import cast, Dict, Optional
-from botocore.compat import OrderedDict
+import sys
+from collections import OrderedDict
+from typing import cast, Dict, IO, Optional
 import yaml
-from samtranslator.utils.py27hash_fix import Py27Dict, Py27UniStr
 
 # ScalarNode and SequenceNode are not declared in __all__,
 # TODO: we need to double check whether they are public and stable
 from yaml.resolver import ScalarNode, SequenceNode  # type: ignore
 
+try:
+    # libyaml based loader is several times faster than the pure Python one, but PyYAML can be installed without
+    # libyaml. The libyaml emitter is not used, since it wraps long scalars differently from the pure Python one,
+    # and the output templates must stay the same.
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
 TAG_STR = "tag:yaml.org,2002:str"
 
 
@@ -93,17 +101,16 @@ def _dict_representer(dumper, data):
     return dumper.represent_dict(data.items())
 
 
-def yaml_dump(dict_to_dump):
+def yaml_dump(dict_to_dump, stream: Optional[IO[str]] = None) -> Optional[str]:
     """
     Dumps the dictionary as a YAML document
     :param dict_to_dump:
-    :return:
+    :param stream: If given, the document is written to this stream as it is emitted,
+        instead of building the whole document in memory
+    :return: YAML document, None if it is written to the stream
     """
-    CfnDumper.add_representer(OrderedDict, _dict_representer)
-    CfnDumper.add_representer(str, string_representer)
-    CfnDumper.add_representer(Py27Dict, _dict_representer)
-    CfnDumper.add_representer(Py27UniStr, string_representer)
-    return yaml.dump(dict_to_dump, default_flow_style=False, Dumper=CfnDumper)
+    _add_py27_representers()
+    return cast(Optional[str], yaml.dump(dict_to_dump, stream, default_flow_style=False, Dumper=CfnDumper))
 
 
 def _dict_constructor(loader, node):
@@ -120,9 +127,7 @@ def yaml_parse(yamlstr) -> Dict:
         # json parser.
         return cast(Dict, json.loads(yamlstr, object_pairs_hook=OrderedDict))
     except ValueError:
-        yaml.SafeLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor)
-        yaml.SafeLoader.add_multi_constructor("!", intrinsics_multi_constructor)
-        return cast(Dict, yaml.safe_load(yamlstr))
+        return cast(Dict, yaml.load(yamlstr, Loader=CfnLoader))
 
 
 def parse_yaml_file(file_path, extra_context: Optional[Dict] = None) -> Dict:
@@ -149,6 +154,31 @@ def parse_yaml_file(file_path, extra_context: Optional[Dict] = None) -> Dict:
         return yaml_parse(content)
 
 
+class CfnLoader(_SafeLoader):
+    """Safe loader for CloudFormation templates, with short form intrinsic function tags and ordered mappings"""
+
+
+CfnLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor)
+CfnLoader.add_multi_constructor("!", intrinsics_multi_constructor)
+
+
 class CfnDumper(yaml.SafeDumper):
     def ignore_aliases(self, data):
         return True
+
+
+CfnDumper.add_representer(OrderedDict, _dict_representer)
+CfnDumper.add_representer(str, string_representer)
+
+
+def _add_py27_representers() -> None:
+    """
+    Add representers for the dictionary and string types of samtranslator.
+    samtranslator is slow to import, so this is deferred until it is loaded by something else,
+    since the template can't contain these types before that.
+    """
+    py27hash_fix = sys.modules.get("samtranslator.utils.py27hash_fix")
+    if not py27hash_fix or py27hash_fix.Py27Dict in CfnDumper.yaml_representers:
+        return
+    CfnDumper.add_representer(py27hash_fix.Py27Dict, _dict_representer)
+    CfnDumper.add_representer(py27hash_fix.Py27UniStr, string_representer)
@@ -0,0 +1,140 @@
+"""
+Benchmark of IntrinsicResolver.resolve_template on a large synthetic template, shaped like the templates that CDK
+synthesizes: every function has its own role and policy, and repeats the same Fn::Sub of the asset bucket and the
+same Fn::GetAtt of shared resources.
+
+The resolution is timed with and without the memoization of the intrinsic functions, best of
+SAM_CLI_BENCHMARK_REPEAT (defaults to 5) runs.
+"""
+import logging
+import os
+import time
+from typing import Callable
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.lib.intrinsic_resolver.intrinsic_property_resolver import IntrinsicResolver
+from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymbolTable
+
+LOG = logging.getLogger(__name__)
+
+FUNCTION_COUNT = 3000
+REPEAT = int(os.environ.get("SAM_CLI_BENCHMARK_REPEAT", 5))
+
+ASSET_BUCKET = {"Fn::Sub": "cdk-hnb659fds-assets-${AWS::AccountId}-${AWS::Region}"}
+
+
+def create_template(function_count: int) -> dict:
+    resources = {
+        "SharedTable": {"Type": "AWS::DynamoDB::Table", "Properties": {"TableName": "shared-table"}},
+        "SharedQueue": {"Type": "AWS::SQS::Queue", "Properties": {"QueueName": "shared-queue"}},
+    }
+    for index in range(function_count):
+        role = f"FunctionRole{index}"
+        resources[role] = {
+            "Type": "AWS::IAM::Role",
+            "Properties": {
+                "AssumeRolePolicyDocument": {
+                    "Statement": [
+                        {
+                            "Action": "sts:AssumeRole",
+                            "Effect": "Allow",
+                            "Principal": {"Service": "lambda.amazonaws.com"},
+                        }
+                    ],
+                    "Version": "2012-10-17",
+                },
+                "ManagedPolicyArns": [
+                    {
+                        "Fn::Join": [
+                            "",
+                            [
+                                "arn:",
+                                {"Ref": "AWS::Partition"},
+                                ":iam::aws:policy/service-role/AWSLambdaBasicExecutionRole",
+                            ],
+                        ]
+                    }
+                ],
+            },
+        }
+        resources[f"FunctionRolePolicy{index}"] = {
+            "Type": "AWS::IAM::Policy",
+            "Properties": {
+                "PolicyDocument": {
+                    "Statement": [
+                        {
+                            "Action": ["dynamodb:GetItem", "dynamodb:PutItem"],
+                            "Effect": "Allow",
+                            "Resource": [{"Fn::GetAtt": ["SharedTable", "Arn"]}],
+                        },
+                        {
+                            "Action": "sqs:SendMessage",
+                            "Effect": "Allow",
+                            "Resource": {"Fn::GetAtt": ["SharedQueue", "Arn"]},
+                        },
+                    ],
+                },
+                "PolicyName": f"FunctionRolePolicy{index}",
+                "Roles": [{"Ref": role}],
+            },
+        }
+        resources[f"Function{index}"] = {
+            "Type": "AWS::Lambda::Function",
+            "Properties": {
+                "Code": {"S3Bucket": ASSET_BUCKET, "S3Key": f"asset{index}.zip"},
+                "Role": {"Fn::GetAtt": [role, "Arn"]},
+                "Handler": "index.handler",
+                "Runtime": "python3.9",
+                "Environment": {
+                    "Variables": {
+                        "TABLE_NAME": {"Ref": "SharedTable"},
+                        "QUEUE_URL": {"Ref": "SharedQueue"},
+                        "ASSET_BUCKET": ASSET_BUCKET,
+                    }
+                },
+            },
+        }
+    return {"Resources": resources}
+
+
+def best_time(function: Callable[[], object]) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start_time = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start_time)
+    return min(times)
+
+
+class TestResolveTemplateBenchmark(TestCase):
+    def setUp(self):
+        self.template = create_template(FUNCTION_COUNT)
+
+    def _resolve(self):
+        symbol_resolver = IntrinsicsSymbolTable(template=self.template)
+        return IntrinsicResolver(template=self.template, symbol_resolver=symbol_resolver).resolve_template(
+            ignore_errors=True
+        )
+
+    def test_resolve_template(self):
+        memoized_result = self._resolve()
+        memoized_time = best_time(self._resolve)
+
+        # Resolve every intrinsic function again, as without the memoization
+        with patch(
+            "samcli.lib.intrinsic_resolver.resolution_helpers.ResolvedIntrinsicCache.resolve",
+            lambda _, key, intrinsic_value, ignore_errors, resolve_function: resolve_function(
+                intrinsic_value, ignore_errors
+            ),
+        ):
+            result = self._resolve()
+            time_without_memoization = best_time(self._resolve)
+
+        LOG.info(
+            "resolve_template of %d resources: %.3fs, %.3fs without memoization",
+            len(self.template["Resources"]),
+            memoized_time,
+            time_without_memoization,
+        )
+        self.assertEqual(memoized_result, result)
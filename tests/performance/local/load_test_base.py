@@ -0,0 +1,223 @@
+"""
+Base class of the load tests of the local services of start-api and start-lambda.
+
+The services are run with a fake Lambda runner that responds without running a container, so that only the work of
+the services is measured: validating the request, constructing the event, parsing the output of the function and
+constructing the response, which are on the path of every request.
+
+The load tests are configured with environment variables:
+
+SAM_CLI_LOAD_TEST_CONCURRENCY
+    Number of clients that send requests at the same time, defaults to 4
+SAM_CLI_LOAD_TEST_RESULTS
+    File that the results are written to as JSON
+SAM_CLI_LOAD_TEST_BASELINE
+    File with the results of a previous run. Scenarios whose throughput is lower than the baseline by more than
+    SAM_CLI_LOAD_TEST_TOLERANCE (defaults to 0.25) fail.
+"""
+import json
+import logging
+import math
+import os
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
+from unittest import TestCase
+
+import requests
+from werkzeug.serving import make_server
+
+LOG = logging.getLogger(__name__)
+
+KB = 1024
+MB = 1024 * KB
+# Payload sizes up to the 6 MB limit of synchronous invocations, and the number of requests sent for each of them
+PAYLOAD_SIZES = [1 * KB, 64 * KB, 1 * MB, 6 * MB]
+REQUEST_COUNTS = {1 * KB: 400, 64 * KB: 200, 1 * MB: 40, 6 * MB: 10}
+WARM_UP_REQUESTS = 3
+
+CONCURRENCY = int(os.environ.get("SAM_CLI_LOAD_TEST_CONCURRENCY", 4))
+RESULTS_FILE = os.environ.get("SAM_CLI_LOAD_TEST_RESULTS")
+BASELINE_FILE = os.environ.get("SAM_CLI_LOAD_TEST_BASELINE")
+TOLERANCE = float(os.environ.get("SAM_CLI_LOAD_TEST_TOLERANCE", 0.25))
+
+_all_results: List["LoadTestResult"] = []
+
+
+class LoadTestResult(NamedTuple):
+    scenario: str
+    payload_size: int
+    requests: int
+    concurrency: int
+    requests_per_second: float
+    p50_latency_ms: float
+    p99_latency_ms: float
+    # Peak memory allocated by Python in the process, client included, while a single request is sent
+    peak_memory_bytes: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.scenario} {self.payload_size}"
+
+
+class FakeLambdaRunner:
+    """Lambda runner that writes a fixed response, instead of running the function in a container"""
+
+    def __init__(self):
+        self.response = b"{}"
+
+    @staticmethod
+    def is_debugging():
+        return False
+
+    def invoke(self, function_name, event, stdout=None, stderr=None):
+        stdout.write(self.response)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(math.ceil(len(ordered) * percent / 100) - 1, 0)]
+
+
+def format_size(size: int) -> str:
+    return f"{size // MB}MB" if size >= MB else f"{size // KB}KB"
+
+
+class LocalServiceLoadTestBase(TestCase):
+    """
+    Runs the service created by create_service on a local server, and sends requests to it from a pool of clients
+    """
+
+    lambda_runner: FakeLambdaRunner
+    base_url: str
+
+    @classmethod
+    def create_service(cls, lambda_runner):
+        """
+        Returns
+        -------
+        samcli.local.services.base_local_service.BaseLocalService
+            Service to run with the given Lambda runner
+        """
+        raise NotImplementedError("Required method to implement")
+
+    @classmethod
+    def setUpClass(cls):
+        cls.lambda_runner = FakeLambdaRunner()
+        cls.service = cls.create_service(cls.lambda_runner)
+        cls.service.create()
+        cls.server = make_server("127.0.0.1", 0, cls.service._app, threaded=True)
+        # The port is part of the events of start-api
+        cls.service.port = cls.server.server_port
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        cls.clients = threading.local()
+        cls.baseline = cls._load_baseline()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server_thread.join()
+        cls.server.server_close()
+        if RESULTS_FILE:
+            with open(RESULTS_FILE, "w") as results_file:
+                json.dump([result._asdict() for result in _all_results], results_file, indent=2)
+
+    def run_load(
+        self, scenario: str, path: str, body: bytes, headers: Dict[str, str], payload_size: int, expected_body: bytes
+    ) -> LoadTestResult:
+        """
+        Send requests to the service, and check that the throughput is not lower than the baseline
+
+        Parameters
+        ----------
+        scenario : str
+            Name of the scenario
+        path : str
+            Path that the requests are sent to
+        body : bytes
+            Body of the requests
+        headers : Dict[str, str]
+            Headers of the requests
+        payload_size : int
+            Size of the payload the scenario is run with, one of PAYLOAD_SIZES
+        expected_body : bytes
+            Body of the responses
+
+        Returns
+        -------
+        LoadTestResult
+            Throughput, latency and memory of the scenario
+        """
+        url = self.base_url + path
+        requests_count = REQUEST_COUNTS[payload_size]
+        for _ in range(WARM_UP_REQUESTS):
+            self._send(url, body, headers, expected_body)
+
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+            latencies = list(
+                executor.map(lambda _: self._send(url, body, headers, expected_body), range(requests_count))
+            )
+        elapsed = time.perf_counter() - start_time
+
+        tracemalloc.start()
+        try:
+            self._send(url, body, headers, expected_body)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = LoadTestResult(
+            scenario=scenario,
+            payload_size=payload_size,
+            requests=requests_count,
+            concurrency=CONCURRENCY,
+            requests_per_second=round(requests_count / elapsed, 1),
+            p50_latency_ms=round(percentile(latencies, 50) * 1000, 2),
+            p99_latency_ms=round(percentile(latencies, 99) * 1000, 2),
+            peak_memory_bytes=peak_memory,
+        )
+        _all_results.append(result)
+        LOG.info(
+            "%s %s: %.1f requests/s, p50 %.2fms, p99 %.2fms, peak memory %.2fMB",
+            scenario,
+            format_size(payload_size),
+            result.requests_per_second,
+            result.p50_latency_ms,
+            result.p99_latency_ms,
+            peak_memory / MB,
+        )
+
+        baseline_requests_per_second = self.baseline.get(result.key)
+        if baseline_requests_per_second:
+            self.assertGreaterEqual(
+                result.requests_per_second,
+                baseline_requests_per_second * (1 - TOLERANCE),
+                f"Throughput of {scenario} {format_size(payload_size)} is lower than the baseline",
+            )
+        return result
+
+    def _send(self, url: str, body: bytes, headers: Dict[str, str], expected_body: bytes) -> float:
+        session: Optional[requests.Session] = getattr(self.clients, "session", None)
+        if not session:
+            session = self.clients.session = requests.Session()
+
+        start_time = time.perf_counter()
+        response = session.post(url, data=body, headers=headers)
+        latency = time.perf_counter() - start_time
+
+        self.assertEqual(response.status_code, 200, response.text[:200])
+        self.assertEqual(response.content, expected_body)
+        return latency
+
+    @staticmethod
+    def _load_baseline() -> Dict[str, float]:
+        if not BASELINE_FILE:
+            return {}
+        with open(BASELINE_FILE, "r") as baseline_file:
+            baseline = [LoadTestResult(**result) for result in json.load(baseline_file)]
+        return {result.key: result.requests_per_second for result in baseline}
@@ -0,0 +1,55 @@
+import json
+from itertools import product
+
+from parameterized import parameterized
+
+from samcli.lib.providers.provider import Api
+from samcli.local.apigw.local_apigw_service import LocalApigwService, Route
+from tests.performance.local.load_test_base import LocalServiceLoadTestBase, PAYLOAD_SIZES
+
+# Name of each payload format, and the path of the route that uses it
+PAYLOAD_FORMATS = [
+    ("rest_api_v1", "/rest-api"),
+    ("http_api_v1", "/http-api-v1"),
+    ("http_api_v2", "/http-api-v2"),
+]
+
+
+class TestStartApiLoad(LocalServiceLoadTestBase):
+    @classmethod
+    def create_service(cls, lambda_runner):
+        api = Api(
+            routes=[
+                Route(function_name="RestApiFunction", path="/rest-api", methods=["POST"], event_type=Route.API),
+                Route(
+                    function_name="HttpApiV1Function",
+                    path="/http-api-v1",
+                    methods=["POST"],
+                    event_type=Route.HTTP,
+                    payload_format_version="1.0",
+                ),
+                Route(
+                    function_name="HttpApiV2Function",
+                    path="/http-api-v2",
+                    methods=["POST"],
+                    event_type=Route.HTTP,
+                    payload_format_version="2.0",
+                ),
+            ]
+        )
+        return LocalApigwService(api, lambda_runner, host="127.0.0.1")
+
+    @parameterized.expand(
+        [
+            (payload_format, path, payload_size)
+            for (payload_format, path), payload_size in product(PAYLOAD_FORMATS, PAYLOAD_SIZES)
+        ]
+    )
+    def test_load(self, payload_format, path, payload_size):
+        body = b"x" * payload_size
+        # Function responds with the request body, so that both the event and the response are of the payload size
+        self.lambda_runner.response = json.dumps(
+            {"statusCode": 200, "headers": {"Content-Type": "text/plain"}, "body": body.decode("utf-8")}
+        ).encode("utf-8")
+
+        self.run_load(f"start-api {payload_format}", path, body, {"Content-Type": "text/plain"}, payload_size, body)
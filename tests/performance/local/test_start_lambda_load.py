@@ -0,0 +1,27 @@
+import json
+
+from parameterized import parameterized
+
+from samcli.local.lambda_service.local_lambda_invoke_service import LocalLambdaInvokeService
+from tests.performance.local.load_test_base import LocalServiceLoadTestBase, PAYLOAD_SIZES
+
+
+class TestStartLambdaLoad(LocalServiceLoadTestBase):
+    @classmethod
+    def create_service(cls, lambda_runner):
+        return LocalLambdaInvokeService(lambda_runner, port=None, host="127.0.0.1")
+
+    @parameterized.expand([(payload_size,) for payload_size in PAYLOAD_SIZES])
+    def test_load(self, payload_size):
+        body = json.dumps({"data": "x" * (payload_size - len('{"data": ""}'))}).encode("utf-8")
+        # Function responds with the event, so that both the event and the response are of the payload size
+        self.lambda_runner.response = body
+
+        self.run_load(
+            "start-lambda",
+            "/2015-03-31/functions/Function/invocations",
+            body,
+            {"Content-Type": "application/json"},
+            payload_size,
+            body,
+        )
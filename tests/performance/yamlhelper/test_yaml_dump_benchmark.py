@@ -0,0 +1,114 @@
+"""
+Benchmark of yaml_dump on a large template, against the dumper that the output templates were written with before
+they were streamed to their files. The output must stay byte for byte the same, for the large template and for the
+templates of the tests.
+"""
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Tuple
+from unittest import TestCase
+
+import yaml
+from botocore.compat import OrderedDict
+
+from samcli.yamlhelper import yaml_dump, yaml_parse
+from tests.unit.test_yamlhelper import PreviousCfnDumper
+
+LOG = logging.getLogger(__name__)
+
+FUNCTION_COUNT = 3000
+TESTS_DIR = Path(__file__).resolve().parents[2]
+
+
+def create_template(function_count: int) -> OrderedDict:
+    resources = OrderedDict()
+    for index in range(function_count):
+        resources[f"Function{index}"] = OrderedDict(
+            [
+                ("Type", "AWS::Lambda::Function"),
+                (
+                    "Properties",
+                    OrderedDict(
+                        [
+                            ("Code", {"S3Bucket": "bucket", "S3Key": f"0{index:031x}"}),
+                            ("Role", {"Fn::GetAtt": [f"FunctionRole{index}", "Arn"]}),
+                            ("Handler", "index.handler"),
+                            ("Runtime", "python3.9"),
+                            (
+                                "Description",
+                                "A long description of the function, that is wrapped by the emitter " * 3,
+                            ),
+                            ("Environment", {"Variables": {"TABLE": {"Ref": "Table"}, "INDEX": str(index)}}),
+                        ]
+                    ),
+                ),
+            ]
+        )
+    return OrderedDict([("AWSTemplateFormatVersion", "2010-09-09"), ("Resources", resources)])
+
+
+def measure(function: Callable[[], object]) -> Tuple[float, int]:
+    """Returns the duration in seconds and the peak memory in bytes allocated by Python while calling the function"""
+    tracemalloc.start()
+    try:
+        start_time = time.perf_counter()
+        function()
+        duration = time.perf_counter() - start_time
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return duration, peak_memory
+
+
+class TestYamlDumpBenchmark(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.template = create_template(FUNCTION_COUNT)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_yaml_dump(self):
+        previous_path = Path(self.temp_dir.name, "previous.yaml")
+        streamed_path = Path(self.temp_dir.name, "streamed.yaml")
+
+        def dump_previous():
+            previous_path.write_text(yaml.dump(self.template, default_flow_style=False, Dumper=PreviousCfnDumper))
+
+        def dump_streamed():
+            with open(streamed_path, "w") as output_file:
+                yaml_dump(self.template, output_file)
+
+        previous_time, previous_memory = measure(dump_previous)
+        streamed_time, streamed_memory = measure(dump_streamed)
+
+        LOG.info(
+            "yaml_dump of %d resources: %.3fs and %.1fMB streamed, %.3fs and %.1fMB before",
+            FUNCTION_COUNT,
+            streamed_time,
+            streamed_memory / 1024 / 1024,
+            previous_time,
+            previous_memory / 1024 / 1024,
+        )
+        self.assertEqual(streamed_path.read_bytes(), previous_path.read_bytes())
+
+    def test_yaml_dump_of_test_templates(self):
+        compared = 0
+        for template_path in TESTS_DIR.rglob("*.y*ml"):
+            try:
+                template = yaml_parse(template_path.read_text(encoding="utf-8"))
+            except Exception:  # pylint: disable=broad-except
+                # Not a YAML document, ex: a template with placeholders
+                continue
+
+            with self.subTest(template=os.path.relpath(template_path, TESTS_DIR)):
+                expected = yaml.dump(template, default_flow_style=False, Dumper=PreviousCfnDumper)
+                self.assertEqual(yaml_dump(template), expected)
+            compared += 1
+
+        LOG.info("yaml_dump of %d test templates is the same as before", compared)
+        self.assertGreater(compared, 0)
@@ -0,0 +1,37 @@
+"""
+Regression tests for the modules that are loaded when SAM CLI starts
+"""
+import re
+import subprocess
+import sys
+from unittest import TestCase
+
+from parameterized import parameterized
+
+# Modules that are slow to import and are only needed by some of the commands
+HEAVY_MODULES = ["boto3", "botocore.session", "botocore.utils", "samtranslator", "docker"]
+
+
+class TestCliImportTime(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Import in a new interpreter, modules loaded by other tests are shared within this process
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import samcli.cli.main"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+        cls.imported_modules = set(
+            match.group(1)
+            for match in re.finditer(
+                r"^import time:\s+\d+\s+\|\s+\d+\s+\|\s*([\w.]+)\s*$", result.stderr.decode(), re.M
+            )
+        )
+
+    def test_cli_main_is_imported(self):
+        self.assertIn("samcli.cli.main", self.imported_modules)
+
+    @parameterized.expand([(module,) for module in HEAVY_MODULES])
+    def test_heavy_module_is_not_imported_on_startup(self, module):
+        self.assertNotIn(module, self.imported_modules)
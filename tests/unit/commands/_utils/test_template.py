@@ -507,7 +507,6 @@ class Test_move_template(TestCase):
         dest = os.path.join("/", "tmp", "new", "root", "othertemplate.yaml")
 
         modified_template = update_relative_paths_mock.return_value = "modified template"
-        dumped_yaml = yaml_dump_mock.return_value = "dump result"
 
         m = mock_open()
         with patch("samcli.commands._utils.template.open", m):
@@ -516,9 +515,8 @@ class Test_move_template(TestCase):
         update_relative_paths_mock.assert_called_once_with(
             template_dict, os.path.dirname(source), os.path.dirname(dest)
         )
-        yaml_dump_mock.assert_called_with(modified_template)
         m.assert_called_with(dest, "w")
-        m.return_value.write.assert_called_with(dumped_yaml)
+        yaml_dump_mock.assert_called_with(modified_template, m.return_value)
 
 
 class Test_get_template_artifacts_format(TestCase):
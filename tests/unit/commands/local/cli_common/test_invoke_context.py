@@ -6,6 +6,7 @@ import os
 
 from samcli.commands._utils.template import TemplateFailedParsingException
 from samcli.commands.local.cli_common.user_exceptions import InvokeContextException, DebugContextException
+from samcli.commands.exceptions import ContainersInitializationException
 from samcli.commands.local.cli_common.invoke_context import InvokeContext, ContainersInitializationMode, ContainersMode
 
 from unittest import TestCase
@@ -434,6 +435,56 @@ class TestInvokeContext__exit__(TestCase):
         self.assertIsNone(context._log_file_handle)
 
 
+class TestInvokeContext_initialize_all_functions_containers(TestCase):
+    def setUp(self):
+        self.context = InvokeContext(template_file="template")
+        self.context._function_provider = Mock()
+        self.context._clean_running_containers_and_related_resources = Mock()
+
+        self.functions = [Mock(), Mock(), Mock()]
+        self.function_configs = {}
+        for index, (function, image) in enumerate(zip(self.functions, ["python-image", "python-image", "node-image"])):
+            function_config = Mock(
+                full_path=f"Function{index}",
+                packagetype="Zip",
+                runtime=image,
+                imageuri=None,
+                architecture="x86_64",
+                layers=[],
+            )
+            self.function_configs[id(function)] = function_config
+        self.context._function_provider.get_all.return_value = self.functions
+
+        self.runner_mock = Mock()
+        self.runner_mock.get_invoke_config.side_effect = lambda function: self.function_configs[id(function)]
+        self.runtime_mock = Mock()
+        patcher = patch.multiple(
+            InvokeContext,
+            local_lambda_runner=PropertyMock(return_value=self.runner_mock),
+            lambda_runtime=PropertyMock(return_value=self.runtime_mock),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_must_initialize_first_function_of_each_image_first(self):
+        self.context._initialize_all_functions_containers()
+
+        initialized = [call_args[0][1].full_path for call_args in self.runtime_mock.run.call_args_list]
+        self.assertCountEqual(initialized[:2], ["Function0", "Function2"])
+        self.assertEqual(initialized[2], "Function1")
+        self.context._clean_running_containers_and_related_resources.assert_not_called()
+
+    def test_must_clean_containers_if_initialization_fails(self):
+        self.runtime_mock.run.side_effect = Exception("failed")
+
+        with self.assertRaises(ContainersInitializationException):
+            self.context._initialize_all_functions_containers()
+
+        self.context._clean_running_containers_and_related_resources.assert_called_once_with()
+        # Functions that share an image with a failed function are not initialized
+        self.assertNotIn("Function1", [call_args[0][1].full_path for call_args in self.runtime_mock.run.call_args_list])
+
+
 class TestInvokeContextAsContextManager(TestCase):
     """
     Must be able to use the class as a context manager
@@ -548,7 +599,7 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             result = self.context.local_lambda_runner
             self.assertEqual(result, runner_mock)
 
-            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
+            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock, ANY)
             lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images=None)
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
@@ -626,7 +677,7 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             result = self.context.local_lambda_runner
             self.assertEqual(result, runner_mock)
 
-            WarmLambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
+            WarmLambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock, ANY)
             lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images=None)
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
@@ -700,7 +751,7 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             result = self.context.local_lambda_runner
             self.assertEqual(result, runner_mock)
 
-            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
+            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock, ANY)
             lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images=None)
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
@@ -774,7 +825,7 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             result = self.context.local_lambda_runner
             self.assertEqual(result, runner_mock)
 
-            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
+            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock, ANY)
             lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images={None: "image"})
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
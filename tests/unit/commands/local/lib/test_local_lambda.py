@@ -7,6 +7,7 @@ from platform import architecture
 from unittest import TestCase
 from unittest.mock import Mock, patch
 from parameterized import parameterized, param
+from botocore.credentials import RefreshableCredentials
 
 from samcli.lib.utils.architecture import X86_64, ARM64
 
@@ -508,6 +509,53 @@ class TestLocalLambda_get_invoke_config(TestCase):
         self.local_lambda._make_env_vars.assert_called_with(function)
 
 
+class TestLocalLambda_get_invoke_config_cache(TestCase):
+    def setUp(self):
+        self.local_lambda = LocalLambdaRunner(Mock(), Mock(), "/my/current/working/directory", env_vars_values={})
+        self.local_lambda._make_invoke_config = Mock(side_effect=lambda function: Mock())
+        self.function = Mock(full_path="Stack/Function")
+
+    def test_must_reuse_config_of_same_function(self):
+        config = self.local_lambda.get_invoke_config(self.function)
+
+        self.assertIs(self.local_lambda.get_invoke_config(self.function), config)
+        self.local_lambda._make_invoke_config.assert_called_once_with(self.function)
+
+    def test_must_cache_config_per_function(self):
+        other_function = Mock(full_path="Stack/OtherFunction")
+
+        config = self.local_lambda.get_invoke_config(self.function)
+        other_config = self.local_lambda.get_invoke_config(other_function)
+
+        self.assertIsNot(config, other_config)
+        self.assertIs(self.local_lambda.get_invoke_config(other_function), other_config)
+        self.assertEqual(self.local_lambda._make_invoke_config.call_count, 2)
+
+    def test_must_generate_config_when_function_is_changed(self):
+        changed_function = Mock(full_path="Stack/Function")
+
+        config = self.local_lambda.get_invoke_config(self.function)
+
+        self.assertIsNot(self.local_lambda.get_invoke_config(changed_function), config)
+        self.local_lambda._make_invoke_config.assert_called_with(changed_function)
+
+    def test_must_generate_config_when_env_vars_values_are_changed(self):
+        config = self.local_lambda.get_invoke_config(self.function)
+        self.local_lambda.env_vars_values = {"Function": {"key": "value"}}
+
+        self.assertIsNot(self.local_lambda.get_invoke_config(self.function), config)
+
+    @parameterized.expand([(True,), (False,)])
+    def test_must_generate_config_when_credentials_need_refresh(self, refresh_needed):
+        credentials = Mock(spec=RefreshableCredentials)
+        credentials.refresh_needed.return_value = refresh_needed
+        self.local_lambda._boto3_session_creds = credentials
+
+        config = self.local_lambda.get_invoke_config(self.function)
+
+        self.assertEqual(self.local_lambda.get_invoke_config(self.function) is not config, refresh_needed)
+
+
 class TestLocalLambda_invoke(TestCase):
     def setUp(self):
         self.runtime_mock = Mock()
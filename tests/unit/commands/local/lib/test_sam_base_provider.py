@@ -1,11 +1,17 @@
 from unittest import TestCase
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 from samcli.lib.providers.sam_base_provider import SamBaseProvider
 from samcli.lib.intrinsic_resolver.intrinsic_property_resolver import IntrinsicResolver
 from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymbolTable
 
 
 class TestSamBaseProvider_get_template(TestCase):
+    def setUp(self):
+        SamBaseProvider._template_cache.clear()
+
+    def tearDown(self):
+        SamBaseProvider._template_cache.clear()
+
     @patch("samcli.lib.providers.sam_base_provider.ResourceMetadataNormalizer")
     @patch("samcli.lib.providers.sam_base_provider.SamTranslatorWrapper")
     @patch.object(IntrinsicResolver, "resolve_template")
@@ -24,3 +30,31 @@ class TestSamBaseProvider_get_template(TestCase):
         called_parameter_values.update(overrides)
         SamTranslatorWrapperMock.assert_called_once_with(template, parameter_values=called_parameter_values)
         translator_instance.run_plugins.assert_called_once()
+
+    @patch("samcli.lib.providers.sam_base_provider.ResourceMetadataNormalizer")
+    @patch("samcli.lib.providers.sam_base_provider.SamTranslatorWrapper")
+    @patch.object(IntrinsicResolver, "resolve_template")
+    def test_must_process_same_template_once(
+        self, resolve_template_mock, SamTranslatorWrapperMock, resource_metadata_normalizer_patch
+    ):
+        resolve_template_mock.return_value = {"Resources": {"Function": {"Properties": {}}}}
+
+        template = {"Key": "Value"}
+        first = SamBaseProvider.get_template(template, {"some": "value"})
+        first["Resources"]["Function"]["Properties"]["Metadata"] = {}
+        second = SamBaseProvider.get_template({"Key": "Value"}, {"some": "value"})
+
+        SamTranslatorWrapperMock.assert_called_once()
+        self.assertEqual(second, {"Resources": {"Function": {"Properties": {}}}})
+
+        SamBaseProvider.get_template(template, {"some": "other value"})
+        SamBaseProvider.get_template({"Key": "Other Value"}, {"some": "value"})
+        self.assertEqual(SamTranslatorWrapperMock.call_count, 3)
+
+    @patch("samcli.lib.providers.sam_base_provider.get_disk_cache_root")
+    @patch.object(SamBaseProvider, "_template_cache")
+    def test_must_store_template_in_project_folder(self, template_cache_mock, get_disk_cache_root_mock):
+        SamBaseProvider.get_template({"Key": "Value"}, None, "template.yaml")
+
+        get_disk_cache_root_mock.assert_called_once_with("template.yaml")
+        template_cache_mock.get_or_process.assert_called_once_with(ANY, ANY, get_disk_cache_root_mock.return_value)
@@ -7,6 +7,7 @@ from parameterized import parameterized
 
 from samcli.lib.utils.architecture import X86_64, ARM64
 
+from samcli.commands._utils.template import TemplateFailedParsingException
 from samcli.commands.local.cli_common.user_exceptions import InvalidLayerVersionArn
 from samcli.lib.providers.provider import Function, LayerVersion, Stack
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider, RefreshableSamFunctionProvider
@@ -1737,6 +1738,31 @@ class TestSamFunctionProvider_get(TestCase):
 
         self.assertIsNone(provider.get("somefunc"), "Must return None when Function is not found")
 
+    def test_lookup_does_not_iterate_functions(self):
+        provider = SamFunctionProvider([])
+        function = Mock(function_id="FunctionA", functionname="physical-name", runtime=None)
+        function.name = "FunctionA"
+        provider.functions = {"ChildStack/FunctionA": function}
+
+        with patch.object(SamFunctionProvider, "get_all") as get_all_mock:
+            self.assertEqual(provider.get("physical-name"), function)
+            self.assertEqual(provider.get("FunctionA"), function)
+            get_all_mock.assert_not_called()
+
+    def test_index_is_rebuilt_when_functions_are_replaced(self):
+        provider = SamFunctionProvider([])
+        function1 = Mock(function_id="Function", functionname="function-1", runtime=None)
+        function1.name = "Function"
+        function2 = Mock(function_id="Function", functionname="function-2", runtime=None)
+        function2.name = "Function"
+
+        provider.functions = {"StackA/Function": function1}
+        self.assertEqual(provider.get("Function"), function1)
+
+        provider.functions = {"StackB/Function": function2}
+        self.assertEqual(provider.get("Function"), function2)
+        self.assertIsNone(provider.get("function-1"))
+
 
 class TestSamFunctionProvider_get_all(TestCase):
     def test_must_work_with_no_functions(self):
@@ -1809,7 +1835,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         provider._set_templates_changed(["child/template.yaml"])
 
         self.assertTrue(provider.is_changed)
-        self.file_observer.unwatch.assert_has_calls([call("template.yaml"), call("child/template.yaml")])
+        self.file_observer.unwatch.assert_called_once_with("child/template.yaml")
 
     @patch("samcli.lib.providers.sam_function_provider.SamLocalStackProvider.get_stacks")
     @patch("samcli.lib.providers.sam_function_provider.FileObserver")
@@ -1831,7 +1857,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         provider = RefreshableSamFunctionProvider(
             [stack, stack2], self.parameter_overrides, self.global_parameter_overrides
         )
-        provider._set_templates_changed(["child/template.yaml"])
+        provider._set_templates_changed(["template.yaml"])
         updated_template = {"Resources": {"a": "b", "c": "d"}}
         updated_template2 = {"Resources": {"a": "b"}}
         updated_template3 = {"Resources": {"a": "b"}}
@@ -1877,7 +1903,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         provider = RefreshableSamFunctionProvider(
             [stack, stack2], self.parameter_overrides, self.global_parameter_overrides
         )
-        provider._set_templates_changed(["child/template.yaml"])
+        provider._set_templates_changed(["template.yaml"])
         updated_template = {"Resources": {"a": "b", "c": "d"}}
         updated_template2 = {"Resources": {"a": "b"}}
         updated_template3 = {"Resources": {"a": "b"}}
@@ -1921,7 +1947,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         provider = RefreshableSamFunctionProvider(
             [stack, stack2], self.parameter_overrides, self.global_parameter_overrides
         )
-        provider._set_templates_changed(["child/template.yaml"])
+        provider._set_templates_changed(["template.yaml"])
         updated_template = {"Resources": {"a": "b", "c": "d"}}
         updated_template2 = {"Resources": {"a": "b"}}
         updated_template3 = {"Resources": {"a": "b"}}
@@ -1963,7 +1989,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         provider = RefreshableSamFunctionProvider(
             [stack, stack2], self.parameter_overrides, self.global_parameter_overrides
         )
-        provider._set_templates_changed(["child/template.yaml"])
+        provider._set_templates_changed(["template.yaml"])
         updated_template = {"Resources": {"a": "b", "c": "d"}}
         updated_template2 = {"Resources": {"a": "b"}}
         updated_template3 = {"Resources": {"c": "d"}}
@@ -1991,6 +2017,128 @@ class TestRefreshableSamFunctionProvider(TestCase):
             [call("template.yaml"), call("child/template.yaml"), call("child/child/template.yaml")]
         )
 
+    @patch("samcli.lib.providers.sam_function_provider.SamLocalStackProvider.get_stacks")
+    @patch("samcli.lib.providers.sam_function_provider.FileObserver")
+    @patch.object(SamFunctionProvider, "_extract_functions")
+    @patch("samcli.lib.providers.provider.SamBaseProvider.get_template")
+    def test_reload_only_changed_nested_stack(self, get_template_mock, extract_mock, FileObserverMock, get_stacks_mock):
+        FileObserverMock.return_value = self.file_observer
+        get_template_mock.return_value = {"Resources": {}}
+
+        root_stack = make_root_stack({}, self.parameter_overrides)
+        stack_a = Stack("", "ChildA", "a/template.yaml", {"P": "v"}, {})
+        stack_b = Stack("", "ChildB", "b/template.yaml", {"P": "v"}, {})
+        stack_c = Stack("ChildB", "ChildC", "c/template.yaml", {}, {})
+        root_function = Mock(stack_path="", full_path="Function")
+        function_a = Mock(stack_path="ChildA", full_path="ChildA/Function")
+        function_b = Mock(stack_path="ChildB", full_path="ChildB/Function")
+        function_c = Mock(stack_path="ChildB/ChildC", full_path="ChildB/ChildC/Function")
+        extract_mock.return_value = {
+            "Function": root_function,
+            "ChildA/Function": function_a,
+            "ChildB/Function": function_b,
+            "ChildB/ChildC/Function": function_c,
+        }
+        provider = RefreshableSamFunctionProvider(
+            [root_stack, stack_a, stack_b, stack_c], self.parameter_overrides, self.global_parameter_overrides
+        )
+
+        provider._set_templates_changed(["b/template.yaml"])
+        self.file_observer.unwatch.assert_called_once_with("b/template.yaml")
+
+        # ChildC got removed from the template of ChildB
+        updated_stack_b = Stack("", "ChildB", "b/template.yaml", {"P": "v"}, {"Resources": {}})
+        get_stacks_mock.return_value = [updated_stack_b], []
+        updated_function_b = Mock(stack_path="ChildB", full_path="ChildB/Function")
+        new_function_b = Mock(stack_path="ChildB", full_path="ChildB/NewFunction")
+        extract_mock.return_value = {"ChildB/Function": updated_function_b, "ChildB/NewFunction": new_function_b}
+        self.file_observer.watch.reset_mock()
+
+        self.assertEqual(provider.stacks, [root_stack, stack_a, updated_stack_b])
+        self.assertFalse(provider.is_changed)
+
+        get_stacks_mock.assert_called_once_with(
+            "b/template.yaml",
+            "",
+            "ChildB",
+            parameter_overrides={"P": "v"},
+            global_parameter_overrides=self.global_parameter_overrides,
+            metadata=None,
+        )
+        extract_mock.assert_called_with([updated_stack_b], False, False)
+        self.assertEqual(
+            provider.functions,
+            {
+                "Function": root_function,
+                "ChildA/Function": function_a,
+                "ChildB/Function": updated_function_b,
+                "ChildB/NewFunction": new_function_b,
+            },
+        )
+        self.assertEqual(provider.get("ChildB/NewFunction"), new_function_b)
+        self.file_observer.unwatch.assert_called_with("c/template.yaml")
+        self.file_observer.watch.assert_has_calls(
+            [call("template.yaml"), call("a/template.yaml"), call("b/template.yaml")]
+        )
+
+    @patch("samcli.lib.providers.sam_function_provider.SamLocalStackProvider.get_stacks")
+    @patch("samcli.lib.providers.sam_function_provider.FileObserver")
+    @patch.object(SamFunctionProvider, "_extract_functions")
+    @patch("samcli.lib.providers.provider.SamBaseProvider.get_template")
+    def test_reload_parent_stack_only_if_parent_and_child_stacks_changed(
+        self, get_template_mock, extract_mock, FileObserverMock, get_stacks_mock
+    ):
+        FileObserverMock.return_value = self.file_observer
+        get_template_mock.return_value = {"Resources": {}}
+        extract_mock.return_value = {}
+
+        root_stack = make_root_stack({}, self.parameter_overrides)
+        stack_b = Stack("", "ChildB", "b/template.yaml", {}, {})
+        stack_c = Stack("ChildB", "ChildC", "c/template.yaml", {}, {})
+        provider = RefreshableSamFunctionProvider(
+            [root_stack, stack_b, stack_c], self.parameter_overrides, self.global_parameter_overrides
+        )
+
+        provider._set_templates_changed(["c/template.yaml"])
+        provider._set_templates_changed(["b/template.yaml"])
+        get_stacks_mock.return_value = [stack_b, stack_c], []
+
+        self.assertEqual(provider.stacks, [root_stack, stack_b, stack_c])
+        get_stacks_mock.assert_called_once_with(
+            "b/template.yaml",
+            "",
+            "ChildB",
+            parameter_overrides={},
+            global_parameter_overrides=self.global_parameter_overrides,
+            metadata=None,
+        )
+        self.assertFalse(provider.is_changed)
+
+    @patch("samcli.lib.providers.sam_function_provider.SamLocalStackProvider.get_stacks")
+    @patch("samcli.lib.providers.sam_function_provider.FileObserver")
+    @patch.object(SamFunctionProvider, "_extract_functions")
+    @patch("samcli.lib.providers.provider.SamBaseProvider.get_template")
+    def test_keep_changed_templates_if_reload_fails(
+        self, get_template_mock, extract_mock, FileObserverMock, get_stacks_mock
+    ):
+        FileObserverMock.return_value = self.file_observer
+        get_template_mock.return_value = {"Resources": {}}
+        extract_mock.return_value = {}
+
+        root_stack = make_root_stack({}, self.parameter_overrides)
+        stack_b = Stack("", "ChildB", "b/template.yaml", {}, {})
+        provider = RefreshableSamFunctionProvider(
+            [root_stack, stack_b], self.parameter_overrides, self.global_parameter_overrides
+        )
+
+        provider._set_templates_changed(["b/template.yaml"])
+        get_stacks_mock.side_effect = TemplateFailedParsingException("invalid template")
+
+        with self.assertRaises(TemplateFailedParsingException):
+            provider.get_all()
+        self.assertTrue(provider.is_changed)
+        self.assertEqual(provider._stacks, [root_stack, stack_b])
+
     @patch("samcli.lib.providers.sam_function_provider.FileObserver")
     @patch.object(SamFunctionProvider, "_extract_functions")
     @patch("samcli.lib.providers.provider.SamBaseProvider.get_template")
@@ -7,6 +7,7 @@ from unittest.mock import patch, Mock
 from parameterized import parameterized
 
 from samcli.lib.utils.resources import AWS_SERVERLESS_APPLICATION, AWS_CLOUDFORMATION_STACK
+from samcli.lib.providers.exceptions import CircularStackReference
 from samcli.lib.providers.provider import Stack
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
 
@@ -177,6 +178,72 @@ class TestSamBuildableStackProvider(TestCase):
         )
         self.assertFalse(remote_stack_full_paths)
 
+    def test_sibling_stacks_are_returned_in_template_order(self):
+        template = {
+            "Resources": {
+                f"ChildStack{index}": {
+                    "Type": AWS_SERVERLESS_APPLICATION,
+                    "Properties": {"Location": f"child{index}.yaml"},
+                }
+                for index in range(10)
+            }
+        }
+        child_template = {
+            "Resources": {
+                "GrandChildStack": {
+                    "Type": AWS_SERVERLESS_APPLICATION,
+                    "Properties": {"Location": "grand-child.yaml"},
+                }
+            }
+        }
+        self.get_template_data_mock.side_effect = lambda t: (
+            template if t == self.template_file else LEAF_TEMPLATE if t == "grand-child.yaml" else child_template
+        )
+
+        stacks, _ = SamLocalStackProvider.get_stacks(self.template_file)
+
+        expected_stack_paths = [""]
+        for index in range(10):
+            expected_stack_paths.extend([f"ChildStack{index}", f"ChildStack{index}/GrandChildStack"])
+        self.assertEqual([stack.stack_path for stack in stacks], expected_stack_paths)
+
+    def test_child_templates_are_read_once(self):
+        template = {
+            "Resources": {
+                "ChildStack": {
+                    "Type": AWS_SERVERLESS_APPLICATION,
+                    "Properties": {"Location": "child.yaml"},
+                }
+            }
+        }
+        self.get_template_data_mock.side_effect = lambda t: template if t == self.template_file else LEAF_TEMPLATE
+
+        SamLocalStackProvider.get_stacks(self.template_file)
+
+        self.assertEqual(self.get_template_data_mock.call_count, 2)
+
+    def test_circular_stack_reference(self):
+        template = {
+            "Resources": {
+                "ChildStack": {
+                    "Type": AWS_SERVERLESS_APPLICATION,
+                    "Properties": {"Location": "child.yaml"},
+                }
+            }
+        }
+        child_template = {
+            "Resources": {
+                "GrandChildStack": {
+                    "Type": AWS_SERVERLESS_APPLICATION,
+                    "Properties": {"Location": self.template_file},
+                }
+            }
+        }
+        self.get_template_data_mock.side_effect = lambda t: template if t == self.template_file else child_template
+
+        with self.assertRaises(CircularStackReference):
+            SamLocalStackProvider.get_stacks(self.template_file)
+
     @parameterized.expand([(AWS_SERVERLESS_APPLICATION, "Location"), (AWS_CLOUDFORMATION_STACK, "TemplateURL")])
     def test_remote_stack_is_skipped(self, resource_type, location_property_name):
         template = {
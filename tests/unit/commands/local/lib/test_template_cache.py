@@ -0,0 +1,185 @@
+import datetime
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import Mock
+
+from samcli.lib.build.build_strategy import clean_redundant_folders
+from samcli.lib.providers.template_cache import (
+    TEMPLATE_CACHE_DIR,
+    TemplateCache,
+    TemplateDiskCache,
+    copy_template,
+    get_disk_cache_root,
+    get_template_cache_key,
+)
+
+
+class TestGetTemplateCacheKey(TestCase):
+    def test_same_content_same_key(self):
+        self.assertEqual(
+            get_template_cache_key({"A": 1, "B": [1, 2]}, {"P": "V"}),
+            get_template_cache_key(OrderedDict([("B", [1, 2]), ("A", 1)]), {"P": "V"}),
+        )
+
+    def test_different_inputs_different_keys(self):
+        key = get_template_cache_key({"A": 1}, {"P": "V"})
+        self.assertNotEqual(key, get_template_cache_key({"A": 2}, {"P": "V"}))
+        self.assertNotEqual(key, get_template_cache_key({"A": 1}, {"P": "W"}))
+        self.assertNotEqual(key, get_template_cache_key({"A": 1}, {"P": "V"}, False))
+
+    def test_unserializable_template(self):
+        self.assertIsNone(get_template_cache_key({1: "a", "b": "c"}, None))
+
+
+class TestCopyTemplate(TestCase):
+    def test_copy_does_not_share_containers(self):
+        template = OrderedDict([("Resources", {"Function": {"Properties": {"Layers": ["Layer"]}}})])
+        copied = copy_template(template)
+
+        self.assertEqual(copied, template)
+        self.assertIsInstance(copied, OrderedDict)
+        copied["Resources"]["Function"]["Properties"]["Layers"].append("Other")
+        self.assertEqual(template["Resources"]["Function"]["Properties"]["Layers"], ["Layer"])
+
+
+class TestTemplateCache(TestCase):
+    def test_process_once(self):
+        cache = TemplateCache()
+        process = Mock(return_value={"Resources": {}})
+
+        first = cache.get_or_process("key", process)
+        first["Resources"]["Function"] = {}
+        second = cache.get_or_process("key", process)
+
+        process.assert_called_once_with()
+        self.assertEqual(second, {"Resources": {}})
+
+    def test_no_key_not_cached(self):
+        cache = TemplateCache()
+        process = Mock(return_value={})
+
+        cache.get_or_process(None, process)
+        cache.get_or_process(None, process)
+
+        self.assertEqual(process.call_count, 2)
+
+    def test_least_recently_used_evicted(self):
+        cache = TemplateCache(max_size=2)
+        process = Mock(return_value={})
+
+        cache.get_or_process("key1", process)
+        cache.get_or_process("key2", process)
+        cache.get_or_process("key1", process)
+        cache.get_or_process("key3", process)
+        self.assertEqual(process.call_count, 3)
+
+        cache.get_or_process("key1", process)
+        self.assertEqual(process.call_count, 3)
+        cache.get_or_process("key2", process)
+        self.assertEqual(process.call_count, 4)
+
+    def test_clear(self):
+        cache = TemplateCache()
+        process = Mock(return_value={})
+
+        cache.get_or_process("key", process)
+        cache.clear()
+        cache.get_or_process("key", process)
+
+        self.assertEqual(process.call_count, 2)
+
+
+class TestTemplateDiskCache(TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_put_and_get(self):
+        disk_cache = TemplateDiskCache(os.path.join(self.cache_dir, "templates"))
+        disk_cache.put("key", {"Resources": {"Function": {"Properties": {"Timeout": 3}}}})
+
+        self.assertEqual(disk_cache.get("key"), {"Resources": {"Function": {"Properties": {"Timeout": 3}}}})
+        self.assertIsNone(disk_cache.get("other_key"))
+
+    def test_get_corrupted_file(self):
+        disk_cache = TemplateDiskCache(self.cache_dir)
+        Path(self.cache_dir, "key.json").write_text("{")
+
+        self.assertIsNone(disk_cache.get("key"))
+
+    def test_put_not_serializable(self):
+        disk_cache = TemplateDiskCache(self.cache_dir)
+        disk_cache.put("key", {"Date": datetime.date(2021, 1, 1)})
+
+        self.assertIsNone(disk_cache.get("key"))
+
+    def test_old_templates_removed(self):
+        disk_cache = TemplateDiskCache(self.cache_dir, max_size=2)
+        for index in range(3):
+            disk_cache.put(f"key{index}", {})
+            os.utime(Path(self.cache_dir, f"key{index}.json"), (index, index))
+        disk_cache.put("key3", {})
+
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ["key2.json", "key3.json"])
+
+
+class TestGetDiskCacheRoot(TestCase):
+    def test_aws_sam_folder_next_to_template(self):
+        self.assertEqual(
+            get_disk_cache_root(os.path.join("project", "template.yaml")),
+            str(Path("project", ".aws-sam").resolve()),
+        )
+
+    def test_aws_sam_folder_of_built_template(self):
+        self.assertEqual(
+            get_disk_cache_root(os.path.join("project", ".aws-sam", "build", "template.yaml")),
+            str(Path("project", ".aws-sam").resolve()),
+        )
+
+    def test_without_template_file(self):
+        self.assertIsNone(get_disk_cache_root(None))
+
+
+class TestTemplateCacheWithDisk(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_reuses_template_from_disk(self):
+        process = Mock(return_value={"Resources": {}})
+
+        TemplateCache().get_or_process("key", process, self.root)
+        template = TemplateCache().get_or_process("key", process, self.root)
+
+        process.assert_called_once_with()
+        self.assertEqual(template, {"Resources": {}})
+
+    def test_disk_cache_not_used_without_root_folder(self):
+        root = os.path.join(self.root, "missing")
+        process = Mock(return_value={"Resources": {}})
+
+        TemplateCache().get_or_process("key", process, root)
+        TemplateCache().get_or_process("key", process, root)
+
+        self.assertEqual(process.call_count, 2)
+        self.assertFalse(os.path.exists(root))
+
+    def test_templates_are_kept_when_build_cache_is_cleaned(self):
+        cache_dir = os.path.join(self.root, "cache")
+        os.makedirs(os.path.join(cache_dir, "uuid1"))
+        process = Mock(return_value={"Resources": {}})
+        TemplateCache().get_or_process("key", process, self.root)
+
+        clean_redundant_folders(cache_dir, set())
+        TemplateCache().get_or_process("key", process, self.root)
+
+        process.assert_called_once_with()
+        self.assertTrue(os.path.isfile(os.path.join(self.root, TEMPLATE_CACHE_DIR, "key.json")))
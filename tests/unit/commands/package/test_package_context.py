@@ -1,8 +1,11 @@
 """Test sam package command"""
+import os
 from unittest import TestCase
 from unittest.mock import patch, MagicMock, Mock, call, ANY
 import tempfile
 
+from parameterized import parameterized
+
 
 from samcli.commands.package.package_context import PackageContext
 from samcli.commands.package.exceptions import PackageFailedError
@@ -147,3 +150,18 @@ class TestPackageCommand(TestCase):
         )
 
         print("hello")
+
+    @parameterized.expand([(True,), (False,)])
+    @patch("samcli.commands.package.package_context.click")
+    def test_write_output_to_file_same_as_stdout(self, use_json, click_mock):
+        exported_template = {
+            "Resources": {"Function": {"Type": "AWS::Lambda::Function", "Properties": {"Description": "ünicode"}}}
+        }
+        PackageContext.write_output(None, exported_template, use_json)
+        (echoed,), _ = click_mock.echo.call_args
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file_name = os.path.join(temp_dir, "packaged.yaml")
+            PackageContext.write_output(output_file_name, exported_template, use_json)
+            with open(output_file_name, "r") as output_file:
+                self.assertEqual(output_file.read(), echoed)
@@ -994,6 +994,17 @@ class TestApplicationBuilder_build_lambda_image_function(TestCase):
     def setUp(self):
         self.stream_mock = Mock()
         self.docker_client_mock = Mock()
+        self.get_docker_context_paths_patcher = patch("samcli.lib.build.app_builder.get_docker_context_paths")
+        self.get_docker_context_paths_mock = self.get_docker_context_paths_patcher.start()
+        self.get_docker_context_paths_mock.return_value = (
+            {"/base/dir/context/Dockerfile": "Dockerfile"},
+            "Dockerfile",
+        )
+        self.addCleanup(self.get_docker_context_paths_patcher.stop)
+        # The files of the mocked Docker context don't exist, they must not be streamed
+        self.stream_tarball_patcher = patch("samcli.lib.build.app_builder.stream_tarball")
+        self.stream_tarball_mock = self.stream_tarball_patcher.start()
+        self.addCleanup(self.stream_tarball_patcher.stop)
         self.builder = ApplicationBuilder(
             Mock(),
             "/build/dir",
@@ -1136,7 +1147,8 @@ class TestApplicationBuilder_build_lambda_image_function(TestCase):
             self.docker_client_mock.api.build.call_args,
             # NOTE (sriram-mv): path set to ANY to handle platform differences.
             call(
-                path=ANY,
+                fileobj=ANY,
+                custom_context=True,
                 dockerfile="Dockerfile",
                 tag="name:Tag-debug",
                 buildargs={"a": "b", "SAM_BUILD_MODE": "debug"},
@@ -1163,7 +1175,8 @@ class TestApplicationBuilder_build_lambda_image_function(TestCase):
         self.assertEqual(
             self.docker_client_mock.api.build.call_args,
             call(
-                path=ANY,
+                fileobj=ANY,
+                custom_context=True,
                 dockerfile="Dockerfile",
                 tag="name:Tag-debug",
                 buildargs={"a": "b", "SAM_BUILD_MODE": "debug"},
@@ -1173,6 +1186,75 @@ class TestApplicationBuilder_build_lambda_image_function(TestCase):
             ),
         )
 
+    @patch("samcli.lib.build.app_builder.stream_tarball")
+    def test_can_build_image_function_with_streamed_context(self, stream_tarball_mock):
+        metadata = {"Dockerfile": "Dockerfile", "DockerContext": "context", "DockerTag": "Tag"}
+        context_mock = Mock()
+        stream_tarball_mock.return_value.__enter__.return_value = context_mock
+        self.docker_client_mock.api.build.return_value = []
+
+        result = self.builder._build_lambda_image("Name", metadata, X86_64)
+
+        self.assertEqual(result, "name:Tag")
+        self.get_docker_context_paths_mock.assert_called_once_with(
+            str(Path("/base/dir/context").resolve()), "Dockerfile"
+        )
+        stream_tarball_mock.assert_called_once_with(
+            {"/base/dir/context/Dockerfile": "Dockerfile"}, tar_filter=ANY, recursive=False
+        )
+        self.docker_client_mock.api.build.assert_called_once_with(
+            fileobj=context_mock,
+            custom_context=True,
+            dockerfile="Dockerfile",
+            tag="name:Tag",
+            buildargs={},
+            decode=True,
+            platform="linux/amd64",
+        )
+        stream_tarball_mock.return_value.__exit__.assert_called_once()
+
+    @patch("samcli.lib.build.app_builder.stream_tarball")
+    def test_can_build_image_function_with_absolute_dockerfile_path_in_context(self, stream_tarball_mock):
+        dockerfile = str(Path("/base/dir/context/app/Dockerfile").resolve())
+        metadata = {"Dockerfile": dockerfile, "DockerContext": "context", "DockerTag": "Tag"}
+        self.get_docker_context_paths_mock.return_value = ({dockerfile: "app/Dockerfile"}, "app/Dockerfile")
+        context_mock = Mock()
+        stream_tarball_mock.return_value.__enter__.return_value = context_mock
+        self.docker_client_mock.api.build.return_value = []
+
+        self.builder._build_lambda_image("Name", metadata, X86_64)
+
+        self.get_docker_context_paths_mock.assert_called_once_with(str(Path("/base/dir/context").resolve()), dockerfile)
+        # Docker only accepts the path of the Dockerfile within a custom context
+        self.docker_client_mock.api.build.assert_called_once_with(
+            fileobj=context_mock,
+            custom_context=True,
+            dockerfile="app/Dockerfile",
+            tag="name:Tag",
+            buildargs={},
+            decode=True,
+            platform="linux/amd64",
+        )
+
+    @patch("samcli.lib.build.app_builder.stream_tarball")
+    def test_can_build_image_function_with_dockerfile_outside_of_context(self, stream_tarball_mock):
+        metadata = {"Dockerfile": "../Dockerfile", "DockerContext": "context", "DockerTag": "Tag"}
+        self.get_docker_context_paths_mock.return_value = None
+        self.docker_client_mock.api.build.return_value = []
+
+        result = self.builder._build_lambda_image("Name", metadata, X86_64)
+
+        self.assertEqual(result, "name:Tag")
+        stream_tarball_mock.assert_not_called()
+        self.docker_client_mock.api.build.assert_called_once_with(
+            path=str(Path("/base/dir/context").resolve()),
+            dockerfile="../Dockerfile",
+            tag="name:Tag",
+            buildargs={},
+            decode=True,
+            platform="linux/amd64",
+        )
+
 
 class TestApplicationBuilder_build_function(TestCase):
     def setUp(self):
@@ -3,7 +3,7 @@ from collections import OrderedDict
 from copy import deepcopy
 from pathlib import Path
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 from parameterized import parameterized
 
@@ -1115,3 +1115,88 @@ class TestIntrinsicResolverInitialization(TestCase):
 
         resolver.set_intrinsic_key_function_map({"key": lambda_func})
         self.assertTrue(resolver.intrinsic_key_function_map.get("key") == lambda_func)
+
+
+class TestIntrinsicResolverMemoization(TestCase):
+    def setUp(self):
+        self.symbol_resolver = Mock()
+        self.symbol_resolver.resolve_symbols.side_effect = lambda logical_id, attribute, **kwargs: {
+            "Table": {"Arn": "table-arn"},
+            "Queue": {"Arn": "queue-arn"},
+        }[logical_id][attribute]
+        self.resolver = IntrinsicResolver(template={}, symbol_resolver=self.symbol_resolver)
+
+    def test_same_intrinsic_is_resolved_once(self):
+        result = self.resolver.intrinsic_property_resolver(
+            {
+                "A": {"Fn::GetAtt": ["Table", "Arn"]},
+                "B": [{"Fn::GetAtt": ["Table", "Arn"]}, {"Fn::GetAtt": ["Queue", "Arn"]}],
+                "C": {"Fn::Join": ["/", [{"Fn::GetAtt": ["Table", "Arn"]}, "index"]]},
+            },
+            True,
+        )
+
+        self.assertEqual(result, {"A": "table-arn", "B": ["table-arn", "queue-arn"], "C": "table-arn/index"})
+        self.assertEqual(self.symbol_resolver.resolve_symbols.call_count, 2)
+
+    def test_memoized_results_are_copied(self):
+        intrinsic = {"Fn::Split": [",", "a,b"]}
+
+        first_result = self.resolver.intrinsic_property_resolver(intrinsic, True)
+        first_result.append("c")
+
+        self.assertEqual(self.resolver.intrinsic_property_resolver(intrinsic, True), ["a", "b"])
+
+    def test_failures_are_not_memoized(self):
+        self.symbol_resolver.resolve_symbols.side_effect = InvalidIntrinsicException("failed")
+
+        for _ in range(2):
+            with self.assertRaises(InvalidIntrinsicException):
+                self.resolver.intrinsic_property_resolver({"Ref": "Table"}, False)
+        self.assertEqual(self.symbol_resolver.resolve_symbols.call_count, 2)
+
+    def test_memoized_results_are_cleared_with_new_function_map(self):
+        self.assertEqual(self.resolver.intrinsic_property_resolver({"Fn::Base64": "a"}, True), "YQ==")
+
+        self.resolver.set_intrinsic_key_function_map({"Fn::Base64": lambda value, ignore_errors: "custom"})
+
+        self.assertEqual(self.resolver.intrinsic_property_resolver({"Fn::Base64": "a"}, True), "custom")
+
+
+class TestIntrinsicResolverNestedProperties(TestCase):
+    def setUp(self):
+        self.resolver = IntrinsicResolver(template={}, symbol_resolver=IntrinsicsSymbolTable(template={}))
+
+    def test_deeply_nested_properties_are_resolved_without_recursion(self):
+        properties = {"Value": {"Ref": "AWS::Region"}}
+        for _ in range(5000):
+            properties = {"Nested": [properties]}
+
+        with patch.dict("os.environ", {"AWS_REGION": "us-east-1"}):
+            result = self.resolver.intrinsic_property_resolver(properties, True)
+
+        for _ in range(5000):
+            self.assertEqual(list(result.keys()), ["Nested"])
+            self.assertEqual(len(result["Nested"]), 1)
+            result = result["Nested"][0]
+        self.assertEqual(result, {"Value": "us-east-1"})
+
+    def test_failed_value_in_nested_list_leaves_dict_value_as_is(self):
+        properties = {"Valid": {"Fn::Join": ["-", ["a", "b"]]}, "Invalid": ["a", [{"Fn::Join": "invalid"}]], "C": 1}
+
+        result = self.resolver.intrinsic_property_resolver(properties, True)
+
+        self.assertEqual(result, {"Valid": "a-b", "Invalid": ["a", [{"Fn::Join": "invalid"}]], "C": 1})
+
+    def test_failed_value_in_nested_list_raises_if_errors_are_not_ignored(self):
+        with self.assertRaises(InvalidIntrinsicException):
+            self.resolver.intrinsic_property_resolver({"Invalid": ["a", [{"Fn::Join": "invalid"}]]}, False)
+
+    def test_failed_value_in_list_raises_without_parent_dict(self):
+        with self.assertRaises(InvalidIntrinsicException):
+            self.resolver.intrinsic_property_resolver(["a", None], True)
+
+    def test_non_string_keys_are_left_as_is_when_errors_are_ignored(self):
+        result = self.resolver.intrinsic_property_resolver({"A": "a", 1: {"Fn::Join": ["-", ["a", "b"]]}}, True)
+
+        self.assertEqual(result, {"A": "a", 1: {"Fn::Join": ["-", ["a", "b"]]}})
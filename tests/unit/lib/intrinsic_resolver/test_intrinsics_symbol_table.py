@@ -1,6 +1,8 @@
 from unittest import TestCase
 
-from unittest.mock import patch
+from unittest.mock import patch, Mock
+
+from parameterized import parameterized
 
 from samcli.lib.intrinsic_resolver.invalid_intrinsic_exception import InvalidSymbolException
 from samcli.lib.intrinsic_resolver.intrinsic_property_resolver import IntrinsicResolver
@@ -139,3 +141,40 @@ class TestSymbolResolution(TestCase):
         resolver = IntrinsicsSymbolTable()
         with self.assertRaises(InvalidSymbolException):
             resolver.resolve_symbols("UNKNOWN", "SOME UNKNOWN RESOURCE PROPERTY")
+
+    def test_resolved_symbols_are_cached(self):
+        arn_resolver = Mock(return_value="arn")
+        symbol_resolver = IntrinsicsSymbolTable(template={}, common_attribute_resolver={"Arn": arn_resolver})
+
+        self.assertEqual(symbol_resolver.resolve_symbols("MyFunction", "Arn"), "arn")
+        self.assertEqual(symbol_resolver.resolve_symbols("MyFunction", "Arn"), "arn")
+        self.assertEqual(symbol_resolver.resolve_symbols("OtherFunction", "Arn"), "arn")
+
+        self.assertEqual(arn_resolver.call_count, 2)
+
+    def test_logical_id_translator_is_checked_before_cached_symbols(self):
+        symbol_resolver = IntrinsicsSymbolTable(template={}, common_attribute_resolver={"Arn": "arn"})
+        self.assertEqual(symbol_resolver.resolve_symbols("MyFunction", "Arn"), "arn")
+
+        symbol_resolver.logical_id_translator["MyFunction"] = {"Arn": "translated-arn"}
+
+        self.assertEqual(symbol_resolver.resolve_symbols("MyFunction", "Arn"), "translated-arn")
+
+    @parameterized.expand([(False,), (True,)])
+    def test_none_from_resolver_is_returned_and_not_cached(self, ignore_errors):
+        arn_resolver = Mock(return_value=None)
+        symbol_resolver = IntrinsicsSymbolTable(template={}, common_attribute_resolver={"Arn": arn_resolver})
+
+        self.assertIsNone(symbol_resolver.resolve_symbols("MyFunction", "Arn", ignore_errors=ignore_errors))
+        self.assertIsNone(symbol_resolver.resolve_symbols("MyFunction", "Arn", ignore_errors=ignore_errors))
+
+        self.assertEqual(arn_resolver.call_count, 2)
+
+    def test_non_string_symbols_are_not_cached(self):
+        template = {"Resources": {"MyLayer": {"Type": "AWS::Lambda::LayerVersion"}}}
+        symbol_resolver = IntrinsicsSymbolTable(template=template)
+
+        first_result = symbol_resolver.resolve_symbols("MyLayer", IntrinsicResolver.REF)
+        first_result["Ref"] = "changed"
+
+        self.assertEqual(symbol_resolver.resolve_symbols("MyLayer", IntrinsicResolver.REF), {"Ref": "MyLayer"})
@@ -0,0 +1,99 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from samcli.lib.intrinsic_resolver.resolution_helpers import ResolvedIntrinsicCache, resolve_properties
+
+
+class TestResolvedIntrinsicCache(TestCase):
+    def setUp(self):
+        self.cache = ResolvedIntrinsicCache()
+
+    def test_must_resolve_same_intrinsic_once(self):
+        resolve_function = Mock(return_value={"Arn": "arn"})
+
+        first = self.cache.resolve("Fn::GetAtt", ["Role", "Arn"], False, resolve_function)
+        second = self.cache.resolve("Fn::GetAtt", ["Role", "Arn"], False, resolve_function)
+
+        self.assertEqual(first, {"Arn": "arn"})
+        self.assertEqual(second, {"Arn": "arn"})
+        resolve_function.assert_called_once_with(["Role", "Arn"], False)
+
+    def test_must_return_copies_of_results(self):
+        resolve_function = Mock(return_value={"Arn": "arn"})
+
+        self.cache.resolve("Fn::GetAtt", ["Role", "Arn"], False, resolve_function)["Arn"] = "changed"
+
+        self.assertEqual(self.cache.resolve("Fn::GetAtt", ["Role", "Arn"], False, resolve_function), {"Arn": "arn"})
+
+    def test_must_not_cache_failures(self):
+        resolve_function = Mock(side_effect=[ValueError(), "value"])
+
+        with self.assertRaises(ValueError):
+            self.cache.resolve("Ref", "Parameter", False, resolve_function)
+
+        self.assertEqual(self.cache.resolve("Ref", "Parameter", False, resolve_function), "value")
+
+    def test_must_resolve_again_after_clear(self):
+        resolve_function = Mock(return_value="value")
+
+        self.cache.resolve("Ref", "Parameter", False, resolve_function)
+        self.cache.clear()
+        self.cache.resolve("Ref", "Parameter", False, resolve_function)
+
+        self.assertEqual(resolve_function.call_count, 2)
+
+    def test_must_not_cache_values_that_are_not_json(self):
+        resolve_function = Mock(return_value="value")
+
+        self.cache.resolve("Ref", object(), False, resolve_function)
+        self.cache.resolve("Ref", object(), False, resolve_function)
+
+        self.assertEqual(resolve_function.call_count, 2)
+
+
+class TestResolveProperties(TestCase):
+    @staticmethod
+    def _resolve(properties, ignore_errors=False):
+        def resolve_value(value):
+            if value == "fail":
+                raise ValueError()
+            return value.upper() if isinstance(value, str) else value
+
+        return resolve_properties(
+            properties,
+            resolve_key=lambda key: str(key),
+            resolve_value=resolve_value,
+            is_nested=lambda value: isinstance(value, (dict, list)),
+            ignore_errors=ignore_errors,
+        )
+
+    def test_must_resolve_nested_properties(self):
+        result = self._resolve({"a": ["b", {"c": "d"}], 1: "e"})
+
+        self.assertEqual(result, {"a": ["B", {"c": "D"}], "1": "E"})
+
+    def test_must_not_hit_recursion_limit(self):
+        properties = value = {}
+        for _ in range(5000):
+            value["key"] = {}
+            value = value["key"]
+        value["key"] = "value"
+
+        result = self._resolve(properties)
+
+        for _ in range(5000):
+            result = result["key"]
+        self.assertEqual(result, {"key": "VALUE"})
+
+    def test_must_keep_original_value_of_nearest_dictionary_when_ignoring_errors(self):
+        result = self._resolve({"a": "b", "c": ["d", "fail"], "e": {"f": "fail", "g": "h"}}, ignore_errors=True)
+
+        self.assertEqual(result, {"a": "B", "c": ["d", "fail"], "e": {"f": "fail", "g": "H"}})
+
+    def test_must_raise_when_not_ignoring_errors(self):
+        with self.assertRaises(ValueError):
+            self._resolve({"a": ["fail"]})
+
+    def test_must_raise_from_list_without_enclosing_dictionary(self):
+        with self.assertRaises(ValueError):
+            self._resolve(["a", ["fail"]], ignore_errors=True)
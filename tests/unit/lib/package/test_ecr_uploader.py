@@ -194,6 +194,65 @@ class TestECRUploader(TestCase):
         with self.assertRaises(DockerPushFailedError):
             ecr_uploader.upload(image, resource_name="HelloWorldFunction")
 
+    def test_upload_skips_images_in_repository(self):
+        repository = "123456789012.dkr.ecr.us-east-1.amazonaws.com/mock-image-repo"
+        registry = FakeEcrRegistry({"mock-image-repo": {"myimage-0123456789ab-v1"}})
+        self.docker_client.images.get.return_value.id = "sha256:0123456789abcdef"
+        ecr_uploader = ECRUploader(
+            docker_client=self.docker_client,
+            ecr_client=registry,
+            ecr_repo=repository,
+            ecr_repo_multi=None,
+            skip_existing_images=True,
+        )
+        ecr_uploader.login = MagicMock()
+
+        image_uri = ecr_uploader.upload("myimage:v1", resource_name="HelloWorldFunction")
+
+        self.assertEqual(image_uri, f"{repository}:myimage-0123456789ab-v1")
+        ecr_uploader.login.assert_not_called()
+        self.docker_client.api.push.assert_not_called()
+
+    def test_upload_pushes_missing_images(self):
+        repository = "123456789012.dkr.ecr.us-east-1.amazonaws.com/mock-image-repo"
+        registry = FakeEcrRegistry({"mock-image-repo": {"myimage-fedcba987654-v1"}})
+        self.docker_client.images.get.return_value.id = "sha256:0123456789abcdef"
+        self.docker_client.api.push.return_value = iter([{"status": "Pushed"}])
+        ecr_uploader = ECRUploader(
+            docker_client=self.docker_client,
+            ecr_client=registry,
+            ecr_repo=repository,
+            ecr_repo_multi=None,
+            no_progressbar=True,
+            skip_existing_images=True,
+        )
+        ecr_uploader.login = MagicMock()
+
+        image_uri = ecr_uploader.upload("myimage:v1", resource_name="HelloWorldFunction")
+
+        self.assertEqual(image_uri, f"{repository}:myimage-0123456789ab-v1")
+        self.docker_client.api.push.assert_called_once_with(
+            repository=repository, tag="myimage-0123456789ab-v1", auth_config={}, stream=True, decode=True
+        )
+        self.assertEqual(registry.describe_images_call_count, 1)
+
+    def test_upload_does_not_check_repository_by_default(self):
+        self.docker_client.images.get.return_value.id = "sha256:0123456789abcdef"
+        self.docker_client.api.push.return_value = iter([{"status": "Pushed"}])
+        ecr_uploader = ECRUploader(
+            docker_client=self.docker_client,
+            ecr_client=self.ecr_client,
+            ecr_repo="123456789012.dkr.ecr.us-east-1.amazonaws.com/mock-image-repo",
+            ecr_repo_multi=None,
+            no_progressbar=True,
+        )
+        ecr_uploader.login = MagicMock()
+
+        ecr_uploader.upload("myimage:v1", resource_name="HelloWorldFunction")
+
+        self.ecr_client.describe_images.assert_not_called()
+        self.docker_client.api.push.assert_called_once()
+
     @patch("samcli.lib.package.ecr_uploader.click.echo")
     def test_delete_artifact_successful(self, patched_click_echo):
         ecr_uploader = ECRUploader(
@@ -321,3 +380,22 @@ class TestECRUploader(TestCase):
             result = ECRUploader.parse_image_url(image_uri=config["url"])
 
             self.assertEqual(result, config["result"])
+
+
+class FakeEcrRegistry:
+    """Stand-in for an ECR repository which only knows about image tags"""
+
+    def __init__(self, repositories):
+        self.repositories = repositories
+        self.describe_images_call_count = 0
+
+    def describe_images(self, repositoryName, imageIds):
+        self.describe_images_call_count += 1
+        tags = self.repositories.get(repositoryName, set())
+        image_details = [{"imageTags": [image_id["imageTag"]]} for image_id in imageIds if image_id["imageTag"] in tags]
+        if not image_details:
+            raise ClientError(
+                error_response={"Error": {"Code": "ImageNotFoundException", "Message": "Image not found"}},
+                operation_name="DescribeImages",
+            )
+        return {"imageDetails": image_details}
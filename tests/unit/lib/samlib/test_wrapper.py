@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer
+from samcli.lib.samlib.wrapper import SamTranslatorWrapper
+
+
+class TestSamTranslatorWrapperRunPlugins(TestCase):
+    def setUp(self):
+        self.template = {
+            "AWSTemplateFormatVersion": "2010-09-09",
+            "Transform": "AWS::Serverless-2016-10-31",
+            "Globals": {"Function": {"Timeout": 10}},
+            "Resources": {
+                "ServerlessFunction": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {"CodeUri": "src", "Handler": "app.handler", "Runtime": "python3.8"},
+                },
+                "Function": {
+                    "Type": "AWS::Lambda::Function",
+                    "Properties": {
+                        "Code": {"S3Bucket": "bucket", "S3Key": "key"},
+                        "Handler": "app.handler",
+                        "Runtime": "python3.8",
+                    },
+                    "Metadata": {"aws:asset:path": "asset", "aws:asset:property": "Code"},
+                },
+            },
+        }
+
+    def test_template_is_not_mutated(self):
+        original_properties = self.template["Resources"]["ServerlessFunction"]["Properties"]
+
+        result = SamTranslatorWrapper(self.template).run_plugins()
+
+        self.assertNotIn("Globals", result)
+        self.assertEqual(result["Resources"]["ServerlessFunction"]["Properties"]["Timeout"], 10)
+        self.assertIn("Globals", self.template)
+        self.assertEqual(original_properties, {"CodeUri": "src", "Handler": "app.handler", "Runtime": "python3.8"})
+
+    def test_nested_values_of_other_resources_are_shared(self):
+        result = SamTranslatorWrapper(self.template).run_plugins()
+
+        resource = self.template["Resources"]["Function"]
+        resource_copy = result["Resources"]["Function"]
+        self.assertEqual(resource_copy, resource)
+        self.assertIsNot(resource_copy, resource)
+        self.assertIsNot(resource_copy["Properties"], resource["Properties"])
+        self.assertIsNot(resource_copy["Metadata"], resource["Metadata"])
+        self.assertIs(resource_copy["Properties"]["Code"], resource["Properties"]["Code"])
+
+    def test_normalizing_result_does_not_change_template(self):
+        result = SamTranslatorWrapper(self.template).run_plugins()
+
+        ResourceMetadataNormalizer.normalize(result)
+
+        self.assertEqual(result["Resources"]["Function"]["Properties"]["Code"], "asset")
+        self.assertEqual(
+            self.template["Resources"]["Function"]["Properties"]["Code"], {"S3Bucket": "bucket", "S3Key": "key"}
+        )
+        self.assertEqual(
+            self.template["Resources"]["Function"]["Metadata"],
+            {"aws:asset:path": "asset", "aws:asset:property": "Code"},
+        )
+
+    def test_template_property_returns_deep_copy(self):
+        template_copy = SamTranslatorWrapper(self.template).template
+
+        self.assertEqual(template_copy, self.template)
+        self.assertIsNot(
+            template_copy["Resources"]["Function"]["Properties"]["Code"],
+            self.template["Resources"]["Function"]["Properties"]["Code"],
+        )
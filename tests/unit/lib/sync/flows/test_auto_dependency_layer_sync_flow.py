@@ -23,21 +23,21 @@ class TestAutoDependencyLayerParentSyncFlow(TestCase):
 
     @patch("samcli.lib.sync.flows.auto_dependency_layer_sync_flow.super")
     def test_gather_dependencies(self, patched_super):
-        patched_super.return_value.gather_dependencies.return_value = []
+        patched_super.return_value._gather_dependencies_after_update.return_value = []
         with patch.object(self.sync_flow, "_build_graph") as patched_build_graph:
             patched_build_graph.get_function_build_definitions.return_value = [Mock(download_dependencies=True)]
 
-            dependencies = self.sync_flow.gather_dependencies()
+            dependencies = self.sync_flow._gather_dependencies_after_update()
             self.assertEqual(len(dependencies), 1)
             self.assertIsInstance(dependencies[0], AutoDependencyLayerSyncFlow)
 
     @patch("samcli.lib.sync.flows.auto_dependency_layer_sync_flow.super")
     def test_skip_gather_dependencies(self, patched_super):
-        patched_super.return_value.gather_dependencies.return_value = []
+        patched_super.return_value._gather_dependencies_after_update.return_value = []
         with patch.object(self.sync_flow, "_build_graph") as patched_build_graph:
             patched_build_graph.get_function_build_definitions.return_value = [Mock(download_dependencies=False)]
 
-            dependencies = self.sync_flow.gather_dependencies()
+            dependencies = self.sync_flow._gather_dependencies_after_update()
             self.assertEqual(dependencies, [])
 
     def test_combine_dependencies(self):
@@ -2,8 +2,14 @@ from samcli.lib.providers.provider import ResourceIdentifier
 from unittest import TestCase
 from unittest.mock import ANY, MagicMock, call, patch
 
+from samcli.lib.sync.exceptions import FunctionUpdateFailedError, SyncFlowRetryRequired
 from samcli.lib.sync.sync_flow import SyncFlow, ResourceAPICall
-from samcli.lib.sync.flows.function_sync_flow import FunctionSyncFlow
+from samcli.lib.sync.flows.function_sync_flow import (
+    FUNCTION_UPDATE_INITIAL_POLL_INTERVAL,
+    FUNCTION_UPDATE_MAX_POLL_INTERVAL,
+    FunctionSyncFlow,
+    FunctionUpdateWaitSyncFlow,
+)
 from samcli.lib.utils.lock_distributor import LockChain
 
 
@@ -29,23 +35,131 @@ class TestFunctionSyncFlow(TestCase):
         sync_flow = self.create_function_sync_flow()
         sync_flow.set_up()
         client_provider_mock.return_value.assert_called_once_with("lambda")
-        sync_flow._lambda_client.get_waiter.assert_called_once_with("function_updated")
+
+    @patch("samcli.lib.sync.flows.function_sync_flow.FunctionUpdateWaitSyncFlow")
+    @patch.multiple(FunctionSyncFlow, __abstractmethods__=set())
+    def test_gather_dependencies(self, wait_sync_flow_mock):
+        sync_flow = self.create_function_sync_flow()
+        result = sync_flow.gather_dependencies()
+
+        wait_sync_flow_mock.assert_called_once_with(
+            "Function1",
+            sync_flow._build_context,
+            sync_flow._deploy_context,
+            sync_flow._physical_id_mapping,
+            sync_flow._stacks,
+            sync_flow._gather_dependencies_after_update,
+        )
+        self.assertEqual(result, [wait_sync_flow_mock.return_value])
 
     @patch("samcli.lib.sync.flows.function_sync_flow.AliasVersionSyncFlow")
-    @patch("samcli.lib.sync.sync_flow.Session")
     @patch.multiple(FunctionSyncFlow, __abstractmethods__=set())
-    def test_gather_dependencies(self, session_mock, alias_version_mock):
+    def test_gather_dependencies_after_update(self, alias_version_mock):
         sync_flow = self.create_function_sync_flow()
-        sync_flow.get_physical_id = lambda x: "PhysicalFunction1"
         sync_flow._get_resource = lambda x: MagicMock()
 
-        sync_flow.set_up()
-        result = sync_flow.gather_dependencies()
+        result = sync_flow._gather_dependencies_after_update()
 
-        sync_flow._lambda_waiter.wait.assert_called_once_with(FunctionName="PhysicalFunction1", WaiterConfig=ANY)
         self.assertEqual(result, [alias_version_mock.return_value])
 
+    @patch("samcli.lib.sync.flows.function_sync_flow.AliasVersionSyncFlow")
+    @patch.multiple(FunctionSyncFlow, __abstractmethods__=set())
+    def test_gather_dependencies_after_update_without_alias(self, alias_version_mock):
+        sync_flow = self.create_function_sync_flow()
+        sync_flow._get_resource = lambda x: {"Properties": {}}
+
+        result = sync_flow._gather_dependencies_after_update()
+
+        self.assertEqual(result, [])
+        alias_version_mock.assert_not_called()
+
     @patch.multiple(FunctionSyncFlow, __abstractmethods__=set())
     def test_equality_keys(self):
         sync_flow = self.create_function_sync_flow()
         self.assertEqual(sync_flow._equality_keys(), "Function1")
+
+
+class TestFunctionUpdateWaitSyncFlow(TestCase):
+    def setUp(self):
+        self.dependencies_after_update = MagicMock()
+        self.sync_flow = FunctionUpdateWaitSyncFlow(
+            "Function1",
+            build_context=MagicMock(),
+            deploy_context=MagicMock(),
+            physical_id_mapping={"Function1": "PhysicalFunction1"},
+            stacks=[MagicMock()],
+            dependencies_after_update=self.dependencies_after_update,
+        )
+        self.sync_flow._lambda_client = MagicMock()
+
+    def _set_update_status(self, status, reason=None):
+        self.sync_flow._lambda_client.get_function_configuration.return_value = {
+            "LastUpdateStatus": status,
+            "LastUpdateStatusReason": reason,
+        }
+
+    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
+    @patch("samcli.lib.sync.sync_flow.Session")
+    def test_sets_up_client_once(self, session_mock, client_provider_mock):
+        self.sync_flow._lambda_client = None
+        self.sync_flow.set_up()
+        self.sync_flow.set_up()
+        client_provider_mock.return_value.assert_called_once_with("lambda")
+
+    def test_sync_successful(self):
+        self._set_update_status("Successful")
+        self.sync_flow.sync()
+        self.sync_flow._lambda_client.get_function_configuration.assert_called_once_with(
+            FunctionName="PhysicalFunction1"
+        )
+
+    def test_sync_in_progress_backs_off(self):
+        self._set_update_status("InProgress")
+        wait_times = []
+        for _ in range(6):
+            with self.assertRaises(SyncFlowRetryRequired) as context:
+                self.sync_flow.sync()
+            wait_times.append(context.exception.wait_time)
+
+        self.assertEqual(wait_times[0], FUNCTION_UPDATE_INITIAL_POLL_INTERVAL)
+        self.assertEqual(wait_times[1], FUNCTION_UPDATE_INITIAL_POLL_INTERVAL * 2)
+        self.assertEqual(wait_times[-1], FUNCTION_UPDATE_MAX_POLL_INTERVAL)
+        self.assertEqual(wait_times, sorted(wait_times))
+
+    @patch("samcli.lib.sync.flows.function_sync_flow.time.time")
+    def test_sync_in_progress_times_out(self, time_mock):
+        self._set_update_status("InProgress")
+        time_mock.return_value = 1000
+        with self.assertRaises(SyncFlowRetryRequired):
+            self.sync_flow.sync()
+
+        time_mock.return_value = 2000
+        with self.assertRaises(FunctionUpdateFailedError):
+            self.sync_flow.sync()
+
+    def test_sync_failed(self):
+        self._set_update_status("Failed", "Reason")
+        with self.assertRaises(FunctionUpdateFailedError) as context:
+            self.sync_flow.sync()
+        self.assertEqual(context.exception.reason, "Reason")
+
+    def test_compare_remote(self):
+        self.assertFalse(self.sync_flow.compare_remote())
+
+    def test_is_internal(self):
+        self.assertTrue(self.sync_flow.is_internal)
+
+    def test_gather_dependencies(self):
+        resource_cache = MagicMock()
+        self.sync_flow.set_resource_cache(resource_cache)
+
+        result = self.sync_flow.gather_dependencies()
+
+        resource_cache.invalidate_function.assert_called_once_with("PhysicalFunction1")
+        self.assertEqual(result, self.dependencies_after_update.return_value)
+
+    def test_get_resource_api_calls(self):
+        self.assertEqual(self.sync_flow._get_resource_api_calls(), [])
+
+    def test_equality_keys(self):
+        self.assertEqual(self.sync_flow._equality_keys(), "Function1")
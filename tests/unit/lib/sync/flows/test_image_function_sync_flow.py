@@ -55,7 +55,9 @@ class TestImageFunctionSyncFlow(TestCase):
         sync_flow.sync()
 
         uploader_mock.return_value.upload.assert_called_once_with("ImageName1", "Function1")
-        uploader_mock.assert_called_once_with(sync_flow._docker_client, sync_flow._ecr_client, "repo_uri", None)
+        uploader_mock.assert_called_once_with(
+            sync_flow._docker_client, sync_flow._ecr_client, "repo_uri", None, skip_existing_images=True
+        )
         sync_flow._lambda_client.update_function_code.assert_called_once_with(
             FunctionName="PhysicalFunction1", ImageUri="image_uri"
         )
@@ -77,7 +79,9 @@ class TestImageFunctionSyncFlow(TestCase):
         sync_flow.sync()
 
         uploader_mock.return_value.upload.assert_called_once_with("ImageName1", "Function1")
-        uploader_mock.assert_called_once_with(sync_flow._docker_client, sync_flow._ecr_client, "repo_uri", None)
+        uploader_mock.assert_called_once_with(
+            sync_flow._docker_client, sync_flow._ecr_client, "repo_uri", None, skip_existing_images=True
+        )
         sync_flow._lambda_client.update_function_code.assert_called_once_with(
             FunctionName="PhysicalFunction1", ImageUri="image_uri"
         )
@@ -103,7 +107,9 @@ class TestImageFunctionSyncFlow(TestCase):
         sync_flow.sync()
 
         uploader_mock.return_value.upload.assert_called_once_with("ImageName1", "Function1")
-        uploader_mock.assert_called_once_with(sync_flow._docker_client, sync_flow._ecr_client, "repo_uri", None)
+        uploader_mock.assert_called_once_with(
+            sync_flow._docker_client, sync_flow._ecr_client, "repo_uri", None, skip_existing_images=True
+        )
         sync_flow._lambda_client.update_function_code.assert_called_once_with(
             FunctionName="PhysicalFunction1", ImageUri="image_uri"
         )
@@ -116,9 +122,44 @@ class TestImageFunctionSyncFlow(TestCase):
         sync_flow.sync()
         uploader_mock.return_value.upload.assert_not_called()
 
-    def test_compare_remote(self):
+    def test_compare_remote_with_no_image(self):
+        sync_flow = self.create_function_sync_flow()
+        self.assertFalse(sync_flow.compare_remote())
+
+    @patch("samcli.lib.sync.sync_flow.Session")
+    def test_compare_remote_same_image(self, session_mock):
         sync_flow = self.create_function_sync_flow()
+        sync_flow._image_name = "imagename1:latest"
+        sync_flow._docker_client.images.get.return_value.id = "sha256:0123456789abcdef"
+        sync_flow._deploy_context.image_repository = "repo_uri"
+        sync_flow.get_physical_id = MagicMock(return_value="PhysicalFunction1")
+
+        sync_flow.set_up()
+        sync_flow._lambda_client.get_function.return_value = {
+            "Code": {"ImageUri": "repo_uri:imagename1-0123456789ab-latest"}
+        }
+
+        self.assertTrue(sync_flow.compare_remote())
+        sync_flow._docker_client.images.get.assert_called_once_with("imagename1:latest")
+        sync_flow._lambda_client.get_function.assert_called_once_with(FunctionName="PhysicalFunction1")
+
+    @patch("samcli.lib.sync.sync_flow.Session")
+    def test_compare_remote_different_image(self, session_mock):
+        sync_flow = self.create_function_sync_flow()
+        sync_flow._image_name = "imagename1:latest"
+        sync_flow._docker_client.images.get.return_value.id = "sha256:0123456789abcdef"
+        sync_flow._deploy_context.image_repository = ""
+        sync_flow._deploy_context.image_repositories = {}
+        sync_flow.get_physical_id = MagicMock(return_value="PhysicalFunction1")
+
+        sync_flow.set_up()
+        sync_flow._lambda_client.get_function.return_value = {
+            "Code": {"ImageUri": "repo_uri:imagename1-fedcba987654-latest"}
+        }
+
         self.assertFalse(sync_flow.compare_remote())
+        # remote function is only fetched once for both repository and image URI
+        sync_flow._lambda_client.get_function.assert_called_once_with(FunctionName="PhysicalFunction1")
 
     def test_get_resource_api_calls(self):
         sync_flow = self.create_function_sync_flow()
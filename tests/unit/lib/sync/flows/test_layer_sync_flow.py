@@ -6,7 +6,8 @@ from unittest.mock import MagicMock, Mock, patch, call, ANY, mock_open, Property
 from parameterized import parameterized
 
 from samcli.lib.sync.exceptions import MissingPhysicalResourceError, NoLayerVersionsFoundError
-from samcli.lib.sync.flows.layer_sync_flow import LayerSyncFlow, FunctionLayerReferenceSync
+from samcli.lib.sync.flows.layer_sync_flow import AbstractLayerSyncFlow, LayerSyncFlow, FunctionLayerReferenceSync
+from samcli.lib.sync.layer_content_hash_store import LayerContentHashRecord
 from samcli.lib.sync.sync_flow import SyncFlow
 
 
@@ -31,7 +32,8 @@ class TestLayerSyncFlow(TestCase):
                 self.layer_sync_flow.set_up()
 
                 patched_super_setup.assert_called_once()
-                client_provider_mock.return_value.assert_called_with("lambda")
+                client_provider_mock.return_value.assert_any_call("lambda")
+                client_provider_mock.return_value.assert_any_call("s3")
 
     @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
     @patch("samcli.lib.sync.flows.layer_sync_flow.get_resource_by_id")
@@ -44,7 +46,8 @@ class TestLayerSyncFlow(TestCase):
                 self.layer_sync_flow.set_up()
 
                 patched_super_setup.assert_called_once()
-                client_provider_mock.return_value.assert_called_with("lambda")
+                client_provider_mock.return_value.assert_any_call("lambda")
+                client_provider_mock.return_value.assert_any_call("s3")
 
         self.assertEqual(self.layer_sync_flow._layer_arn, "layer_version_arn")
 
@@ -56,14 +59,24 @@ class TestLayerSyncFlow(TestCase):
                 with self.assertRaises(MissingPhysicalResourceError):
                     self.layer_sync_flow.set_up()
 
+    @patch("samcli.lib.sync.flows.layer_sync_flow.LayerContentHashStore")
+    @patch("samcli.lib.sync.flows.layer_sync_flow.dir_checksum")
     @patch("samcli.lib.sync.flows.layer_sync_flow.ApplicationBuilder")
     @patch("samcli.lib.sync.flows.layer_sync_flow.tempfile")
     @patch("samcli.lib.sync.flows.layer_sync_flow.make_zip")
     @patch("samcli.lib.sync.flows.layer_sync_flow.file_checksum")
     @patch("samcli.lib.sync.flows.layer_sync_flow.os")
     def test_setup_gather_resources(
-        self, patched_os, patched_file_checksum, patched_make_zip, patched_tempfile, patched_app_builder
+        self,
+        patched_os,
+        patched_file_checksum,
+        patched_make_zip,
+        patched_tempfile,
+        patched_app_builder,
+        patched_dir_checksum,
+        patched_content_hash_store,
     ):
+        patched_content_hash_store.return_value.get.return_value = None
         given_collect_build_resources = Mock()
         self.build_context_mock.collect_build_resources.return_value = given_collect_build_resources
 
@@ -130,6 +143,41 @@ class TestLayerSyncFlow(TestCase):
 
             self.assertTrue(compare_result)
 
+    def test_compare_remote_with_resource_cache(self):
+        given_lambda_client = Mock()
+        self.layer_sync_flow._lambda_client = given_lambda_client
+        self.layer_sync_flow._layer_arn = "LayerArn"
+
+        given_sha256 = base64.b64encode(b"checksum")
+        resource_cache = Mock()
+        resource_cache.get_latest_layer_version.return_value = 3
+        resource_cache.get_layer_version.return_value = {"Content": {"CodeSha256": given_sha256}}
+        self.layer_sync_flow.set_resource_cache(resource_cache)
+
+        self.layer_sync_flow._local_sha = base64.b64decode(given_sha256).hex()
+
+        self.assertTrue(self.layer_sync_flow.compare_remote())
+
+        resource_cache.get_latest_layer_version.assert_called_once_with(given_lambda_client, "LayerArn")
+        resource_cache.get_layer_version.assert_called_once_with(given_lambda_client, "LayerArn", 3)
+        given_lambda_client.list_layer_versions.assert_not_called()
+        given_lambda_client.get_layer_version.assert_not_called()
+
+    def test_sync_updates_resource_cache(self):
+        resource_cache = Mock()
+        self.layer_sync_flow.set_resource_cache(resource_cache)
+        self.layer_sync_flow._layer_arn = "LayerArn"
+        self.layer_sync_flow._old_layer_version = 3
+
+        with patch.object(self.layer_sync_flow, "_publish_new_layer_version") as patched_publish_new_layer_version:
+            with patch.object(self.layer_sync_flow, "_delete_old_layer_version"):
+                patched_publish_new_layer_version.return_value = 4
+
+                self.layer_sync_flow.sync()
+
+        resource_cache.invalidate_layer_version.assert_called_once_with("LayerArn", 3)
+        resource_cache.set_latest_layer_version.assert_called_once_with("LayerArn", 4)
+
     def test_sync(self):
         with patch.object(self.layer_sync_flow, "_publish_new_layer_version") as patched_publish_new_layer_version:
             with patch.object(self.layer_sync_flow, "_delete_old_layer_version") as patched_delete_old_layer_version:
@@ -142,7 +190,9 @@ class TestLayerSyncFlow(TestCase):
                 patched_publish_new_layer_version.assert_called_once()
                 patched_delete_old_layer_version.assert_called_once()
 
-    def test_publish_new_layer_version(self):
+    @patch("samcli.lib.sync.flows.layer_sync_flow.os.path.getsize")
+    def test_publish_new_layer_version(self, patched_getsize):
+        patched_getsize.return_value = 49 * 1024 * 1024
         given_layer_name = Mock()
 
         given_lambda_client = Mock()
@@ -172,6 +222,87 @@ class TestLayerSyncFlow(TestCase):
 
                 self.assertEqual(result_version, given_publish_layer_result.get("Version"))
 
+    @patch("samcli.lib.sync.flows.layer_sync_flow.os.path.getsize")
+    @patch("samcli.lib.sync.flows.layer_sync_flow.S3Uploader")
+    def test_publish_new_layer_version_through_s3(self, patched_s3_uploader, patched_getsize):
+        patched_getsize.return_value = 51 * 1024 * 1024
+        patched_s3_uploader.return_value.upload_with_dedup.return_value = "s3://bucket/prefix/zip_file"
+
+        given_lambda_client = Mock()
+        given_lambda_client.publish_layer_version.return_value = {"Version": 24}
+        self.layer_sync_flow._lambda_client = given_lambda_client
+        self.layer_sync_flow._s3_client = Mock()
+        self.layer_sync_flow._zip_file = "zip_file"
+        self.layer_sync_flow._layer_arn = "LayerArn"
+
+        with patch.object(self.layer_sync_flow, "_get_compatible_runtimes") as patched_get_compatible_runtimes:
+            patched_get_compatible_runtimes.return_value = ["python3.9"]
+            result_version = self.layer_sync_flow._publish_new_layer_version()
+
+        patched_s3_uploader.return_value.upload_with_dedup.assert_called_once_with("zip_file")
+        given_lambda_client.publish_layer_version.assert_called_once_with(
+            LayerName="LayerArn",
+            Content={"S3Bucket": self.deploy_context_mock.s3_bucket, "S3Key": "prefix/zip_file"},
+            CompatibleRuntimes=["python3.9"],
+        )
+        self.assertEqual(result_version, 24)
+
+    @patch("samcli.lib.sync.flows.layer_sync_flow.LayerContentHashStore")
+    @patch("samcli.lib.sync.flows.layer_sync_flow.dir_checksum")
+    @patch("samcli.lib.sync.flows.layer_sync_flow.ApplicationBuilder")
+    @patch("samcli.lib.sync.flows.layer_sync_flow.make_zip")
+    def test_gather_resources_skips_zip_for_unchanged_content(
+        self, patched_make_zip, patched_app_builder, patched_dir_checksum, patched_content_hash_store
+    ):
+        patched_dir_checksum.return_value = "content_hash"
+        patched_content_hash_store.return_value.get.return_value = LayerContentHashRecord("content_hash", "code_sha")
+        self.layer_sync_flow._layer_arn = "LayerArn"
+        self.layer_sync_flow._get_lock_chain = MagicMock()
+
+        self.layer_sync_flow.gather_resources()
+
+        patched_content_hash_store.assert_called_once_with(self.build_context_mock.build_dir)
+        patched_content_hash_store.return_value.get.assert_called_once_with("LayerArn")
+        patched_make_zip.assert_not_called()
+        self.assertIsNone(self.layer_sync_flow._zip_file)
+        self.assertEqual(self.layer_sync_flow._local_sha, "code_sha")
+
+    def test_compare_remote_creates_zip_for_stale_content_hash(self):
+        self.layer_sync_flow._content_hash = "content_hash"
+        self.layer_sync_flow._local_sha = "stale_sha"
+        self.layer_sync_flow._content_hash_store = Mock()
+        self.layer_sync_flow._layer_arn = "LayerArn"
+
+        def create_zip_file():
+            self.layer_sync_flow._zip_file = "zip_file"
+            self.layer_sync_flow._local_sha = "new_sha"
+
+        with patch.object(AbstractLayerSyncFlow, "compare_remote") as patched_super_compare_remote:
+            with patch.object(self.layer_sync_flow, "_create_zip_file") as patched_create_zip_file:
+                patched_super_compare_remote.side_effect = [False, True]
+                patched_create_zip_file.side_effect = create_zip_file
+
+                self.assertTrue(self.layer_sync_flow.compare_remote())
+
+                patched_create_zip_file.assert_called_once()
+        self.layer_sync_flow._content_hash_store.put.assert_called_once_with(
+            "LayerArn", LayerContentHashRecord("content_hash", "new_sha")
+        )
+
+    def test_sync_records_content_hash(self):
+        self.layer_sync_flow._content_hash = "content_hash"
+        self.layer_sync_flow._local_sha = "local_sha"
+        self.layer_sync_flow._content_hash_store = Mock()
+        self.layer_sync_flow._layer_arn = "LayerArn"
+
+        with patch.object(self.layer_sync_flow, "_publish_new_layer_version"):
+            with patch.object(self.layer_sync_flow, "_delete_old_layer_version"):
+                self.layer_sync_flow.sync()
+
+        self.layer_sync_flow._content_hash_store.put.assert_called_once_with(
+            "LayerArn", LayerContentHashRecord("content_hash", "local_sha")
+        )
+
     def test_delete_old_layer_version(self):
         given_layer_name = Mock()
         given_layer_version = Mock()
@@ -101,6 +101,28 @@ class TestZipFunctionSyncFlow(TestCase):
         b64decode_mock.assert_called_once_with("sha256_value_b64")
         self.assertFalse(result)
 
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.base64.b64decode")
+    @patch("samcli.lib.sync.sync_flow.Session")
+    def test_compare_remote_with_resource_cache(self, session_mock, b64decode_mock):
+        b64decode_mock.return_value.hex.return_value = "sha256_value"
+        sync_flow = self.create_function_sync_flow()
+        sync_flow._local_sha = "sha256_value"
+        resource_cache = MagicMock()
+        resource_cache.get_function_configuration.return_value = {"CodeSha256": "sha256_value_b64"}
+        sync_flow.set_resource_cache(resource_cache)
+
+        sync_flow.get_physical_id = MagicMock()
+        sync_flow.get_physical_id.return_value = "PhysicalFunction1"
+
+        sync_flow.set_up()
+
+        result = sync_flow.compare_remote()
+
+        resource_cache.get_function_configuration.assert_called_once_with(sync_flow._lambda_client, "PhysicalFunction1")
+        sync_flow._lambda_client.get_function.assert_not_called()
+        b64decode_mock.assert_called_once_with("sha256_value_b64")
+        self.assertTrue(result)
+
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.open", mock_open(read_data=b"zip_content"), create=True)
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.os.remove")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.os.path.exists")
@@ -142,3 +142,13 @@ class TestContinuousSyncFlowExecutor(TestCase):
 
         exception_handler_mock.assert_called_once_with(sync_flow_exception)
         self.assertEqual(len(sleep_mock.mock_calls), 10)
+
+    @patch("samcli.lib.sync.sync_flow_executor.time.sleep")
+    def test_execute_exports_timeline_while_idle(self, sleep_mock):
+        self.executor._timeline = MagicMock()
+        # Executor keeps running until it is stopped, the timeline must be exported before that
+        sleep_mock.side_effect = lambda _: self.executor.stop()
+
+        self.executor.execute()
+
+        self.assertEqual(self.executor._timeline.export.call_count, 2)
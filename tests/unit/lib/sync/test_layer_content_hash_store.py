@@ -0,0 +1,55 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from samcli.lib.build.build_strategy import clean_redundant_folders
+from samcli.lib.sync.layer_content_hash_store import (
+    LAYER_CONTENT_HASHES_FILE_NAME,
+    LayerContentHashRecord,
+    LayerContentHashStore,
+)
+
+
+class TestLayerContentHashStore(TestCase):
+    def test_put_and_get(self):
+        with TemporaryDirectory() as aws_sam_dir:
+            store = LayerContentHashStore(os.path.join(aws_sam_dir, "build"))
+            store.put("Layer1Arn", LayerContentHashRecord("content_hash1", "code_sha1"))
+            store.put("Layer2Arn", LayerContentHashRecord("content_hash2", "code_sha2"))
+
+            self.assertTrue(os.path.isfile(os.path.join(aws_sam_dir, LAYER_CONTENT_HASHES_FILE_NAME)))
+            other_store = LayerContentHashStore(os.path.join(aws_sam_dir, "build"))
+            self.assertEqual(other_store.get("Layer1Arn"), LayerContentHashRecord("content_hash1", "code_sha1"))
+            self.assertEqual(other_store.get("Layer2Arn"), LayerContentHashRecord("content_hash2", "code_sha2"))
+            self.assertIsNone(other_store.get("Layer3Arn"))
+
+    def test_get_without_file(self):
+        with TemporaryDirectory() as aws_sam_dir:
+            self.assertIsNone(LayerContentHashStore(os.path.join(aws_sam_dir, "build")).get("Layer1Arn"))
+
+    def test_get_with_corrupted_file(self):
+        with TemporaryDirectory() as aws_sam_dir:
+            with open(os.path.join(aws_sam_dir, LAYER_CONTENT_HASHES_FILE_NAME), "w") as hashes_file:
+                hashes_file.write("{not json")
+
+            store = LayerContentHashStore(os.path.join(aws_sam_dir, "build"))
+            self.assertIsNone(store.get("Layer1Arn"))
+
+            store.put("Layer1Arn", LayerContentHashRecord("content_hash1", "code_sha1"))
+            self.assertEqual(store.get("Layer1Arn"), LayerContentHashRecord("content_hash1", "code_sha1"))
+
+    def test_store_is_kept_when_build_cache_is_cleaned(self):
+        with TemporaryDirectory() as aws_sam_dir:
+            cache_dir = os.path.join(aws_sam_dir, "cache")
+            os.makedirs(os.path.join(cache_dir, "uuid1"))
+            os.makedirs(os.path.join(cache_dir, "uuid2"))
+            store = LayerContentHashStore(os.path.join(aws_sam_dir, "build"))
+            store.put("Layer1Arn", LayerContentHashRecord("content_hash1", "code_sha1"))
+
+            clean_redundant_folders(cache_dir, {"uuid1"})
+
+            self.assertEqual(os.listdir(cache_dir), ["uuid1"])
+            self.assertEqual(
+                LayerContentHashStore(os.path.join(aws_sam_dir, "build")).get("Layer1Arn"),
+                LayerContentHashRecord("content_hash1", "code_sha1"),
+            )
@@ -0,0 +1,107 @@
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from samcli.lib.sync.resource_cache import SyncResourceCache
+
+
+class TestSyncResourceCache(TestCase):
+    def setUp(self):
+        self.lambda_client = MagicMock()
+        self.lambda_client.get_paginator.return_value.paginate.return_value = [
+            {"Functions": [{"FunctionName": "Function1", "CodeSha256": "sha1"}]},
+            {"Functions": [{"FunctionName": "Function2", "CodeSha256": "sha2"}]},
+        ]
+        self.cache = SyncResourceCache()
+
+    def test_function_configurations_are_bulk_loaded_once(self):
+        self.assertEqual(self.cache.get_function_configuration(self.lambda_client, "Function1")["CodeSha256"], "sha1")
+        self.assertEqual(self.cache.get_function_configuration(self.lambda_client, "Function2")["CodeSha256"], "sha2")
+
+        self.lambda_client.get_paginator.assert_called_once_with("list_functions")
+        self.lambda_client.get_function_configuration.assert_not_called()
+
+    def test_invalidated_function_is_loaded_individually(self):
+        self.lambda_client.get_function_configuration.return_value = {"FunctionName": "Function1", "CodeSha256": "new"}
+        self.cache.get_function_configuration(self.lambda_client, "Function1")
+
+        self.cache.invalidate_function("Function1")
+        result = self.cache.get_function_configuration(self.lambda_client, "Function1")
+
+        self.assertEqual(result["CodeSha256"], "new")
+        self.lambda_client.get_paginator.assert_called_once_with("list_functions")
+        self.lambda_client.get_function_configuration.assert_called_once_with(FunctionName="Function1")
+
+    @patch("samcli.lib.sync.resource_cache.time.time")
+    def test_expired_entries_are_reloaded(self, time_mock):
+        cache = SyncResourceCache(ttl=10)
+        time_mock.return_value = 100
+        cache.get_function_configuration(self.lambda_client, "Function1")
+        time_mock.return_value = 111
+        cache.get_function_configuration(self.lambda_client, "Function1")
+
+        self.assertEqual(self.lambda_client.get_paginator.call_count, 2)
+
+    def test_latest_layer_version_from_list_layers(self):
+        self.lambda_client.get_paginator.return_value.paginate.return_value = [
+            {"Layers": [{"LayerArn": "Layer1Arn", "LatestMatchingVersion": {"Version": 3}}]}
+        ]
+
+        self.assertEqual(self.cache.get_latest_layer_version(self.lambda_client, "Layer1Arn"), 3)
+        self.cache.set_latest_layer_version("Layer1Arn", 4)
+        self.assertEqual(self.cache.get_latest_layer_version(self.lambda_client, "Layer1Arn"), 4)
+
+        self.lambda_client.get_paginator.assert_called_once_with("list_layers")
+        self.lambda_client.list_layer_versions.assert_not_called()
+
+    def test_latest_layer_version_missing_from_bulk_result(self):
+        self.lambda_client.get_paginator.return_value.paginate.return_value = [{"Layers": []}]
+        self.lambda_client.list_layer_versions.return_value = {"LayerVersions": []}
+
+        self.assertIsNone(self.cache.get_latest_layer_version(self.lambda_client, "Layer1Arn"))
+        self.lambda_client.list_layer_versions.assert_called_once_with(LayerName="Layer1Arn")
+
+    def test_layer_version_cached_until_invalidated(self):
+        self.lambda_client.get_layer_version.return_value = {"Content": {"CodeSha256": "sha"}}
+
+        self.cache.get_layer_version(self.lambda_client, "Layer1Arn", 1)
+        self.cache.get_layer_version(self.lambda_client, "Layer1Arn", 1)
+        self.lambda_client.get_layer_version.assert_called_once_with(LayerName="Layer1Arn", VersionNumber=1)
+
+        self.cache.invalidate_layer_version("Layer1Arn", 1)
+        self.cache.get_layer_version(self.lambda_client, "Layer1Arn", 1)
+        self.assertEqual(self.lambda_client.get_layer_version.call_count, 2)
+
+    def test_invalidate_clears_bulk_results(self):
+        self.cache.get_function_configuration(self.lambda_client, "Function1")
+        self.cache.invalidate()
+        self.cache.get_function_configuration(self.lambda_client, "Function1")
+
+        self.assertEqual(self.lambda_client.get_paginator.call_count, 2)
+
+    def test_bulk_load_does_not_hold_lock(self):
+        def paginate():
+            # Lookups of other threads must not be blocked while the bulk load is running
+            lookup_thread = Thread(target=self.cache.get_layer_version, args=(self.lambda_client, "Layer1Arn", 1))
+            lookup_thread.start()
+            lookup_thread.join(timeout=5)
+            self.assertFalse(lookup_thread.is_alive())
+            return [{"Functions": [{"FunctionName": "Function1", "CodeSha256": "sha1"}]}]
+
+        self.lambda_client.get_paginator.return_value.paginate.side_effect = paginate
+
+        self.assertEqual(self.cache.get_function_configuration(self.lambda_client, "Function1")["CodeSha256"], "sha1")
+        self.lambda_client.get_layer_version.assert_called_once_with(LayerName="Layer1Arn", VersionNumber=1)
+
+    def test_result_loaded_before_invalidation_is_not_cached(self):
+        def paginate():
+            self.cache.invalidate_function("Function1")
+            return [{"Functions": [{"FunctionName": "Function1", "CodeSha256": "old_sha"}]}]
+
+        self.lambda_client.get_paginator.return_value.paginate.side_effect = paginate
+        self.lambda_client.get_function_configuration.return_value = {"FunctionName": "Function1", "CodeSha256": "sha"}
+
+        self.cache.get_function_configuration(self.lambda_client, "Function1")
+
+        self.assertEqual(self.cache.get_function_configuration(self.lambda_client, "Function1")["CodeSha256"], "sha")
+        self.lambda_client.get_function_configuration.assert_called_once_with(FunctionName="Function1")
@@ -3,6 +3,7 @@ from unittest import TestCase
 from unittest.mock import MagicMock, call, patch, Mock
 
 from samcli.lib.sync.sync_flow import SyncFlow, ResourceAPICall
+from samcli.lib.sync.sync_timeline import SyncTimeline
 from samcli.lib.utils.lock_distributor import LockChain
 
 
@@ -50,6 +51,38 @@ class TestSyncFlow(TestCase):
         sync_flow.gather_dependencies.assert_not_called()
         self.assertEqual(result, [])
 
+    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch.multiple(SyncFlow, __abstractmethods__=set())
+    def test_execute_records_phases_to_timeline(self, session_mock):
+        sync_flow = self.create_sync_flow()
+        sync_flow.compare_remote.return_value = False
+        sync_flow.gather_dependencies.return_value = []
+        timeline = SyncTimeline()
+        sync_flow.set_timeline(timeline)
+
+        sync_flow.execute()
+
+        self.assertEqual(
+            [record.phase for record in timeline.get_flow_records("log-name")],
+            ["set_up", "gather_resources", "compare_remote", "sync", "gather_dependencies", "execute"],
+        )
+
+    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch.multiple(SyncFlow, __abstractmethods__=set())
+    def test_execute_records_failed_phase_to_timeline(self, session_mock):
+        sync_flow = self.create_sync_flow()
+        sync_flow.gather_resources.side_effect = Exception()
+        timeline = SyncTimeline()
+        sync_flow.set_timeline(timeline)
+
+        with self.assertRaises(Exception):
+            sync_flow.execute()
+
+        self.assertEqual(
+            [record.phase for record in timeline.get_flow_records("log-name")],
+            ["set_up", "gather_resources", "execute"],
+        )
+
     @patch("samcli.lib.sync.sync_flow.Session")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_set_up(self, session_mock):
@@ -108,6 +141,10 @@ class TestSyncFlow(TestCase):
         sync_flow._log_name = "A"
         self.assertEqual(sync_flow.log_prefix, "SyncFlow [A]: ")
 
+    @patch.multiple(SyncFlow, __abstractmethods__=set())
+    def test_is_not_internal(self):
+        self.assertFalse(self.create_sync_flow().is_internal)
+
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_eq_true(self):
         sync_flow_1 = self.create_sync_flow()
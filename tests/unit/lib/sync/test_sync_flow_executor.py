@@ -10,11 +10,15 @@ from samcli.lib.sync.exceptions import (
     SyncFlowException,
     MissingFunctionBuildDefinition,
     InvalidRuntimeDefinitionForFunction,
+    SyncFlowRetryRequired,
 )
 from unittest import TestCase
 from unittest.mock import ANY, MagicMock, call, patch
 
+from parameterized import parameterized
+
 from samcli.lib.sync.sync_flow_executor import (
+    DelayedSyncFlowTask,
     SyncFlowExecutor,
     SyncFlowResult,
     SyncFlowTask,
@@ -180,6 +184,7 @@ class TestSyncFlowExecutor(TestCase):
         self.executor._add_sync_flow_task(task)
 
         sync_flow.set_locks_with_distributor.assert_called_once_with(self.executor._lock_distributor)
+        sync_flow.set_timeline.assert_called_once_with(self.executor.timeline)
 
         queue_task = self.executor._flow_queue.get()
         self.assertEqual(sync_flow, queue_task.sync_flow)
@@ -199,6 +204,58 @@ class TestSyncFlowExecutor(TestCase):
         self.assertEqual(sync_flow, queue_task.sync_flow)
         self.assertTrue(self.executor._flow_queue.empty())
 
+    @patch("samcli.lib.sync.sync_flow_executor.time.time")
+    def test_submit_delayed_sync_flow_task(self, time_mock):
+        executor = MagicMock()
+        sync_flow = MagicMock()
+        task = DelayedSyncFlowTask(sync_flow, False, 1000, 2)
+
+        time_mock.return_value = 1001
+        self.assertIsNone(self.executor._submit_sync_flow_task(executor, task))
+        executor.submit.assert_not_called()
+
+        time_mock.return_value = 1002
+        sync_flow_future = self.executor._submit_sync_flow_task(executor, task)
+        self.assertEqual(sync_flow_future.sync_flow, sync_flow)
+        executor.submit.assert_called_once_with(SyncFlowExecutor._sync_flow_execute_wrapper, sync_flow)
+
+    @patch("samcli.lib.sync.sync_flow_executor.time.time")
+    def test_handle_result_retry_required(self, time_mock):
+        time_mock.return_value = 1000
+        sync_flow = MagicMock()
+        future = MagicMock()
+        future.done.return_value = True
+        future.exception.return_value = SyncFlowException(sync_flow, SyncFlowRetryRequired(0.5))
+        exception_handler = MagicMock()
+        self.executor._add_sync_flow_task = MagicMock()
+        self.executor.add_sync_flow = MagicMock()
+
+        sync_flow_future = MagicMock(sync_flow=sync_flow, future=future, submit_time=1000)
+        self.assertTrue(self.executor._handle_result(sync_flow_future, exception_handler))
+
+        self.executor._add_sync_flow_task.assert_called_once_with(
+            DelayedSyncFlowTask(sync_flow, False, 1000, 0.5, retry=True)
+        )
+        exception_handler.assert_not_called()
+        self.executor.add_sync_flow.assert_not_called()
+
+    @parameterized.expand([(False, "info", "debug"), (True, "debug", "info")])
+    @patch("samcli.lib.sync.sync_flow_executor.LOG")
+    def test_handle_result_logs_finished_sync_flow(self, is_internal, logged_level, not_logged_level, log_mock):
+        sync_flow = MagicMock(is_internal=is_internal, log_name="Function")
+        future = MagicMock()
+        future.done.return_value = True
+        future.exception.return_value = None
+        future.result.return_value = SyncFlowResult(sync_flow=sync_flow, dependent_sync_flows=[])
+        self.executor._color = MagicMock()
+
+        sync_flow_future = MagicMock(sync_flow=sync_flow, future=future, submit_time=1000)
+        self.assertTrue(self.executor._handle_result(sync_flow_future, MagicMock()))
+
+        getattr(log_mock, logged_level).assert_called_once_with(self.executor._color.green.return_value)
+        self.executor._color.green.assert_called_once_with("Finished syncing Function.")
+        getattr(log_mock, not_logged_level).assert_not_called()
+
     def test_is_running_without_manager(self):
         self.executor._running_flag = True
         self.assertTrue(self.executor.is_running())
@@ -131,6 +131,7 @@ class TestSyncFlowFactory(TestCase):
 
         self.assertEqual(result, sync_flow)
         generator_mock.assert_called_once_with(factory, resource_identifier, get_resource_by_id)
+        sync_flow.set_resource_cache.assert_called_once_with(factory._resource_cache)
 
     @patch("samcli.lib.sync.sync_flow_factory.get_resource_by_id")
     def test_create_unknown_resource_sync_flow(self, get_resource_by_id_mock):
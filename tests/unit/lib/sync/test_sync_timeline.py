@@ -0,0 +1,80 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.lib.sync.sync_timeline import SYNC_TRACE_FILE_ENV_VAR, SyncPhaseSummary, SyncTimeline
+
+
+class TestSyncTimeline(TestCase):
+    def setUp(self):
+        self.timeline = SyncTimeline()
+        self.timeline.record("Function1", "gather_resources", 100.0, 2.0)
+        self.timeline.record("Function2", "gather_resources", 100.5, 4.0)
+        self.timeline.record("Function1", "sync", 102.0, 1.0)
+
+    def test_get_summary(self):
+        self.assertEqual(
+            self.timeline.get_summary(),
+            [SyncPhaseSummary("gather_resources", 2, 6.0, 4.0), SyncPhaseSummary("sync", 1, 1.0, 1.0)],
+        )
+
+    def test_get_flow_records(self):
+        self.assertEqual(
+            [record.phase for record in self.timeline.get_flow_records("Function1")], ["gather_resources", "sync"]
+        )
+
+    def test_phase_is_recorded_when_exception_is_raised(self):
+        timeline = SyncTimeline()
+        with self.assertRaises(ValueError):
+            with timeline.phase("Function1", "sync"):
+                raise ValueError()
+
+        self.assertEqual([record.phase for record in timeline.records], ["sync"])
+
+    def test_write_trace(self):
+        with TemporaryDirectory() as temp_dir:
+            trace_file_path = os.path.join(temp_dir, "trace.json")
+            self.timeline.write_trace(trace_file_path)
+
+            with open(trace_file_path) as trace_file:
+                trace = json.load(trace_file)
+
+        trace_events = trace["traceEvents"]
+        self.assertEqual(len(trace_events), 3)
+        self.assertEqual(trace_events[0]["name"], "Function1 gather_resources")
+        self.assertEqual(trace_events[0]["ph"], "X")
+        self.assertEqual(trace_events[0]["ts"], 100_000_000)
+        self.assertEqual(trace_events[0]["dur"], 2_000_000)
+
+    def test_export_writes_trace_when_enabled(self):
+        with TemporaryDirectory() as temp_dir:
+            trace_file_path = os.path.join(temp_dir, "trace.json")
+            with patch.dict(os.environ, {SYNC_TRACE_FILE_ENV_VAR: trace_file_path}):
+                self.timeline.export()
+            self.assertTrue(os.path.exists(trace_file_path))
+
+    @patch.object(SyncTimeline, "log_summary")
+    def test_export_only_new_records(self, log_summary_mock):
+        with patch.dict("os.environ", {}, clear=True):
+            self.timeline.export()
+            self.timeline.export()
+            self.timeline.record("Function1", "sync", 103.0, 1.0)
+            self.timeline.export()
+
+        self.assertEqual(log_summary_mock.call_count, 2)
+
+    def test_records_are_capped(self):
+        timeline = SyncTimeline(max_records=2)
+        for index in range(5):
+            timeline.record(f"Function{index}", "sync", 100.0 + index, 1.0)
+
+        self.assertEqual([record.flow_name for record in timeline.records], ["Function3", "Function4"])
+        self.assertEqual(timeline.get_summary(), [SyncPhaseSummary("sync", 5, 5.0, 1.0)])
+
+    @patch.object(SyncTimeline, "write_trace")
+    def test_export_without_trace_file(self, write_trace_mock):
+        with patch.dict(os.environ, {}, clear=True):
+            self.timeline.export()
+        write_trace_mock.assert_not_called()
@@ -0,0 +1,170 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from parameterized import parameterized
+
+from samcli.lib.utils.invocation_timings import (
+    InvocationMetrics,
+    InvocationTimings,
+    get_current_timings,
+    invocation_phase,
+    is_invocation_timing_enabled,
+    record_invocation,
+    INVOCATION_TIMINGS_ENV_VAR,
+)
+
+
+class TestIsInvocationTimingEnabled(TestCase):
+    @parameterized.expand([("1", True), ("true", True), ("TRUE", True), ("0", False), ("", False)])
+    def test_must_read_env_var(self, value, expected):
+        with patch.dict("os.environ", {INVOCATION_TIMINGS_ENV_VAR: value}):
+            self.assertEqual(is_invocation_timing_enabled(), expected)
+
+    def test_must_be_disabled_by_default(self):
+        with patch.dict("os.environ", {}, clear=True):
+            self.assertFalse(is_invocation_timing_enabled())
+
+
+class TestInvocationTimings(TestCase):
+    @patch("samcli.lib.utils.invocation_timings.time.perf_counter")
+    def test_must_not_count_nested_phases_in_enclosing_phase(self, perf_counter_mock):
+        perf_counter_mock.side_effect = [0.0, 1.0, 3.0, 7.0, 8.0, 10.0]
+        timings = InvocationTimings("Function")
+
+        with timings.phase("start"):
+            with timings.phase("port-wait"):
+                pass
+        timings.finish()
+
+        self.assertEqual(timings.durations, {"start": 3.0, "port-wait": 4.0, "other": 3.0})
+        self.assertEqual(timings.total, 10.0)
+
+    @patch("samcli.lib.utils.invocation_timings.time.perf_counter")
+    def test_must_add_up_phases_with_same_name(self, perf_counter_mock):
+        perf_counter_mock.side_effect = [0.0, 0.0, 1.0, 2.0, 4.0, 4.0]
+        timings = InvocationTimings("Function")
+
+        with timings.phase("config"):
+            pass
+        with timings.phase("config"):
+            pass
+        timings.finish()
+
+        self.assertEqual(timings.durations, {"config": 3.0, "other": 1.0})
+
+    @patch("samcli.lib.utils.invocation_timings.time.perf_counter")
+    def test_must_record_phase_that_raises(self, perf_counter_mock):
+        perf_counter_mock.side_effect = [0.0, 1.0, 2.0]
+        timings = InvocationTimings("Function")
+
+        with self.assertRaises(ValueError):
+            with timings.phase("image"):
+                raise ValueError()
+
+        self.assertEqual(timings.durations, {"image": 1.0})
+
+    def test_must_compute_overhead_and_server_timing_header(self):
+        timings = InvocationTimings("Function")
+        timings.durations = {"create": 0.25, "invoke": 1.5}
+        timings.total = 2.0
+
+        self.assertEqual(timings.overhead, 0.5)
+        self.assertEqual(
+            timings.to_server_timing_header(),
+            "create;dur=250.000, invoke;dur=1500.000, overhead;dur=500.000, total;dur=2000.000",
+        )
+
+
+class TestRecordInvocation(TestCase):
+    @patch.dict("os.environ", {INVOCATION_TIMINGS_ENV_VAR: ""})
+    def test_must_not_record_when_disabled(self):
+        with record_invocation("Function") as timings:
+            with invocation_phase("config"):
+                self.assertIsNone(get_current_timings())
+
+        self.assertIsNone(timings)
+
+    @patch.dict("os.environ", {INVOCATION_TIMINGS_ENV_VAR: "1"})
+    @patch("samcli.lib.utils.invocation_timings.get_invocation_metrics")
+    def test_must_record_phases_and_add_to_metrics(self, get_metrics_mock):
+        with record_invocation("Function") as timings:
+            self.assertIs(get_current_timings(), timings)
+            with invocation_phase("config"):
+                pass
+
+        self.assertIsNone(get_current_timings())
+        self.assertEqual(timings.function_name, "Function")
+        self.assertIn("config", timings.durations)
+        get_metrics_mock.return_value.add.assert_called_once_with(timings)
+
+    @patch.dict("os.environ", {INVOCATION_TIMINGS_ENV_VAR: "1"})
+    @patch("samcli.lib.utils.invocation_timings.get_invocation_metrics")
+    def test_must_reuse_timings_of_enclosing_invocation(self, get_metrics_mock):
+        with record_invocation("Function") as timings:
+            with record_invocation("Function") as nested_timings:
+                self.assertIs(nested_timings, timings)
+
+        get_metrics_mock.return_value.add.assert_called_once_with(timings)
+
+    @patch.dict("os.environ", {INVOCATION_TIMINGS_ENV_VAR: "1"})
+    @patch("samcli.lib.utils.invocation_timings.get_invocation_metrics")
+    def test_must_not_add_failed_invocations_to_metrics(self, get_metrics_mock):
+        with self.assertRaises(ValueError):
+            with record_invocation("Function"):
+                raise ValueError()
+
+        self.assertIsNone(get_current_timings())
+        get_metrics_mock.return_value.add.assert_not_called()
+
+
+class TestInvocationMetrics(TestCase):
+    def setUp(self):
+        self.metrics = InvocationMetrics(summary_interval=3600)
+
+    def tearDown(self):
+        self.metrics.stop()
+
+    @staticmethod
+    def _timings(function_name, total, durations):
+        timings = InvocationTimings(function_name)
+        timings.total = total
+        timings.durations = durations
+        return timings
+
+    def test_must_aggregate_timings_per_function(self):
+        self.metrics.add(self._timings("Function", 2.0, {"create": 1.0, "invoke": 1.0}))
+        self.metrics.add(self._timings("Function", 1.0, {"invoke": 1.0}))
+        self.metrics.add(self._timings("Other", 0.5, {"invoke": 0.5}))
+
+        result = self.metrics.to_dict()
+
+        self.assertEqual(set(result.keys()), {"Function", "Other"})
+        self.assertEqual(result["Function"]["invocations"], 2)
+        self.assertEqual(
+            result["Function"]["total"], {"count": 2, "average_ms": 1500.0, "max_ms": 2000.0, "total_ms": 3000.0}
+        )
+        self.assertEqual(result["Function"]["overhead"]["average_ms"], 500.0)
+        self.assertEqual(result["Function"]["phases"]["create"]["count"], 1)
+        self.assertEqual(result["Function"]["phases"]["invoke"]["count"], 2)
+
+    @patch("samcli.lib.utils.invocation_timings.LOG")
+    def test_must_log_summary_only_when_there_are_new_invocations(self, log_mock):
+        self.metrics.log_summary()
+        log_mock.info.assert_not_called()
+
+        self.metrics.add(self._timings("Function", 2.0, {"invoke": 1.0}))
+        self.metrics.log_summary()
+        self.metrics.log_summary()
+
+        log_mock.info.assert_called_once()
+        self.assertIn("Function (1 invocations): average 2000.0ms, overhead 1000.0ms", log_mock.info.call_args[0][1])
+
+    def test_must_log_summaries_periodically(self):
+        metrics = InvocationMetrics(summary_interval=0.01)
+        metrics.log_summary = Mock()
+
+        metrics.add(self._timings("Function", 1.0, {}))
+        metrics._stopped.wait(0.1)
+        metrics.stop()
+
+        metrics.log_summary.assert_called()
@@ -4,6 +4,7 @@ Tests OSUtils file
 
 import os
 import sys
+import threading
 
 from unittest import TestCase
 from unittest.mock import patch
@@ -41,6 +42,26 @@ class Test_mkdir_temp(TestCase):
             self.assertTrue(os.path.exists(tempdir))
 
 
+class Test_file_lock(TestCase):
+    def test_must_hold_lock_until_released(self):
+        events = []
+        with osutils.mkdir_temp() as temp_dir:
+            lock_file_path = os.path.join(temp_dir, "file.lock")
+
+            def acquire_lock():
+                with osutils.file_lock(lock_file_path):
+                    events.append("second acquired")
+
+            with osutils.file_lock(lock_file_path):
+                thread = threading.Thread(target=acquire_lock)
+                thread.start()
+                thread.join(timeout=0.5)
+                events.append("first released")
+            thread.join()
+
+        self.assertEqual(events, ["first released", "second acquired"])
+
+
 class Test_stderr(TestCase):
     def test_must_return_sys_stderr(self):
 
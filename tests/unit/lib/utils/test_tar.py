@@ -1,7 +1,14 @@
+import gzip
+import io
+import os
+import tarfile
+import tempfile
+import threading
+from pathlib import Path
 from unittest import TestCase
 from unittest.mock import Mock, patch, call
 
-from samcli.lib.utils.tar import create_tarball
+from samcli.lib.utils.tar import create_tarball, stream_tarball
 
 
 class TestTar(TestCase):
@@ -62,3 +69,113 @@ class TestTar(TestCase):
         temp_file_mock.seek.assert_called_once_with(0)
         temp_file_mock.close.assert_called_once()
         tarfile_open_patch.assert_called_once_with(fileobj=temp_file_mock, mode="w")
+
+
+class TestStreamTarball(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.layer_dir = Path(self.temp_dir.name, "layer")
+        self.layer_dir.joinpath("python").mkdir(parents=True)
+        self.layer_dir.joinpath("python", "module.py").write_text("print('layer')")
+        self.dockerfile = Path(self.temp_dir.name, "dockerfile")
+        self.dockerfile.write_text("FROM scratch")
+        self.tar_paths = {str(self.dockerfile): "Dockerfile", str(self.layer_dir): "/layer1"}
+
+    def _read_members(self, tarball_content, mode="r"):
+        with tarfile.open(fileobj=io.BytesIO(tarball_content), mode=mode) as archive:
+            return {
+                member.name: archive.extractfile(member).read() if member.isfile() else None
+                for member in archive.getmembers()
+            }
+
+    def test_streams_same_content_as_tarball_file(self):
+        with stream_tarball(self.tar_paths) as tarball:
+            streamed_content = b"".join(tarball)
+        with create_tarball(self.tar_paths) as tarball_file:
+            file_content = tarball_file.read()
+
+        self.assertEqual(self._read_members(streamed_content), self._read_members(file_content))
+        self.assertEqual(
+            self._read_members(streamed_content),
+            {
+                "Dockerfile": b"FROM scratch",
+                "layer1": None,
+                "layer1/python": None,
+                "layer1/python/module.py": b"print('layer')",
+            },
+        )
+
+    def test_streams_large_files_in_chunks(self):
+        self.layer_dir.joinpath("large").write_bytes(os.urandom(3 * 1024 * 1024))
+
+        with stream_tarball(self.tar_paths) as tarball:
+            chunks = list(tarball)
+
+        self.assertGreater(len(chunks), 1)
+        members = self._read_members(b"".join(chunks))
+        self.assertEqual(members["layer1/large"], self.layer_dir.joinpath("large").read_bytes())
+
+    def test_streams_gzip_compressed_tarball(self):
+        with stream_tarball(self.tar_paths, gzip=True) as tarball:
+            content = b"".join(tarball)
+
+        self.assertEqual(content[:2], b"\x1f\x8b")
+        self.assertEqual(self._read_members(gzip.decompress(content))["Dockerfile"], b"FROM scratch")
+
+    def test_streams_same_tarball_in_deterministic_mode(self):
+        def set_item_permission(tar_info):
+            tar_info.mode = 0o500
+            return tar_info
+
+        with stream_tarball(self.tar_paths, tar_filter=set_item_permission, gzip=True, deterministic=True) as tarball:
+            first_content = b"".join(tarball)
+        os.utime(self.dockerfile, (0, 123456))
+        with stream_tarball(self.tar_paths, tar_filter=set_item_permission, gzip=True, deterministic=True) as tarball:
+            second_content = b"".join(tarball)
+
+        self.assertEqual(first_content, second_content)
+        with tarfile.open(fileobj=io.BytesIO(first_content), mode="r:gz") as archive:
+            for member in archive.getmembers():
+                self.assertEqual((member.mtime, member.uid, member.uname, member.mode), (0, 0, "", 0o500))
+
+    def test_streams_only_given_paths_if_not_recursive(self):
+        with stream_tarball({str(self.layer_dir): "layer1"}, recursive=False) as tarball:
+            content = b"".join(tarball)
+
+        self.assertEqual(self._read_members(content), {"layer1": None})
+
+    def test_raises_error_of_missing_path(self):
+        with self.assertRaises(FileNotFoundError):
+            with stream_tarball({str(Path(self.temp_dir.name, "missing")): "missing"}) as tarball:
+                b"".join(tarball)
+
+    def test_raises_error_of_missing_path_if_reader_wraps_it(self):
+        with self.assertRaises(FileNotFoundError) as context:
+            with stream_tarball({str(Path(self.temp_dir.name, "missing")): "missing"}) as tarball:
+                try:
+                    b"".join(tarball)
+                except OSError as ex:
+                    raise ConnectionError("Connection aborted") from ex
+
+        self.assertIsInstance(context.exception.__cause__, ConnectionError)
+
+    def test_raises_error_of_reader_if_it_fails_without_reading_writer_error(self):
+        writer_failed = threading.Event()
+
+        def fail_to_open(*args, **kwargs):
+            writer_failed.set()
+            raise FileNotFoundError()
+
+        with patch("samcli.lib.utils.tar.tarfile.open", side_effect=fail_to_open):
+            with self.assertRaises(ValueError):
+                with stream_tarball(self.tar_paths):
+                    writer_failed.wait(5)
+                    raise ValueError("Build failed")
+
+    @patch("samcli.lib.utils.tar.STREAM_MAX_PENDING_CHUNKS", 1)
+    def test_stops_writing_if_reader_stops(self):
+        self.layer_dir.joinpath("large").write_bytes(os.urandom(4 * 1024 * 1024))
+
+        with stream_tarball(self.tar_paths) as tarball:
+            next(tarball)
@@ -643,6 +643,48 @@ class TestContainer_wait_for_result(TestCase):
                 event=self.event, full_path=self.name, stdout=stdout_mock, stderr=stderr_mock
             )
 
+    @patch("samcli.local.docker.container.get_container_log_collector")
+    @patch("samcli.local.docker.container.requests")
+    def test_wait_for_result_collects_logs_with_log_collector(self, mock_requests, get_log_collector_mock):
+        self.container.is_created.return_value = True
+        self.mock_docker_client.api.base_url = "http+docker://localhost"
+        attach_socket_mock = Mock()
+        self.mock_docker_client.api.attach_socket.return_value = attach_socket_mock
+        log_collector_mock = get_log_collector_mock.return_value
+        log_collector_mock.is_attached.side_effect = [False, True]
+        mock_requests.post.return_value = Mock(content=b"{}")
+
+        stdout_mock = Mock()
+        stderr_mock = Mock()
+        self.container.wait_for_result(event=self.event, full_path=self.name, stdout=stdout_mock, stderr=stderr_mock)
+        self.container.wait_for_result(event=self.event, full_path=self.name, stdout=stdout_mock, stderr=stderr_mock)
+
+        self.mock_docker_client.api.attach_socket.assert_called_once_with(
+            "someid", params={"stdout": 1, "stderr": 1, "stream": 1, "logs": 1}
+        )
+        log_collector_mock.attach.assert_called_once_with(
+            "someid", attach_socket_mock, stdout=stderr_mock, stderr=stderr_mock
+        )
+        self.assertIsNone(self.container._logs_thread)
+        self.assertEqual(mock_requests.post.call_count, 2)
+
+    @patch("samcli.local.docker.container.get_container_log_collector")
+    @patch("samcli.local.docker.container.requests")
+    def test_wait_for_result_starts_logs_thread_if_log_collector_is_not_supported(
+        self, mock_requests, get_log_collector_mock
+    ):
+        self.container.is_created.return_value = True
+        self.mock_docker_client.api.base_url = "https://127.0.0.1:2376"
+        self.container.wait_for_logs = Mock()
+        mock_requests.post.return_value = Mock(content=b"{}")
+
+        stderr_mock = Mock()
+        self.container.wait_for_result(event=self.event, full_path=self.name, stdout=Mock(), stderr=stderr_mock)
+        self.container._logs_thread.join()
+
+        get_log_collector_mock.assert_not_called()
+        self.container.wait_for_logs.assert_called_once_with(stderr_mock, stderr_mock)
+
 
 class TestContainer_wait_for_logs(TestCase):
     def setUp(self):
@@ -1,5 +1,8 @@
 import io
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from unittest import TestCase
 from unittest.mock import patch, Mock, mock_open, ANY, call
@@ -10,7 +13,7 @@ from parameterized import parameterized
 from samcli.commands.local.lib.exceptions import InvalidIntermediateImageError
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from samcli.lib.utils.architecture import ARM64, X86_64
-from samcli.local.docker.lambda_image import LambdaImage, RAPID_IMAGE_TAG_PREFIX
+from samcli.local.docker.lambda_image import LambdaImage, RAPID_IMAGE_TAG_PREFIX, CONTEXT_HASH_LABEL
 from samcli.commands.local.cli_common.user_exceptions import ImageBuildException
 from samcli import __version__ as version
 
@@ -84,6 +87,7 @@ class TestLambdaImage(TestCase):
             [],
             X86_64,
             stream=ANY,
+            context_hash=ANY,
         )
         # No Layers are added.
         layer_downloader_mock.assert_not_called()
@@ -216,13 +220,16 @@ class TestLambdaImage(TestCase):
 
         layer_downloader_mock.download_all.assert_called_once_with(["layers1"], True)
         generate_docker_image_version_patch.assert_called_once_with(["layers1"], runtime, X86_64)
-        docker_client_mock.images.get.assert_called_once_with("samcli/lambda:image-version")
+        docker_client_mock.images.get.assert_any_call("samcli/lambda:image-version")
+        repository, tag = image_name.split(":")
+        docker_client_mock.images.pull.assert_called_once_with(repository, tag=tag, platform="linux/amd64")
         build_image_patch.assert_called_once_with(
             image_name,
             "samcli/lambda:image-version",
             ["layers1"],
             X86_64,
             stream=stream,
+            context_hash=ANY,
         )
 
     @parameterized.expand(
@@ -256,14 +263,193 @@ class TestLambdaImage(TestCase):
 
         layer_downloader_mock.download_all.assert_called_once_with(["layers1"], False)
         generate_docker_image_version_patch.assert_called_once_with(["layers1"], runtime, ARM64)
-        docker_client_mock.images.get.assert_called_once_with("samcli/lambda:image-version")
+        docker_client_mock.images.get.assert_any_call("samcli/lambda:image-version")
+        docker_client_mock.images.pull.assert_not_called()
         build_image_patch.assert_called_once_with(
             image_name,
             "samcli/lambda:image-version",
             ["layers1"],
             ARM64,
             stream=stream,
+            context_hash=ANY,
+        )
+
+    @patch("samcli.local.docker.lambda_image.LambdaImage._get_context_hash")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_docker_image_version")
+    def test_force_building_image_that_is_up_to_date_is_skipped(
+        self, generate_docker_image_version_patch, build_image_patch, get_context_hash_patch
+    ):
+        layer_mock = Mock()
+        layer_mock.is_defined_within_template = True
+        layer_downloader_mock = Mock()
+        layer_downloader_mock.download_all.return_value = [layer_mock]
+        generate_docker_image_version_patch.return_value = "image-version"
+        get_context_hash_patch.return_value = "context-hash"
+
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.return_value = Mock(labels={CONTEXT_HASH_LABEL: "context-hash"})
+
+        lambda_image = LambdaImage(layer_downloader_mock, False, True, docker_client=docker_client_mock)
+        actual_image_id = lambda_image.build("python3.8", ZIP, None, [layer_mock], X86_64, function_name="function")
+
+        self.assertEqual(actual_image_id, "samcli/lambda:image-version")
+        layer_downloader_mock.download_all.assert_called_once_with([layer_mock], True)
+        get_context_hash_patch.assert_called_once_with(
+            "public.ecr.aws/sam/emulation-python3.8:latest-x86_64", [layer_mock], X86_64
         )
+        build_image_patch.assert_not_called()
+
+    @parameterized.expand([({CONTEXT_HASH_LABEL: "old-context-hash"},), ({},), (None,)])
+    @patch("samcli.local.docker.lambda_image.LambdaImage._get_context_hash")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_docker_image_version")
+    def test_force_building_image_that_is_not_up_to_date(
+        self, labels, generate_docker_image_version_patch, build_image_patch, get_context_hash_patch
+    ):
+        layer_downloader_mock = Mock()
+        layer_downloader_mock.download_all.return_value = ["layers1"]
+        generate_docker_image_version_patch.return_value = "image-version"
+        get_context_hash_patch.return_value = "context-hash"
+
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.return_value = Mock(labels=labels)
+
+        stream = io.StringIO()
+
+        lambda_image = LambdaImage(layer_downloader_mock, False, True, docker_client=docker_client_mock)
+        lambda_image.build("python3.8", ZIP, None, ["layers1"], X86_64, stream=stream, function_name="function")
+
+        # Context hash is computed once, for both comparing and labeling the image
+        get_context_hash_patch.assert_called_once()
+        build_image_patch.assert_called_once_with(
+            "public.ecr.aws/sam/emulation-python3.8:latest-x86_64",
+            "samcli/lambda:image-version",
+            ["layers1"],
+            X86_64,
+            stream=stream,
+            context_hash="context-hash",
+        )
+
+    @patch("samcli.local.docker.lambda_image.LambdaImage._get_context_hash")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    def test_concurrent_builds_of_the_same_image_build_once(self, build_image_patch, get_context_hash_patch):
+        image_tag = f"public.ecr.aws/sam/emulation-python3.8:{RAPID_IMAGE_TAG_PREFIX}-{version}-x86_64"
+        built_images = {}
+        get_context_hash_patch.return_value = "context-hash"
+
+        def get_image(name):
+            if name not in built_images:
+                raise ImageNotFound("image not found")
+            return built_images[name]
+
+        def build_image(base_image, docker_tag, layers, architecture, stream=None, context_hash=None):
+            time.sleep(0.1)
+            built_images[docker_tag] = Mock(labels={CONTEXT_HASH_LABEL: "context-hash"})
+
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.side_effect = get_image
+        docker_client_mock.images.list.return_value = []
+        build_image_patch.side_effect = build_image
+
+        lambda_image = LambdaImage(Mock(), False, True, docker_client=docker_client_mock)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            image_ids = list(
+                executor.map(
+                    lambda function_name: lambda_image.build(
+                        "python3.8", ZIP, None, [], X86_64, stream=io.StringIO(), function_name=function_name
+                    ),
+                    ["function1", "function2", "function3", "function4"],
+                )
+            )
+
+        self.assertEqual(image_ids, [image_tag] * 4)
+        build_image_patch.assert_called_once()
+        # Locks are only kept while the image is built
+        self.assertEqual(lambda_image._build_locks, {})
+
+    @parameterized.expand([(False, True), (True, False)])
+    @patch("samcli.local.docker.lambda_image.LambdaImage._get_context_hash")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_docker_image_version")
+    def test_force_building_image_pulls_base_image_before_comparing(
+        self,
+        skip_pull_image,
+        expect_pull,
+        generate_docker_image_version_patch,
+        build_image_patch,
+        get_context_hash_patch,
+    ):
+        calls = Mock()
+        generate_docker_image_version_patch.return_value = "image-version"
+        calls.get_context_hash.return_value = "context-hash"
+        get_context_hash_patch.side_effect = lambda *args: calls.get_context_hash()
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.return_value = Mock(labels={CONTEXT_HASH_LABEL: "context-hash"})
+        docker_client_mock.images.pull.side_effect = lambda *args, **kwargs: calls.pull(*args, **kwargs)
+
+        lambda_image = LambdaImage(Mock(), skip_pull_image, True, docker_client=docker_client_mock)
+        lambda_image.build("python3.8", ZIP, None, ["layers1"], ARM64, function_name="function")
+
+        expected_calls = [call.get_context_hash()]
+        if expect_pull:
+            expected_calls.insert(
+                0, call.pull("public.ecr.aws/sam/emulation-python3.8", tag="latest-arm64", platform="linux/arm64")
+            )
+        self.assertEqual(calls.mock_calls, expected_calls)
+        build_image_patch.assert_not_called()
+
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    def test_force_building_uses_local_base_image_if_pull_fails(self, build_image_patch):
+        docker_client_mock = Mock()
+        docker_client_mock.images.pull.side_effect = APIError("network error")
+        docker_client_mock.images.list.return_value = []
+
+        LambdaImage(Mock(), False, True, docker_client=docker_client_mock).build(
+            "python3.8", ZIP, None, [], X86_64, function_name="function"
+        )
+
+        build_image_patch.assert_called_once()
+
+    def test_get_context_hash(self):
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.return_value = Mock(id="sha256:base")
+        lambda_image = LambdaImage(Mock(), False, False, docker_client=docker_client_mock)
+
+        with tempfile.TemporaryDirectory() as layer_dir:
+            layer_file = Path(layer_dir, "python", "module.py")
+            layer_file.parent.mkdir()
+            layer_file.write_text("content")
+            layer_mock = Mock(codeuri=layer_dir)
+            layer_mock.name = "layer1"
+
+            context_hash = lambda_image._get_context_hash("base_image", [layer_mock], X86_64)
+            self.assertEqual(context_hash, lambda_image._get_context_hash("base_image", [layer_mock], X86_64))
+            self.assertNotEqual(context_hash, lambda_image._get_context_hash("base_image", [layer_mock], ARM64))
+            self.assertNotEqual(context_hash, lambda_image._get_context_hash("base_image", [], X86_64))
+
+            docker_client_mock.images.get.return_value = Mock(id="sha256:newbase")
+            self.assertNotEqual(context_hash, lambda_image._get_context_hash("base_image", [layer_mock], X86_64))
+
+            docker_client_mock.images.get.return_value = Mock(id="sha256:base")
+            layer_file.write_text("new content")
+            self.assertNotEqual(context_hash, lambda_image._get_context_hash("base_image", [layer_mock], X86_64))
+
+        docker_client_mock.images.get.assert_called_with("base_image")
+
+    @parameterized.expand([(ImageNotFound("image not found"), "layer_dir"), (None, "missing_layer_dir")])
+    def test_get_context_hash_returns_none(self, get_image_error, layer_codeuri):
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.side_effect = get_image_error
+        docker_client_mock.images.get.return_value = Mock(id="sha256:base")
+        lambda_image = LambdaImage(Mock(), False, False, docker_client=docker_client_mock)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            layer_mock = Mock(codeuri=str(Path(temp_dir, layer_codeuri)))
+            layer_mock.name = "layer1"
+            Path(temp_dir, "layer_dir").mkdir()
+
+            self.assertIsNone(lambda_image._get_context_hash("base_image", [layer_mock], X86_64))
 
     @patch("samcli.local.docker.lambda_image.hashlib")
     def test_generate_docker_image_version(self, hashlib_patch):
@@ -304,11 +490,11 @@ class TestLambdaImage(TestCase):
 
         self.assertEqual(LambdaImage._generate_dockerfile("python", [layer_mock], ARM64), expected_docker_file)
 
-    @patch("samcli.local.docker.lambda_image.create_tarball")
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
     @patch("samcli.local.docker.lambda_image.uuid")
     @patch("samcli.local.docker.lambda_image.Path")
     @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
-    def test_build_image(self, generate_dockerfile_patch, path_patch, uuid_patch, create_tarball_patch):
+    def test_build_image(self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch):
         uuid_patch.uuid4.return_value = "uuid"
         generate_dockerfile_patch.return_value = "Dockerfile content"
 
@@ -322,7 +508,7 @@ class TestLambdaImage(TestCase):
         layer_downloader_mock.layer_cache = "cached layers"
 
         tarball_fileobj = Mock()
-        create_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
+        stream_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
 
         layer_version1 = Mock()
         layer_version1.codeuri = "somevalue"
@@ -332,7 +518,7 @@ class TestLambdaImage(TestCase):
         m = mock_open(dockerfile_mock)
         with patch("samcli.local.docker.lambda_image.open", m):
             LambdaImage(layer_downloader_mock, True, False, docker_client=docker_client_mock)._build_image(
-                "base_image", "docker_tag", [layer_version1], "arm64"
+                "base_image", "docker_tag", [layer_version1], "arm64", context_hash="context-hash"
             )
 
         handle = m()
@@ -346,16 +532,16 @@ class TestLambdaImage(TestCase):
             custom_context=True,
             decode=True,
             platform="linux/arm64",
+            labels={CONTEXT_HASH_LABEL: "context-hash"},
         )
-
         docker_full_path_mock.unlink.assert_called_once()
 
-    @patch("samcli.local.docker.lambda_image.create_tarball")
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
     @patch("samcli.local.docker.lambda_image.uuid")
     @patch("samcli.local.docker.lambda_image.Path")
     @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
     def test_build_image_fails_with_BuildError(
-        self, generate_dockerfile_patch, path_patch, uuid_patch, create_tarball_patch
+        self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch
     ):
         uuid_patch.uuid4.return_value = "uuid"
         generate_dockerfile_patch.return_value = "Dockerfile content"
@@ -370,7 +556,7 @@ class TestLambdaImage(TestCase):
         layer_downloader_mock.layer_cache = "cached layers"
 
         tarball_fileobj = Mock()
-        create_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
+        stream_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
 
         layer_version1 = Mock()
         layer_version1.codeuri = "somevalue"
@@ -395,16 +581,17 @@ class TestLambdaImage(TestCase):
             custom_context=True,
             decode=True,
             platform="linux/arm64",
+            labels=None,
         )
 
         docker_full_path_mock.unlink.assert_not_called()
 
-    @patch("samcli.local.docker.lambda_image.create_tarball")
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
     @patch("samcli.local.docker.lambda_image.uuid")
     @patch("samcli.local.docker.lambda_image.Path")
     @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
     def test_build_image_fails_with_BuildError_from_output(
-        self, generate_dockerfile_patch, path_patch, uuid_patch, create_tarball_patch
+        self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch
     ):
         uuid_patch.uuid4.return_value = "uuid"
         generate_dockerfile_patch.return_value = "Dockerfile content"
@@ -419,7 +606,7 @@ class TestLambdaImage(TestCase):
         layer_downloader_mock.layer_cache = "cached layers"
 
         tarball_fileobj = Mock()
-        create_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
+        stream_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
 
         layer_version1 = Mock()
         layer_version1.codeuri = "somevalue"
@@ -444,16 +631,17 @@ class TestLambdaImage(TestCase):
             custom_context=True,
             decode=True,
             platform="linux/amd64",
+            labels=None,
         )
 
         docker_full_path_mock.unlink.assert_not_called()
 
-    @patch("samcli.local.docker.lambda_image.create_tarball")
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
     @patch("samcli.local.docker.lambda_image.uuid")
     @patch("samcli.local.docker.lambda_image.Path")
     @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
     def test_build_image_fails_with_ApiError(
-        self, generate_dockerfile_patch, path_patch, uuid_patch, create_tarball_patch
+        self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch
     ):
         uuid_patch.uuid4.return_value = "uuid"
         generate_dockerfile_patch.return_value = "Dockerfile content"
@@ -467,7 +655,7 @@ class TestLambdaImage(TestCase):
         layer_downloader_mock.layer_cache = "cached layers"
 
         tarball_fileobj = Mock()
-        create_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
+        stream_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
 
         layer_version1 = Mock()
         layer_version1.codeuri = "somevalue"
@@ -492,6 +680,7 @@ class TestLambdaImage(TestCase):
             custom_context=True,
             decode=True,
             platform="linux/amd64",
+            labels=None,
         )
         docker_full_path_mock.unlink.assert_called_once()
 
@@ -0,0 +1,142 @@
+import io
+import socket
+import struct
+import time
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from parameterized import parameterized
+
+from samcli.lib.utils.stream_writer import StreamWriter
+from samcli.local.docker.log_collector import ContainerLogCollector, _AttachedContainer, get_container_log_collector
+
+
+def frame(frame_type, payload):
+    return struct.pack(">BxxxL", frame_type, len(payload)) + payload
+
+
+class TestContainerLogCollector(TestCase):
+    def setUp(self):
+        self.collector = ContainerLogCollector()
+        self.addCleanup(self.collector.stop)
+        self.container_socket, self.docker_socket = socket.socketpair()
+        self.addCleanup(self.docker_socket.close)
+        self.stdout = io.BytesIO()
+        self.stderr = io.BytesIO()
+
+    def _wait_until_detached(self, container_id):
+        deadline = time.time() + 5
+        while self.collector.is_attached(container_id):
+            self.assertLess(time.time(), deadline, "Container output is not closed")
+            time.sleep(0.01)
+
+    def test_must_write_output_of_container(self):
+        self.collector.attach("id", self.container_socket, StreamWriter(self.stdout), StreamWriter(self.stderr))
+        self.assertTrue(self.collector.is_attached("id"))
+
+        content = frame(1, b"stdout1\n") + frame(2, b"stderr1\n") + frame(1, b"stdout2\n")
+        # Send a frame header and payload split in multiple parts
+        for index in range(0, len(content), 5):
+            self.docker_socket.sendall(content[index : index + 5])
+            time.sleep(0.001)
+        self.docker_socket.close()
+        self._wait_until_detached("id")
+
+        self.assertEqual(self.stdout.getvalue(), b"stdout1\nstdout2\n")
+        self.assertEqual(self.stderr.getvalue(), b"stderr1\n")
+
+    def test_must_write_output_of_multiple_containers(self):
+        other_container_socket, other_docker_socket = socket.socketpair()
+        other_stderr = io.BytesIO()
+        self.collector.attach("id1", self.container_socket, stderr=StreamWriter(self.stderr))
+        self.collector.attach("id2", other_container_socket, stderr=StreamWriter(other_stderr))
+
+        self.docker_socket.sendall(frame(2, b"container1\n") + frame(1, b"ignored\n"))
+        other_docker_socket.sendall(frame(2, b"container2\n"))
+        self.docker_socket.close()
+        other_docker_socket.close()
+        self._wait_until_detached("id1")
+        self._wait_until_detached("id2")
+
+        self.assertEqual(self.stderr.getvalue(), b"container1\n")
+        self.assertEqual(other_stderr.getvalue(), b"container2\n")
+
+    def test_must_write_output_read_at_once_in_single_write(self):
+        stderr_mock = Mock()
+        self.docker_socket.sendall(b"".join(frame(2, f"line{index}\n".encode()) for index in range(100)))
+        self.docker_socket.close()
+
+        self.collector.attach("id", self.container_socket, stderr=stderr_mock)
+        self._wait_until_detached("id")
+
+        stderr_mock.write.assert_called_once_with(b"".join(f"line{index}\n".encode() for index in range(100)))
+
+    def test_must_replace_previous_output_of_same_container(self):
+        previous_socket = Mock(spec=socket.socket)
+        previous_socket.fileno.return_value = self.container_socket.fileno()
+        self.collector.attach("id", previous_socket, stderr=Mock())
+
+        other_container_socket, other_docker_socket = socket.socketpair()
+        self.addCleanup(other_docker_socket.close)
+        self.collector.attach("id", other_container_socket, stderr=Mock())
+
+        previous_socket.close.assert_called()
+        self.assertTrue(self.collector.is_attached("id"))
+
+    def test_must_raise_if_output_is_not_socket(self):
+        with self.assertRaises(ValueError):
+            self.collector.attach("id", io.BytesIO(), stderr=Mock())
+
+        self.assertFalse(self.collector.is_attached("id"))
+
+    def test_must_read_socket_of_attach_socket_wrapper(self):
+        socket_io = self.container_socket.makefile("rb", buffering=0)
+        self.collector.attach("id", socket_io, stderr=StreamWriter(self.stderr))
+
+        self.docker_socket.sendall(frame(2, b"output\n"))
+        self.docker_socket.close()
+        self._wait_until_detached("id")
+
+        self.assertEqual(self.stderr.getvalue(), b"output\n")
+
+    def test_stop_must_close_attached_containers(self):
+        self.collector.attach("id", self.container_socket, stderr=Mock())
+
+        self.collector.stop()
+
+        self.assertFalse(self.collector.is_attached("id"))
+        self.assertEqual(self.container_socket.fileno(), -1)
+
+    @parameterized.expand(
+        [
+            ("http+docker://localhost", True),
+            ("http://127.0.0.1:2375", True),
+            ("https://127.0.0.1:2376", False),
+            ("http+docker://localnpipe", False),
+            ("http+docker://ssh", False),
+            (None, False),
+        ]
+    )
+    def test_is_supported(self, base_url, expected):
+        self.assertEqual(ContainerLogCollector.is_supported(Mock(api=Mock(base_url=base_url))), expected)
+
+
+class TestAttachedContainer_parse(TestCase):
+    def test_must_return_payload_as_it_is_read(self):
+        attached = _AttachedContainer("id", Mock(), Mock(), Mock(), Mock())
+        content = frame(1, b"stdout") + frame(2, b"stderr")
+
+        self.assertEqual(list(attached.parse(content[:4])), [])
+        self.assertEqual(list(attached.parse(content[4:11])), [(1, b"std")])
+        self.assertEqual(list(attached.parse(content[11:23])), [(1, b"out"), (2, b"s")])
+        self.assertEqual(list(attached.parse(content[23:])), [(2, b"tderr")])
+
+
+class TestGetContainerLogCollector(TestCase):
+    @patch("samcli.local.docker.log_collector._collector", None)
+    def test_must_return_same_collector(self):
+        collector = get_container_log_collector()
+        self.addCleanup(collector.stop)
+
+        self.assertIsInstance(collector, ContainerLogCollector)
+        self.assertIs(get_container_log_collector(), collector)
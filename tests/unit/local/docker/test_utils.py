@@ -3,11 +3,20 @@ Unit test for Utils
 """
 
 import os
+import tempfile
+from pathlib import Path
 from unittest import TestCase
 from unittest.mock import patch, Mock
 
 from samcli.lib.utils.architecture import ARM64, InvalidArchitecture, X86_64
-from samcli.local.docker.utils import to_posix_path, find_free_port, get_rapid_name, get_docker_platform, get_image_arch
+from samcli.local.docker.utils import (
+    to_posix_path,
+    find_free_port,
+    get_rapid_name,
+    get_docker_platform,
+    get_image_arch,
+    get_docker_context_paths,
+)
 from samcli.local.docker.exceptions import NoFreePortsError
 
 
@@ -93,3 +102,59 @@ class TestGetDockerPlatform(TestCase):
         for arch in unknown_architectures:
             with self.assertRaises(InvalidArchitecture):
                 get_docker_platform(arch)
+
+
+class TestGetDockerContextPaths(TestCase):
+    def setUp(self):
+        self.context_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.context_dir.cleanup)
+        self.root = self.context_dir.name
+        Path(self.root, "Dockerfile").write_text("FROM scratch")
+        Path(self.root, "app").mkdir()
+        Path(self.root, "app", "app.py").write_text("print()")
+        Path(self.root, "app", "app.pyc").write_text("")
+        Path(self.root, "node_modules").mkdir()
+        Path(self.root, "node_modules", "module.js").write_text("")
+
+    def test_returns_all_paths_without_dockerignore(self):
+        self.assertEqual(
+            get_docker_context_paths(self.root, "Dockerfile"),
+            (
+                {
+                    os.path.join(self.root, path): path
+                    for path in [
+                        "Dockerfile",
+                        "app",
+                        os.path.join("app", "app.py"),
+                        os.path.join("app", "app.pyc"),
+                        "node_modules",
+                        os.path.join("node_modules", "module.js"),
+                    ]
+                },
+                "Dockerfile",
+            ),
+        )
+
+    def test_excludes_paths_in_dockerignore(self):
+        Path(self.root, ".dockerignore").write_text("# comment\n\nnode_modules\n**/*.pyc\nDockerfile\n")
+
+        self.assertEqual(
+            get_docker_context_paths(self.root, "Dockerfile"),
+            (
+                {
+                    os.path.join(self.root, path): path
+                    for path in [".dockerignore", "Dockerfile", "app", os.path.join("app", "app.py")]
+                },
+                "Dockerfile",
+            ),
+        )
+
+    def test_returns_dockerfile_path_within_context(self):
+        Path(self.root, "app", "Dockerfile").write_text("FROM scratch")
+
+        _, dockerfile = get_docker_context_paths(self.root, os.path.join(self.root, "app", "Dockerfile"))
+
+        self.assertEqual(dockerfile, "app/Dockerfile")
+
+    def test_returns_none_if_dockerfile_is_outside_of_context(self):
+        self.assertIsNone(get_docker_context_paths(os.path.join(self.root, "app"), "../Dockerfile"))
@@ -0,0 +1,83 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from samcli.local.lambda_service.event_invocation_queue import EventInvocationQueue
+
+
+class TestEventInvocationQueue(TestCase):
+    def test_must_run_invocations_in_background(self):
+        invoke_mock = Mock()
+        invocation_queue = EventInvocationQueue(invoke_mock, max_workers=2)
+
+        for index in range(5):
+            self.assertTrue(invocation_queue.submit("HelloWorld", str(index)))
+        invocation_queue.join()
+        invocation_queue.stop()
+
+        self.assertEqual(invoke_mock.call_count, 5)
+        self.assertCountEqual([call_args[0][1] for call_args in invoke_mock.call_args_list], ["0", "1", "2", "3", "4"])
+        metrics = invocation_queue.get_metrics()
+        self.assertEqual(metrics.completed, 5)
+        self.assertEqual(metrics.failed, 0)
+        self.assertEqual(metrics.queue_depth, 0)
+        self.assertEqual(metrics.running, 0)
+        self.assertGreaterEqual(metrics.max_run_latency, metrics.average_run_latency)
+
+    def test_must_throttle_invocations_when_queue_is_full(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def invoke(function_name, event):
+            started.set()
+            release.wait(timeout=10)
+
+        invocation_queue = EventInvocationQueue(invoke, max_queued_invocations=1, max_workers=1)
+
+        self.assertTrue(invocation_queue.submit("HelloWorld", "running"))
+        started.wait(timeout=10)
+        self.assertTrue(invocation_queue.submit("HelloWorld", "queued"))
+        self.assertFalse(invocation_queue.submit("HelloWorld", "throttled"))
+
+        metrics = invocation_queue.get_metrics()
+        self.assertEqual(metrics.queue_depth, 1)
+        self.assertEqual(metrics.running, 1)
+        self.assertEqual(metrics.throttled, 1)
+
+        release.set()
+        invocation_queue.join()
+        invocation_queue.stop()
+        self.assertEqual(invocation_queue.get_metrics().completed, 2)
+
+    def test_failed_invocation_does_not_stop_worker(self):
+        invoke_mock = Mock(side_effect=[Exception("failed"), None])
+        invocation_queue = EventInvocationQueue(invoke_mock, max_workers=1)
+
+        invocation_queue.submit("HelloWorld", "first")
+        invocation_queue.submit("HelloWorld", "second")
+        invocation_queue.join()
+        invocation_queue.stop()
+
+        metrics = invocation_queue.get_metrics()
+        self.assertEqual(metrics.completed, 2)
+        self.assertEqual(metrics.failed, 1)
+
+    def test_workers_are_not_started_without_invocations(self):
+        invocation_queue = EventInvocationQueue(Mock())
+
+        self.assertEqual(invocation_queue._workers, [])
+
+    @patch("samcli.local.lambda_service.event_invocation_queue.LOG")
+    def test_must_log_metrics_when_all_invocations_are_finished(self, log_mock):
+        release = threading.Event()
+        invoke_mock = Mock(side_effect=lambda function_name, event: release.wait(timeout=10))
+        invocation_queue = EventInvocationQueue(invoke_mock, max_workers=1)
+
+        invocation_queue.submit("HelloWorld", "first")
+        invocation_queue.submit("HelloWorld", "second")
+        release.set()
+        invocation_queue.join()
+        invocation_queue.stop()
+
+        log_mock.info.assert_called_once()
+        self.assertEqual(log_mock.info.call_args[0][1:4], (2, 0, 0))
@@ -71,6 +71,19 @@ class TestLambdaErrorResponses(TestCase):
             501,
         )
 
+    @patch("samcli.local.services.base_local_service.BaseLocalService.service_response")
+    def test_too_many_requests(self, service_response_mock):
+        service_response_mock.return_value = "TooManyRequests"
+
+        response = LambdaErrorResponses.too_many_requests("TooManyRequests")
+
+        self.assertEqual(response, "TooManyRequests")
+        service_response_mock.assert_called_once_with(
+            '{"Type": "User", "Message": "TooManyRequests"}',
+            {"x-amzn-errortype": "TooManyRequests", "Content-Type": "application/json"},
+            429,
+        )
+
     @patch("samcli.local.services.base_local_service.BaseLocalService.service_response")
     def test_generic_path_not_found(self, service_response_mock):
         service_response_mock.return_value = "GenericPathNotFound"
@@ -1,6 +1,9 @@
 from unittest import TestCase
 from unittest.mock import Mock, patch, ANY, call
 
+from parameterized import parameterized
+
+from samcli.lib.utils.invocation_timings import invocation_phase, INVOCATION_TIMINGS_ENV_VAR
 from samcli.local.lambda_service import local_lambda_invoke_service
 from samcli.local.lambda_service.local_lambda_invoke_service import LocalLambdaInvokeService, FunctionNamePathConverter
 from samcli.local.lambdafn.exceptions import FunctionNotFound
@@ -24,6 +27,15 @@ class TestLocalLambdaService(TestCase):
         self.assertEqual(local_service.stderr, stderr_mock)
         self.assertEqual(local_service.lambda_runner, lambda_runner_mock)
 
+    @parameterized.expand([(True, 1), (False, 4)])
+    def test_event_invocations_run_one_at_a_time_when_debugging(self, is_debugging, expected_workers):
+        lambda_runner_mock = Mock()
+        lambda_runner_mock.is_debugging.return_value = is_debugging
+
+        service = LocalLambdaInvokeService(lambda_runner=lambda_runner_mock, port=3000, host="localhost")
+
+        self.assertEqual(service.event_invocation_queue._max_workers, expected_workers)
+
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LocalLambdaInvokeService._construct_error_handling")
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.Flask")
     def test_create_service_endpoints(self, flask_mock, error_handling_mock):
@@ -176,6 +188,102 @@ class TestLocalLambdaService(TestCase):
         lambda_runner_mock.invoke.assert_called_once_with("HelloWorld", "{}", stdout=ANY, stderr=None)
         service_response_mock.assert_called_once_with("hello world", {"Content-Type": "application/json"}, 200)
 
+    @patch.dict("os.environ", {INVOCATION_TIMINGS_ENV_VAR: "1"})
+    @patch("samcli.lib.utils.invocation_timings.get_invocation_metrics")
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaOutputParser")
+    def test_invoke_request_handler_returns_invocation_timings(self, lambda_output_parser_mock, get_metrics_mock):
+        lambda_output_parser_mock.get_lambda_output.return_value = "hello world", None, False
+
+        request_mock = Mock()
+        request_mock.get_data.return_value = b"{}"
+        local_lambda_invoke_service.request = request_mock
+
+        def invoke(*args, **kwargs):
+            with invocation_phase("invoke"):
+                pass
+
+        lambda_runner_mock = Mock()
+        lambda_runner_mock.invoke.side_effect = invoke
+        service = LocalLambdaInvokeService(lambda_runner=lambda_runner_mock, port=3000, host="localhost")
+
+        response = service._invoke_request_handler(function_name="HelloWorld")
+
+        server_timing = response.headers["Server-Timing"]
+        for phase in ("invoke;dur=", "logs;dur=", "overhead;dur=", "total;dur="):
+            self.assertIn(phase, server_timing)
+        get_metrics_mock.return_value.add.assert_called_once()
+
+    @patch("samcli.local.services.base_local_service.get_invocation_metrics")
+    def test_get_invocation_metrics_includes_event_invocation_queue(self, get_invocation_metrics_mock):
+        get_invocation_metrics_mock.return_value.to_dict.return_value = {}
+        service = LocalLambdaInvokeService(lambda_runner=Mock(), port=3000, host="localhost")
+
+        metrics = service.get_invocation_metrics()
+
+        self.assertEqual(metrics["functions"], {})
+        self.assertEqual(metrics["event_invocation_queue"]["completed"], 0)
+        self.assertEqual(metrics["event_invocation_queue"]["throttled"], 0)
+
+
+class TestLocalLambdaService_event_invocation(TestCase):
+    def setUp(self):
+        request_mock = Mock()
+        request_mock.get_data.return_value = b"{}"
+        request_mock.headers = {"X-Amz-Invocation-Type": "Event"}
+        local_lambda_invoke_service.request = request_mock
+
+        self.lambda_runner_mock = Mock()
+        self.stderr_mock = Mock()
+        self.service = LocalLambdaInvokeService(
+            lambda_runner=self.lambda_runner_mock, port=3000, host="localhost", stderr=self.stderr_mock
+        )
+
+    def tearDown(self):
+        self.service.event_invocation_queue.stop()
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LocalLambdaInvokeService.service_response")
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaOutputParser")
+    def test_invoke_request_handler_runs_event_invocation_in_background(
+        self, lambda_output_parser_mock, service_response_mock
+    ):
+        lambda_output_parser_mock.get_lambda_output.return_value = "hello world", "logs", False
+        service_response_mock.return_value = "request response"
+
+        response = self.service._invoke_request_handler(function_name="HelloWorld")
+        self.service.event_invocation_queue.join()
+
+        self.assertEqual(response, "request response")
+        service_response_mock.assert_called_once_with("", {"Content-Type": "application/json"}, 202)
+        self.lambda_runner_mock.invoke.assert_called_once_with("HelloWorld", "{}", stdout=ANY, stderr=self.stderr_mock)
+        self.stderr_mock.write.assert_called_once_with("logs")
+        self.assertEqual(self.service.event_invocation_queue.get_metrics().completed, 1)
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
+    def test_invoke_request_handler_event_invocation_of_missing_function(self, lambda_error_responses_mock):
+        self.lambda_runner_mock.provider.get.return_value = None
+        lambda_error_responses_mock.resource_not_found.return_value = "Couldn't find Lambda"
+
+        response = self.service._invoke_request_handler(function_name="NotFound")
+
+        self.assertEqual(response, "Couldn't find Lambda")
+        lambda_error_responses_mock.resource_not_found.assert_called_once_with("NotFound")
+        self.lambda_runner_mock.invoke.assert_not_called()
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
+    def test_invoke_request_handler_throttles_event_invocation_when_queue_is_full(self, lambda_error_responses_mock):
+        self.service.event_invocation_queue = Mock()
+        self.service.event_invocation_queue.submit.return_value = False
+        self.service.event_invocation_queue.depth = 100
+        lambda_error_responses_mock.too_many_requests.return_value = "Throttled"
+
+        response = self.service._invoke_request_handler(function_name="HelloWorld")
+
+        self.assertEqual(response, "Throttled")
+        self.service.event_invocation_queue.submit.assert_called_once_with("HelloWorld", "{}")
+        lambda_error_responses_mock.too_many_requests.assert_called_once_with(
+            "Event invocation queue is full, 100 invocations are waiting"
+        )
+
 
 class TestValidateRequestHandling(TestCase):
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
@@ -251,7 +359,7 @@ class TestValidateRequestHandling(TestCase):
         self.assertEqual(response, "NotImplementedLocally")
 
         lambda_error_responses_mock.not_implemented_locally.assert_called_once_with(
-            "invocation-type: DryRun is not supported. RequestResponse is only supported."
+            "invocation-type: DryRun is not supported. RequestResponse and Event are only supported."
         )
 
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.request")
@@ -266,6 +374,18 @@ class TestValidateRequestHandling(TestCase):
 
         self.assertIsNone(response)
 
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.request")
+    def test_request_with_event_invocation_type(self, flask_request):
+        flask_request.get_data.return_value = None
+        flask_request.headers = {"X-Amz-Invocation-Type": "Event"}
+        flask_request.content_type = "application/json"
+        flask_request.args = {}
+        local_lambda_invoke_service.request = flask_request
+
+        response = LocalLambdaInvokeService.validate_request()
+
+        self.assertIsNone(response)
+
 
 class TestPathConverter(TestCase):
     def test_path_converter_to_url_accepts_function_full_path(self):
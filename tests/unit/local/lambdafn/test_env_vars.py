@@ -369,3 +369,22 @@ class TestEnvironmentVariables_add_lambda_event_body(TestCase):
         environ.add_lambda_event_body(value)
 
         self.assertEqual(environ.variables.get("AWS_LAMBDA_EVENT_BODY"), value)
+
+
+class TestEnvironmentVariables_eq(TestCase):
+    def test_must_not_resolve_when_compared_with_itself(self):
+        environ = EnvironmentVariables(variables={"key": "value"})
+
+        with patch.object(EnvironmentVariables, "resolve") as resolve_mock:
+            self.assertTrue(environ == environ)
+            self.assertFalse(environ != environ)
+
+        resolve_mock.assert_not_called()
+
+    def test_must_compare_resolved_values(self):
+        self.assertEqual(
+            EnvironmentVariables(variables={"key": "value"}), EnvironmentVariables(variables={"key": "value"})
+        )
+        self.assertNotEqual(
+            EnvironmentVariables(variables={"key": "value"}), EnvironmentVariables(variables={"key": "x"})
+        )
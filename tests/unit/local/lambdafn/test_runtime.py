@@ -533,6 +533,34 @@ class TestLambdaRuntime_get_code_dir(TestCase):
         shutil_mock.rmtree.assert_not_called()
 
 
+class TestLambdaRuntime_get_code_dir_with_unzip_cache(TestCase):
+    def setUp(self):
+        self.manager_mock = Mock()
+        self.layer_downloader = Mock()
+        self.unzip_cache = Mock()
+        self.runtime = LambdaRuntime(self.manager_mock, self.layer_downloader, self.unzip_cache)
+
+    @patch("samcli.local.lambdafn.runtime.os")
+    @patch("samcli.local.lambdafn.runtime.shutil")
+    @patch("samcli.local.lambdafn.runtime._unzip_file")
+    def test_must_use_unzip_cache(self, unzip_file_mock, shutil_mock, os_mock):
+        os_mock.path.isfile.return_value = True
+        self.unzip_cache.acquire.return_value = "cached-dir"
+
+        result = self.runtime._get_code_dir("foo.zip")
+        self.assertEqual(result, "cached-dir")
+        self.unzip_cache.acquire.assert_called_once_with("foo.zip")
+        unzip_file_mock.assert_not_called()
+
+        self.runtime._clean_decompressed_paths()
+        self.unzip_cache.release.assert_called_once_with("cached-dir")
+        # Decompressed dirs in the cache are reused by the following invocations
+        shutil_mock.rmtree.assert_not_called()
+
+        self.runtime._clean_decompressed_paths()
+        self.unzip_cache.release.assert_called_once()
+
+
 class TestLambdaRuntime_unarchived_layer(TestCase):
     def setUp(self):
         self.manager_mock = Mock()
@@ -0,0 +1,248 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from parameterized import parameterized
+
+from samcli.local.lambdafn.unzip_cache import (
+    DEFAULT_MAX_SIZE_BYTES,
+    REFERENCE_EXPIRY_SECONDS,
+    REFERENCES_DIR_NAME,
+    STALE_FILE_SECONDS,
+    UNZIP_CACHE_ENV_VAR,
+    UNZIP_CACHE_MAX_SIZE_ENV_VAR,
+    UnzipCache,
+    get_unzip_cache,
+)
+
+
+class TestGetUnzipCache(TestCase):
+    @parameterized.expand([("",), ("0",), ("false",)])
+    def test_must_be_disabled_by_default(self, value):
+        with patch.dict("os.environ", {UNZIP_CACHE_ENV_VAR: value}):
+            self.assertIsNone(get_unzip_cache())
+
+    @parameterized.expand(
+        [
+            ({UNZIP_CACHE_ENV_VAR: "1"}, DEFAULT_MAX_SIZE_BYTES),
+            ({UNZIP_CACHE_ENV_VAR: "true", UNZIP_CACHE_MAX_SIZE_ENV_VAR: "512"}, 512 * 1024 * 1024),
+            ({UNZIP_CACHE_ENV_VAR: "1", UNZIP_CACHE_MAX_SIZE_ENV_VAR: "invalid"}, DEFAULT_MAX_SIZE_BYTES),
+        ]
+    )
+    @patch("samcli.local.lambdafn.unzip_cache.get_default_unzip_cache_dir")
+    def test_must_create_cache_when_enabled(self, env_vars, expected_max_size, get_dir_mock):
+        get_dir_mock.return_value = "cache-dir"
+
+        with patch.dict("os.environ", env_vars):
+            cache = get_unzip_cache()
+
+        self.assertEqual(cache._cache_dir, "cache-dir")
+        self.assertEqual(cache._max_size, expected_max_size)
+
+
+class TestUnzipCache(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _create_archive(self, name, content):
+        archive_path = os.path.join(self.temp_dir, name)
+        with zipfile.ZipFile(archive_path, "w") as zip_file:
+            zip_file.writestr("app.py", content)
+        return archive_path
+
+    def _make_old(self, path, seconds=60):
+        old_time = time.time() - seconds
+        os.utime(path, (old_time, old_time))
+
+    def _references(self):
+        return os.listdir(os.path.join(self.cache_dir, REFERENCES_DIR_NAME))
+
+    def test_must_decompress_archive_once(self):
+        archive_path = self._create_archive("code.zip", "print('hello')")
+        cache = UnzipCache(self.cache_dir)
+
+        with patch(
+            "samcli.local.lambdafn.unzip_cache.unzip", wraps=lambda *args: shutil.unpack_archive(*args, "zip")
+        ) as unzip_mock:
+            first = cache.acquire(archive_path)
+            second = cache.acquire(archive_path)
+
+        self.assertEqual(first, second)
+        unzip_mock.assert_called_once()
+        with open(os.path.join(first, "app.py")) as code_file:
+            self.assertEqual(code_file.read(), "print('hello')")
+        self.assertCountEqual(
+            os.listdir(self.cache_dir),
+            [os.path.basename(first), os.path.basename(first) + ".size", REFERENCES_DIR_NAME],
+        )
+
+    def test_archives_with_same_content_share_directory(self):
+        first = UnzipCache(self.cache_dir).acquire(self._create_archive("first.zip", "same"))
+        second = UnzipCache(self.cache_dir).acquire(self._create_archive("second.zip", "same"))
+
+        self.assertEqual(first, second)
+
+    def test_modified_archive_is_decompressed_again(self):
+        archive_path = self._create_archive("code.zip", "first")
+        cache = UnzipCache(self.cache_dir)
+        first = cache.acquire(archive_path)
+
+        archive_path = self._create_archive("code.zip", "second version")
+        second = cache.acquire(archive_path)
+
+        self.assertNotEqual(first, second)
+        with open(os.path.join(second, "app.py")) as code_file:
+            self.assertEqual(code_file.read(), "second version")
+
+    def test_concurrent_acquires_decompress_once(self):
+        archive_path = self._create_archive("code.zip", "print('hello')")
+        cache = UnzipCache(self.cache_dir)
+        results = []
+
+        with patch(
+            "samcli.local.lambdafn.unzip_cache.unzip", wraps=lambda *args: shutil.unpack_archive(*args, "zip")
+        ) as unzip_mock:
+            threads = [threading.Thread(target=lambda: results.append(cache.acquire(archive_path))) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        unzip_mock.assert_called_once()
+        self.assertEqual(len(set(results)), 1)
+
+    def test_must_evict_least_recently_used_released_directories(self):
+        cache = UnzipCache(self.cache_dir, max_size=10)
+        old = cache.acquire(self._create_archive("old.zip", "0123456789"))
+        in_use = cache.acquire(self._create_archive("in_use.zip", "abcdefghij"))
+        cache.release(old)
+        self._make_old(old)
+        self._make_old(in_use)
+
+        new = cache.acquire(self._create_archive("new.zip", "ABCDEFGHIJ"))
+
+        self.assertFalse(os.path.exists(old))
+        self.assertFalse(os.path.exists(old + ".size"))
+        self.assertTrue(os.path.isdir(in_use))
+        self.assertTrue(os.path.isdir(new))
+
+    def test_must_keep_reference_until_last_release(self):
+        cache = UnzipCache(self.cache_dir)
+        archive_path = self._create_archive("code.zip", "0123456789")
+        directory = cache.acquire(archive_path)
+        cache.acquire(archive_path)
+
+        cache.release(directory)
+        self.assertEqual(len(self._references()), 1)
+        self.assertTrue(self._references()[0].startswith(os.path.basename(directory) + "."))
+
+        cache.release(directory)
+        self.assertEqual(self._references(), [])
+
+    def test_must_not_evict_directories_acquired_by_other_processes(self):
+        other_process_cache = UnzipCache(self.cache_dir, max_size=10)
+        in_use = other_process_cache.acquire(self._create_archive("in_use.zip", "0123456789"))
+        self._make_old(in_use, seconds=REFERENCE_EXPIRY_SECONDS)
+
+        new = UnzipCache(self.cache_dir, max_size=10).acquire(self._create_archive("new.zip", "ABCDEFGHIJ"))
+
+        self.assertTrue(os.path.isdir(in_use))
+        self.assertTrue(os.path.isfile(in_use + ".size"))
+        self.assertTrue(os.path.isdir(new))
+
+    def test_must_evict_directories_with_expired_references(self):
+        killed_process_cache = UnzipCache(self.cache_dir, max_size=10)
+        abandoned = killed_process_cache.acquire(self._create_archive("abandoned.zip", "0123456789"))
+        self._make_old(abandoned)
+        for reference in self._references():
+            self._make_old(os.path.join(self.cache_dir, REFERENCES_DIR_NAME, reference), REFERENCE_EXPIRY_SECONDS + 60)
+
+        new = UnzipCache(self.cache_dir, max_size=10).acquire(self._create_archive("new.zip", "ABCDEFGHIJ"))
+
+        self.assertFalse(os.path.exists(abandoned))
+        self.assertTrue(os.path.isdir(new))
+        self.assertEqual(len(self._references()), 1)
+
+    def test_must_put_back_directory_acquired_while_being_evicted(self):
+        cache = UnzipCache(self.cache_dir, max_size=10)
+        directory = cache.acquire(self._create_archive("code.zip", "0123456789"))
+        cache.release(directory)
+        key = os.path.basename(directory)
+
+        # Another process acquires the directory after the first check for references
+        with patch.object(cache, "_is_referenced", side_effect=[True]):
+            self.assertFalse(cache._remove_entry(key, 10))
+
+        self.assertTrue(os.path.isdir(directory))
+        with open(directory + ".size") as size_file:
+            self.assertEqual(size_file.read(), "10")
+        self.assertEqual([name for name in os.listdir(self.cache_dir) if name.startswith(".tmp-")], [])
+
+    @patch("samcli.local.lambdafn.unzip_cache.REFERENCE_REFRESH_INTERVAL_SECONDS", 0.01)
+    def test_must_refresh_references_while_acquired(self):
+        cache = UnzipCache(self.cache_dir)
+        directory = cache.acquire(self._create_archive("code.zip", "0123456789"))
+        reference_file = os.path.join(self.cache_dir, REFERENCES_DIR_NAME, self._references()[0])
+        self._make_old(reference_file, REFERENCE_EXPIRY_SECONDS + 60)
+
+        time.sleep(0.1)
+        self.assertGreater(os.path.getmtime(reference_file), time.time() - REFERENCE_EXPIRY_SECONDS)
+
+        refresher = cache._refresher
+        cache.release(directory)
+        refresher.join(1)
+        self.assertFalse(refresher.is_alive())
+        self.assertIsNone(cache._refresher)
+
+    def test_must_write_size_before_renaming_directory(self):
+        cache = UnzipCache(self.cache_dir)
+        renamed = []
+
+        def rename(source, destination):
+            renamed.append(os.path.isfile(destination + ".size"))
+            os.replace(source, destination)
+
+        with patch("samcli.local.lambdafn.unzip_cache.os.rename", side_effect=rename):
+            cache.acquire(self._create_archive("code.zip", "0123456789"))
+
+        self.assertEqual(renamed, [True])
+
+    def test_must_remove_stale_files_of_killed_processes(self):
+        os.makedirs(os.path.join(self.cache_dir, ".tmp-1000-stale", "nested"))
+        fresh_temp_dir = os.path.join(self.cache_dir, ".tmp-{}-fresh".format(int(time.time())))
+        os.makedirs(fresh_temp_dir)
+        stale_size_file = os.path.join(self.cache_dir, "stale.size")
+        fresh_size_file = os.path.join(self.cache_dir, "fresh.size")
+        for size_file in (stale_size_file, fresh_size_file):
+            with open(size_file, "w") as size_file_stream:
+                size_file_stream.write("10")
+        self._make_old(stale_size_file, STALE_FILE_SECONDS + 60)
+
+        UnzipCache(self.cache_dir, max_size=10).acquire(self._create_archive("new.zip", "ABCDEFGHIJ"))
+
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, ".tmp-1000-stale")))
+        self.assertFalse(os.path.exists(stale_size_file))
+        self.assertTrue(os.path.isdir(fresh_temp_dir))
+        self.assertTrue(os.path.isfile(fresh_size_file))
+
+    def test_failed_decompression_leaves_no_directory(self):
+        archive_path = os.path.join(self.temp_dir, "broken.zip")
+        with open(archive_path, "w") as archive_file:
+            archive_file.write("not a zip file")
+        cache = UnzipCache(self.cache_dir)
+
+        with self.assertRaises(zipfile.BadZipFile):
+            cache.acquire(archive_path)
+
+        self.assertEqual(os.listdir(self.cache_dir), [REFERENCES_DIR_NAME])
+        self.assertEqual(self._references(), [])
+        self.assertEqual(cache._in_use, {})
@@ -1,4 +1,10 @@
+import io
 import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import TestCase
 from unittest.mock import Mock, call, patch
 
@@ -7,6 +13,7 @@ from pathlib import Path
 
 from parameterized import parameterized
 
+from samcli.lib.providers.provider import LayerVersion
 from samcli.local.layers.layer_downloader import LayerDownloader
 from samcli.commands.local.cli_common.user_exceptions import CredentialsRequired, ResourceNotFound
 
@@ -23,7 +30,7 @@ class TestDownloadLayers(TestCase):
 
     @patch("samcli.local.layers.layer_downloader.LayerDownloader.download")
     def test_download_all_without_force(self, download_patch):
-        download_patch.side_effect = ["/home/layer1", "/home/layer2"]
+        download_patch.side_effect = lambda layer, force, show_progress: "/home/" + layer
 
         download_layers = LayerDownloader("/home", ".", Mock())
 
@@ -31,11 +38,13 @@ class TestDownloadLayers(TestCase):
 
         self.assertEqual(acutal_results, ["/home/layer1", "/home/layer2"])
 
-        download_patch.assert_has_calls([call("layer1", False), call("layer2", False)])
+        download_patch.assert_has_calls(
+            [call("layer1", False, show_progress=False), call("layer2", False, show_progress=False)], any_order=True
+        )
 
     @patch("samcli.local.layers.layer_downloader.LayerDownloader.download")
     def test_download_all_with_force(self, download_patch):
-        download_patch.side_effect = ["/home/layer1", "/home/layer2"]
+        download_patch.side_effect = lambda layer, force, show_progress: "/home/" + layer
 
         download_layers = LayerDownloader("/home", ".", Mock())
 
@@ -43,7 +52,9 @@ class TestDownloadLayers(TestCase):
 
         self.assertEqual(acutal_results, ["/home/layer1", "/home/layer2"])
 
-        download_patch.assert_has_calls([call("layer1", True), call("layer2", True)])
+        download_patch.assert_has_calls(
+            [call("layer1", True, show_progress=False), call("layer2", True, show_progress=False)], any_order=True
+        )
 
     @patch("samcli.local.layers.layer_downloader.LayerDownloader._create_cache")
     @patch("samcli.local.layers.layer_downloader.LayerDownloader._is_layer_cached")
@@ -93,14 +104,10 @@ class TestDownloadLayers(TestCase):
 
     @patch("samcli.local.layers.layer_downloader.unzip_from_uri")
     @patch("samcli.local.layers.layer_downloader.LayerDownloader._fetch_layer_uri")
-    @patch("samcli.local.layers.layer_downloader.LayerDownloader._create_cache")
-    @patch("samcli.local.layers.layer_downloader.LayerDownloader._is_layer_cached")
-    def test_download_layer(
-        self, is_layer_cached_patch, create_cache_patch, fetch_layer_uri_patch, unzip_from_uri_patch
-    ):
-        is_layer_cached_patch.return_value = False
-
-        download_layers = LayerDownloader("/home", ".", Mock())
+    def test_download_layer(self, fetch_layer_uri_patch, unzip_from_uri_patch):
+        layer_cache = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, layer_cache)
+        download_layers = LayerDownloader(layer_cache, ".", Mock())
 
         layer_mock = Mock()
         layer_mock.is_defined_within_template = False
@@ -109,19 +116,67 @@ class TestDownloadLayers(TestCase):
         layer_mock.layer_arn = "arn:layer:layer1"
 
         fetch_layer_uri_patch.return_value = "layer/uri"
+        unzip_from_uri_patch.side_effect = lambda uri, zip_path, unzip_output_dir, progressbar_label: Path(
+            unzip_output_dir, "content"
+        ).touch()
 
         actual = download_layers.download(layer_mock)
 
-        self.assertEqual(actual.codeuri, str(Path("/home/layer1").resolve()))
+        layer_path = str(Path(layer_cache, "layer1").resolve())
+        self.assertEqual(actual.codeuri, layer_path)
+        self.assertTrue(Path(layer_path, "content").exists())
+        self.assertCountEqual(os.listdir(layer_cache), ["layer1", "layer1.lock"])
 
-        create_cache_patch.assert_called_once_with("/home")
         fetch_layer_uri_patch.assert_called_once_with(layer_mock)
-        unzip_from_uri_patch.assert_called_once_with(
-            "layer/uri",
-            str(Path("/home/layer1.zip").resolve()),
-            unzip_output_dir=str(Path("/home/layer1").resolve()),
-            progressbar_label="Downloading arn:layer:layer1",
-        )
+        unzip_from_uri_patch.assert_called_once()
+        uri, zip_path = unzip_from_uri_patch.call_args[0]
+        self.assertEqual(uri, "layer/uri")
+        self.assertEqual(zip_path, unzip_from_uri_patch.call_args[1]["unzip_output_dir"] + ".zip")
+        self.assertEqual(unzip_from_uri_patch.call_args[1]["progressbar_label"], "Downloading arn:layer:layer1")
+
+    @patch("samcli.local.layers.layer_downloader.unzip_from_uri")
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._fetch_layer_uri")
+    def test_failed_download_is_not_cached(self, fetch_layer_uri_patch, unzip_from_uri_patch):
+        layer_cache = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, layer_cache)
+        download_layers = LayerDownloader(layer_cache, ".", Mock())
+
+        layer_mock = Mock()
+        layer_mock.is_defined_within_template = False
+        layer_mock.name = "layer1"
+
+        def partial_download(uri, zip_path, unzip_output_dir, progressbar_label):
+            Path(unzip_output_dir, "partial").touch()
+            raise ConnectionError()
+
+        unzip_from_uri_patch.side_effect = partial_download
+
+        with self.assertRaises(ConnectionError):
+            download_layers.download(layer_mock)
+
+        self.assertEqual(os.listdir(layer_cache), ["layer1.lock"])
+
+    @patch("samcli.local.layers.layer_downloader.unzip_from_uri")
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._fetch_layer_uri")
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._is_layer_cached")
+    def test_download_layer_downloaded_by_other_process(
+        self, is_layer_cached_patch, fetch_layer_uri_patch, unzip_from_uri_patch
+    ):
+        layer_cache = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, layer_cache)
+        download_layers = LayerDownloader(layer_cache, ".", Mock())
+        # Layer is downloaded by another process while waiting for the lock
+        is_layer_cached_patch.side_effect = [False, True]
+
+        layer_mock = Mock()
+        layer_mock.is_defined_within_template = False
+        layer_mock.name = "layer1"
+
+        actual = download_layers.download(layer_mock)
+
+        self.assertEqual(actual.codeuri, str(Path(layer_cache, "layer1").resolve()))
+        fetch_layer_uri_patch.assert_not_called()
+        unzip_from_uri_patch.assert_not_called()
 
     def test_layer_is_cached(self):
         download_layers = LayerDownloader("/", ".", Mock())
@@ -216,3 +271,54 @@ class TestLayerDownloader_fetch_layer_uri(TestCase):
 
         with self.assertRaises(ClientError):
             download_layers._fetch_layer_uri(layer=layer)
+
+
+class _LayerContentHandler(BaseHTTPRequestHandler):
+    barrier: threading.Barrier
+
+    def do_GET(self):
+        # Every layer is served only after all of them are requested, which fails if they are downloaded one by one
+        self.barrier.wait(timeout=10)
+        content = io.BytesIO()
+        with zipfile.ZipFile(content, "w") as layer_zip:
+            layer_zip.writestr("python/layer.py", self.path)
+        self.send_response(200)
+        self.send_header("Content-length", str(len(content.getvalue())))
+        self.end_headers()
+        self.wfile.write(content.getvalue())
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownloadLayersConcurrently(TestCase):
+    def setUp(self):
+        self.layer_cache = tempfile.mkdtemp()
+        _LayerContentHandler.barrier = threading.Barrier(3)
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _LayerContentHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.layer_cache)
+
+    @patch("samcli.local.lambdafn.zip.progressbar")
+    def test_must_download_layers_concurrently(self, progressbar_patch):
+        lambda_client_mock = Mock()
+        lambda_client_mock.get_layer_version.side_effect = lambda LayerName, VersionNumber: {
+            "Content": {"Location": "http://127.0.0.1:{}/{}".format(self.server.server_port, LayerName.split(":")[-1])}
+        }
+        layers = [
+            LayerVersion(f"arn:aws:lambda:us-east-1:123456789012:layer:layer{index}:1", None) for index in range(3)
+        ]
+        download_layers = LayerDownloader(self.layer_cache, ".", Mock(), lambda_client_mock)
+
+        actual = download_layers.download_all(layers)
+
+        self.assertEqual(actual, layers)
+        for index, layer in enumerate(layers):
+            self.assertEqual(layer.codeuri, str(Path(self.layer_cache, layer.name).resolve()))
+            self.assertEqual(Path(layer.codeuri, "python", "layer.py").read_text(), f"/layer{index}")
+        # Progress bars of concurrent downloads would overwrite each other
+        progressbar_patch.assert_not_called()
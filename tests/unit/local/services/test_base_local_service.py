@@ -1,8 +1,10 @@
+import json
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
 from parameterized import parameterized, param
 
+from samcli.lib.utils.invocation_timings import INVOCATION_TIMINGS_ENV_VAR
 from samcli.local.services.base_local_service import BaseLocalService, LambdaOutputParser
 
 
@@ -63,6 +65,54 @@ class TestLocalHostRunner(TestCase):
             service.create()
 
 
+class TestInvocationTimings(TestCase):
+    def test_add_invocation_timings_sets_server_timing_header(self):
+        response = Mock(headers={})
+        timings = Mock()
+        timings.to_server_timing_header.return_value = "invoke;dur=1.000"
+
+        result = BaseLocalService.add_invocation_timings(response, timings)
+
+        self.assertIs(result, response)
+        self.assertEqual(response.headers, {"Server-Timing": "invoke;dur=1.000"})
+
+    def test_add_invocation_timings_without_timings(self):
+        response = Mock(headers={})
+
+        BaseLocalService.add_invocation_timings(response, None)
+
+        self.assertEqual(response.headers, {})
+
+    @patch.dict("os.environ", {INVOCATION_TIMINGS_ENV_VAR: ""})
+    def test_metrics_endpoint_is_not_added_when_disabled(self):
+        service = BaseLocalService(is_debugging=False, port=3000, host="127.0.0.1")
+        service._app = Mock()
+
+        service._add_invocation_metrics_endpoint()
+
+        service._app.add_url_rule.assert_not_called()
+
+    @patch.dict("os.environ", {INVOCATION_TIMINGS_ENV_VAR: "1"})
+    @patch("samcli.local.services.base_local_service.get_invocation_metrics")
+    def test_metrics_endpoint_returns_metrics(self, get_invocation_metrics_mock):
+        get_invocation_metrics_mock.return_value.to_dict.return_value = {"HelloWorld": {"invocations": 1}}
+        service = BaseLocalService(is_debugging=False, port=3000, host="127.0.0.1")
+        service._app = Mock()
+
+        service._add_invocation_metrics_endpoint()
+        response = service._invocation_metrics_handler()
+
+        service._app.add_url_rule.assert_called_once_with(
+            "/_sam/invocation-metrics",
+            endpoint="/_sam/invocation-metrics",
+            view_func=service._invocation_metrics_handler,
+            methods=["GET"],
+            provide_automatic_options=False,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.get_data()), {"functions": {"HelloWorld": {"invocations": 1}}})
+
+
 class TestLambdaOutputParser(TestCase):
     @parameterized.expand(
         [
@@ -10,10 +10,27 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import io
+
 from botocore.compat import OrderedDict
 
-from unittest import TestCase
-from samcli.yamlhelper import yaml_parse, yaml_dump
+import yaml
+from samtranslator.utils.py27hash_fix import Py27UniStr
+from unittest import TestCase, skipUnless
+from samcli.yamlhelper import yaml_parse, yaml_dump, CfnLoader, CfnDumper, _dict_constructor, _dict_representer
+from samcli.yamlhelper import intrinsics_multi_constructor, string_representer
+
+
+class PreviousCfnDumper(yaml.SafeDumper):
+    """Dumper of the output templates before they were streamed"""
+
+    def ignore_aliases(self, data):
+        return True
+
+
+PreviousCfnDumper.add_representer(OrderedDict, _dict_representer)
+PreviousCfnDumper.add_representer(str, string_representer)
+PreviousCfnDumper.add_representer(Py27UniStr, string_representer)
 
 
 class TestYaml(TestCase):
@@ -161,3 +178,77 @@ class TestYaml(TestCase):
         )
         actual = yaml_dump(template)
         self.assertEqual(actual, expected)
+
+    def test_yaml_dump_to_stream(self):
+        template = OrderedDict(
+            [
+                ("AWSTemplateFormatVersion", "2010-09-09"),
+                (
+                    "Resources",
+                    OrderedDict(
+                        (
+                            f"Function{index}",
+                            {
+                                "Type": "AWS::Lambda::Function",
+                                "Properties": {
+                                    "Code": {"S3Bucket": "bucket", "S3Key": f"0{index}"},
+                                    "Role": {"Fn::GetAtt": ["Role", "Arn"]},
+                                    "Description": "multi\nline ünicode",
+                                    "InlineCode": "def handler(event, context):\n    return "
+                                    + "'a very long line that is wrapped by the emitter, " * 5
+                                    + "'\n",
+                                },
+                            },
+                        )
+                        for index in range(100)
+                    ),
+                ),
+            ]
+        )
+        stream = io.StringIO()
+
+        self.assertIsNone(yaml_dump(template, stream))
+        expected = yaml.dump(template, default_flow_style=False, Dumper=PreviousCfnDumper)
+        self.assertEqual(stream.getvalue(), expected)
+        self.assertEqual(yaml_dump(template), expected)
+
+    def test_yaml_dumps_str_subclass(self):
+        self.assertEqual(yaml_dump({"Key": Py27UniStr("0123")}), "Key: '0123'\n")
+
+    def test_parse_does_not_modify_global_loader(self):
+        yaml_parse(self.yaml_with_tags)
+        with self.assertRaises(yaml.constructor.ConstructorError):
+            yaml.safe_load("Key: !Ref Something")
+
+    @skipUnless(yaml.__with_libyaml__, "libyaml is not available")
+    def test_libyaml_loader_is_used_when_available(self):
+        self.assertTrue(issubclass(CfnLoader, yaml.CSafeLoader))
+        # libyaml emitter wraps long scalars differently
+        self.assertFalse(issubclass(CfnDumper, yaml.CSafeDumper))
+
+    def test_same_output_as_pure_python_loader(self):
+        class PurePythonLoader(yaml.SafeLoader):
+            pass
+
+        PurePythonLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor)
+        PurePythonLoader.add_multi_constructor("!", intrinsics_multi_constructor)
+
+        template = "Resources:\n" + "".join(
+            f"""
+  Function{index}:
+    Type: AWS::Serverless::Function
+    Properties:
+      Handler: !Sub "${{AWS::StackName}}-{index}"
+      Role: !GetAtt Role.Arn
+      Environment:
+        Variables: &variables{index}
+          TABLE: !Ref Table
+          LIST: !Split [",", !ImportValue Value]
+      Tags:
+        <<: *variables{index}
+        Account: "0123"
+"""
+            for index in range(100)
+        )
+
+        self.assertEqual(yaml_parse(template), yaml.load(template, Loader=PurePythonLoader))